@@ -106,6 +106,22 @@ DATABASES = {
     }
 }
 
+# Cache
+# The cached API responses, their ETags, and the package version and
+#   resolution caches are invalidated by bumping generations stored in the
+#   cache, so every worker process must share it. The file based cache is
+#   shared by the processes of one host, use Memcached or Redis when the
+#   workers run on several hosts.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/1.9/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -195,3 +211,65 @@ STATIC_ROOT = BASE_DIR / 'static'
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# Release downloads
+# Number of bytes read from disk per chunk when streaming a release zip
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Backend that sends the file, the web server offload backends are
+#   project_manager.downloads.backends.XAccelRedirectDownloadBackend (nginx)
+#   project_manager.downloads.backends.XSendfileDownloadBackend (Apache/lighttpd)
+DOWNLOAD_BACKEND = 'project_manager.downloads.backends.PythonDownloadBackend'
+# Internal nginx location that aliases MEDIA_ROOT
+DOWNLOAD_OFFLOAD_PREFIX = '/protected-media/'
+# Download counts are buffered in each process and written in one update
+#   once this many downloads are pending or this many seconds have passed
+DOWNLOAD_COUNT_FLUSH_THRESHOLD = 100
+DOWNLOAD_COUNT_FLUSH_INTERVAL = 60
+# Counts that cannot be written on shutdown are saved here until the next flush
+DOWNLOAD_COUNT_SPOOL_FILE = BASE_DIR / '.download_counts.json'
+# Seconds to cache the release for a download path, entries are also
+#   removed whenever a release is saved or deleted
+DOWNLOAD_RELEASE_CACHE_TIMEOUT = 60 * 60 * 24
+# Daily download statistics older than this many days are merged into
+#   monthly rows by the rollup_download_statistics command
+DOWNLOAD_STATISTICS_DAILY_RETENTION = 90
+
+# Release jobs
+# Validate and create uploaded releases in a background worker pool instead
+#   of during the request, the upload is answered with a job to poll
+RELEASE_JOBS_ENABLED = False
+# Number of worker threads per process that process release jobs
+RELEASE_JOB_WORKERS = 2
+# Seconds after its last update that a running job is assumed to have been
+#   interrupted, such as by a restart, and is requeued by run_release_jobs
+RELEASE_JOB_STALE_TIMEOUT = 60 * 30
+
+# Package requirements
+# Seconds to cache each package's sorted release versions, entries are also
+#   removed whenever one of the package's releases is saved or deleted
+PACKAGE_VERSIONS_CACHE_TIMEOUT = 60 * 60 * 24
+# Seconds to cache each release's resolved install plan, all plans are also
+#   invalidated whenever any release is saved or deleted
+RELEASE_RESOLUTION_CACHE_TIMEOUT = 60 * 60
+
+# API responses
+# Seconds to cache the data of read-only project, game, and tag responses,
+#   entries are also invalidated whenever one of their models is written
+API_RESPONSE_CACHE_TIMEOUT = 60 * 10
+
+# Sync API
+# Seconds before a change is returned by the sync API. Change ids are given
+#   on insert, but transactions can commit out of order, so every
+#   transaction that writes a project must commit within this time for
+#   sync tokens to never skip a change
+SYNC_CHANGE_COMMIT_LAG = 10
+
+# Catalog index
+# Path, relative to MEDIA_ROOT, of the JSON catalog of every project's current
+#   release, written with a gzipped copy by the build_catalog command and
+#   then updated whenever a project or release is written
+CATALOG_INDEX_FILE = 'catalog/index.json'
+
+# Project export
+# Number of projects read, and prefetched for, at a time by the NDJSON export
+PROJECT_EXPORT_CHUNK_SIZE = 100
@@ -18,3 +18,10 @@ TEMPLATES[0]['OPTIONS']['context_processors'] += [
 ]
 TEMPLATES[0]['DIRS'].append(BASE_DIR / 'local-templates')
 LOGIN_REDIRECT_URL = '/'
+
+# The development server and the tests run in a single process
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
@@ -4,6 +4,7 @@
 # Django
 from django.db import connection
 from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import Coalesce
 from django.test import override_settings
 
 # Third Party Django
@@ -151,20 +152,18 @@ class GameViewSetTestCase(APITestCase):
             tuple1=getattr(queryset, '_prefetch_related_lookups'),
             tuple2=(),
         )
+        # Verify that each count is an independent subquery, not a join
+        self.assertNotIn(member='JOIN', container=str(queryset.query))
         annotations = queryset.query.annotations
         self.assertIn(
             member='package_count',
             container=annotations,
         )
         package_count = annotations['package_count']
-        self.assertTrue(expr=package_count.distinct)
-        self.assertEqual(
-            first=len(package_count.source_expressions),
-            second=1,
-        )
+        self.assertIsInstance(obj=package_count, cls=Coalesce)
         self.assertIs(
-            expr1=package_count.source_expressions[0].target,
-            expr2=getattr(PackageGame.package, 'field'),
+            expr1=package_count.source_expressions[0].query.model,
+            expr2=PackageGame,
         )
 
         self.assertIn(
@@ -172,14 +171,10 @@ class GameViewSetTestCase(APITestCase):
             container=annotations,
         )
         plugin_count = annotations['plugin_count']
-        self.assertTrue(expr=plugin_count.distinct)
-        self.assertEqual(
-            first=len(plugin_count.source_expressions),
-            second=1,
-        )
+        self.assertIsInstance(obj=plugin_count, cls=Coalesce)
         self.assertIs(
-            expr1=plugin_count.source_expressions[0].target,
-            expr2=getattr(PluginGame.plugin, 'field'),
+            expr1=plugin_count.source_expressions[0].query.model,
+            expr2=PluginGame,
         )
 
         self.assertIn(
@@ -187,14 +182,10 @@ class GameViewSetTestCase(APITestCase):
             container=annotations,
         )
         sub_plugin_count = annotations['sub_plugin_count']
-        self.assertTrue(expr=sub_plugin_count.distinct)
-        self.assertEqual(
-            first=len(sub_plugin_count.source_expressions),
-            second=1,
-        )
+        self.assertIsInstance(obj=sub_plugin_count, cls=Coalesce)
         self.assertIs(
-            expr1=sub_plugin_count.source_expressions[0].target,
-            expr2=getattr(SubPluginGame.sub_plugin, 'field'),
+            expr1=sub_plugin_count.source_expressions[0].query.model,
+            expr2=SubPluginGame,
         )
 
         self.assertIn(
@@ -4,7 +4,7 @@
 # IMPORTS
 # =============================================================================
 # Django
-from django.db.models import Count, F, Prefetch
+from django.db.models import F, Prefetch
 
 # Third Party Django
 from rest_framework.filters import OrderingFilter
@@ -14,6 +14,8 @@ from rest_framework.viewsets import GenericViewSet
 # App
 from games.api.serializers import GameListSerializer, GameRetrieveSerializer
 from games.models import Game
+from project_manager.api.common.views.mixins import CachedResponseMixin
+from project_manager.helpers import get_relation_count_subquery
 from project_manager.sub_plugins.models import SubPlugin
 
 
@@ -28,7 +30,12 @@ __all__ = (
 # =============================================================================
 # VIEWS
 # =============================================================================
-class GameViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
+class GameViewSet(
+    CachedResponseMixin,
+    ListModelMixin,
+    RetrieveModelMixin,
+    GenericViewSet,
+):
     """ViewSet for listing Supported Games.
 
     ###Available Ordering:
@@ -81,8 +88,17 @@ class GameViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
             )
 
         return queryset.annotate(
-            package_count=Count('packages', distinct=True),
-            plugin_count=Count('plugins', distinct=True),
-            sub_plugin_count=Count('sub_plugins', distinct=True),
+            package_count=get_relation_count_subquery(
+                model=Game,
+                relation_name='packages',
+            ),
+            plugin_count=get_relation_count_subquery(
+                model=Game,
+                relation_name='plugins',
+            ),
+            sub_plugin_count=get_relation_count_subquery(
+                model=Game,
+                relation_name='sub_plugins',
+            ),
             project_count=F('package_count') + F('plugin_count') + F('sub_plugin_count'),
         )
@@ -0,0 +1,222 @@
+"""Versioned cache for the data of read-only API responses."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from functools import partial
+from hashlib import sha256
+from time import time
+
+# Django
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils.http import quote_etag
+
+# App
+from project_manager.constants import (
+    RESPONSE_CACHE_KEY_PREFIX,
+    RESPONSE_CACHE_PROJECT_SCOPES,
+    RESPONSE_CACHE_SHARED_SCOPES,
+    RESPONSE_GENERATION_KEY_PREFIX,
+)
+from project_manager.helpers import get_release_project_field
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'bump_cached_responses',
+    'bump_project_responses',
+    'bump_response_generations',
+    'bump_user_responses',
+    'get_instance_scopes',
+    'get_response_cache_key',
+    'get_response_etag',
+    'get_response_generations',
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def get_response_generations(scopes):
+    """Return the current generation of each of the given scopes."""
+    keys = [
+        f'{RESPONSE_GENERATION_KEY_PREFIX}:{scope}' for scope in scopes
+    ]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key in generations:
+            continue
+        generation = int(time() * 1000)
+        if not cache.add(key, generation, None):
+            generation = cache.get(key)
+        generations[key] = generation
+    return [generations[key] for key in keys]
+
+
+def get_response_cache_key(request, scopes):
+    """Return the cache key for the request's response in the given scopes.
+
+    The key includes the request's auth class, so anonymous and logged in
+        users never share a response, and the host, as pagination links
+        are absolute.
+    """
+    auth_class = (
+        'authenticated' if request.user.is_authenticated else 'anonymous'
+    )
+    query = sorted(request.query_params.lists())
+    digest = sha256(
+        f'{request.get_host()}{request.path}?{query}'.encode()
+    ).hexdigest()
+    generations = '.'.join(map(str, get_response_generations(scopes)))
+    return (
+        f'{RESPONSE_CACHE_KEY_PREFIX}:{auth_class}:{generations}:{digest}'
+    )
+
+
+def get_response_etag(cache_key):
+    """Return the ETag of the response stored under the given cache key.
+
+    The key changes whenever the response's scopes are bumped, so the ETag
+        does not need the response's content. This requires a cache shared
+        by every process, which the check_shared_cache check enforces.
+    """
+    return quote_etag(sha256(cache_key.encode()).hexdigest()[:32])
+
+
+def bump_response_generations(*scopes):
+    """Invalidate every cached response in the given scopes."""
+    for scope in scopes:
+        key = f'{RESPONSE_GENERATION_KEY_PREFIX}:{scope}'
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, int(time() * 1000), None)
+
+
+def get_instance_scopes(instance):
+    """Return the scopes whose responses include the given instance.
+
+    A project is included in its type's lists, its own detail, and the
+        Game and Tag responses. Releases and through models are included in
+        the scopes of the projects, Games, and Tags they relate to, and
+        requirements in the scopes of their release's project.
+    """
+    label = instance._meta.label_lower
+    if label in RESPONSE_CACHE_PROJECT_SCOPES:
+        return (
+            label,
+            f'{label}:{instance.pk}',
+            *RESPONSE_CACHE_SHARED_SCOPES,
+        )
+
+    scopes = [label] if label in RESPONSE_CACHE_SHARED_SCOPES else []
+    for field in instance._meta.concrete_fields:
+        if not field.is_relation:
+            continue
+        related_label = field.related_model._meta.label_lower
+        if related_label in RESPONSE_CACHE_PROJECT_SCOPES:
+            scopes.extend([
+                related_label,
+                f'{related_label}:{getattr(instance, field.attname)}',
+            ])
+        elif related_label in RESPONSE_CACHE_SHARED_SCOPES:
+            scopes.append(related_label)
+        elif hasattr(field.related_model, 'project_class'):
+            scopes.extend(
+                _get_release_scopes(
+                    release_model=field.related_model,
+                    release_id=getattr(instance, field.attname),
+                )
+            )
+    return tuple(scopes)
+
+
+def bump_cached_responses(instance, **kwargs):
+    """Invalidate the cached responses that include the saved instance.
+
+    Inside a transaction, the scopes are bumped again on commit, so that a
+        response cached before the commit is not served afterwards.
+    """
+    scopes = get_instance_scopes(instance)
+    if not scopes:
+        return
+    _bump_on_commit(scopes)
+
+
+def bump_user_responses(instance, update_fields=None, **kwargs):
+    """Invalidate the cached responses that include the saved user's name.
+
+    Projects include their owner and contributors, and releases their
+        creator, so the list and detail scopes of each project the user is
+        related to are bumped. User saves that do not change the username,
+        such as logins, are skipped.
+    """
+    if update_fields is not None and 'username' not in update_fields:
+        return
+
+    suffix = '' if instance._meta.label_lower == 'users.forumuser' else '__user'
+    scopes = []
+    for label in RESPONSE_CACHE_PROJECT_SCOPES:
+        project_model = apps.get_model(label)
+        release_model = apps.get_model(
+            app_label=project_model._meta.app_label,
+            model_name=f'{project_model.__name__}Release',
+        )
+        project_pks = set(
+            project_model.objects.filter(
+                Q(**{f'owner{suffix}': instance}) |
+                Q(**{f'contributors{suffix}': instance}),
+            ).values_list('pk', flat=True)
+        ).union(
+            release_model.objects.filter(
+                **{f'created_by{suffix}': instance},
+            ).values_list(
+                f'{get_release_project_field(release_model)}_id',
+                flat=True,
+            )
+        )
+        if project_pks:
+            scopes.append(label)
+            scopes.extend(f'{label}:{pk}' for pk in project_pks)
+    if scopes:
+        _bump_on_commit(scopes)
+
+
+def bump_project_responses(project_model, project_pks):
+    """Invalidate the cached responses of projects updated in bulk."""
+    label = project_model._meta.label_lower
+    bump_response_generations(
+        label,
+        *(f'{label}:{pk}' for pk in project_pks),
+    )
+
+
+def _bump_on_commit(scopes):
+    """Bump the scopes, and inside a transaction again on commit."""
+    bump_response_generations(*scopes)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(partial(bump_response_generations, *scopes))
+
+
+def _get_release_scopes(release_model, release_id):
+    """Return the scopes of the release's project.
+
+    The release may already be deleted when its requirements are, in which
+        case only the project type's scope is returned.
+    """
+    label = release_model.project_class._meta.label_lower
+    project_pk = release_model.objects.filter(
+        pk=release_id,
+    ).values_list(
+        f'{get_release_project_field(release_model)}_id',
+        flat=True,
+    ).first()
+    if project_pk is None:
+        return [label]
+    return [label, f'{label}:{project_pk}']
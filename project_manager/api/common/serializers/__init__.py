@@ -7,18 +7,21 @@
 from contextlib import suppress
 
 # Django
+from django.db import transaction
 from django.utils.timezone import now
 
 # Third Party Django
 from rest_framework.exceptions import ValidationError
 from rest_framework.fields import (
     CharField,
+    ChoiceField,
+    DateField,
     FileField,
     IntegerField,
     SerializerMethodField,
 )
 from rest_framework.reverse import reverse
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import ModelSerializer, Serializer
 
 # App
 from project_manager.api.common.serializers.mixins import (
@@ -31,6 +34,10 @@ from project_manager.constants import (
     RELEASE_NOTES_MAX_LENGTH,
     RELEASE_VERSION_MAX_LENGTH,
 )
+from project_manager.downloads.constants import (
+    DOWNLOAD_PERIOD_DAY,
+    DOWNLOAD_PERIODS,
+)
 from games.api.common.serializers import MinimalGameSerializer
 from games.constants import GAME_SLUG_MAX_LENGTH
 from games.models import Game
@@ -47,8 +54,10 @@ from users.models import ForumUser
 __all__ = (
     'ProjectContributorSerializer',
     'ProjectCreateReleaseSerializer',
+    'ProjectDownloadStatisticQuerySerializer',
     'ProjectGameSerializer',
     'ProjectImageSerializer',
+    'ProjectReleaseJobSerializer',
     'ProjectReleaseSerializer',
     'ProjectSerializer',
     'ProjectTagSerializer',
@@ -123,6 +132,7 @@ class ProjectSerializer(
             del fields['contributors']
         return fields
 
+    @transaction.atomic
     def create(self, validated_data):
         """Create the instance and the first release of the project."""
         validated_data = self.get_extra_validated_data(validated_data)
@@ -148,7 +158,7 @@ class ProjectSerializer(
 
     def get_current_release(self, obj):
         """Return the current release info."""
-        release = obj.releases.first()
+        release = self.get_current_release_object(obj)
         zip_url = reverse(
             viewname=f'{self.project_type}-download',
             kwargs=self.get_download_kwargs(
@@ -166,64 +176,63 @@ class ProjectSerializer(
             release_dict.update(self.get_requirements(release))
         return release_dict
 
+    @staticmethod
+    def get_current_release_object(obj):
+        """Return the project's most recently created release.
+
+        The viewsets prefetch only this release into "current_releases".
+        """
+        current_releases = getattr(obj, 'current_releases', None)
+        if current_releases is None:
+            current_releases = obj.releases.order_by('-created')[:1]
+        return current_releases[0]
+
     @staticmethod
     def get_requirements(release):
-        """Return a dictionary of requirements for the given release."""
-        project_type = release.__class__.__name__.lower()
-        package_requirements = [
-            {
-                'name': item['package_requirement__name'],
-                'version': item['version'],
-                'optional': item['optional'],
-            } for item in
-            getattr(release, f'{project_type}packagerequirement_set').values(
-                'package_requirement__name',
-                'version',
-                'optional',
-            )
-        ]
-        pypi_requirements = [
-            {
-                'name': item['pypi_requirement__name'],
-                'version': item['version'],
-                'optional': item['optional'],
-            } for item in
-            getattr(release, f'{project_type}pypirequirement_set').values(
-                'pypi_requirement__name',
-                'version',
-                'optional',
-            )
-        ]
-        vcs_requirements = [
-            {
-                'url': item['vcs_requirement__url'],
-                'version': item['version'],
-                'optional': item['optional'],
-            } for item in
-            getattr(
+        """Return a dictionary of requirements for the given release.
+
+        The requirements are read from the through rows prefetched by
+            get_requirement_prefetches and use the same fields as
+            the release serializers' requirements.
+        """
+        release_name = release.__class__.__name__.lower()
+
+        def get_rows(group):
+            return getattr(
                 release,
-                f'{project_type}versioncontrolrequirement_set'
-            ).values(
-                'vcs_requirement__url',
-                'version',
-                'optional',
-            )
-        ]
-        download_requirements = [
-            {
-                'url': item['download_requirement__url'],
-                'optional': item['optional'],
-            } for item in
-            getattr(release, f'{project_type}downloadrequirement_set').values(
-                'download_requirement__url',
-                'optional',
-            )
-        ]
+                f'{release_name}{group}requirement_set',
+            ).all()
+
         return {
-            'package_requirements': package_requirements,
-            'pypi_requirements': pypi_requirements,
-            'version_control_requirements': vcs_requirements,
-            'download_requirements': download_requirements,
+            'package_requirements': [
+                {
+                    'name': item.package_requirement.name,
+                    'slug': item.package_requirement.slug,
+                    'version': item.version,
+                    'optional': item.optional,
+                } for item in get_rows('package')
+            ],
+            'pypi_requirements': [
+                {
+                    'name': item.pypi_requirement.name,
+                    'slug': item.pypi_requirement.slug,
+                    'version': item.version,
+                    'optional': item.optional,
+                } for item in get_rows('pypi')
+            ],
+            'version_control_requirements': [
+                {
+                    'url': item.vcs_requirement.url,
+                    'version': item.version,
+                    'optional': item.optional,
+                } for item in get_rows('versioncontrol')
+            ],
+            'download_requirements': [
+                {
+                    'url': item.download_requirement.url,
+                    'optional': item.optional,
+                } for item in get_rows('download')
+            ],
         }
 
     def get_extra_validated_data(self, validated_data):
@@ -289,6 +298,77 @@ class ProjectReleaseSerializer(
         return self.get_date_time_dict(timestamp=obj.created)
 
 
+class ProjectReleaseJobSerializer(ModelSerializer, ProjectLocaleMixin):
+    """Base ProjectReleaseJob Serializer for queueing and retrieving."""
+
+    notes = CharField(
+        max_length=RELEASE_NOTES_MAX_LENGTH,
+        allow_blank=True,
+        required=False,
+    )
+    zip_file = FileField(
+        write_only=True,
+    )
+    release = SerializerMethodField()
+    created = SerializerMethodField()
+    updated = SerializerMethodField()
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        model = None
+        fields = (
+            'id',
+            'version',
+            'notes',
+            'zip_file',
+            'status',
+            'progress',
+            'errors',
+            'release',
+            'created',
+            'updated',
+        )
+        read_only_fields = (
+            'status',
+            'progress',
+            'errors',
+        )
+
+    @property
+    def release_serializer_class(self):
+        """Return the serializer that validates and creates the release."""
+        raise NotImplementedError(
+            f'Class "{self.__class__.__name__}" must implement a '
+            '"release_serializer_class" attribute.'
+        )
+
+    def validate(self, attrs):
+        """Validate the version is new and add the project and user."""
+        view = self.context['view']
+        if view.project.releases.filter(version=attrs['version']).exists():
+            raise ValidationError({
+                'version': 'Given version matches existing version.',
+            })
+
+        attrs[view.project_type.replace('-', '_')] = view.project
+        attrs['created_by'] = self.context['request'].user.forum_user
+        return attrs
+
+    @staticmethod
+    def get_release(obj):
+        """Return the version of the release created by the job."""
+        return obj.release.version if obj.release_id else None
+
+    def get_created(self, obj):
+        """Return the job's created info."""
+        return self.get_date_time_dict(timestamp=obj.created)
+
+    def get_updated(self, obj):
+        """Return the job's last updated info."""
+        return self.get_date_time_dict(timestamp=obj.updated)
+
+
 class ProjectCreateReleaseSerializer(ProjectReleaseCreationMixin):
     """Base ProjectRelease Serializer for creating and retrieving."""
 
@@ -448,3 +528,29 @@ class ProjectContributorSerializer(ProjectThroughMixin):
 
         attrs['user'] = user
         return super().validate(attrs=attrs)
+
+
+class ProjectDownloadStatisticQuerySerializer(Serializer):
+    """Serializer for the download statistics query parameters."""
+
+    # pylint: disable=abstract-method
+    period = ChoiceField(
+        choices=DOWNLOAD_PERIODS,
+        default=DOWNLOAD_PERIOD_DAY,
+    )
+    start = DateField(
+        required=False,
+    )
+    end = DateField(
+        required=False,
+    )
+
+    def validate(self, attrs):
+        """Validate that the start date is not after the end date."""
+        start = attrs.get('start')
+        end = attrs.get('end')
+        if start is not None and end is not None and start > end:
+            raise ValidationError({
+                'end': 'End date must not be before the start date.',
+            })
+        return attrs
@@ -4,6 +4,7 @@
 # IMPORTS
 # =============================================================================
 # Django
+from django.db import transaction
 from django.utils import formats
 
 # Third Party Django
@@ -12,6 +13,7 @@ from rest_framework.serializers import ModelSerializer
 
 # App
 from project_manager.helpers import GROUP_QUERYSET_NAMES
+from project_manager.packages.dependents import index_package_requirements
 
 
 # =============================================================================
@@ -65,7 +67,6 @@ class CreateRequirementsMixin:
         if not self.requirements:
             return
 
-        # TODO: look into bulk_create
         project_type = release.__class__.__name__.lower()
         for group_type, group in self.requirements.items():
             self._create_group_requirements(
@@ -78,12 +79,17 @@ class CreateRequirementsMixin:
     @staticmethod
     def _create_group_requirements(release, project_type, group_type, group):
         queryset_group_name = GROUP_QUERYSET_NAMES.get(group_type)
-        for requirement in group:
-            requirement_set = getattr(
-                release,
-                f'{project_type}{queryset_group_name}requirement_set'
-            )
-            requirement_set.create(**requirement)
+        requirement_set = getattr(
+            release,
+            f'{project_type}{queryset_group_name}requirement_set'
+        )
+        release_field = requirement_set.field.name
+        requirements = requirement_set.model.objects.bulk_create([
+            requirement_set.model(**{release_field: release}, **requirement)
+            for requirement in group
+        ])
+        if group_type == 'custom':
+            index_package_requirements(requirements=requirements)
 
 
 class ProjectReleaseCreationMixin(CreateRequirementsMixin, ModelSerializer):
@@ -126,13 +132,10 @@ class ProjectReleaseCreationMixin(CreateRequirementsMixin, ModelSerializer):
         """Validate that the new release can be created."""
         version = attrs.get('version', '')
         zip_file = attrs.get('zip_file')
-        attrs['created_by'] = self.context['request'].user.forum_user
+        attrs['created_by'] = self.get_created_by()
 
         # Validate the version is new for the project
-        kwargs = self.get_project_kwargs()
-        project = self.get_project(
-            kwargs=kwargs,
-        )
+        project = self.get_release_project()
         self.run_version_validation(
             project=project,
             version=version,
@@ -141,11 +144,11 @@ class ProjectReleaseCreationMixin(CreateRequirementsMixin, ModelSerializer):
 
         args = self.get_zip_file_args(zip_file=zip_file)
 
-        zip_validator = self.zip_parser(*args)
-        self.run_zip_file_validation(
-            zip_validator=zip_validator,
-            project_basename=project_basename,
-        )
+        with self.zip_parser(*args) as zip_validator:
+            self.run_zip_file_validation(
+                zip_validator=zip_validator,
+                project_basename=project_basename,
+            )
 
         # This needs added for project creation
         attrs['basename'] = zip_validator.basename
@@ -156,6 +159,20 @@ class ProjectReleaseCreationMixin(CreateRequirementsMixin, ModelSerializer):
 
         return attrs
 
+    def get_created_by(self):
+        """Return the ForumUser creating the release."""
+        if 'job' in self.context:
+            return self.context['job'].created_by
+        return self.context['request'].user.forum_user
+
+    def get_release_project(self):
+        """Return the project the release is being created for."""
+        if 'job' in self.context:
+            return self.context['job'].project
+        return self.get_project(
+            kwargs=self.get_project_kwargs(),
+        )
+
     def get_zip_file_args(self, zip_file):
         """Return the arguments necessary to instantiate the ZipFile class."""
         return [zip_file]
@@ -194,8 +211,13 @@ class ProjectReleaseCreationMixin(CreateRequirementsMixin, ModelSerializer):
                 )
             })
 
+    @transaction.atomic
     def create(self, validated_data):
-        """Update the project's updated datetime when release is created."""
+        """Update the project's updated datetime when release is created.
+
+        The release's project has its stored release stats updated by the
+            release's post_save signal, within the same transaction.
+        """
         # Remove the basename before creating the release
         del validated_data['basename']
         self.requirements = validated_data.pop('requirements')
@@ -12,11 +12,17 @@ from django.utils.timezone import now
 # Third Party Django
 from rest_framework.fields import (
     CharField,
+    ChoiceField,
+    DateField,
     FileField,
     IntegerField,
     SerializerMethodField,
 )
-from rest_framework.serializers import ListSerializer, ModelSerializer
+from rest_framework.serializers import (
+    ListSerializer,
+    ModelSerializer,
+    Serializer,
+)
 
 # App
 from games.api.common.serializers import MinimalGameSerializer
@@ -24,8 +30,10 @@ from games.constants import GAME_SLUG_MAX_LENGTH
 from project_manager.api.common.serializers import (
     ProjectContributorSerializer,
     ProjectCreateReleaseSerializer,
+    ProjectDownloadStatisticQuerySerializer,
     ProjectGameSerializer,
     ProjectImageSerializer,
+    ProjectReleaseJobSerializer,
     ProjectReleaseSerializer,
     ProjectSerializer,
     ProjectTagSerializer,
@@ -40,7 +48,14 @@ from project_manager.constants import (
     RELEASE_NOTES_MAX_LENGTH,
     RELEASE_VERSION_MAX_LENGTH,
 )
+from project_manager.downloads.constants import DOWNLOAD_PERIOD_DAY
 from tags.constants import TAG_NAME_MAX_LENGTH
+from test_utils.factories.packages import PackageFactory
+from test_utils.factories.plugins import PluginReleaseFactory
+from test_utils.factories.requirements import (
+    DownloadRequirementFactory,
+    PyPiRequirementFactory,
+)
 from test_utils.factories.users import ForumUserFactory
 from users.api.common.serializers import ForumUserContributorSerializer
 from users.constants import USER_USERNAME_MAX_LENGTH
@@ -204,6 +219,68 @@ class ProjectThroughMixinTestCase(TestCase):
         )
 
 
+class CreateRequirementsMixinTestCase(TestCase):
+    def test_create_requirements(self):
+        release = PluginReleaseFactory()
+        package = PackageFactory()
+        pypi_requirement = PyPiRequirementFactory()
+        obj = CreateRequirementsMixin()
+        obj.requirements = {
+            'custom': [
+                {
+                    'package_requirement': package,
+                    'version': '1.0.0',
+                    'optional': False,
+                },
+            ],
+            'download': [
+                {
+                    'download_requirement': DownloadRequirementFactory(),
+                    'optional': False,
+                },
+                {
+                    'download_requirement': DownloadRequirementFactory(),
+                    'optional': True,
+                },
+            ],
+            'pypi': [
+                {
+                    'pypi_requirement': pypi_requirement,
+                    'version': None,
+                    'optional': True,
+                },
+            ],
+        }
+        # One insert per group, and one for the Package dependents index
+        with self.assertNumQueries(4):
+            obj._create_requirements(release=release)
+
+        requirement = release.pluginreleasepackagerequirement_set.get()
+        self.assertEqual(
+            first=requirement.package_requirement,
+            second=package,
+        )
+        self.assertEqual(
+            first=package.dependents.get().requirement_id,
+            second=requirement.pk,
+        )
+        self.assertEqual(
+            first=release.pluginreleasedownloadrequirement_set.count(),
+            second=2,
+        )
+        requirement = release.pluginreleasepypirequirement_set.get()
+        self.assertEqual(
+            first=requirement.pypi_requirement,
+            second=pypi_requirement,
+        )
+        self.assertTrue(expr=requirement.optional)
+
+    def test_create_requirements_empty(self):
+        obj = CreateRequirementsMixin()
+        with self.assertNumQueries(0):
+            obj._create_requirements(release=None)
+
+
 class ProjectReleaseCreationMixinTestCase(TestCase):
     def test_class_inheritance(self):
         self.assertTrue(
@@ -373,6 +450,58 @@ class ProjectCreateReleaseSerializerTestCase(TestCase):
         )
 
 
+class ProjectDownloadStatisticQuerySerializerTestCase(TestCase):
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(ProjectDownloadStatisticQuerySerializer, Serializer),
+        )
+
+    def test_declared_fields(self):
+        declared_fields = getattr(
+            ProjectDownloadStatisticQuerySerializer,
+            '_declared_fields',
+        )
+        self.assertSetEqual(
+            set1=set(declared_fields),
+            set2={'period', 'start', 'end'},
+        )
+        field = declared_fields['period']
+        self.assertIsInstance(
+            obj=field,
+            cls=ChoiceField,
+        )
+        self.assertEqual(
+            first=field.default,
+            second=DOWNLOAD_PERIOD_DAY,
+        )
+        for name in ('start', 'end'):
+            field = declared_fields[name]
+            self.assertIsInstance(
+                obj=field,
+                cls=DateField,
+            )
+            self.assertFalse(expr=field.required)
+
+    def test_validate(self):
+        serializer = ProjectDownloadStatisticQuerySerializer(
+            data={'start': '2023-01-01', 'end': '2023-01-01'},
+        )
+        self.assertTrue(expr=serializer.is_valid())
+        self.assertEqual(
+            first=serializer.validated_data['period'],
+            second=DOWNLOAD_PERIOD_DAY,
+        )
+
+        serializer = ProjectDownloadStatisticQuerySerializer(
+            data={'start': '2023-01-02', 'end': '2023-01-01'},
+        )
+        self.assertFalse(expr=serializer.is_valid())
+        self.assertDictEqual(
+            d1=serializer.errors,
+            d2={'end': ['End date must not be before the start date.']},
+        )
+
+
 class ProjectGameSerializerTestCase(TestCase):
     def test_class_inheritance(self):
         self.assertTrue(
@@ -497,6 +626,82 @@ class ProjectReleaseSerializerTestCase(TestCase):
         )
 
 
+class ProjectReleaseJobSerializerTestCase(TestCase):
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(ProjectReleaseJobSerializer, ModelSerializer),
+        )
+        self.assertTrue(
+            expr=issubclass(ProjectReleaseJobSerializer, ProjectLocaleMixin),
+        )
+
+    def test_declared_fields(self):
+        declared_fields = getattr(ProjectReleaseJobSerializer, '_declared_fields')
+        self.assertEqual(
+            first=len(declared_fields),
+            second=5,
+        )
+
+        field = declared_fields['notes']
+        self.assertIsInstance(
+            obj=field,
+            cls=CharField,
+        )
+        self.assertEqual(
+            first=field.max_length,
+            second=RELEASE_NOTES_MAX_LENGTH,
+        )
+        self.assertTrue(expr=field.allow_blank)
+        self.assertFalse(expr=field.required)
+
+        field = declared_fields['zip_file']
+        self.assertIsInstance(
+            obj=field,
+            cls=FileField,
+        )
+        self.assertTrue(expr=field.write_only)
+
+        for name in ('release', 'created', 'updated'):
+            self.assertIsInstance(
+                obj=declared_fields[name],
+                cls=SerializerMethodField,
+            )
+
+    def test_meta_class(self):
+        self.assertTupleEqual(
+            tuple1=ProjectReleaseJobSerializer.Meta.fields,
+            tuple2=(
+                'id',
+                'version',
+                'notes',
+                'zip_file',
+                'status',
+                'progress',
+                'errors',
+                'release',
+                'created',
+                'updated',
+            ),
+        )
+        self.assertTupleEqual(
+            tuple1=ProjectReleaseJobSerializer.Meta.read_only_fields,
+            tuple2=('status', 'progress', 'errors'),
+        )
+
+    def test_release_serializer_class_required(self):
+        obj = ProjectReleaseJobSerializer()
+        with self.assertRaises(NotImplementedError) as context:
+            _ = obj.release_serializer_class
+
+        self.assertEqual(
+            first=str(context.exception),
+            second=(
+                f'Class "{obj.__class__.__name__}" must implement a '
+                f'"release_serializer_class" attribute.'
+            ),
+        )
+
+
 class ProjectSerializerTestCase(TestCase):
     def test_class_inheritance(self):
         self.assertTrue(
@@ -11,11 +11,16 @@ from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
 # App
+from project_manager.api.common.serializers import (
+    ProjectDownloadStatisticQuerySerializer,
+)
 from project_manager.api.common.views import (
     ProjectAPIView,
     ProjectContributorViewSet,
+    ProjectDownloadStatisticViewSet,
     ProjectGameViewSet,
     ProjectImageViewSet,
+    ProjectReleaseJobViewSet,
     ProjectReleaseViewSet,
     ProjectTagViewSet,
     ProjectViewSet,
@@ -98,7 +103,13 @@ class ProjectViewSetTestCase(TestCase):
         )
         self.assertTupleEqual(
             tuple1=ProjectViewSet.ordering_fields,
-            tuple2=('name', 'basename', 'updated', 'created'),
+            tuple2=(
+                'name',
+                'basename',
+                'updated',
+                'created',
+                'total_downloads',
+            ),
         )
 
     def test_creation_serializer_class_required(self):
@@ -168,6 +179,45 @@ class ProjectReleaseViewSetTestCase(TestCase):
             second='Release',
         )
 
+    def test_job_serializer_class_required(self):
+        obj = ProjectReleaseViewSet()
+        with self.assertRaises(NotImplementedError) as context:
+            _ = obj.job_serializer_class
+
+        self.assertEqual(
+            first=str(context.exception),
+            second=(
+                f'Class "{obj.__class__.__name__}" must implement a '
+                f'"job_serializer_class" attribute.'
+            ),
+        )
+
+
+class ProjectReleaseJobViewSetTestCase(TestCase):
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(ProjectReleaseJobViewSet, ProjectRelatedInfoMixin),
+        )
+
+    def test_base_attributes(self):
+        self.assertTupleEqual(
+            tuple1=ProjectReleaseJobViewSet.http_method_names,
+            tuple2=('get', 'options'),
+        )
+        self.assertTupleEqual(
+            tuple1=ProjectReleaseJobViewSet.ordering,
+            tuple2=('-created',),
+        )
+        self.assertTupleEqual(
+            tuple1=ProjectReleaseJobViewSet.ordering_fields,
+            tuple2=('created',),
+        )
+        self.assertFalse(expr=ProjectReleaseJobViewSet.allow_retrieve_access)
+        self.assertEqual(
+            first=ProjectReleaseJobViewSet.related_model_type,
+            second='Release Job',
+        )
+
 
 class ProjectGameViewSetTestCase(TestCase):
     def test_class_inheritance(self):
@@ -234,3 +284,41 @@ class ProjectContributorViewSetTestCase(TestCase):
             second='Contributor',
         )
         self.assertTrue(expr=ProjectContributorViewSet.owner_only_id_access)
+
+
+class ProjectDownloadStatisticViewSetTestCase(TestCase):
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(
+                ProjectDownloadStatisticViewSet,
+                ProjectRelatedInfoMixin,
+            ),
+        )
+
+    def test_base_attributes(self):
+        self.assertTupleEqual(
+            tuple1=ProjectDownloadStatisticViewSet.filter_backends,
+            tuple2=(),
+        )
+        self.assertTupleEqual(
+            tuple1=ProjectDownloadStatisticViewSet.http_method_names,
+            tuple2=('get', 'options'),
+        )
+        self.assertEqual(
+            first=ProjectDownloadStatisticViewSet.lookup_field,
+            second='version',
+        )
+        self.assertEqual(
+            first=ProjectDownloadStatisticViewSet.lookup_value_regex,
+            second=RELEASE_VERSION_REGEX,
+        )
+        self.assertIsNone(obj=ProjectDownloadStatisticViewSet.pagination_class)
+        self.assertEqual(
+            first=ProjectDownloadStatisticViewSet.serializer_class,
+            second=ProjectDownloadStatisticQuerySerializer,
+        )
+        self.assertTrue(expr=ProjectDownloadStatisticViewSet.allow_retrieve_access)
+        self.assertEqual(
+            first=ProjectDownloadStatisticViewSet.related_model_type,
+            second='Download Statistic',
+        )
@@ -4,15 +4,24 @@
 # IMPORTS
 # =============================================================================
 # Python
+from collections import defaultdict
 from urllib.parse import unquote
 
 # Django
+from django.conf import settings
 from django.db import IntegrityError
 from django.db.models import Prefetch
+from django.utils.functional import cached_property
 
 # Third Party Django
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import (
+    NotFound,
+    PermissionDenied,
+    ValidationError,
+)
 from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
@@ -21,8 +30,18 @@ from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
 # App
-from project_manager.api.common.views.mixins import ProjectRelatedInfoMixin
+from project_manager.api.common.serializers import (
+    ProjectDownloadStatisticQuerySerializer,
+)
+from project_manager.api.common.views.mixins import (
+    CachedResponseMixin,
+    ProjectRelatedInfoMixin,
+)
 from project_manager.constants import RELEASE_VERSION_REGEX
+from project_manager.downloads.statistics import get_download_series
+from project_manager.helpers import get_requirement_prefetches
+from project_manager.packages.resolution import get_resolved_requirements
+from project_manager.release_jobs.workers import submit_release_job
 from users.models import ForumUser
 
 
@@ -32,8 +51,10 @@ from users.models import ForumUser
 __all__ = (
     'ProjectAPIView',
     'ProjectContributorViewSet',
+    'ProjectDownloadStatisticViewSet',
     'ProjectGameViewSet',
     'ProjectImageViewSet',
+    'ProjectReleaseJobViewSet',
     'ProjectReleaseViewSet',
     'ProjectTagViewSet',
     'ProjectViewSet',
@@ -51,9 +72,11 @@ class ProjectAPIView(APIView):
     project_type = None
     views = (
         'contributors',
+        'downloads',
         'games',
         'images',
         'projects',
+        'release-jobs',
         'releases',
         'tags',
     )
@@ -87,7 +110,7 @@ class ProjectAPIView(APIView):
         }
 
 
-class ProjectViewSet(ModelViewSet):
+class ProjectViewSet(CachedResponseMixin, ModelViewSet):
     """Base ViewSet for creating, updating, and listing Projects."""
 
     doc_string = """
@@ -123,16 +146,41 @@ class ProjectViewSet(ModelViewSet):
     *  **basename** (descending) or **-basename** (ascending)
     *  **created** (descending) or **-created** (ascending)
     *  **updated** (descending) or **-updated** (ascending)
+    *  **total_downloads** (descending) or **-total_downloads** (ascending)
 
         ####Example:
         `?ordering=basename`
 
         `?ordering=-updated`
+
+        `?ordering=-total_downloads`
+
+    ###Cursor Pagination:
+
+    *  **pagination**=*cursor* pages through the list with "next" and
+        "previous" cursor links and no "count", which stays fast for deep
+        pages. It is available when ordering by name, basename, created,
+        or updated.
+
+        ####Example:
+        `?pagination=cursor&ordering=name`
+
+    ###Conditional Requests:
+
+    *  Responses include an **ETag** header. Sending it back in an
+        **If-None-Match** header returns an empty "304 Not Modified"
+        response until the data changes.
     """
     filter_backends = (OrderingFilter, DjangoFilterBackend)
     http_method_names = ('get', 'post', 'patch', 'options')
     ordering = ('-updated',)
-    ordering_fields = ('name', 'basename', 'updated', 'created')
+    ordering_fields = (
+        'name',
+        'basename',
+        'updated',
+        'created',
+        'total_downloads',
+    )
 
     @property
     def creation_serializer_class(self):
@@ -166,6 +214,17 @@ class ProjectViewSet(ModelViewSet):
                 'basename': f'{self.queryset.model.__name__} already exists. Cannot create.'
             }) from exception
 
+    def get_cache_scopes(self):
+        """Scope the retrieve response to the project being retrieved."""
+        scopes = super().get_cache_scopes()
+        if self.action == 'retrieve':
+            return (f'{scopes[0]}:{self.get_project_pk()}',)
+        return scopes
+
+    def get_project_pk(self):
+        """Return the primary key of the project being retrieved."""
+        return self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+
     def get_serializer_class(self):
         """Return the serializer class for the current method."""
         if self.request.method == 'POST':
@@ -173,8 +232,19 @@ class ProjectViewSet(ModelViewSet):
         return super().get_serializer_class()
 
     def get_queryset(self):
-        """Prefetch the contributors in the list view."""
+        """Prefetch the related objects each view serializes.
+
+        The list view needs the contributors and the retrieve view needs the
+            current release's requirements.
+        """
         queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related(
+                *get_requirement_prefetches(
+                    release_model=self.serializer_class.release_model,
+                    prefix='current_releases__',
+                ),
+            )
         if self.action == 'list':
             queryset = queryset.prefetch_related(
                 Prefetch(
@@ -209,7 +279,7 @@ class ProjectImageViewSet(ProjectRelatedInfoMixin):
     related_model_type = 'Image'
 
 
-class ProjectReleaseViewSet(ProjectRelatedInfoMixin):
+class ProjectReleaseViewSet(CachedResponseMixin, ProjectRelatedInfoMixin):
     """Base Release ViewSet."""
 
     doc_string = """
@@ -222,6 +292,27 @@ class ProjectReleaseViewSet(ProjectRelatedInfoMixin):
         `?ordering=created`
 
         `?ordering=-created`
+
+    ###Cursor Pagination:
+
+    *  **pagination**=*cursor* pages through the list with "next" and
+        "previous" cursor links and no "count", which stays fast for deep
+        pages.
+
+        ####Example:
+        `?pagination=cursor&ordering=version`
+
+    ###Resolving Requirements:
+
+    *  **<version>/resolve/** returns the flat install plan of the release,
+        including every custom package it requires, directly or through
+        other packages, with the version of each to install.
+
+    ###Conditional Requests:
+
+    *  Responses include an **ETag** header. Sending it back in an
+        **If-None-Match** header returns an empty "304 Not Modified"
+        response until the data changes.
     """
     http_method_names = ('get', 'post', 'options')
     ordering = ('-created',)
@@ -232,6 +323,96 @@ class ProjectReleaseViewSet(ProjectRelatedInfoMixin):
     allow_retrieve_access = True
     related_model_type = 'Release'
 
+    @property
+    def job_serializer_class(self):
+        """Return the serializer used to queue release jobs."""
+        raise NotImplementedError(
+            f'Class "{self.__class__.__name__}" must implement a '
+            '"job_serializer_class" attribute.'
+        )
+
+    def get_cache_scopes(self):
+        """Scope the releases to their project."""
+        label = self.project_model._meta.label_lower
+        return (f'{label}:{self.get_project_pk()}',)
+
+    def get_project_pk(self):
+        """Return the primary key of the releases' project."""
+        return self.get_project_kwargs()['slug']
+
+    def get_queryset(self):
+        """Skip loading the release's requirements when resolving them."""
+        queryset = super().get_queryset()
+        if self.action == 'resolve':
+            return queryset.prefetch_related(None)
+        return queryset
+
+    @action(detail=True, methods=['get'])
+    def resolve(self, request, *args, **kwargs):
+        """Return the release's full requirement install plan."""
+        return Response(
+            data=get_resolved_requirements(release=self.get_object()),
+        )
+
+    def create(self, request, *args, **kwargs):
+        """Queue the release to be created in the background if enabled."""
+        if not settings.RELEASE_JOBS_ENABLED:
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.job_serializer_class(
+            data=request.data,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        job = serializer.save()
+        submit_release_job(
+            job=job,
+            serializer_class=serializer.release_serializer_class,
+        )
+        return Response(
+            data=serializer.data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={
+                'Location': reverse(
+                    viewname=f'api:{self.project_type}s:release-jobs-detail',
+                    kwargs={**self.kwargs, 'pk': job.pk},
+                    request=request,
+                ),
+            },
+        )
+
+
+class ProjectReleaseJobViewSet(ProjectRelatedInfoMixin):
+    """Base Release Job ViewSet."""
+
+    doc_string = """
+
+    Release jobs are created for uploaded releases when they are validated
+    and created in the background. Only the owner and contributors of the
+    project can view its jobs.
+
+    ###Available Ordering:
+
+    *  **created** (descending) or **-created** (ascending)
+
+        ####Example:
+        `?ordering=created`
+
+        `?ordering=-created`
+    """
+    http_method_names = ('get', 'options')
+    ordering = ('-created',)
+    ordering_fields = ('created',)
+
+    related_model_type = 'Release Job'
+
+    def check_permissions(self, request):
+        """Only allow the owner and contributors to view release jobs."""
+        if request.method == 'GET':
+            self._check_permissions(user_id=request.user.id)
+
+        return super().check_permissions(request=request)
+
 
 class ProjectGameViewSet(ProjectRelatedInfoMixin):
     """Base Game Support ViewSet."""
@@ -290,3 +471,89 @@ class ProjectContributorViewSet(ProjectRelatedInfoMixin):
     related_model_type = 'Contributor'
 
     owner_only_id_access = True
+
+
+class ProjectDownloadStatisticViewSet(ProjectRelatedInfoMixin):
+    """Base Download Statistic ViewSet."""
+
+    doc_string = """
+
+    Returns the number of downloads per period for the project and each of
+    its releases. Retrieve a release's version for only that release.
+
+    ###Available Filters:
+
+    *  **period**: `day` (default) or `month`
+
+        ####Example:
+        `?period=month`
+
+    *  **start** and **end**: only include periods starting in this range
+
+        ####Example:
+        `?start=2023-01-01&end=2023-01-31`
+    """
+    filter_backends = ()
+    http_method_names = ('get', 'options')
+    lookup_value_regex = RELEASE_VERSION_REGEX
+    lookup_field = 'version'
+    pagination_class = None
+    serializer_class = ProjectDownloadStatisticQuerySerializer
+
+    allow_retrieve_access = True
+    related_model_type = 'Download Statistic'
+
+    @cached_property
+    def query(self):
+        """Return the validated query parameters."""
+        serializer = self.get_serializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def get_project_lookup(self):
+        """Return the lookup that relates the statistics to the project."""
+        return f'release__{super().get_project_lookup()}'
+
+    def filter_queryset(self, queryset):
+        """Filter the statistics to the requested date range."""
+        if 'start' in self.query:
+            queryset = queryset.filter(date__gte=self.query['start'])
+        if 'end' in self.query:
+            queryset = queryset.filter(date__lte=self.query['end'])
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """Return the project's downloads and each release's downloads."""
+        queryset = self.filter_queryset(self.get_queryset())
+        period = self.query['period']
+        releases = defaultdict(list)
+        for row in get_download_series(queryset, period, 'release__version'):
+            releases[row.pop('release__version')].append(row)
+
+        return Response(
+            data={
+                'period': period,
+                'downloads': get_download_series(queryset, period),
+                'releases': releases,
+            }
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return the downloads for a single release."""
+        version = self.kwargs['version']
+        if not self.project.releases.filter(version=version).exists():
+            raise NotFound(detail='Invalid version.')
+
+        period = self.query['period']
+        return Response(
+            data={
+                'version': version,
+                'period': period,
+                'downloads': get_download_series(
+                    self.filter_queryset(self.get_queryset()).filter(
+                        release__version=version,
+                    ),
+                    period,
+                ),
+            }
+        )
@@ -4,20 +4,32 @@
 # IMPORTS
 # =============================================================================
 # Django
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
 from django.utils.functional import cached_property
 
 # Third Party Django
 from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import status
 from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+# App
+from project_manager.api.caching import (
+    get_response_cache_key,
+    get_response_etag,
+)
+
 
 # =============================================================================
 # ALL DECLARATION
 # =============================================================================
 __all__ = (
+    'CachedResponseMixin',
     'ProjectRelatedInfoMixin',
 )
 
@@ -25,6 +37,68 @@ __all__ = (
 # =============================================================================
 # MIXINS
 # =============================================================================
+class CachedResponseMixin:
+    """Mixin used to cache the data of list and retrieve responses.
+
+    Responses are cached until the generation of their scope is bumped by
+        a write to one of their models. Their ETag is derived from the same
+        cache key, so conditional requests are answered with a 304 before
+        the database or the serializer is used.
+    """
+
+    cached_formats = ('json',)
+
+    def list(self, request, *args, **kwargs):
+        """Return the cached list response, if there is one."""
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return the cached retrieve response, if there is one."""
+        return self.get_cached_response(
+            super().retrieve,
+            request,
+            *args,
+            **kwargs,
+        )
+
+    def get_cache_scopes(self):
+        """Return the scopes whose changes invalidate the response."""
+        return (self.queryset.model._meta.label_lower,)
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        """Return the response's cached data, or cache the handler's data.
+
+        The browsable API is not cached, as it renders page controls from
+            the paginator.
+        """
+        if request.accepted_renderer.format not in self.cached_formats:
+            return handler(request, *args, **kwargs)
+
+        cache_key = get_response_cache_key(
+            request=request,
+            scopes=self.get_cache_scopes(),
+        )
+        etag = get_response_etag(cache_key)
+        response = get_conditional_response(request=request, etag=etag)
+        if response is not None:
+            response['ETag'] = etag
+            return response
+
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data=data, headers={'ETag': etag})
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(
+                key=cache_key,
+                value=response.data,
+                timeout=settings.API_RESPONSE_CACHE_TIMEOUT,
+            )
+            response['ETag'] = etag
+        return response
+
+
 class ProjectRelatedInfoMixin(ModelViewSet):
     """Mixin used to retrieve information for a specific project."""
 
@@ -86,11 +160,15 @@ class ProjectRelatedInfoMixin(ModelViewSet):
             'slug': self.kwargs.get(project_slug)
         }
 
+    def get_project_lookup(self):
+        """Return the lookup that relates the queryset to the project."""
+        return self.project_type.replace('-', '_')
+
     def get_queryset(self):
         """Filter the queryset to only the ones for the current project."""
         queryset = super().get_queryset()
         kwargs = {
-            self.project_type.replace('-', '_'): self.project
+            self.get_project_lookup(): self.project
         }
         return queryset.filter(**kwargs)
 
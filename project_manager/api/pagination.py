@@ -3,23 +3,128 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
+# Django
+from django.db.models import QuerySet
+
 # Third Party Django
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 # =============================================================================
 # ALL DECLARATION
 # =============================================================================
 __all__ = (
+    'BaseCursorPagination',
     'BasePagination',
 )
 
 
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+# The query parameter value that selects cursor pagination
+CURSOR_PAGINATION_MODE = 'cursor'
+
+# Fields that are stable enough to use as the cursor's position
+CURSOR_ORDERING_FIELDS = (
+    'basename',
+    'created',
+    'name',
+    'updated',
+    'version',
+)
+
+
 # =============================================================================
 # CLASSES
 # =============================================================================
+class BaseCursorPagination(CursorPagination):
+    """Cursor Pagination for crawling lists without a count query.
+
+    The cursor is positioned on the first field of the view's ordering, and
+        the primary key is added as a tie-breaker so that the order is
+        stable between requests.
+    """
+
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        """Return the view's ordering with the primary key tie-breaker."""
+        if not isinstance(queryset, QuerySet) or not any(
+            hasattr(filter_class, 'get_ordering')
+            for filter_class in getattr(view, 'filter_backends', ())
+        ):
+            raise ValidationError({
+                'pagination': 'Cursor pagination is not available here.',
+            })
+
+        ordering = super().get_ordering(request, queryset, view)
+        field_name = ordering[0].lstrip('-')
+        if field_name not in CURSOR_ORDERING_FIELDS:
+            raise ValidationError({
+                'pagination': (
+                    f'Cursor pagination is not available when ordering by '
+                    f'"{field_name}".'
+                ),
+            })
+
+        pk_name = queryset.model._meta.pk.name
+        if any(item.lstrip('-') in ('pk', pk_name) for item in ordering):
+            return ordering
+        prefix = '-' if ordering[0].startswith('-') else ''
+        return ordering + (f'{prefix}{pk_name}',)
+
+
 class BasePagination(PageNumberPagination):
-    """Base Pagination for Project Manger."""
+    """Base Pagination for Project Manger.
+
+    Lists are paginated by page number, unless the request asks for cursor
+        pagination with "?pagination=cursor".
+    """
 
     page_size_query_param = 'page_size'
     max_page_size = 100
+    pagination_query_param = 'pagination'
+    cursor_pagination_class = BaseCursorPagination
+
+    cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate with the pagination mode selected by the request."""
+        if any([
+            request.query_params.get(
+                self.pagination_query_param
+            ) == CURSOR_PAGINATION_MODE,
+            self.cursor_pagination_class.cursor_query_param in (
+                request.query_params
+            ),
+        ]):
+            self.cursor_paginator = self.cursor_pagination_class()
+            page = self.cursor_paginator.paginate_queryset(
+                queryset=queryset,
+                request=request,
+                view=view,
+            )
+            self.display_page_controls = (
+                self.cursor_paginator.display_page_controls
+            )
+            return page
+        return super().paginate_queryset(
+            queryset=queryset,
+            request=request,
+            view=view,
+        )
+
+    def get_paginated_response(self, data):
+        """Return the response for the pagination mode in use."""
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        """Return the page controls for the pagination mode in use."""
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
@@ -0,0 +1,332 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.cache import cache
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.caching import (
+    bump_project_responses,
+    get_instance_scopes,
+    get_response_generations,
+)
+from project_manager.plugins.models import Plugin
+from test_utils.factories.games import GameFactory
+from test_utils.factories.plugins import (
+    PluginFactory,
+    PluginGameFactory,
+    PluginReleaseFactory,
+    PluginReleasePyPiRequirementFactory,
+    PluginTagFactory,
+)
+from test_utils.factories.sub_plugins import SubPluginFactory
+from test_utils.factories.tags import TagFactory
+from test_utils.factories.users import ForumUserFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class ResponseCacheTestCase(APITestCase):
+
+    plugin = other_plugin = release = None
+    list_path = reverse(viewname='api:plugins:projects-list')
+    detail_path = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.plugin = PluginFactory(basename='cached_plugin')
+        cls.other_plugin = PluginFactory(basename='other_plugin')
+        cls.release = PluginReleaseFactory(
+            plugin=cls.plugin,
+            version='1.0.0',
+            zip_file='/media/cached-plugin-v1.0.0.zip',
+        )
+        PluginReleaseFactory(
+            plugin=cls.other_plugin,
+            version='1.0.0',
+            zip_file='/media/other-plugin-v1.0.0.zip',
+        )
+        cls.detail_path = reverse(
+            viewname='api:plugins:projects-detail',
+            kwargs={
+                'pk': cls.plugin.slug,
+            },
+        )
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def get_content(self, path, queries, **kwargs):
+        with self.assertNumQueries(queries):
+            response = self.client.get(path=path, **kwargs)
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        return response.json()
+
+    def test_cached_list(self):
+        content = self.get_content(path=self.list_path, queries=4)
+        self.assertDictEqual(
+            d1=self.get_content(path=self.list_path, queries=0),
+            d2=content,
+        )
+
+        # Verify that the query string is part of the key, in any order
+        data = {'ordering': 'name', 'page_size': 1}
+        self.get_content(path=self.list_path, queries=4, data=data)
+        self.get_content(
+            path=f'{self.list_path}?page_size=1&ordering=name',
+            queries=0,
+        )
+
+    def test_cached_detail(self):
+        content = self.get_content(path=self.detail_path, queries=6)
+        self.assertDictEqual(
+            d1=self.get_content(path=self.detail_path, queries=0),
+            d2=content,
+        )
+
+    def test_invalidation(self):
+        self.get_content(path=self.list_path, queries=4)
+        self.get_content(path=self.detail_path, queries=6)
+
+        # Verify that another plugin only invalidates the list
+        self.other_plugin.synopsis = 'Updated synopsis'
+        self.other_plugin.save()
+        content = self.get_content(path=self.list_path, queries=4)
+        self.assertIn(
+            member='Updated synopsis',
+            container=[result['synopsis'] for result in content['results']],
+        )
+        self.get_content(path=self.detail_path, queries=0)
+
+        # Verify that the plugin's own changes invalidate its detail
+        self.plugin.synopsis = 'New synopsis'
+        self.plugin.save()
+        content = self.get_content(path=self.detail_path, queries=6)
+        self.assertEqual(first=content['synopsis'], second='New synopsis')
+
+        # Verify that release requirements invalidate the detail
+        PluginReleasePyPiRequirementFactory(plugin_release=self.release)
+        content = self.get_content(path=self.detail_path, queries=6)
+        self.assertEqual(
+            first=len(content['current_release']['pypi_requirements']),
+            second=1,
+        )
+
+        # Verify that the download counts invalidate the list and detail
+        self.get_content(path=self.list_path, queries=4)
+        bump_project_responses(
+            project_model=Plugin,
+            project_pks=[self.plugin.pk],
+        )
+        self.get_content(path=self.list_path, queries=4)
+        self.get_content(path=self.detail_path, queries=6)
+
+    def test_auth_classes(self):
+        self.get_content(path=self.list_path, queries=4)
+
+        # Verify that logged in users do not use the anonymous response
+        self.client.force_login(ForumUserFactory().user)
+        self.get_content(path=self.list_path, queries=6)
+        self.get_content(path=self.list_path, queries=2)
+
+    def test_browsable_api_not_cached(self):
+        for _ in range(2):
+            with self.assertNumQueries(4):
+                response = self.client.get(
+                    path=self.list_path,
+                    data={'format': 'api'},
+                )
+            self.assertEqual(
+                first=response.status_code,
+                second=status.HTTP_200_OK,
+            )
+
+    def test_errors_not_cached(self):
+        path = reverse(
+            viewname='api:plugins:projects-detail',
+            kwargs={
+                'pk': 'invalid',
+            },
+        )
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                response = self.client.get(path=path)
+            self.assertEqual(
+                first=response.status_code,
+                second=status.HTTP_404_NOT_FOUND,
+            )
+
+    def test_conditional_requests(self):
+        release_path = reverse(
+            viewname='api:plugins:releases-list',
+            kwargs={
+                'plugin_slug': self.plugin.slug,
+            },
+        )
+        for path, queries in (
+            (self.list_path, 4),
+            (self.detail_path, 6),
+            (release_path, 7),
+        ):
+            with self.assertNumQueries(queries):
+                response = self.client.get(path=path)
+            etag = response.headers['ETag']
+
+            # Verify that an unchanged response is not built again
+            with self.assertNumQueries(0):
+                response = self.client.get(
+                    path=path,
+                    HTTP_IF_NONE_MATCH=etag,
+                )
+            self.assertEqual(
+                first=response.status_code,
+                second=status.HTTP_304_NOT_MODIFIED,
+            )
+            self.assertEqual(first=response.headers['ETag'], second=etag)
+            self.assertEqual(first=response.content, second=b'')
+
+            # Verify that the cached response has the same ETag
+            response = self.client.get(path=path)
+            self.assertEqual(first=response.headers['ETag'], second=etag)
+
+        # Verify that a new release changes the ETags
+        PluginReleaseFactory(
+            plugin=self.plugin,
+            version='1.0.1',
+            zip_file='/media/cached-plugin-v1.0.1.zip',
+        )
+        for path in (self.list_path, self.detail_path, release_path):
+            response = self.client.get(path=path, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(
+                first=response.status_code,
+                second=status.HTTP_200_OK,
+            )
+            self.assertNotEqual(first=response.headers['ETag'], second=etag)
+
+    def test_user_invalidation(self):
+        etags = {}
+        for path in (self.list_path, self.detail_path):
+            etags[path] = self.client.get(path=path).headers['ETag']
+
+        # Verify that saving the user without a new username keeps the ETags
+        user = self.plugin.owner.user
+        user.save(update_fields=['last_login'])
+        for path, etag in etags.items():
+            response = self.client.get(path=path, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(
+                first=response.status_code,
+                second=status.HTTP_304_NOT_MODIFIED,
+            )
+
+        # Verify that renaming the owner changes the ETags
+        user.username = 'renamed_owner'
+        user.save()
+        for path, etag in etags.items():
+            response = self.client.get(path=path, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(
+                first=response.status_code,
+                second=status.HTTP_200_OK,
+            )
+            self.assertNotEqual(first=response.headers['ETag'], second=etag)
+        self.assertEqual(
+            first=response.json()['owner']['username'],
+            second='renamed_owner',
+        )
+
+    def test_game_and_tag_invalidation(self):
+        for viewname in ('api:games:games-list', 'api:tags:tags-list'):
+            self.get_content(path=reverse(viewname=viewname), queries=1)
+            self.get_content(path=reverse(viewname=viewname), queries=0)
+
+        PluginGameFactory(plugin=self.plugin, game=GameFactory())
+        PluginTagFactory(plugin=self.plugin, tag=TagFactory())
+        for viewname in ('api:games:games-list', 'api:tags:tags-list'):
+            content = self.get_content(
+                path=reverse(viewname=viewname),
+                queries=2,
+            )
+            self.assertEqual(first=content['count'], second=1)
+
+
+class ResponseCacheFunctionsTestCase(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_get_response_generations(self):
+        generations = get_response_generations(['first', 'second'])
+        self.assertEqual(first=len(generations), second=2)
+        self.assertListEqual(
+            list1=get_response_generations(['first', 'second']),
+            list2=generations,
+        )
+
+        bump_project_responses(project_model=Plugin, project_pks=['test'])
+        before = get_response_generations(
+            ['project_manager.plugin', 'project_manager.plugin:test'],
+        )
+        bump_project_responses(project_model=Plugin, project_pks=['test'])
+        after = get_response_generations(
+            ['project_manager.plugin', 'project_manager.plugin:test'],
+        )
+        self.assertListEqual(
+            list1=after,
+            list2=[generation + 1 for generation in before],
+        )
+
+    def test_get_instance_scopes(self):
+        plugin = PluginFactory(basename='test_plugin')
+        shared_scopes = ('games.game', 'tags.tag')
+        self.assertTupleEqual(
+            tuple1=get_instance_scopes(plugin),
+            tuple2=(
+                'project_manager.plugin',
+                f'project_manager.plugin:{plugin.pk}',
+                *shared_scopes,
+            ),
+        )
+
+        sub_plugin = SubPluginFactory(plugin=plugin)
+        self.assertTupleEqual(
+            tuple1=get_instance_scopes(sub_plugin),
+            tuple2=(
+                'project_manager.subplugin',
+                f'project_manager.subplugin:{sub_plugin.pk}',
+                *shared_scopes,
+            ),
+        )
+
+        game = GameFactory()
+        self.assertTupleEqual(
+            tuple1=get_instance_scopes(game),
+            tuple2=('games.game',),
+        )
+        self.assertTupleEqual(
+            tuple1=get_instance_scopes(
+                PluginGameFactory(plugin=plugin, game=game),
+            ),
+            tuple2=(
+                'project_manager.plugin',
+                f'project_manager.plugin:{plugin.pk}',
+                'games.game',
+            ),
+        )
+
+        release = PluginReleaseFactory(plugin=plugin)
+        self.assertTupleEqual(
+            tuple1=get_instance_scopes(
+                PluginReleasePyPiRequirementFactory(plugin_release=release),
+            ),
+            tuple2=(
+                'project_manager.plugin',
+                f'project_manager.plugin:{plugin.pk}',
+            ),
+        )
@@ -0,0 +1,184 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.db import connection
+from django.test import override_settings
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.pagination import BaseCursorPagination, BasePagination
+from test_utils.factories.packages import PackageFactory
+from test_utils.factories.plugins import PluginFactory, PluginReleaseFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class BasePaginationTestCase(APITestCase):
+
+    plugins = None
+    list_path = reverse(viewname='api:plugins:projects-list')
+
+    @classmethod
+    def setUpTestData(cls):
+        # Duplicate names verify that the primary key breaks the ties
+        cls.plugins = [
+            PluginFactory(name=name, basename=basename)
+            for name, basename in (
+                ('Plugin B', 'plugin_b'),
+                ('Plugin A', 'plugin_a'),
+                ('Plugin B', 'plugin_c'),
+                ('Plugin C', 'plugin_d'),
+                ('Plugin B', 'plugin_e'),
+            )
+        ]
+        for plugin in cls.plugins:
+            PluginReleaseFactory(
+                plugin=plugin,
+                version='1.0.0',
+                zip_file=f'/media/{plugin.slug}-v1.0.0.zip',
+            )
+
+    def get_all_pages(self, path, data=None, key='slug'):
+        values = []
+        while path is not None:
+            response = self.client.get(path=path, data=data)
+            self.assertEqual(
+                first=response.status_code,
+                second=status.HTTP_200_OK,
+            )
+            content = response.json()
+            self.assertNotIn(member='count', container=content)
+            values.extend(result[key] for result in content['results'])
+            path, data = content['next'], None
+        return values
+
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(BasePagination, PageNumberPagination),
+        )
+        self.assertTrue(
+            expr=issubclass(BaseCursorPagination, CursorPagination),
+        )
+
+    def test_base_attributes(self):
+        self.assertEqual(first=BasePagination.page_size_query_param, second='page_size')
+        self.assertEqual(first=BasePagination.max_page_size, second=100)
+        self.assertEqual(first=BasePagination.pagination_query_param, second='pagination')
+        self.assertIs(
+            expr1=BasePagination.cursor_pagination_class,
+            expr2=BaseCursorPagination,
+        )
+
+    def test_cursor_pagination(self):
+        for ordering in ('name', '-name', 'basename', '-created', 'updated'):
+            with self.subTest(ordering=ordering):
+                reverse_order = ordering.startswith('-')
+                field_name = ordering.lstrip('-')
+                expected = [
+                    plugin.slug for plugin in sorted(
+                        self.plugins,
+                        key=lambda plugin: (
+                            getattr(plugin, field_name),
+                            plugin.slug,
+                        ),
+                        reverse=reverse_order,
+                    )
+                ]
+                self.assertListEqual(
+                    list1=self.get_all_pages(
+                        path=self.list_path,
+                        data={
+                            'pagination': 'cursor',
+                            'ordering': ordering,
+                            'page_size': 2,
+                        },
+                    ),
+                    list2=expected,
+                )
+
+    @override_settings(DEBUG=True)
+    def test_cursor_pagination_skips_count(self):
+        response = self.client.get(
+            path=self.list_path,
+            data={'pagination': 'cursor', 'page_size': 2},
+        )
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        self.assertFalse(
+            expr=any(
+                'COUNT(' in query['sql'] for query in connection.queries
+            ),
+        )
+        content = response.json()
+        self.assertIsNone(obj=content['previous'])
+        self.assertIn(member='cursor=', container=content['next'])
+
+        # Verify that page number pagination is still the default
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(first=response.json()['count'], second=5)
+
+    def test_cursor_pagination_failure(self):
+        response = self.client.get(
+            path=self.list_path,
+            data={'pagination': 'cursor', 'ordering': 'total_downloads'},
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={
+                'pagination': (
+                    'Cursor pagination is not available when ordering by '
+                    '"total_downloads".'
+                ),
+            },
+        )
+
+        # Verify that lists that are not querysets cannot use a cursor
+        response = self.client.get(
+            path=reverse(
+                viewname='api:packages:dependents-list',
+                kwargs={'package_slug': PackageFactory().slug},
+            ),
+            data={'pagination': 'cursor'},
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'pagination': 'Cursor pagination is not available here.'},
+        )
+
+    def test_release_cursor_pagination(self):
+        plugin = self.plugins[0]
+        for version in ('1.2.0', '1.1.0', '1.3.0'):
+            PluginReleaseFactory(
+                plugin=plugin,
+                version=version,
+                zip_file=f'/media/{plugin.slug}-v{version}.zip',
+            )
+        self.assertListEqual(
+            list1=self.get_all_pages(
+                path=reverse(
+                    viewname='api:plugins:releases-list',
+                    kwargs={'plugin_slug': plugin.slug},
+                ),
+                data={
+                    'pagination': 'cursor',
+                    'ordering': 'version',
+                    'page_size': 1,
+                },
+                key='version',
+            ),
+            list2=['1.0.0', '1.1.0', '1.2.0', '1.3.0'],
+        )
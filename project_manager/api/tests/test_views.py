@@ -1,6 +1,12 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
+# Python
+import json
+
+# Django
+from django.test import override_settings
+
 # Third Party Django
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -8,7 +14,15 @@ from rest_framework.test import APITestCase
 from rest_framework.views import APIView
 
 # App
-from project_manager.api.views import ProjectManagerAPIView
+from project_manager.api.views import (
+    ExportAPIView,
+    ProjectManagerAPIView,
+    SyncAPIView,
+)
+from project_manager.models import SyncChange
+from test_utils.factories.plugins import PluginFactory, PluginTagFactory
+from test_utils.factories.tags import TagFactory
+from test_utils.factories.users import AdminUserFactory, ForumUserFactory
 
 
 # =============================================================================
@@ -38,6 +52,10 @@ class ProjectManagerAPIViewTestCase(APITestCase):
         self.assertDictEqual(
             d1=response.json(),
             d2={
+                'export': reverse(
+                    viewname='api:export',
+                    request=response.wsgi_request,
+                ),
                 'games': reverse(
                     viewname='api:games:games-list',
                     request=response.wsgi_request,
@@ -54,6 +72,10 @@ class ProjectManagerAPIViewTestCase(APITestCase):
                     viewname='api:sub-plugins:endpoints',
                     request=response.wsgi_request,
                 ),
+                'sync': reverse(
+                    viewname='api:sync',
+                    request=response.wsgi_request,
+                ),
                 'tags': reverse(
                     viewname='api:tags:tags-list',
                     request=response.wsgi_request,
@@ -75,3 +97,147 @@ class ProjectManagerAPIViewTestCase(APITestCase):
             first=response.json()['name'],
             second='Project Manager APIs',
         )
+
+
+@override_settings(SYNC_CHANGE_COMMIT_LAG=0)
+class SyncAPIViewTestCase(APITestCase):
+
+    sync_path = reverse(
+        viewname='api:sync',
+    )
+
+    def test_class_inheritance(self):
+        self.assertTrue(expr=issubclass(SyncAPIView, APIView))
+
+    def test_allowed_methods(self):
+        self.assertListEqual(
+            list1=SyncAPIView().allowed_methods,
+            list2=['GET', 'OPTIONS'],
+        )
+
+    def test_get(self):
+        plugin = PluginFactory(basename='test_plugin')
+        response = self.client.get(path=self.sync_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        content = response.json()
+        self.assertEqual(
+            first=content['token'],
+            second=str(SyncChange.objects.latest('pk').pk),
+        )
+        self.assertFalse(expr=content['more'])
+        self.assertListEqual(
+            list1=[project['project'] for project in content['projects']],
+            list2=[plugin.pk],
+        )
+
+        # Verify that the token returns only the newer changes
+        tag = PluginTagFactory(plugin=plugin, tag=TagFactory(name='test_tag'))
+        response = self.client.get(
+            path=self.sync_path,
+            data={'since': content['token']},
+        )
+        content = response.json()
+        self.assertListEqual(list1=content['projects'], list2=[])
+        self.assertListEqual(
+            list1=content['tags'],
+            list2=[{
+                'project_type': 'plugin',
+                'project': plugin.pk,
+                'tag': 'test_tag',
+            }],
+        )
+
+        tag.delete()
+        response = self.client.get(
+            path=self.sync_path,
+            data={'since': content['token']},
+        )
+        content = response.json()
+        self.assertListEqual(list1=content['tags'], list2=[])
+        self.assertListEqual(
+            list1=content['deleted'],
+            list2=[{
+                'object_type': 'tag',
+                'project_type': 'plugin',
+                'project': plugin.pk,
+                'key': 'test_tag',
+            }],
+        )
+
+    def test_get_failure(self):
+        response = self.client.get(
+            path=self.sync_path,
+            data={'since': 'invalid'},
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'since': 'Must be a sync token or an ISO 8601 timestamp.'},
+        )
+
+    def test_options(self):
+        response = self.client.options(path=self.sync_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            first=response.json()['name'],
+            second='Sync',
+        )
+
+
+class ExportAPIViewTestCase(APITestCase):
+
+    export_path = reverse(
+        viewname='api:export',
+    )
+
+    def test_class_inheritance(self):
+        self.assertTrue(expr=issubclass(ExportAPIView, APIView))
+
+    def test_allowed_methods(self):
+        self.assertListEqual(
+            list1=ExportAPIView().allowed_methods,
+            list2=['GET', 'OPTIONS'],
+        )
+
+    def test_get(self):
+        plugin = PluginFactory(basename='test_plugin')
+        PluginTagFactory(plugin=plugin, tag=TagFactory(name='test_tag'))
+        self.client.force_login(AdminUserFactory())
+        response = self.client.get(path=self.export_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            first=response.headers['Content-Type'],
+            second='application/x-ndjson',
+        )
+        self.assertTrue(expr=response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(first=len(lines), second=1)
+        record = json.loads(lines[0])
+        self.assertEqual(first=record['slug'], second=plugin.slug)
+        self.assertListEqual(list1=record['tags'], list2=['test_tag'])
+
+    def test_get_failure(self):
+        response = self.client.get(path=self.export_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_403_FORBIDDEN,
+        )
+
+        self.client.force_login(ForumUserFactory().user)
+        response = self.client.get(path=self.export_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_403_FORBIDDEN,
+        )
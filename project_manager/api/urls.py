@@ -7,7 +7,11 @@
 from django.urls import include, path
 
 # App
-from project_manager.api.views import ProjectManagerAPIView
+from project_manager.api.views import (
+    ExportAPIView,
+    ProjectManagerAPIView,
+    SyncAPIView,
+)
 
 
 # =============================================================================
@@ -16,6 +20,11 @@ from project_manager.api.views import ProjectManagerAPIView
 app_name = 'api'
 
 urlpatterns = [
+    path(
+        route='export/',
+        view=ExportAPIView.as_view(),
+        name='export',
+    ),
     path(
         route='games/',
         view=include(
@@ -44,6 +53,11 @@ urlpatterns = [
             namespace='sub-plugins',
         ),
     ),
+    path(
+        route='sync/',
+        view=SyncAPIView.as_view(),
+        name='sync',
+    ),
     path(
         route='tags/',
         view=include(
@@ -3,17 +3,28 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
+# Django
+from django.http import StreamingHttpResponse
+
 # Third Party Django
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 
+# App
+from project_manager.export import iter_export_lines
+from project_manager.sync import get_sync_changes, get_sync_start
+
 
 # =============================================================================
 # ALL DECLARATION
 # =============================================================================
 __all__ = (
+    'ExportAPIView',
     'ProjectManagerAPIView',
+    'SyncAPIView',
 )
 
 
@@ -27,6 +38,10 @@ class ProjectManagerAPIView(APIView):
     def get(request):
         """Retrieve the API endpoints."""
         data = {
+            'export': reverse(
+                viewname='api:export',
+                request=request,
+            ),
             'games': reverse(
                 viewname='api:games:games-list',
                 request=request,
@@ -43,6 +58,10 @@ class ProjectManagerAPIView(APIView):
                 viewname='api:sub-plugins:endpoints',
                 request=request,
             ),
+            'sync': reverse(
+                viewname='api:sync',
+                request=request,
+            ),
             'tags': reverse(
                 viewname='api:tags:tags-list',
                 request=request,
@@ -58,3 +77,67 @@ class ProjectManagerAPIView(APIView):
     def get_view_name(self):
         """Return the base API name."""
         return 'Project Manager APIs'
+
+
+class SyncAPIView(APIView):
+    """Projects, releases, tags, and games changed since a sync token.
+
+    ###Available Filters:
+    *  **since**=*{token}* or *{timestamp}*
+        * Returns the changes after the token returned by the previous
+            sync, or after an ISO 8601 timestamp. Every recorded change is
+            returned without it.
+
+        ####Example:
+        `?since=1024`
+
+        `?since=2023-01-31T12:00:00Z`
+
+    The **token** in the response is the **since** value for the next
+    sync, and **more** is true when more changes are waiting. Deleted
+    projects, releases, tags, and games are listed in **deleted**. Changes
+    are only returned once they are a few seconds old.
+    """
+
+    http_method_names = ('get', 'options')
+
+    @staticmethod
+    def get(request):
+        """Return the changes since the given token or timestamp."""
+        start = get_sync_start(request.query_params.get('since', '0'))
+        if start is None:
+            raise ValidationError({
+                'since': 'Must be a sync token or an ISO 8601 timestamp.',
+            })
+        return Response(data=get_sync_changes(start=start))
+
+    def get_view_name(self):
+        """Return the sync API name."""
+        return 'Sync'
+
+
+class ExportAPIView(APIView):
+    """Every project, with its releases, as newline delimited JSON.
+
+    Each line is one package, plugin, or sub-plugin with its contributors,
+    tags, games, and releases, and each release with its requirements. The
+    export is streamed, and is only available to staff users.
+    """
+
+    http_method_names = ('get', 'options')
+    permission_classes = (IsAdminUser,)
+
+    @staticmethod
+    def get(request):
+        """Stream the export of every project."""
+        return StreamingHttpResponse(
+            streaming_content=iter_export_lines(),
+            content_type='application/x-ndjson',
+            headers={
+                'Content-Disposition': 'attachment; filename="projects.ndjson"',
+            },
+        )
+
+    def get_view_name(self):
+        """Return the export API name."""
+        return 'Export'
@@ -3,8 +3,14 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
+# Python
+import atexit
+
 # Django
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.checks import Tags, register
+from django.db.models.signals import post_delete, post_save
 
 
 # =============================================================================
@@ -23,3 +29,153 @@ class ProjectManagerConfig(AppConfig):
 
     name = 'project_manager'
     verbose_name = 'Project Manager'
+
+    def ready(self):
+        """Register the download counter, checks, and model signal handlers."""
+        # pylint: disable=import-outside-toplevel
+        from project_manager.checks import check_shared_cache
+        from project_manager.downloads.counters import download_counter
+        from project_manager.downloads.helpers import clear_cached_release
+        from project_manager.helpers import update_project_release_stats
+        from project_manager.packages.dependents import (
+            delete_package_dependent,
+            update_package_dependent,
+        )
+        from project_manager.packages.resolution import (
+            bump_resolution_generation,
+        )
+        from project_manager.packages.versions import (
+            clear_cached_package_versions,
+        )
+        from project_manager.statistics import (
+            add_release_statistics,
+            remove_release_statistics,
+            update_statistics_users,
+        )
+        atexit.register(download_counter.shutdown)
+        register(check_shared_cache, Tags.caches)
+        for model_name in (
+            'PackageRelease',
+            'PluginRelease',
+            'SubPluginRelease',
+        ):
+            model = self.get_model(model_name)
+            post_save.connect(receiver=clear_cached_release, sender=model)
+            post_delete.connect(receiver=clear_cached_release, sender=model)
+            post_save.connect(
+                receiver=update_project_release_stats,
+                sender=model,
+            )
+            post_delete.connect(
+                receiver=update_project_release_stats,
+                sender=model,
+            )
+            post_save.connect(receiver=bump_resolution_generation, sender=model)
+            post_delete.connect(
+                receiver=bump_resolution_generation,
+                sender=model,
+            )
+            post_save.connect(receiver=add_release_statistics, sender=model)
+            post_delete.connect(
+                receiver=remove_release_statistics,
+                sender=model,
+            )
+
+            # Keep the Package dependents index in sync with the requirements
+            model = self.get_model(f'{model_name}PackageRequirement')
+            post_save.connect(receiver=update_package_dependent, sender=model)
+            post_delete.connect(receiver=delete_package_dependent, sender=model)
+
+        model = self.get_model('PackageRelease')
+        for signal in (post_save, post_delete):
+            signal.connect(
+                receiver=clear_cached_package_versions,
+                sender=model,
+            )
+
+        # Recount the active users when owners or contributors may change
+        for model in (
+            self.get_model('Package'),
+            self.get_model('PackageContributor'),
+            self.get_model('Plugin'),
+            self.get_model('PluginContributor'),
+            self.get_model('SubPlugin'),
+            self.get_model('SubPluginContributor'),
+        ):
+            for signal in (post_save, post_delete):
+                signal.connect(receiver=update_statistics_users, sender=model)
+
+        # Deleting a forum user removes them as an owner without a signal
+        post_delete.connect(
+            receiver=update_statistics_users,
+            sender='users.ForumUser',
+        )
+
+        self.connect_response_cache()
+        self.connect_sync_changes()
+        self.connect_catalog()
+
+    def connect_response_cache(self):
+        """Invalidate the cached API responses that include written rows."""
+        # pylint: disable=import-outside-toplevel
+        from project_manager.api.caching import (
+            bump_cached_responses,
+            bump_user_responses,
+        )
+        for model_name in ('Package', 'Plugin', 'SubPlugin'):
+            for suffix in ('', 'Contributor', 'Game', 'Image', 'Release', 'Tag'):
+                for signal in (post_save, post_delete):
+                    signal.connect(
+                        receiver=bump_cached_responses,
+                        sender=self.get_model(f'{model_name}{suffix}'),
+                    )
+            for suffix in (
+                'DownloadRequirement',
+                'PackageRequirement',
+                'PyPiRequirement',
+                'VersionControlRequirement',
+            ):
+                for signal in (post_save, post_delete):
+                    signal.connect(
+                        receiver=bump_cached_responses,
+                        sender=self.get_model(f'{model_name}Release{suffix}'),
+                    )
+        for sender in ('games.Game', 'tags.Tag'):
+            for signal in (post_save, post_delete):
+                signal.connect(receiver=bump_cached_responses, sender=sender)
+
+        # Projects and releases include the names of their users
+        for sender in ('users.ForumUser', settings.AUTH_USER_MODEL):
+            post_save.connect(receiver=bump_user_responses, sender=sender)
+
+    def connect_sync_changes(self):
+        """Record the changes and deletions served by the sync API."""
+        # pylint: disable=import-outside-toplevel
+        from project_manager.sync import (
+            record_sync_change,
+            record_sync_deletion,
+        )
+        for model_name in ('Package', 'Plugin', 'SubPlugin'):
+            for suffix in ('', 'Game', 'Release', 'Tag'):
+                model = self.get_model(f'{model_name}{suffix}')
+                post_save.connect(receiver=record_sync_change, sender=model)
+                post_delete.connect(receiver=record_sync_deletion, sender=model)
+
+    def connect_catalog(self):
+        """Update the catalog index when a project's current release changes."""
+        # pylint: disable=import-outside-toplevel
+        from project_manager.catalog import update_catalog
+        for model_name in ('Package', 'Plugin', 'SubPlugin'):
+            for suffix in (
+                '',
+                'Release',
+                'ReleaseDownloadRequirement',
+                'ReleasePackageRequirement',
+                'ReleasePyPiRequirement',
+                'ReleaseVersionControlRequirement',
+            ):
+                for signal in (post_save, post_delete):
+                    signal.connect(
+                        receiver=update_catalog,
+                        sender=self.get_model(f'{model_name}{suffix}'),
+                    )
@@ -0,0 +1,306 @@
+"""Static JSON catalog of every project's current release."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import gzip
+import json
+import os
+from collections import defaultdict
+from functools import partial
+from weakref import WeakKeyDictionary
+
+# Django
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F
+from django.utils.timezone import now
+
+# App
+from project_manager.helpers import get_release_project_field, lock_file
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'CATALOG_PROJECT_SECTIONS',
+    'build_catalog',
+    'get_catalog_entries',
+    'get_catalog_file',
+    'update_catalog',
+    'update_catalog_projects',
+    'write_catalog',
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+# The catalog section of each project model
+CATALOG_PROJECT_SECTIONS = {
+    'Package': 'packages',
+    'Plugin': 'plugins',
+    'SubPlugin': 'sub-plugins',
+}
+
+# The through model suffix, and the catalog keys and the fields they are
+#   loaded from, of each requirement group
+CATALOG_REQUIREMENT_FIELDS = {
+    'packages': (
+        'PackageRequirement',
+        (
+            ('slug', 'package_requirement_id'),
+            ('version', 'version'),
+            ('optional', 'optional'),
+        ),
+    ),
+    'pypi': (
+        'PyPiRequirement',
+        (
+            ('name', 'pypi_requirement__name'),
+            ('version', 'version'),
+            ('optional', 'optional'),
+        ),
+    ),
+    'vcs': (
+        'VersionControlRequirement',
+        (
+            ('url', 'vcs_requirement__url'),
+            ('version', 'version'),
+            ('optional', 'optional'),
+        ),
+    ),
+    'download': (
+        'DownloadRequirement',
+        (
+            ('url', 'download_requirement__url'),
+            ('optional', 'optional'),
+        ),
+    ),
+}
+
+# The on commit callback, and the projects it updates, of each connection's
+#   current transaction
+_catalog_updates = WeakKeyDictionary()
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def get_catalog_file():
+    """Return the path of the catalog index file."""
+    return settings.MEDIA_ROOT / settings.CATALOG_INDEX_FILE
+
+
+def build_catalog():
+    """Return the catalog of every project that has a current release."""
+    catalog = {
+        'generated': now(),
+    }
+    for model_name, section in CATALOG_PROJECT_SECTIONS.items():
+        catalog[section] = get_catalog_entries(model_name=model_name)
+    return catalog
+
+
+def get_catalog_entries(model_name, project_pks=None):
+    """Return the catalog entries of the project type, by project pk.
+
+    Only the projects with a current release are included, and all of the
+        releases' requirements are loaded with one query per group.
+    """
+    release_model = apps.get_model(
+        app_label='project_manager',
+        model_name=f'{model_name}Release',
+    )
+    project_field = get_release_project_field(release_model)
+    releases = release_model.objects.filter(
+        version=F(f'{project_field}__current_version'),
+    ).select_related(project_field)
+    if project_pks is not None:
+        releases = releases.filter(**{f'{project_field}__in': project_pks})
+    releases = list(releases.order_by(project_field))
+    requirements = _get_requirements(
+        release_model=release_model,
+        release_ids=[release.pk for release in releases],
+    )
+
+    entries = {}
+    for release in releases:
+        project = getattr(release, project_field)
+        entries[project.pk] = {
+            'name': project.name,
+            'basename': project.basename,
+            'version': release.version,
+            'created': release.created,
+            'url': release.get_absolute_url(),
+            'file_hash': release.file_hash,
+            'requirements': requirements.get(release.pk, {}),
+        }
+    return entries
+
+
+def write_catalog(catalog):
+    """Write the catalog and its gzipped copy.
+
+    Each file is written to a temporary file first and then moved into
+        place, so that clients never download a partially written catalog.
+        Writes are serialized, across processes, by a lock file next to the
+        catalog.
+    """
+    with lock_file(_get_lock_file()):
+        _write_catalog(catalog=catalog)
+
+
+def update_catalog(instance, **kwargs):
+    """Update the catalog entry of the written instance's project on commit.
+
+    Nothing is written until the catalog has been built by the build_catalog
+        command. The projects written in a transaction are collected, so
+        that the catalog is only rewritten once when it is committed.
+    """
+    if not get_catalog_file().isfile():
+        return
+
+    project = _get_instance_project(instance)
+    if project is None:
+        return
+
+    connection = transaction.get_connection()
+    callback, projects = _catalog_updates.get(connection, (None, None))
+    if callback is not None and any(
+        entry[1] is callback for entry in connection.run_on_commit
+    ):
+        projects.add(project)
+        return
+
+    projects = {project}
+    callback = partial(_apply_catalog_updates, connection, projects)
+    _catalog_updates[connection] = (callback, projects)
+    transaction.on_commit(callback)
+
+
+def update_catalog_projects(projects):
+    """Replace the given projects' catalog entries with their current release.
+
+    The projects are (model name, pk) pairs. The catalog is read and written
+        while holding its lock, so that the updates of other processes are
+        not lost.
+    """
+    catalog_file = get_catalog_file()
+    if not catalog_file.isfile():
+        return
+
+    project_pks = defaultdict(list)
+    for model_name, project_pk in projects:
+        project_pks[model_name].append(project_pk)
+
+    with lock_file(_get_lock_file()):
+        if not catalog_file.isfile():
+            return
+
+        with catalog_file.open() as open_file:
+            catalog = json.load(open_file)
+        for model_name, pks in project_pks.items():
+            section = catalog[CATALOG_PROJECT_SECTIONS[model_name]]
+            for project_pk in pks:
+                section.pop(project_pk, None)
+            section.update(
+                get_catalog_entries(
+                    model_name=model_name,
+                    project_pks=pks,
+                )
+            )
+        catalog['generated'] = now()
+        _write_catalog(catalog=catalog)
+
+
+def _apply_catalog_updates(connection, projects):
+    """Write the projects collected for the committed transaction."""
+    if _catalog_updates.get(connection, (None, None))[1] is projects:
+        del _catalog_updates[connection]
+    update_catalog_projects(projects=projects)
+
+
+def _get_requirements(release_model, release_ids):
+    """Return the requirements of the given releases, by release id."""
+    requirements = defaultdict(dict)
+    for group, (suffix, fields) in CATALOG_REQUIREMENT_FIELDS.items():
+        model = apps.get_model(
+            app_label='project_manager',
+            model_name=f'{release_model.__name__}{suffix}',
+        )
+        release_field = next(
+            field.attname for field in model._meta.fields
+            if field.related_model is release_model
+        )
+        field_names = [field_name for _, field_name in fields]
+        for row in model.objects.filter(
+            **{f'{release_field}__in': release_ids}
+        ).order_by(*field_names).values(release_field, *field_names):
+            requirements[row[release_field]].setdefault(group, []).append({
+                key: row[field_name] for key, field_name in fields
+            })
+    return requirements
+
+
+def _get_instance_project(instance):
+    """Return the model name and pk of the instance's project.
+
+    None is returned for the requirements of a release that was already
+        deleted, as the release's own deletion updates the catalog.
+    """
+    model = instance.__class__
+    if model.__name__ in CATALOG_PROJECT_SECTIONS:
+        return model.__name__, instance.pk
+
+    if hasattr(model, 'project_class'):
+        return model.project_class.__name__, getattr(
+            instance,
+            f'{get_release_project_field(model)}_id',
+        )
+
+    release_field = next(
+        field for field in model._meta.fields
+        if hasattr(field.related_model, 'project_class')
+    )
+    release_model = release_field.related_model
+    project_pk = release_model.objects.filter(
+        pk=getattr(instance, release_field.attname),
+    ).values_list(
+        f'{get_release_project_field(release_model)}_id',
+        flat=True,
+    ).first()
+    if project_pk is None:
+        return None
+    return release_model.project_class.__name__, project_pk
+
+
+def _get_lock_file():
+    catalog_file = get_catalog_file()
+    return catalog_file.parent / f'{catalog_file.name}.lock'
+
+
+def _write_catalog(catalog):
+    catalog_file = get_catalog_file()
+    catalog_file.parent.makedirs_p()
+    content = json.dumps(
+        catalog,
+        cls=DjangoJSONEncoder,
+        separators=(',', ':'),
+        sort_keys=True,
+    ).encode()
+    _replace_file(
+        path=catalog_file.parent / f'{catalog_file.name}.gz',
+        content=gzip.compress(content, mtime=0),
+    )
+    _replace_file(path=catalog_file, content=content)
+
+
+def _replace_file(path, content):
+    temp_file = path.parent / f'{path.name}.{os.getpid()}'
+    temp_file.write_bytes(content)
+    os.replace(temp_file, path)
@@ -0,0 +1,46 @@
+"""System checks for the project manager's deployment settings."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'check_shared_cache',
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def check_shared_cache(**kwargs):
+    """Return an error when the default cache is local to each process.
+
+    The API responses' ETags are derived from generations stored in the
+        cache, so with a cache per process a worker that did not handle a
+        write keeps answering conditional requests with a 304.
+    """
+    if settings.DEBUG:
+        return []
+
+    if not isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache):
+        return []
+
+    return [
+        Error(
+            'The default cache is local to each process.',
+            hint=(
+                'Configure a cache that is shared by every worker process, '
+                'such as the file based, Memcached, or Redis cache.'
+            ),
+            id='project_manager.E001',
+        )
+    ]
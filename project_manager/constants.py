@@ -29,6 +29,17 @@ __all__ = (
     'RELEASE_URL',
     'RELEASE_VERSION_MAX_LENGTH',
     'RELEASE_VERSION_REGEX',
+    'REQUIREMENT_SPECIFIER_MAX_LENGTH',
+    'RESPONSE_CACHE_KEY_PREFIX',
+    'RESPONSE_CACHE_PROJECT_SCOPES',
+    'RESPONSE_CACHE_SHARED_SCOPES',
+    'RESPONSE_GENERATION_KEY_PREFIX',
+    'STATISTICS_PROJECT_TYPES',
+    'STATISTICS_SNAPSHOT_PK',
+    'SYNC_CHANGE_LIMIT',
+    'SYNC_OBJECT_TYPES',
+    'SYNC_PROJECT_TYPES',
+    'SYNC_RELATED_OBJECTS',
     'VCS_REQUIREMENT_TYPES',
     'WIKI_URL',
 )
@@ -47,6 +58,7 @@ PROJECT_SYNOPSIS_MAX_LENGTH = 128
 RELEASE_NOTES_MAX_LENGTH = 512
 RELEASE_VERSION_MAX_LENGTH = 8
 RELEASE_VERSION_REGEX = r'[0-9][0-9a-z.]*[0-9a-z]'
+REQUIREMENT_SPECIFIER_MAX_LENGTH = 64
 
 # Maximum allowed width and height for all logo files
 LOGO_MAX_WIDTH = 200
@@ -59,6 +71,51 @@ IMAGE_MAX_HEIGHT = 400
 # Maximum number of images allowed per package, plugin, or sub-plugin
 MAX_IMAGES = 10
 
+# The model name and StatisticsSnapshot field prefix of each project type
+STATISTICS_PROJECT_TYPES = (
+    ('Package', 'package'),
+    ('Plugin', 'plugin'),
+    ('SubPlugin', 'sub_plugin'),
+)
+STATISTICS_SNAPSHOT_PK = 1
+
+# The types of changes recorded for the sync API
+SYNC_OBJECT_TYPES = (
+    ('project', 'Project'),
+    ('release', 'Release'),
+    ('tag', 'Tag'),
+    ('game', 'Game'),
+)
+# The sync API's project type of each project model
+SYNC_PROJECT_TYPES = {
+    'Package': 'package',
+    'Plugin': 'plugin',
+    'SubPlugin': 'sub-plugin',
+}
+# The object type and key field of each project's related model suffix
+SYNC_RELATED_OBJECTS = {
+    'Release': ('release', 'version'),
+    'Tag': ('tag', 'tag_id'),
+    'Game': ('game', 'game_id'),
+}
+# Maximum number of recorded changes returned by a single sync request
+SYNC_CHANGE_LIMIT = 500
+
+# Cached API responses are keyed on the generation of their scope, which is
+#   the label of the model they list, or the label and pk of a single project
+RESPONSE_CACHE_KEY_PREFIX = 'api-response'
+RESPONSE_GENERATION_KEY_PREFIX = 'api-response-generation'
+RESPONSE_CACHE_PROJECT_SCOPES = (
+    'project_manager.package',
+    'project_manager.plugin',
+    'project_manager.subplugin',
+)
+# Game and Tag responses list the names of their projects
+RESPONSE_CACHE_SHARED_SCOPES = (
+    'games.game',
+    'tags.tag',
+)
+
 # URLs
 IMAGE_URL = 'images/'
 LOGO_URL = 'logos/'
@@ -0,0 +1 @@
+"""Release download app."""
@@ -0,0 +1,211 @@
+"""Backends used to serve release zip files."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from uuid import uuid4
+
+# Django
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.module_loading import import_string
+
+# App
+from project_manager.downloads.constants import ZIP_CONTENT_TYPE
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'BaseDownloadBackend',
+    'OffloadDownloadBackend',
+    'PythonDownloadBackend',
+    'XAccelRedirectDownloadBackend',
+    'XSendfileDownloadBackend',
+    'get_download_backend',
+)
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+# pylint: disable=too-few-public-methods
+class BaseDownloadBackend:
+    """Base class for returning the response for a release download."""
+
+    def get_response(self, full_path, relative_path, file_name, ranges=None):
+        """Return the response that sends the file to the client.
+
+        The given ranges are the satisfiable byte ranges from the request's
+            Range header, or None if the full file should be sent.
+        """
+        raise NotImplementedError(
+            f'Class "{self.__class__.__name__}" must implement a '
+            '"get_response" method.'
+        )
+
+
+class PythonDownloadBackend(BaseDownloadBackend):
+    """Stream the file through Python in chunks."""
+
+    def get_response(self, full_path, relative_path, file_name, ranges=None):
+        """Return a streaming response for the file or the given ranges."""
+        if not ranges:
+            response = FileResponse(
+                full_path.open('rb'),
+                as_attachment=True,
+                filename=file_name,
+                content_type=ZIP_CONTENT_TYPE,
+            )
+            response.block_size = settings.DOWNLOAD_CHUNK_SIZE
+        elif len(ranges) == 1:
+            response = self.get_single_range_response(
+                full_path=full_path,
+                byte_range=ranges[0],
+            )
+        else:
+            response = self.get_multiple_range_response(
+                full_path=full_path,
+                ranges=ranges,
+            )
+
+        if ranges:
+            response['Content-Disposition'] = (
+                f'attachment; filename="{file_name}"'
+            )
+        response['Accept-Ranges'] = 'bytes'
+        return response
+
+    def get_single_range_response(self, full_path, byte_range):
+        """Return a partial response for one byte range."""
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            streaming_content=self.iter_range(
+                full_path=full_path,
+                start=start,
+                end=end,
+            ),
+            status=206,
+            content_type=ZIP_CONTENT_TYPE,
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{full_path.size}'
+        response['Content-Length'] = end - start + 1
+        return response
+
+    def get_multiple_range_response(self, full_path, ranges):
+        """Return a multipart/byteranges response for the byte ranges."""
+        boundary = uuid4().hex
+        size = full_path.size
+        parts = [
+            (
+                (
+                    f'\r\n--{boundary}\r\n'
+                    f'Content-Type: {ZIP_CONTENT_TYPE}\r\n'
+                    f'Content-Range: bytes {start}-{end}/{size}\r\n\r\n'
+                ).encode(),
+                start,
+                end,
+            ) for start, end in ranges
+        ]
+        closing = f'\r\n--{boundary}--\r\n'.encode()
+
+        def iter_parts():
+            for header, start, end in parts:
+                yield header
+                yield from self.iter_range(
+                    full_path=full_path,
+                    start=start,
+                    end=end,
+                )
+            yield closing
+
+        response = StreamingHttpResponse(
+            streaming_content=iter_parts(),
+            status=206,
+            content_type=f'multipart/byteranges; boundary={boundary}',
+        )
+        response['Content-Length'] = sum(
+            len(header) + end - start + 1 for header, start, end in parts
+        ) + len(closing)
+        return response
+
+    @staticmethod
+    def iter_range(full_path, start, end):
+        """Yield the bytes of the file between start and end, inclusive."""
+        remaining = end - start + 1
+        with full_path.open('rb') as open_file:
+            open_file.seek(start)
+            while remaining > 0:
+                chunk = open_file.read(
+                    min(remaining, settings.DOWNLOAD_CHUNK_SIZE)
+                )
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+class OffloadDownloadBackend(BaseDownloadBackend):
+    """Base class for letting the web server send the file."""
+
+    @property
+    def header_name(self):
+        """Return the name of the header the web server listens for."""
+        raise NotImplementedError(
+            f'Class "{self.__class__.__name__}" must implement a '
+            '"header_name" attribute.'
+        )
+
+    def get_header_value(self, full_path, relative_path):
+        """Return the value for the offload header."""
+        raise NotImplementedError(
+            f'Class "{self.__class__.__name__}" must implement a '
+            '"get_header_value" method.'
+        )
+
+    def get_response(self, full_path, relative_path, file_name, ranges=None):
+        """Return an empty response the web server fills in.
+
+        The web server handles any Range header itself.
+        """
+        response = HttpResponse(content_type=ZIP_CONTENT_TYPE)
+        response['Content-Disposition'] = f'attachment; filename="{file_name}"'
+        response[self.header_name] = self.get_header_value(
+            full_path=full_path,
+            relative_path=relative_path,
+        )
+        return response
+
+
+class XAccelRedirectDownloadBackend(OffloadDownloadBackend):
+    """Internal redirect for nginx.
+
+    DOWNLOAD_OFFLOAD_PREFIX must point to an "internal" location that
+        aliases MEDIA_ROOT.
+    """
+
+    header_name = 'X-Accel-Redirect'
+
+    def get_header_value(self, full_path, relative_path):
+        """Return the internal location for the file."""
+        return f'{settings.DOWNLOAD_OFFLOAD_PREFIX}{relative_path}'
+
+
+class XSendfileDownloadBackend(OffloadDownloadBackend):
+    """Send the file using Apache's mod_xsendfile or lighttpd."""
+
+    header_name = 'X-Sendfile'
+
+    def get_header_value(self, full_path, relative_path):
+        """Return the absolute path to the file."""
+        return str(full_path.abspath())
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def get_download_backend():
+    """Return an instance of the backend from the DOWNLOAD_BACKEND setting."""
+    return import_string(settings.DOWNLOAD_BACKEND)()
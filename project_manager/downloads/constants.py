@@ -0,0 +1,36 @@
+"""Constants for use with release downloads."""
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'DOWNLOAD_PERIODS',
+    'DOWNLOAD_PERIOD_DAY',
+    'DOWNLOAD_PERIOD_MONTH',
+    'MAX_BYTE_RANGES',
+    'RECENT_DOWNLOAD_DAYS',
+    'RELEASE_CACHE_KEY_PREFIX',
+    'ZIP_CONTENT_TYPE',
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+# Requests asking for more ranges than this are sent the full file
+MAX_BYTE_RANGES = 16
+
+ZIP_CONTENT_TYPE = 'application/zip'
+
+RELEASE_CACHE_KEY_PREFIX = 'download-release'
+
+# Periods that download statistics are bucketed by
+DOWNLOAD_PERIOD_DAY = 'day'
+DOWNLOAD_PERIOD_MONTH = 'month'
+DOWNLOAD_PERIODS = (
+    (DOWNLOAD_PERIOD_DAY, 'Day'),
+    (DOWNLOAD_PERIOD_MONTH, 'Month'),
+)
+
+# Number of days included in recent download totals
+RECENT_DOWNLOAD_DAYS = 30
@@ -0,0 +1,257 @@
+"""Buffered download counts for release downloads."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import json
+import logging
+import os
+from collections import Counter, defaultdict
+from datetime import date
+from threading import Lock
+from time import monotonic
+
+# Django
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import (
+    Case,
+    F,
+    PositiveIntegerField,
+    Value,
+    When,
+)
+from django.utils.timezone import localdate
+
+# App
+from project_manager.api.caching import bump_project_responses
+from project_manager.downloads.constants import DOWNLOAD_PERIOD_DAY
+from project_manager.downloads.statistics import (
+    add_download_statistics,
+    get_statistic_model,
+)
+from project_manager.helpers import get_release_project_field, lock_file
+from project_manager.statistics import add_statistics_downloads
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'DownloadCounter',
+    'download_counter',
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+class DownloadCounter:
+    """Accumulate release downloads and write them in batches.
+
+    Downloads are counted per release and day, each flush adds them to the
+        release's download_count, its project's total_downloads, its daily
+        download statistics, and the statistics snapshot.
+    """
+
+    def __init__(self):
+        """Store the buffer and the time of the last flush."""
+        self._lock = Lock()
+        self._counts = Counter()
+        self._pending = 0
+        self._last_flush = monotonic()
+
+    @property
+    def pending(self):
+        """Return the number of downloads that have not been written."""
+        return self._pending
+
+    def increment(self, release):
+        """Add a download for the given release, flushing when one is due."""
+        key = (release._meta.label, str(release.pk), localdate().isoformat())
+        with self._lock:
+            self._counts[key] += 1
+            self._pending += 1
+            flush_due = any([
+                self._pending >= settings.DOWNLOAD_COUNT_FLUSH_THRESHOLD,
+                (
+                    monotonic() - self._last_flush >=
+                    settings.DOWNLOAD_COUNT_FLUSH_INTERVAL
+                ),
+            ])
+
+        if flush_due:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered counts and return the number written."""
+        self.load_spool()
+        counts = self._take()
+        if not counts:
+            return 0
+
+        try:
+            project_pks = {}
+            with transaction.atomic():
+                snapshot_counts = {}
+                for label, daily_counts in self._group(counts).items():
+                    model = apps.get_model(label)
+                    release_counts = Counter()
+                    for (pk, _), count in daily_counts.items():
+                        release_counts[pk] += count
+                    self._update(model=model, counts=release_counts)
+                    project_pks[model.project_class] = self._update_projects(
+                        model=model,
+                        release_counts=release_counts,
+                    )
+                    statistic_counts = {
+                        (pk, date.fromisoformat(day)): count
+                        for (pk, day), count in daily_counts.items()
+                    }
+                    add_download_statistics(
+                        model=get_statistic_model(model),
+                        period=DOWNLOAD_PERIOD_DAY,
+                        counts=statistic_counts,
+                    )
+                    snapshot_counts[model] = statistic_counts
+                add_statistics_downloads(counts=snapshot_counts)
+        except DatabaseError:
+            logger.exception(
+                'Unable to write %s download counts, they will be retried.',
+                sum(counts.values()),
+            )
+            self._restore(counts)
+            return 0
+
+        for project_model, pks in project_pks.items():
+            bump_project_responses(project_model=project_model, project_pks=pks)
+        return sum(counts.values())
+
+    def shutdown(self):
+        """Flush the buffer on exit, spooling anything that is not written."""
+        self.flush()
+        self.spool()
+
+    def spool(self):
+        """Add the buffered counts to the spool file."""
+        counts = self._take()
+        if not counts:
+            return
+
+        spool_file = settings.DOWNLOAD_COUNT_SPOOL_FILE
+        with lock_file(self._get_spool_lock_file()):
+            if spool_file.isfile():
+                with spool_file.open() as open_file:
+                    counts.update(self._from_json(json.load(open_file)))
+
+            temp_file = spool_file.parent / f'{spool_file.name}.{os.getpid()}'
+            with temp_file.open('w') as open_file:
+                json.dump(
+                    [list(key) + [count] for key, count in counts.items()],
+                    open_file,
+                )
+            os.replace(temp_file, spool_file)
+
+    def load_spool(self):
+        """Move counts saved by a previous process back into the buffer.
+
+        The spool file is read and removed while holding its lock, so that
+            only one process loads the counts, and no process adds to the
+            file in between.
+        """
+        spool_file = settings.DOWNLOAD_COUNT_SPOOL_FILE
+        if not spool_file.isfile():
+            return
+
+        with lock_file(self._get_spool_lock_file()):
+            if not spool_file.isfile():
+                return
+            with spool_file.open() as open_file:
+                counts = self._from_json(json.load(open_file))
+            spool_file.remove()
+        self._restore(counts)
+
+    def _take(self):
+        """Empty the buffer and return its counts."""
+        with self._lock:
+            counts = self._counts
+            self._counts = Counter()
+            self._pending = 0
+            self._last_flush = monotonic()
+        return counts
+
+    def _restore(self, counts):
+        """Add the given counts back into the buffer."""
+        with self._lock:
+            self._counts.update(counts)
+            self._pending += sum(counts.values())
+
+    @staticmethod
+    def _group(counts):
+        """Return the (pk, date) counts grouped by model label."""
+        grouped = defaultdict(dict)
+        for (label, pk, day), count in counts.items():
+            grouped[label][(pk, day)] = count
+        return grouped
+
+    @staticmethod
+    def _update(model, counts, field_name='download_count'):
+        """Add the counts to their objects in a single UPDATE."""
+        model.objects.filter(
+            pk__in=counts,
+        ).update(**{
+            field_name: F(field_name) + Case(
+                *[
+                    When(pk=pk, then=Value(count))
+                    for pk, count in counts.items()
+                ],
+                default=Value(0),
+                output_field=PositiveIntegerField(),
+            )
+        })
+
+    def _update_projects(self, model, release_counts):
+        """Add the release counts to their projects' total_downloads.
+
+        Returns the primary keys of the updated projects.
+        """
+        project_field = get_release_project_field(model)
+        project_counts = Counter()
+        for pk, project_pk in model.objects.filter(
+            pk__in=release_counts,
+        ).values_list(
+            'pk',
+            f'{project_field}_id',
+        ):
+            project_counts[project_pk] += release_counts[str(pk)]
+
+        self._update(
+            model=model.project_class,
+            counts=project_counts,
+            field_name='total_downloads',
+        )
+        return list(project_counts)
+
+    @staticmethod
+    def _get_spool_lock_file():
+        spool_file = settings.DOWNLOAD_COUNT_SPOOL_FILE
+        return spool_file.parent / f'{spool_file.name}.lock'
+
+    @staticmethod
+    def _from_json(data):
+        """Return the counts stored in the given spool file data."""
+        return Counter({tuple(row[:-1]): row[-1] for row in data})
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+download_counter = DownloadCounter()
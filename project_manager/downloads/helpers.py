@@ -0,0 +1,148 @@
+"""Helpers for use with release downloads."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from hashlib import sha256
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_http_date_safe
+
+# App
+from project_manager.downloads.constants import (
+    MAX_BYTE_RANGES,
+    RELEASE_CACHE_KEY_PREFIX,
+)
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'clear_cached_release',
+    'get_cached_release',
+    'get_release_cache_key',
+    'if_range_matches',
+    'is_new_download',
+    'parse_range_header',
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+_MISSING = object()
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def parse_range_header(header, size):
+    """Return the inclusive byte ranges requested by the Range header.
+
+    None is returned when the header is missing or malformed, meaning the
+        full file should be sent. An empty list means that none of the
+        ranges can be satisfied.
+    """
+    if not header or not header.startswith('bytes='):
+        return None
+
+    ranges = []
+    for spec in header[6:].split(','):
+        start, separator, end = spec.strip().partition('-')
+        if not separator:
+            return None
+
+        try:
+            if not start:
+                # Suffix range, ie "-500" for the last 500 bytes
+                length = int(end)
+                if length and size:
+                    ranges.append((max(size - length, 0), size - 1))
+                continue
+
+            start = int(start)
+            end = min(int(end), size - 1) if end else size - 1
+        except ValueError:
+            return None
+
+        if start >= size:
+            continue
+
+        if end < start:
+            return None
+
+        ranges.append((start, end))
+
+    if len(ranges) > MAX_BYTE_RANGES:
+        return None
+
+    return ranges
+
+
+def if_range_matches(header, etag, last_modified):
+    """Return whether the If-Range header allows a partial response."""
+    if header is None:
+        return True
+
+    if header.startswith(('"', 'W/')):
+        # Weak ETags can never be used with If-Range
+        return etag is not None and header == etag
+
+    return (
+        last_modified is not None and
+        parse_http_date_safe(header) == last_modified
+    )
+
+
+def is_new_download(ranges):
+    """Return whether the request is the start of a download.
+
+    Resumed downloads only request later parts of the file, so they are
+        only counted once, when the first byte is requested.
+    """
+    return ranges is None or any(start == 0 for start, _ in ranges)
+
+
+def get_release_cache_key(relative_path):
+    """Return the cache key for the release stored at the given path."""
+    digest = sha256(relative_path.encode()).hexdigest()
+    return f'{RELEASE_CACHE_KEY_PREFIX}:{digest}'
+
+
+def get_cached_release(model, relative_path):
+    """Return the release whose zip file is stored at the given path.
+
+    Only the fields needed to serve the download are loaded. Paths without
+        a release are cached as None.
+    """
+    cache_key = get_release_cache_key(relative_path)
+    release = cache.get(cache_key, _MISSING)
+    if release is _MISSING:
+        release = model.objects.filter(
+            zip_file=relative_path,
+        ).only(
+            'pk',
+            'created',
+            'file_hash',
+        ).first()
+        cache.set(
+            key=cache_key,
+            value=release,
+            timeout=settings.DOWNLOAD_RELEASE_CACHE_TIMEOUT,
+        )
+    return release
+
+
+def clear_cached_release(instance, **kwargs):
+    """Remove the cached release when it is saved or deleted."""
+    paths = {instance.zip_file.name}
+    if not kwargs.get('created', False):
+        previous = instance.field_tracker.previous('zip_file')
+        paths.add(getattr(previous, 'name', previous))
+    cache.delete_many([
+        get_release_cache_key(path) for path in paths if path
+    ])
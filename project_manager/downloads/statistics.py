@@ -0,0 +1,156 @@
+"""Time-bucketed download statistics for releases."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from itertools import islice
+
+# Django
+from django.db import transaction
+from django.db.models import (
+    Case,
+    F,
+    PositiveIntegerField,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import TruncMonth
+
+# App
+from project_manager.downloads.constants import (
+    DOWNLOAD_PERIOD_DAY,
+    DOWNLOAD_PERIOD_MONTH,
+)
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'add_download_statistics',
+    'get_download_series',
+    'get_statistic_model',
+    'rollup_download_statistics',
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+# Number of (release, date) pairs written per UPDATE statement
+BATCH_SIZE = 100
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def get_statistic_model(release_model):
+    """Return the download statistic model for the given release model."""
+    return release_model._meta.get_field('download_statistics').related_model
+
+
+def add_download_statistics(model, period, counts):
+    """Add the given counts to the statistic rows for the period.
+
+    The counts are keyed by (release_id, date). Missing rows are created
+        first so that concurrent writers only ever increment existing rows.
+    """
+    counts = iter(counts.items())
+    while batch := dict(islice(counts, BATCH_SIZE)):
+        model.objects.bulk_create(
+            objs=[
+                model(
+                    release_id=release_id,
+                    period=period,
+                    date=date,
+                )
+                for release_id, date in batch
+            ],
+            ignore_conflicts=True,
+        )
+        lookups = [
+            Q(release_id=release_id, date=date)
+            for release_id, date in batch
+        ]
+        model.objects.filter(
+            Q(*lookups, _connector=Q.OR),
+            period=period,
+        ).update(
+            download_count=F('download_count') + Case(
+                *[
+                    When(lookup, then=Value(count))
+                    for lookup, count in zip(lookups, batch.values())
+                ],
+                default=Value(0),
+                output_field=PositiveIntegerField(),
+            )
+        )
+
+
+def get_download_series(queryset, period, *fields):
+    """Return the download counts of the queryset summed per period.
+
+    Monthly series include the daily rows that have not been rolled up yet,
+        daily series only cover the days that still have daily rows.
+    """
+    if period == DOWNLOAD_PERIOD_DAY:
+        queryset = queryset.filter(
+            period=DOWNLOAD_PERIOD_DAY,
+        ).annotate(
+            bucket=F('date'),
+        )
+    else:
+        queryset = queryset.annotate(
+            bucket=TruncMonth('date'),
+        )
+
+    rows = queryset.values(
+        *fields,
+        'bucket',
+    ).annotate(
+        total=Sum('download_count'),
+    ).order_by(
+        *fields,
+        'bucket',
+    )
+    return [
+        {
+            **{field: row[field] for field in fields},
+            'date': row['bucket'],
+            'download_count': row['total'],
+        }
+        for row in rows
+    ]
+
+
+def rollup_download_statistics(model, before):
+    """Merge the daily rows before the given date into monthly rows.
+
+    Returns the number of daily rows that were removed.
+    """
+    daily = model.objects.filter(
+        period=DOWNLOAD_PERIOD_DAY,
+        date__lt=before,
+    )
+    with transaction.atomic():
+        totals = daily.annotate(
+            month=TruncMonth('date'),
+        ).values(
+            'release_id',
+            'month',
+        ).annotate(
+            total=Sum('download_count'),
+        ).order_by()
+        add_download_statistics(
+            model=model,
+            period=DOWNLOAD_PERIOD_MONTH,
+            counts={
+                (row['release_id'], row['month']): row['total']
+                for row in totals
+            },
+        )
+        deleted, _ = daily.delete()
+    return deleted
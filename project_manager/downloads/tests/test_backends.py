@@ -0,0 +1,279 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.test import TestCase, override_settings
+
+# App
+from project_manager.downloads.backends import (
+    BaseDownloadBackend,
+    OffloadDownloadBackend,
+    PythonDownloadBackend,
+    XAccelRedirectDownloadBackend,
+    XSendfileDownloadBackend,
+    get_download_backend,
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+FIXTURES_PATH = settings.BASE_DIR / 'fixtures'
+RELATIVE_PATH = 'releases/plugins/test-plugin/test-plugin-v1.0.0.zip'
+FULL_PATH = FIXTURES_PATH / RELATIVE_PATH
+FILE_NAME = 'test-plugin-v1.0.0.zip'
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class BaseDownloadBackendTestCase(TestCase):
+    def test_get_response_required(self):
+        obj = BaseDownloadBackend()
+        with self.assertRaises(NotImplementedError) as context:
+            obj.get_response(
+                full_path=FULL_PATH,
+                relative_path=RELATIVE_PATH,
+                file_name=FILE_NAME,
+            )
+
+        self.assertEqual(
+            first=str(context.exception),
+            second=(
+                f'Class "{obj.__class__.__name__}" must implement a '
+                f'"get_response" method.'
+            ),
+        )
+
+
+class PythonDownloadBackendTestCase(TestCase):
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(PythonDownloadBackend, BaseDownloadBackend),
+        )
+
+    @override_settings(DOWNLOAD_CHUNK_SIZE=1024)
+    def test_get_response(self):
+        response = PythonDownloadBackend().get_response(
+            full_path=FULL_PATH,
+            relative_path=RELATIVE_PATH,
+            file_name=FILE_NAME,
+        )
+        self.assertIsInstance(
+            obj=response,
+            cls=FileResponse,
+        )
+        self.assertEqual(
+            first=response.block_size,
+            second=1024,
+        )
+        self.assertEqual(
+            first=response['Content-Type'],
+            second='application/zip',
+        )
+        self.assertEqual(
+            first=response['Content-Disposition'],
+            second=f'attachment; filename="{FILE_NAME}"',
+        )
+        with FULL_PATH.open('rb') as open_file:
+            contents = open_file.read()
+        self.assertEqual(
+            first=int(response['Content-Length']),
+            second=len(contents),
+        )
+        self.assertEqual(
+            first=b''.join(response.streaming_content),
+            second=contents,
+        )
+        self.assertEqual(
+            first=response['Accept-Ranges'],
+            second='bytes',
+        )
+        response.close()
+
+    @override_settings(DOWNLOAD_CHUNK_SIZE=4)
+    def test_get_response_single_range(self):
+        response = PythonDownloadBackend().get_response(
+            full_path=FULL_PATH,
+            relative_path=RELATIVE_PATH,
+            file_name=FILE_NAME,
+            ranges=[(5, 14)],
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=206,
+        )
+        self.assertEqual(
+            first=response['Content-Range'],
+            second=f'bytes 5-14/{FULL_PATH.size}',
+        )
+        self.assertEqual(
+            first=response['Content-Length'],
+            second='10',
+        )
+        self.assertEqual(
+            first=response['Content-Disposition'],
+            second=f'attachment; filename="{FILE_NAME}"',
+        )
+        with FULL_PATH.open('rb') as open_file:
+            contents = open_file.read()
+        self.assertEqual(
+            first=b''.join(response.streaming_content),
+            second=contents[5:15],
+        )
+
+    def test_get_response_multiple_ranges(self):
+        response = PythonDownloadBackend().get_response(
+            full_path=FULL_PATH,
+            relative_path=RELATIVE_PATH,
+            file_name=FILE_NAME,
+            ranges=[(0, 3), (10, 12)],
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=206,
+        )
+        content_type, boundary = response['Content-Type'].split(
+            '; boundary='
+        )
+        self.assertEqual(
+            first=content_type,
+            second='multipart/byteranges',
+        )
+        content = b''.join(response.streaming_content)
+        self.assertEqual(
+            first=int(response['Content-Length']),
+            second=len(content),
+        )
+        with FULL_PATH.open('rb') as open_file:
+            contents = open_file.read()
+        size = FULL_PATH.size
+        self.assertEqual(
+            first=content,
+            second=(
+                f'\r\n--{boundary}\r\n'
+                f'Content-Type: application/zip\r\n'
+                f'Content-Range: bytes 0-3/{size}\r\n\r\n'
+            ).encode() + contents[0:4] + (
+                f'\r\n--{boundary}\r\n'
+                f'Content-Type: application/zip\r\n'
+                f'Content-Range: bytes 10-12/{size}\r\n\r\n'
+            ).encode() + contents[10:13] + f'\r\n--{boundary}--\r\n'.encode(),
+        )
+
+
+class OffloadDownloadBackendTestCase(TestCase):
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(OffloadDownloadBackend, BaseDownloadBackend),
+        )
+
+    def test_header_name_required(self):
+        obj = OffloadDownloadBackend()
+        with self.assertRaises(NotImplementedError) as context:
+            _ = obj.header_name
+
+        self.assertEqual(
+            first=str(context.exception),
+            second=(
+                f'Class "{obj.__class__.__name__}" must implement a '
+                f'"header_name" attribute.'
+            ),
+        )
+
+    def test_get_header_value_required(self):
+        obj = OffloadDownloadBackend()
+        with self.assertRaises(NotImplementedError) as context:
+            obj.get_header_value(
+                full_path=FULL_PATH,
+                relative_path=RELATIVE_PATH,
+            )
+
+        self.assertEqual(
+            first=str(context.exception),
+            second=(
+                f'Class "{obj.__class__.__name__}" must implement a '
+                f'"get_header_value" method.'
+            ),
+        )
+
+
+class XAccelRedirectDownloadBackendTestCase(TestCase):
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(
+                XAccelRedirectDownloadBackend,
+                OffloadDownloadBackend,
+            ),
+        )
+
+    @override_settings(DOWNLOAD_OFFLOAD_PREFIX='/internal/')
+    def test_get_response(self):
+        response = XAccelRedirectDownloadBackend().get_response(
+            full_path=FULL_PATH,
+            relative_path=RELATIVE_PATH,
+            file_name=FILE_NAME,
+        )
+        self.assertIsInstance(
+            obj=response,
+            cls=HttpResponse,
+        )
+        self.assertEqual(
+            first=response.content,
+            second=b'',
+        )
+        self.assertEqual(
+            first=response['Content-Type'],
+            second='application/zip',
+        )
+        self.assertEqual(
+            first=response['Content-Disposition'],
+            second=f'attachment; filename="{FILE_NAME}"',
+        )
+        self.assertEqual(
+            first=response['X-Accel-Redirect'],
+            second=f'/internal/{RELATIVE_PATH}',
+        )
+
+
+class XSendfileDownloadBackendTestCase(TestCase):
+    def test_class_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(XSendfileDownloadBackend, OffloadDownloadBackend),
+        )
+
+    def test_get_response(self):
+        response = XSendfileDownloadBackend().get_response(
+            full_path=FULL_PATH,
+            relative_path=RELATIVE_PATH,
+            file_name=FILE_NAME,
+        )
+        self.assertEqual(
+            first=response.content,
+            second=b'',
+        )
+        self.assertEqual(
+            first=response['X-Sendfile'],
+            second=str(FULL_PATH.abspath()),
+        )
+
+
+class GetDownloadBackendTestCase(TestCase):
+    def test_default(self):
+        self.assertIsInstance(
+            obj=get_download_backend(),
+            cls=PythonDownloadBackend,
+        )
+
+    @override_settings(
+        DOWNLOAD_BACKEND=(
+            'project_manager.downloads.backends.XSendfileDownloadBackend'
+        ),
+    )
+    def test_setting(self):
+        self.assertIsInstance(
+            obj=get_download_backend(),
+            cls=XSendfileDownloadBackend,
+        )
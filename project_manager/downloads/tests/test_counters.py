@@ -0,0 +1,260 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import json
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import mock
+
+# Django
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.utils.timezone import localdate
+
+# Third Party Python
+from path import Path
+
+# App
+from project_manager.downloads.counters import DownloadCounter
+from project_manager.downloads.constants import DOWNLOAD_PERIOD_DAY
+from project_manager.helpers import lock_file
+from project_manager.plugins.models import PluginRelease
+from project_manager.sub_plugins.models import SubPluginRelease
+from test_utils.factories.plugins import PluginReleaseFactory
+from test_utils.factories.sub_plugins import SubPluginReleaseFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+@override_settings(
+    DOWNLOAD_COUNT_FLUSH_THRESHOLD=100,
+    DOWNLOAD_COUNT_FLUSH_INTERVAL=60,
+)
+class DownloadCounterTestCase(TestCase):
+
+    plugin_release = sub_plugin_release = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.plugin_release = PluginReleaseFactory()
+        cls.sub_plugin_release = SubPluginReleaseFactory()
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.spool_file = Path(self.temp_dir.name) / 'download_counts.json'
+        override = override_settings(DOWNLOAD_COUNT_SPOOL_FILE=self.spool_file)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(self.temp_dir.cleanup)
+        self.counter = DownloadCounter()
+        self.today = localdate().isoformat()
+
+    def _get_download_counts(self):
+        return (
+            PluginRelease.objects.get(
+                pk=self.plugin_release.pk,
+            ).download_count,
+            SubPluginRelease.objects.get(
+                pk=self.sub_plugin_release.pk,
+            ).download_count,
+        )
+
+    def test_increment_buffers(self):
+        self.counter.increment(release=self.plugin_release)
+        self.counter.increment(release=self.plugin_release)
+        self.assertEqual(
+            first=self.counter.pending,
+            second=2,
+        )
+        self.assertTupleEqual(
+            tuple1=self._get_download_counts(),
+            tuple2=(0, 0),
+        )
+
+    def test_flush(self):
+        for _ in range(3):
+            self.counter.increment(release=self.plugin_release)
+        self.counter.increment(release=self.sub_plugin_release)
+        # Per model, one UPDATE for the release counts, a SELECT and an
+        #   UPDATE for the project totals, plus an INSERT and an UPDATE for
+        #   the statistics, then one UPDATE for the statistics snapshot,
+        #   wrapped in a savepoint.
+        with self.assertNumQueries(13):
+            self.assertEqual(
+                first=self.counter.flush(),
+                second=4,
+            )
+        self.assertTupleEqual(
+            tuple1=self._get_download_counts(),
+            tuple2=(3, 1),
+        )
+        self.plugin_release.plugin.refresh_from_db()
+        self.assertEqual(
+            first=self.plugin_release.plugin.total_downloads,
+            second=3,
+        )
+        self.sub_plugin_release.sub_plugin.refresh_from_db()
+        self.assertEqual(
+            first=self.sub_plugin_release.sub_plugin.total_downloads,
+            second=1,
+        )
+        statistic = self.plugin_release.download_statistics.get()
+        self.assertEqual(
+            first=statistic.period,
+            second=DOWNLOAD_PERIOD_DAY,
+        )
+        self.assertEqual(
+            first=statistic.date,
+            second=localdate(),
+        )
+        self.assertEqual(
+            first=statistic.download_count,
+            second=3,
+        )
+        self.assertEqual(
+            first=self.sub_plugin_release.download_statistics.get().download_count,
+            second=1,
+        )
+
+        self.counter.increment(release=self.plugin_release)
+        self.counter.flush()
+        self.assertEqual(
+            first=self.plugin_release.download_statistics.get().download_count,
+            second=4,
+        )
+        self.assertEqual(
+            first=self.counter.pending,
+            second=0,
+        )
+        self.assertEqual(
+            first=self.counter.flush(),
+            second=0,
+        )
+
+    @override_settings(DOWNLOAD_COUNT_FLUSH_THRESHOLD=3)
+    def test_increment_threshold(self):
+        self.counter.increment(release=self.plugin_release)
+        self.counter.increment(release=self.sub_plugin_release)
+        self.assertTupleEqual(
+            tuple1=self._get_download_counts(),
+            tuple2=(0, 0),
+        )
+        self.counter.increment(release=self.plugin_release)
+        self.assertTupleEqual(
+            tuple1=self._get_download_counts(),
+            tuple2=(2, 1),
+        )
+
+    @override_settings(DOWNLOAD_COUNT_FLUSH_INTERVAL=0)
+    def test_increment_interval(self):
+        self.counter.increment(release=self.plugin_release)
+        self.assertTupleEqual(
+            tuple1=self._get_download_counts(),
+            tuple2=(1, 0),
+        )
+
+    @mock.patch(
+        target='project_manager.downloads.counters.DownloadCounter._update',
+        side_effect=DatabaseError,
+    )
+    def test_flush_failure(self, _):
+        self.counter.increment(release=self.plugin_release)
+        self.assertEqual(
+            first=self.counter.flush(),
+            second=0,
+        )
+        self.assertEqual(
+            first=self.counter.pending,
+            second=1,
+        )
+
+    def test_spool(self):
+        self.counter.increment(release=self.plugin_release)
+        self.counter.spool()
+        self.counter.increment(release=self.plugin_release)
+        self.counter.increment(release=self.sub_plugin_release)
+        self.counter.spool()
+        self.assertEqual(
+            first=self.counter.pending,
+            second=0,
+        )
+        with self.spool_file.open() as open_file:
+            data = json.load(open_file)
+        self.assertCountEqual(
+            first=data,
+            second=[
+                [
+                    'project_manager.PluginRelease',
+                    str(self.plugin_release.pk),
+                    self.today,
+                    2,
+                ],
+                [
+                    'project_manager.SubPluginRelease',
+                    str(self.sub_plugin_release.pk),
+                    self.today,
+                    1,
+                ],
+            ],
+        )
+
+        self.assertEqual(
+            first=DownloadCounter().flush(),
+            second=3,
+        )
+        self.assertFalse(expr=self.spool_file.exists())
+        self.assertTupleEqual(
+            tuple1=self._get_download_counts(),
+            tuple2=(2, 1),
+        )
+
+    def test_spool_lock(self):
+        self.counter.increment(release=self.plugin_release)
+
+        # Verify that the spool file is not written while another process
+        #   holds its lock
+        with lock_file(self.spool_file.parent / 'download_counts.json.lock'):
+            thread = Thread(target=self.counter.spool)
+            thread.start()
+            thread.join(timeout=0.5)
+            self.assertTrue(expr=thread.is_alive())
+            self.assertFalse(expr=self.spool_file.exists())
+
+        thread.join()
+        self.assertTrue(expr=self.spool_file.exists())
+
+    def test_shutdown(self):
+        self.counter.increment(release=self.plugin_release)
+        self.counter.shutdown()
+        self.assertFalse(expr=self.spool_file.exists())
+        self.assertTupleEqual(
+            tuple1=self._get_download_counts(),
+            tuple2=(1, 0),
+        )
+
+    @mock.patch(
+        target='project_manager.downloads.counters.DownloadCounter._update',
+        side_effect=DatabaseError,
+    )
+    def test_shutdown_failure(self, _):
+        self.counter.increment(release=self.plugin_release)
+        self.counter.shutdown()
+        self.assertEqual(
+            first=self.counter.pending,
+            second=0,
+        )
+        with self.spool_file.open() as open_file:
+            self.assertListEqual(
+                list1=json.load(open_file),
+                list2=[
+                    [
+                        'project_manager.PluginRelease',
+                        str(self.plugin_release.pk),
+                        self.today,
+                        1,
+                    ],
+                ],
+            )
@@ -0,0 +1,286 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from hashlib import sha256
+
+# Django
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils.http import http_date
+
+# App
+from project_manager.downloads.helpers import (
+    get_cached_release,
+    get_release_cache_key,
+    if_range_matches,
+    is_new_download,
+    parse_range_header,
+)
+from project_manager.plugins.models import PluginRelease
+from test_utils.factories.plugins import PluginReleaseFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class ParseRangeHeaderTestCase(TestCase):
+    def test_no_header(self):
+        self.assertIsNone(
+            obj=parse_range_header(header=None, size=100),
+        )
+
+    def test_invalid_unit(self):
+        self.assertIsNone(
+            obj=parse_range_header(header='items=0-5', size=100),
+        )
+
+    def test_malformed(self):
+        for header in ('bytes=5', 'bytes=a-b', 'bytes=10-5', 'bytes=0-5,x'):
+            self.assertIsNone(
+                obj=parse_range_header(header=header, size=100),
+                msg=header,
+            )
+
+    def test_single_range(self):
+        self.assertListEqual(
+            list1=parse_range_header(header='bytes=10-19', size=100),
+            list2=[(10, 19)],
+        )
+
+    def test_open_ended_range(self):
+        self.assertListEqual(
+            list1=parse_range_header(header='bytes=90-', size=100),
+            list2=[(90, 99)],
+        )
+
+    def test_end_past_size(self):
+        self.assertListEqual(
+            list1=parse_range_header(header='bytes=90-500', size=100),
+            list2=[(90, 99)],
+        )
+
+    def test_suffix_range(self):
+        self.assertListEqual(
+            list1=parse_range_header(header='bytes=-10', size=100),
+            list2=[(90, 99)],
+        )
+        self.assertListEqual(
+            list1=parse_range_header(header='bytes=-500', size=100),
+            list2=[(0, 99)],
+        )
+
+    def test_multiple_ranges(self):
+        self.assertListEqual(
+            list1=parse_range_header(header='bytes=0-9, 50-59,-5', size=100),
+            list2=[(0, 9), (50, 59), (95, 99)],
+        )
+
+    def test_unsatisfiable(self):
+        self.assertListEqual(
+            list1=parse_range_header(header='bytes=100-', size=100),
+            list2=[],
+        )
+        self.assertListEqual(
+            list1=parse_range_header(header='bytes=-0', size=100),
+            list2=[],
+        )
+
+    def test_too_many_ranges(self):
+        header = 'bytes=' + ','.join(f'{x}-{x}' for x in range(17))
+        self.assertIsNone(
+            obj=parse_range_header(header=header, size=100),
+        )
+
+
+class IfRangeMatchesTestCase(TestCase):
+    etag = '"abc"'
+    last_modified = 1000000000
+
+    def test_no_header(self):
+        self.assertTrue(
+            expr=if_range_matches(
+                header=None,
+                etag=self.etag,
+                last_modified=self.last_modified,
+            ),
+        )
+
+    def test_etag(self):
+        self.assertTrue(
+            expr=if_range_matches(
+                header=self.etag,
+                etag=self.etag,
+                last_modified=self.last_modified,
+            ),
+        )
+        self.assertFalse(
+            expr=if_range_matches(
+                header='"def"',
+                etag=self.etag,
+                last_modified=self.last_modified,
+            ),
+        )
+        self.assertFalse(
+            expr=if_range_matches(
+                header=f'W/{self.etag}',
+                etag=self.etag,
+                last_modified=self.last_modified,
+            ),
+        )
+        self.assertFalse(
+            expr=if_range_matches(
+                header=self.etag,
+                etag=None,
+                last_modified=self.last_modified,
+            ),
+        )
+
+    def test_date(self):
+        self.assertTrue(
+            expr=if_range_matches(
+                header=http_date(self.last_modified),
+                etag=self.etag,
+                last_modified=self.last_modified,
+            ),
+        )
+        self.assertFalse(
+            expr=if_range_matches(
+                header=http_date(self.last_modified + 1),
+                etag=self.etag,
+                last_modified=self.last_modified,
+            ),
+        )
+
+
+class IsNewDownloadTestCase(TestCase):
+    def test_full_download(self):
+        self.assertTrue(expr=is_new_download(ranges=None))
+
+    def test_first_range(self):
+        self.assertTrue(expr=is_new_download(ranges=[(0, 9)]))
+        self.assertTrue(expr=is_new_download(ranges=[(50, 59), (0, 9)]))
+
+    def test_resumed(self):
+        self.assertFalse(expr=is_new_download(ranges=[(10, 99)]))
+
+
+class GetReleaseCacheKeyTestCase(TestCase):
+    def test_key(self):
+        relative_path = 'releases/plugins/test/test-v1.0.0.zip'
+        self.assertEqual(
+            first=get_release_cache_key(relative_path=relative_path),
+            second=(
+                'download-release:'
+                f'{sha256(relative_path.encode()).hexdigest()}'
+            ),
+        )
+
+
+class GetCachedReleaseTestCase(TestCase):
+
+    release = relative_path = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.relative_path = 'releases/plugins/test/test-v1.0.0-v2.zip'
+        cls.release = PluginReleaseFactory(
+            zip_file=cls.relative_path,
+        )
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_get(self):
+        with self.assertNumQueries(1):
+            release = get_cached_release(
+                model=PluginRelease,
+                relative_path=self.relative_path,
+            )
+        self.assertEqual(
+            first=release.pk,
+            second=self.release.pk,
+        )
+        with self.assertNumQueries(0):
+            release = get_cached_release(
+                model=PluginRelease,
+                relative_path=self.relative_path,
+            )
+        self.assertEqual(
+            first=release.pk,
+            second=self.release.pk,
+        )
+        self.assertEqual(
+            first=release.created,
+            second=self.release.created,
+        )
+        self.assertEqual(
+            first=release.file_hash,
+            second=self.release.file_hash,
+        )
+
+    def test_missing_release(self):
+        relative_path = 'releases/plugins/test/test-v2.0.0.zip'
+        with self.assertNumQueries(1):
+            self.assertIsNone(
+                obj=get_cached_release(
+                    model=PluginRelease,
+                    relative_path=relative_path,
+                ),
+            )
+        with self.assertNumQueries(0):
+            self.assertIsNone(
+                obj=get_cached_release(
+                    model=PluginRelease,
+                    relative_path=relative_path,
+                ),
+            )
+        release = PluginReleaseFactory(
+            zip_file=relative_path,
+        )
+        self.assertEqual(
+            first=get_cached_release(
+                model=PluginRelease,
+                relative_path=relative_path,
+            ).pk,
+            second=release.pk,
+        )
+
+    def test_cleared_on_save(self):
+        get_cached_release(
+            model=PluginRelease,
+            relative_path=self.relative_path,
+        )
+        release = PluginRelease.objects.get(pk=self.release.pk)
+        new_path = 'releases/plugins/test/test-v1.0.1.zip'
+        release.zip_file = new_path
+        release.save()
+        with self.assertNumQueries(1):
+            self.assertIsNone(
+                obj=get_cached_release(
+                    model=PluginRelease,
+                    relative_path=self.relative_path,
+                ),
+            )
+        self.assertEqual(
+            first=get_cached_release(
+                model=PluginRelease,
+                relative_path=new_path,
+            ).pk,
+            second=self.release.pk,
+        )
+
+    def test_cleared_on_delete(self):
+        get_cached_release(
+            model=PluginRelease,
+            relative_path=self.relative_path,
+        )
+        PluginRelease.objects.filter(pk=self.release.pk).delete()
+        with self.assertNumQueries(1):
+            self.assertIsNone(
+                obj=get_cached_release(
+                    model=PluginRelease,
+                    relative_path=self.relative_path,
+                ),
+            )
@@ -0,0 +1,191 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from datetime import date
+
+# Django
+from django.test import TestCase
+
+# App
+from project_manager.downloads.constants import (
+    DOWNLOAD_PERIOD_DAY,
+    DOWNLOAD_PERIOD_MONTH,
+)
+from project_manager.downloads.statistics import (
+    add_download_statistics,
+    get_download_series,
+    get_statistic_model,
+    rollup_download_statistics,
+)
+from project_manager.packages.models import (
+    PackageRelease,
+    PackageReleaseDownloadStatistic,
+)
+from project_manager.plugins.models import (
+    PluginRelease,
+    PluginReleaseDownloadStatistic,
+)
+from project_manager.sub_plugins.models import (
+    SubPluginRelease,
+    SubPluginReleaseDownloadStatistic,
+)
+from test_utils.factories.plugins import (
+    PluginReleaseDownloadStatisticFactory,
+    PluginReleaseFactory,
+)
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class GetStatisticModelTestCase(TestCase):
+    def test_models(self):
+        for release_model, statistic_model in (
+            (PackageRelease, PackageReleaseDownloadStatistic),
+            (PluginRelease, PluginReleaseDownloadStatistic),
+            (SubPluginRelease, SubPluginReleaseDownloadStatistic),
+        ):
+            self.assertIs(
+                expr1=get_statistic_model(release_model),
+                expr2=statistic_model,
+            )
+
+
+class AddDownloadStatisticsTestCase(TestCase):
+
+    release_1 = release_2 = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.release_1 = PluginReleaseFactory()
+        cls.release_2 = PluginReleaseFactory()
+
+    def _get_counts(self):
+        return {
+            (row.release_id, row.period, row.date): row.download_count
+            for row in PluginReleaseDownloadStatistic.objects.all()
+        }
+
+    def test_add(self):
+        day_1 = date(2023, 1, 1)
+        day_2 = date(2023, 1, 2)
+        add_download_statistics(
+            model=PluginReleaseDownloadStatistic,
+            period=DOWNLOAD_PERIOD_DAY,
+            counts={
+                (self.release_1.pk, day_1): 2,
+                (self.release_2.pk, day_1): 1,
+            },
+        )
+        add_download_statistics(
+            model=PluginReleaseDownloadStatistic,
+            period=DOWNLOAD_PERIOD_DAY,
+            counts={
+                (self.release_1.pk, day_1): 3,
+                (self.release_1.pk, day_2): 4,
+            },
+        )
+        self.assertDictEqual(
+            d1=self._get_counts(),
+            d2={
+                (self.release_1.pk, DOWNLOAD_PERIOD_DAY, day_1): 5,
+                (self.release_2.pk, DOWNLOAD_PERIOD_DAY, day_1): 1,
+                (self.release_1.pk, DOWNLOAD_PERIOD_DAY, day_2): 4,
+            },
+        )
+
+    def test_add_empty(self):
+        with self.assertNumQueries(0):
+            add_download_statistics(
+                model=PluginReleaseDownloadStatistic,
+                period=DOWNLOAD_PERIOD_DAY,
+                counts={},
+            )
+
+
+class RollupDownloadStatisticsTestCase(TestCase):
+    def test_rollup(self):
+        release = PluginReleaseFactory()
+        for period, day, count in (
+            (DOWNLOAD_PERIOD_MONTH, date(2023, 1, 1), 10),
+            (DOWNLOAD_PERIOD_DAY, date(2023, 1, 20), 1),
+            (DOWNLOAD_PERIOD_DAY, date(2023, 1, 31), 2),
+            (DOWNLOAD_PERIOD_DAY, date(2023, 2, 1), 3),
+            (DOWNLOAD_PERIOD_DAY, date(2023, 3, 1), 4),
+        ):
+            PluginReleaseDownloadStatisticFactory(
+                release=release,
+                period=period,
+                date=day,
+                download_count=count,
+            )
+
+        self.assertEqual(
+            first=rollup_download_statistics(
+                model=PluginReleaseDownloadStatistic,
+                before=date(2023, 3, 1),
+            ),
+            second=3,
+        )
+        self.assertListEqual(
+            list1=list(
+                release.download_statistics.order_by(
+                    'date',
+                    'period',
+                ).values_list(
+                    'period',
+                    'date',
+                    'download_count',
+                )
+            ),
+            list2=[
+                (DOWNLOAD_PERIOD_MONTH, date(2023, 1, 1), 13),
+                (DOWNLOAD_PERIOD_MONTH, date(2023, 2, 1), 3),
+                (DOWNLOAD_PERIOD_DAY, date(2023, 3, 1), 4),
+            ],
+        )
+
+
+class GetDownloadSeriesTestCase(TestCase):
+    def test_series(self):
+        release = PluginReleaseFactory()
+        for period, day, count in (
+            (DOWNLOAD_PERIOD_MONTH, date(2023, 1, 1), 10),
+            (DOWNLOAD_PERIOD_DAY, date(2023, 2, 1), 1),
+            (DOWNLOAD_PERIOD_DAY, date(2023, 2, 2), 2),
+        ):
+            PluginReleaseDownloadStatisticFactory(
+                release=release,
+                period=period,
+                date=day,
+                download_count=count,
+            )
+
+        queryset = PluginReleaseDownloadStatistic.objects.all()
+        self.assertListEqual(
+            list1=get_download_series(queryset, DOWNLOAD_PERIOD_DAY),
+            list2=[
+                {'date': date(2023, 2, 1), 'download_count': 1},
+                {'date': date(2023, 2, 2), 'download_count': 2},
+            ],
+        )
+        self.assertListEqual(
+            list1=get_download_series(
+                queryset,
+                DOWNLOAD_PERIOD_MONTH,
+                'release_id',
+            ),
+            list2=[
+                {
+                    'release_id': release.pk,
+                    'date': date(2023, 1, 1),
+                    'download_count': 10,
+                },
+                {
+                    'release_id': release.pk,
+                    'date': date(2023, 2, 1),
+                    'download_count': 3,
+                },
+            ],
+        )
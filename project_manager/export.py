@@ -0,0 +1,148 @@
+"""Newline delimited JSON export of every project."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+# App
+from project_manager.api.common.serializers import ProjectSerializer
+from project_manager.constants import SYNC_PROJECT_TYPES
+from project_manager.helpers import get_requirement_prefetches
+from games.models import Game
+from tags.models import Tag
+from users.models import ForumUser
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'get_export_queryset',
+    'get_export_record',
+    'iter_export_lines',
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def iter_export_lines(chunk_size=None):
+    """Yield every project, with its releases, as a line of JSON.
+
+    The projects are read in chunks, with their related objects prefetched
+        once per chunk, so the memory used does not grow with the number of
+        projects. Databases that support server-side cursors stream the
+        projects with one.
+    """
+    if chunk_size is None:
+        chunk_size = settings.PROJECT_EXPORT_CHUNK_SIZE
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+    for model_name, project_type in SYNC_PROJECT_TYPES.items():
+        for project in get_export_queryset(model_name=model_name).iterator(
+            chunk_size=chunk_size,
+        ):
+            record = get_export_record(
+                project=project,
+                project_type=project_type,
+            )
+            yield f'{encoder.encode(record)}\n'
+
+
+def get_export_queryset(model_name):
+    """Return the projects of the given model with their related objects."""
+    project_model = apps.get_model(
+        app_label='project_manager',
+        model_name=model_name,
+    )
+    release_model = apps.get_model(
+        app_label='project_manager',
+        model_name=f'{model_name}Release',
+    )
+    users = ForumUser.objects.select_related('user').only(
+        'forum_id',
+        'user__username',
+    )
+    return project_model.objects.select_related(
+        'owner__user',
+    ).prefetch_related(
+        Prefetch(lookup='contributors', queryset=users),
+        Prefetch(lookup='tags', queryset=Tag.objects.order_by('pk')),
+        Prefetch(
+            lookup='supported_games',
+            queryset=Game.objects.order_by('pk'),
+        ),
+        Prefetch(
+            lookup='releases',
+            queryset=release_model.objects.select_related(
+                'created_by__user',
+            ).order_by('-created'),
+        ),
+        *get_requirement_prefetches(
+            release_model=release_model,
+            prefix='releases__',
+        ),
+    ).order_by('pk')
+
+
+def get_export_record(project, project_type):
+    """Return the project's export record.
+
+    The record follows the project serializer's fields, but timestamps are
+        not formatted for the locale, and release downloads are given as
+        their paths, so that no request is needed.
+    """
+    record = {
+        'project_type': project_type,
+        'name': project.name,
+        'slug': project.slug,
+        'basename': project.basename,
+        'total_downloads': project.total_downloads,
+        'current_version': project.current_version,
+        'created': project.created,
+        'updated': project.updated,
+        'synopsis': _get_text(project.synopsis),
+        'description': _get_text(project.description),
+        'configuration': _get_text(project.configuration),
+        'logo': project.logo.url if project.logo else None,
+        'video': project.video or None,
+        'owner': _get_user(project.owner),
+        'contributors': [
+            _get_user(user) for user in project.contributors.all()
+        ],
+        'tags': [tag.pk for tag in project.tags.all()],
+        'games': [game.pk for game in project.supported_games.all()],
+        'releases': [
+            {
+                'version': release.version,
+                'notes': _get_text(release.notes),
+                'zip_file': release.zip_file.url,
+                'file_hash': release.file_hash,
+                'created': release.created,
+                'created_by': _get_user(release.created_by),
+                'download_count': release.download_count,
+                **ProjectSerializer.get_requirements(release),
+            } for release in project.releases.all()
+        ],
+    }
+    if project_type == 'sub-plugin':
+        record['plugin'] = project.plugin_id
+    return record
+
+
+def _get_text(value):
+    """Return the raw text of a BBCode field."""
+    return str(value) if value is not None else None
+
+
+def _get_user(forum_user):
+    if forum_user is None:
+        return None
+    return {
+        'forum_id': forum_user.forum_id,
+        'username': forum_user.user.username,
+    }
@@ -4,29 +4,53 @@
 # IMPORTS
 # =============================================================================
 # Python
+import fcntl
 import json
 import logging
 from collections import defaultdict
+from contextlib import contextmanager
+from hashlib import sha256
 from zipfile import ZipFile, BadZipFile
 
 # Django
 from django.apps import apps
 from django.conf import settings
-from django.core.exceptions import ValidationError
+from django.core.exceptions import SuspiciousFileOperation, ValidationError
+from django.db.models import Count, OuterRef, Prefetch, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils.text import slugify
+
+# Third Party Python
+from packaging.specifiers import InvalidSpecifier
 
 # App
 from project_manager.constants import CANNOT_BE_NAMED, CANNOT_START_WITH
+from project_manager.packages.versions import (
+    get_package_version_indexes,
+    get_version_specifier,
+)
+from project_manager.release_jobs.constants import RELEASE_JOB_URL
 
 
 # =============================================================================
 # ALL DECLARATION
 # =============================================================================
 __all__ = (
+    'AllowedPathTrie',
     'GROUP_QUERYSET_NAMES',
     'ProjectZipFile',
     'find_image_number',
+    'get_current_release_prefetch',
+    'get_file_hash',
+    'get_relation_count_subquery',
+    'get_release_project_field',
+    'get_release_stats_values',
+    'get_requirement_prefetches',
     'handle_project_logo_upload',
+    'handle_release_job_upload',
     'handle_release_zip_file_upload',
+    'lock_file',
+    'update_project_release_stats',
 )
 
 
@@ -46,29 +70,84 @@ VersionControlRequirement = apps.get_model(
     model_name='VersionControlRequirement',
 )
 logger = logging.getLogger(__name__)
+REQUIREMENT_MODELS = {
+    'download': (DownloadRequirement, 'url'),
+    'pypi': (PyPiRequirement, 'name'),
+    'vcs': (VersionControlRequirement, 'url'),
+}
 GROUP_QUERYSET_NAMES = {
     'custom': 'package',
     'pypi': 'pypi',
     'vcs': 'versioncontrol',
     'download': 'download',
 }
+# The through row field and ordering field of each requirement group
+RELEASE_REQUIREMENT_FIELDS = {
+    'package': ('package_requirement', 'name'),
+    'download': ('download_requirement', 'url'),
+    'pypi': ('pypi_requirement', 'name'),
+    'versioncontrol': ('vcs_requirement', 'url'),
+}
 
 
 # =============================================================================
 # CLASSES
 # =============================================================================
+# pylint: disable=too-few-public-methods
+class AllowedPathTrie:
+    """Directory prefix trie mapping paths to their allowed extensions."""
+
+    def __init__(self, allowed_paths):
+        """Build the trie from (directory, extensions) pairs in priority order."""
+        self.root = {}
+        for index, (base_path, allowed_extensions) in enumerate(allowed_paths):
+            node = self.root
+            for segment in base_path.rstrip('/').split('/'):
+                node = node.setdefault(segment, {})
+
+            # The None key holds the node's rule, earlier rules take priority
+            node.setdefault(None, (index, frozenset(allowed_extensions)))
+
+    def get_allowed_extensions(self, path):
+        """Return the extensions of the first rule matching the file path."""
+        matches = []
+        node = self.root
+        for segment in path.split('/')[:-1]:
+            node = node.get(segment)
+            if node is None:
+                break
+
+            if None in node:
+                matches.append(node[None])
+
+        return min(matches)[1] if matches else None
+
+
 class ProjectZipFile:
     """Base ZipFile parsing class."""
 
     def __init__(self, zip_file):
         """Store the base attributes for the zip file."""
         self.zip_file = zip_file
-        with ZipFile(self.zip_file) as zip_obj:
-            self.file_list = self.get_file_list(zip_obj)
+        self.zip_obj = self.open_zip_file(zip_file)
+        self.file_list = self.get_file_list(self.zip_obj)
+        self.file_paths = frozenset(self.file_list)
         self.basename = None
         self.requirements = defaultdict(list)
         self.requirements_errors = []
 
+    def __enter__(self):
+        """Return the instance when used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the zip file when leaving the context."""
+        self.close()
+
+    def close(self):
+        """Close the zip file opened on instantiation."""
+        self.zip_obj.close()
+
     @property
     def project_type(self):
         """Return the type of project."""
@@ -101,10 +180,11 @@ class ProjectZipFile:
 
     def validate_file_paths(self):
         """Validate all paths in the zip file for their extension."""
-        invalid_paths = []
-        for file_path in self.file_list:
-            if not self._validate_path(file_path):
-                invalid_paths.append(file_path)
+        allowed_paths = AllowedPathTrie(self.get_allowed_paths())
+        invalid_paths = [
+            file_path for file_path in self.file_list
+            if not self._validate_path(file_path, allowed_paths)
+        ]
 
         if invalid_paths:
             raise ValidationError({
@@ -113,7 +193,15 @@ class ProjectZipFile:
                 )
             })
 
-    def _validate_path(self, path):
+    def get_allowed_paths(self):
+        """Return the formatted base paths and their allowed extensions."""
+        return [
+            (base_path.format(self=self), allowed_extensions)
+            for base_path, allowed_extensions in self.file_types.items()
+        ]
+
+    @staticmethod
+    def _validate_path(path, allowed_paths):
         """Validate the given path is ok for the extension."""
         if path.endswith('/'):
             return True
@@ -123,19 +211,23 @@ class ProjectZipFile:
         except IndexError:
             return True
 
-        for base_path, allowed_extensions in self.file_types.items():
-            if not path.startswith(base_path.format(self=self)):
-                continue
-
-            # extension allowed for path
-            if extension in allowed_extensions:
-                return True
+        allowed_extensions = allowed_paths.get_allowed_extensions(path)
 
-            # extension not allowed for path
+        # File not found in any allowed paths
+        if allowed_extensions is None:
             return False
 
-        # File not found in any allowed paths
-        return False
+        return extension in allowed_extensions
+
+    @staticmethod
+    def open_zip_file(zip_file):
+        """Open the zip file, parsing its central directory."""
+        try:
+            return ZipFile(zip_file)
+        except BadZipFile as exception:
+            raise ValidationError({
+                'zip_file': 'Given file is not a valid zip file.'
+            }) from exception
 
     @staticmethod
     def get_file_list(zip_obj):
@@ -177,7 +269,7 @@ class ProjectZipFile:
     def validate_base_file_in_zip(self):
         """Verify that there is a base file within the zip file."""
         for path in self.get_base_paths():
-            if path in self.file_list:
+            if path in self.file_paths:
                 break
         else:
             raise ValidationError(
@@ -206,40 +298,51 @@ class ProjectZipFile:
                 )
                 continue
 
-            for item in group:
-                if not isinstance(item, dict):
-                    self.requirements_errors.append(
-                        f'Invalid object found in "{group_type}" listing in '
-                        f'requirements json file.'
-                    )
-                    continue
+            items = self._get_group_items(
+                group_type=group_type,
+                group=group,
+            )
+            if group_type == 'custom':
+                self._validate_custom_requirements(items=items)
+                continue
 
-                if group_type == 'custom':
-                    self._validate_custom_requirement(
-                        item=item,
-                    )
-                else:
-                    is_pypi = group_type == 'pypi'
-                    self._validate_requirement(
-                        item=item,
-                        group_type=group_type,
-                        field='name' if is_pypi else 'url',
-                        include_version=is_pypi,
-                    )
+            for item in items:
+                is_pypi = group_type == 'pypi'
+                self._validate_requirement(
+                    item=item,
+                    group_type=group_type,
+                    field='name' if is_pypi else 'url',
+                    include_version=is_pypi,
+                )
 
         if self.requirements_errors:
             raise ValidationError({
                 'zip_file': self.requirements_errors,
             })
 
+        for group_type, (model, field) in REQUIREMENT_MODELS.items():
+            if group_type in self.requirements:
+                self._resolve_requirements(
+                    group_type=group_type,
+                    model=model,
+                    field=field,
+                )
+
     def get_requirements_file_contents(self):
         """Return the contents of the requirements.json file."""
-        requirement_path = self.get_requirement_path()
+        contents = self.read_requirements_file(
+            requirement_path=self.get_requirement_path(),
+        )
+        if contents is None:
+            logger.debug('No requirement file found.')
+        return contents
+
+    def read_requirements_file(self, requirement_path):
+        """Return the decoded requirements json file at the given path."""
         try:
-            with ZipFile(self.zip_file).open(requirement_path) as requirement_file:
+            with self.zip_obj.open(requirement_path) as requirement_file:
                 contents = json.load(requirement_file)
         except KeyError:
-            logger.debug('No requirement file found.')
             return None
         except json.decoder.JSONDecodeError as exception:
             raise ValidationError({
@@ -260,46 +363,92 @@ class ProjectZipFile:
             f'"get_requirement_path" method.'
         )
 
-    def _validate_custom_requirement(self, item):
-        """Verify that the given requirement exists."""
-        basename = item.get('basename')
-        if basename is None:
-            self.requirements_errors.append(
-                'No basename found for object in "custom" '
-                'listing in requirements json file.'
-            )
+    def _get_group_items(self, group_type, group):
+        """Return the group's objects, storing an error for any others."""
+        items = []
+        for item in group:
+            if not isinstance(item, dict):
+                self.requirements_errors.append(
+                    f'Invalid object found in "{group_type}" listing in '
+                    f'requirements json file.'
+                )
+                continue
+
+            items.append(item)
+        return items
+
+    def _validate_custom_requirements(self, items):
+        """Verify that the given custom package requirements exist.
+
+        All packages and their version indexes for the group are retrieved
+            together so the number of queries does not grow with the number
+            of items. Versions can be given as PEP 440 version specifiers.
+        """
+        basenames = set()
+        for item in items:
+            basename = item.get('basename')
+            if basename is None:
+                self.requirements_errors.append(
+                    'No basename found for object in "custom" '
+                    'listing in requirements json file.'
+                )
+                continue
+            basenames.add(basename)
+
+        if not basenames:
             return
 
         package_model = apps.get_model(
             app_label='project_manager',
             model_name='Package',
         )
-        try:
-            package = package_model.objects.get(basename=basename)
-        except package_model.DoesNotExist:
-            self.requirements_errors.append(
-                f'Custom Package "{basename}" from requirements '
-                f'json file not found.'
+        packages = package_model.objects.in_bulk(
+            id_list=basenames,
+            field_name='basename',
+        )
+        version_indexes = {}
+        if packages and any(item.get('version') is not None for item in items):
+            version_indexes = get_package_version_indexes(
+                package_ids=[package.pk for package in packages.values()],
             )
-            return
 
-        version = item.get('version')
-        # TODO: update this logic to work with all version operators
-        if (
-            version is not None and
-            not package.releases.filter(version=version).exists()
-        ):
-            self.requirements_errors.append(
-                f'Custom Package "{basename}" version "{version}", '
-                f'from requirements json file, not found.'
-            )
-            return
+        for item in items:
+            basename = item.get('basename')
+            if basename is None:
+                continue
 
-        self.requirements['custom'].append({
-            'package_requirement': package,
-            'version': version,
-            'optional': item.get('optional', False),
-        })
+            package = packages.get(basename)
+            if package is None:
+                self.requirements_errors.append(
+                    f'Custom Package "{basename}" from requirements '
+                    f'json file not found.'
+                )
+                continue
+
+            version = item.get('version')
+            if version is not None:
+                try:
+                    specifier = get_version_specifier(version)
+                except InvalidSpecifier:
+                    self.requirements_errors.append(
+                        f'Custom Package "{basename}" version "{version}", '
+                        f'from requirements json file, is not a valid '
+                        f'version specifier.'
+                    )
+                    continue
+
+                if not version_indexes[package.pk].find(specifier):
+                    self.requirements_errors.append(
+                        f'Custom Package "{basename}" version "{version}", '
+                        f'from requirements json file, not found.'
+                    )
+                    continue
+
+            self.requirements['custom'].append({
+                'package_requirement': package,
+                'version': version,
+                'optional': item.get('optional', False),
+            })
 
     def _validate_requirement(
         self, item, group_type, field, include_version=False
@@ -307,11 +456,6 @@ class ProjectZipFile:
         """Verify that the given requirement is valid."""
         # TODO: validate pypi requirements?
         # TODO: validate vcs requirements?
-        model = {
-            'download': DownloadRequirement,
-            'pypi': PyPiRequirement,
-            'vcs': VersionControlRequirement,
-        }.get(group_type)
         value = item.get(field)
         if value is None:
             self.requirements_errors.append(
@@ -320,10 +464,10 @@ class ProjectZipFile:
             )
             return
 
-        instance, created = model.objects.get_or_create(**{field: value})
+        # The value is replaced with its instance in _resolve_requirements
         key = f'{group_type}_requirement'
         requirement_dict = {
-            key: instance,
+            key: value,
             'optional': item.get('optional', False),
         }
         if include_version:
@@ -333,6 +477,57 @@ class ProjectZipFile:
 
         self.requirements[group_type].append(requirement_dict)
 
+    def _resolve_requirements(self, group_type, model, field):
+        """Replace the group's values with their requirement instances.
+
+        Existing requirements are retrieved in a single query and all missing
+            requirements are created in a single query. Requirements created
+            by another upload in between are ignored on insert, so the
+            missing requirements are then retrieved again.
+        """
+        key = f'{group_type}_requirement'
+        group = self.requirements[group_type]
+        values = {requirement[key] for requirement in group}
+        instances = self._get_requirement_instances(
+            model=model,
+            field=field,
+            values=values,
+        )
+
+        missing = [
+            model(**{field: value})
+            for value in sorted(values.difference(instances))
+        ]
+        if missing:
+            if model is PyPiRequirement:
+                # bulk_create does not call save(), which sets the slug
+                for instance in missing:
+                    instance.slug = slugify(instance.name)
+
+            # ignore_conflicts leaves the pks unset, so the rows are fetched
+            model.objects.bulk_create(missing, ignore_conflicts=True)
+            instances.update(
+                self._get_requirement_instances(
+                    model=model,
+                    field=field,
+                    values=[getattr(instance, field) for instance in missing],
+                )
+            )
+
+        for requirement in group:
+            requirement[key] = instances[requirement[key]]
+
+    @staticmethod
+    def _get_requirement_instances(model, field, values):
+        """Return the requirement instances with the given values."""
+        instances = {}
+        for instance in model.objects.filter(
+            **{f'{field}__in': values}
+        ).order_by('-pk'):
+            # Ordered so that the oldest duplicate url is the one kept
+            instances[getattr(instance, field)] = instance
+        return instances
+
 
 # =============================================================================
 # FUNCTIONS
@@ -344,11 +539,173 @@ def find_image_number(directory, slug):
     return f'{max(map(int, current_files or [0])) + 1:04}'
 
 
+def get_current_release_prefetch(release_model):
+    """Return a Prefetch of only the current release of each project.
+
+    The most recently created release of each project is found with a
+        subquery, so a page of projects loads exactly one release for each.
+        The release is stored in a list in the "current_releases" attribute.
+    """
+    project_field = get_release_project_field(release_model)
+    return Prefetch(
+        lookup='releases',
+        queryset=release_model.objects.filter(
+            pk=Subquery(
+                release_model.objects.filter(
+                    **{project_field: OuterRef(project_field)},
+                ).order_by('-created').values('pk')[:1],
+            ),
+        ),
+        to_attr='current_releases',
+    )
+
+
+def get_file_hash(field_file):
+    """Return the SHA-256 hash of the given file's contents."""
+    is_committed = getattr(field_file, '_committed', True)
+    file_hash = sha256()
+    try:
+        for chunk in field_file.chunks():
+            file_hash.update(chunk)
+    except (FileNotFoundError, SuspiciousFileOperation):
+        logger.warning('Unable to hash missing file "%s".', field_file.name)
+        return ''
+
+    # Only close files that were opened from storage,
+    #   new uploads still need to be saved.
+    if is_committed:
+        field_file.close()
+    return file_hash.hexdigest()
+
+
+def get_relation_count_subquery(model, relation_name):
+    """Return a subquery counting each object's rows of the reverse relation.
+
+    Each count is its own correlated subquery on the relation's table, or its
+        through table for ManyToMany relations. This avoids joining several
+        relations together, which multiplies the rows and needs a DISTINCT.
+    """
+    relation = model._meta.get_field(relation_name)
+    if relation.many_to_many:
+        count_model = relation.through
+        field_name = relation.field.m2m_reverse_field_name()
+    else:
+        count_model = relation.related_model
+        field_name = relation.field.name
+    return Coalesce(
+        Subquery(
+            count_model.objects.filter(
+                **{field_name: OuterRef('pk')},
+            ).order_by().values(
+                field_name,
+            ).annotate(
+                count=Count('pk'),
+            ).values('count'),
+        ),
+        0,
+    )
+
+
+def get_release_project_field(release_model):
+    """Return the name of the release model's ForeignKey to its project."""
+    return next(
+        field.name for field in release_model._meta.fields
+        if field.related_model is release_model.project_class
+    )
+
+
+def get_release_stats_values(release_model, project_field):
+    """Return the update values for the projects' stored release stats.
+
+    The values are subqueries on the project's releases, so every project
+        in a queryset can be updated in a single UPDATE statement.
+    """
+    releases = release_model.objects.filter(
+        **{project_field: OuterRef('pk')},
+    ).order_by()
+    return {
+        'current_version': Subquery(
+            releases.order_by('-created').values('version')[:1],
+        ),
+        'total_downloads': Coalesce(
+            Subquery(
+                releases.values(
+                    project_field,
+                ).annotate(
+                    total=Sum('download_count'),
+                ).values('total'),
+            ),
+            0,
+        ),
+    }
+
+
+def get_requirement_prefetches(release_model, prefix=''):
+    """Return Prefetches of the release's requirement through rows.
+
+    Each through row selects its requirement, so any number of releases and
+        requirements are loaded with one query per requirement group. The
+        prefix allows prefetching the requirements of related releases.
+    """
+    release_name = release_model.__name__.lower()
+    prefetches = []
+    for group, (field, ordering) in RELEASE_REQUIREMENT_FIELDS.items():
+        lookup = f'{release_name}{group}requirement_set'
+        through_model = getattr(release_model, lookup).rel.related_model
+        prefetches.append(
+            Prefetch(
+                lookup=f'{prefix}{lookup}',
+                queryset=through_model.objects.order_by(
+                    f'{field}__{ordering}',
+                ).select_related(
+                    field,
+                ),
+            )
+        )
+    return tuple(prefetches)
+
+
 def handle_project_logo_upload(instance, filename):
     """Handle uploading the logo by directing to the proper directory."""
     return instance.handle_logo_upload(filename)
 
 
+def handle_release_job_upload(instance, filename):
+    """Return the path to store the zip file until the job is processed."""
+    return f'{RELEASE_JOB_URL}{instance.pk}.zip'
+
+
 def handle_release_zip_file_upload(instance, filename):
     """Handle uploading the zip file by directing to the proper directory."""
     return instance.handle_zip_file_upload()
+
+
+@contextmanager
+def lock_file(path):
+    """Hold an exclusive lock on the given file, across processes.
+
+    The lock file is created when needed and never removed, so that every
+        process locks the same file.
+    """
+    path.parent.makedirs_p()
+    with path.open('a') as open_file:
+        fcntl.flock(open_file, fcntl.LOCK_EX)
+        yield
+
+
+def update_project_release_stats(instance, **kwargs):
+    """Update the stored release stats of the release's project.
+
+    This is connected to the post_save and post_delete signals of the
+        release models, so it runs in the same transaction as the change.
+    """
+    release_model = instance.__class__
+    project_field = get_release_project_field(release_model)
+    release_model.project_class.objects.filter(
+        pk=getattr(instance, f'{project_field}_id'),
+    ).update(
+        **get_release_stats_values(
+            release_model=release_model,
+            project_field=project_field,
+        )
+    )
@@ -0,0 +1,31 @@
+"""Command to write the catalog index."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.management.base import BaseCommand
+
+# App
+from project_manager.catalog import (
+    CATALOG_PROJECT_SECTIONS,
+    build_catalog,
+    write_catalog,
+)
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+class Command(BaseCommand):
+    """Write the catalog index of every project's current release."""
+
+    def handle(self, *args, **options):
+        """Replace the catalog files with a freshly built catalog."""
+        catalog = build_catalog()
+        write_catalog(catalog=catalog)
+        projects = sum(
+            len(catalog[section])
+            for section in CATALOG_PROJECT_SECTIONS.values()
+        )
+        self.stdout.write(f'Wrote the catalog index of {projects} projects.')
@@ -0,0 +1,46 @@
+"""Command to export every project as newline delimited JSON."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.management.base import BaseCommand
+
+# App
+from project_manager.export import iter_export_lines
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+class Command(BaseCommand):
+    """Write every project, with its releases, as a line of JSON."""
+
+    def add_arguments(self, parser):
+        """Add the output file and chunk size arguments."""
+        parser.add_argument(
+            '--output',
+            help='The file to write the export to, instead of stdout.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='The number of projects to read at a time.',
+        )
+
+    def handle(self, *args, **options):
+        """Stream the export to the output file or stdout."""
+        lines = iter_export_lines(chunk_size=options['chunk_size'])
+        if options['output'] is None:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+
+        count = 0
+        with open(options['output'], 'w', encoding='utf-8') as open_file:
+            for line in lines:
+                open_file.write(line)
+                count += 1
+        self.stdout.write(
+            f'Exported {count} projects to "{options["output"]}".'
+        )
@@ -0,0 +1,34 @@
+"""Command to write spooled download counts."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.management.base import BaseCommand, CommandError
+
+# App
+from project_manager.downloads.counters import download_counter
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+class Command(BaseCommand):
+    """Write the spooled download counts to the database.
+
+    Each web process buffers its own counts, which this command cannot
+        reach. They are written by the process itself, or spooled when it
+        shuts down, so only the spooled counts are written here.
+    """
+
+    help = 'Write the spooled download counts to the database.'
+
+    def handle(self, *args, **options):
+        """Load the spool file and flush it to the database."""
+        count = download_counter.flush()
+        if download_counter.pending:
+            download_counter.spool()
+            raise CommandError(
+                'Unable to write download counts, they have been spooled.'
+            )
+        self.stdout.write(f'Wrote {count} download counts.')
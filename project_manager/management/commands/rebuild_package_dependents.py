@@ -0,0 +1,22 @@
+"""Command to rebuild the Package dependents index."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.management.base import BaseCommand
+
+# App
+from project_manager.packages.dependents import rebuild_package_dependents
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+class Command(BaseCommand):
+    """Rebuild the Package dependents index from the release requirements."""
+
+    def handle(self, *args, **options):
+        """Replace every index row with ones built from the requirements."""
+        count = rebuild_package_dependents()
+        self.stdout.write(f'Indexed {count} Package dependents.')
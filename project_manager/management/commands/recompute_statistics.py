@@ -0,0 +1,30 @@
+"""Command to rebuild the statistics snapshot."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.management.base import BaseCommand
+
+# App
+from project_manager.statistics import recompute_statistics
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+class Command(BaseCommand):
+    """Rebuild the statistics snapshot from the release and project tables."""
+
+    def handle(self, *args, **options):
+        """Replace the snapshot's totals with freshly aggregated ones."""
+        snapshot = recompute_statistics()
+        projects = sum([
+            snapshot.package_count,
+            snapshot.plugin_count,
+            snapshot.sub_plugin_count,
+        ])
+        self.stdout.write(
+            f'Recomputed statistics for {snapshot.users} users and '
+            f'{projects} projects.'
+        )
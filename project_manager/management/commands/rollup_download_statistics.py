@@ -0,0 +1,55 @@
+"""Command to merge old daily download statistics into monthly rows."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from datetime import timedelta
+
+# Django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.timezone import localdate
+
+# App
+from project_manager.downloads.statistics import rollup_download_statistics
+from project_manager.packages.models import PackageReleaseDownloadStatistic
+from project_manager.plugins.models import PluginReleaseDownloadStatistic
+from project_manager.sub_plugins.models import (
+    SubPluginReleaseDownloadStatistic,
+)
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+class Command(BaseCommand):
+    """Merge old daily download statistics into monthly rows."""
+
+    def add_arguments(self, parser):
+        """Add the optional arguments for the command."""
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.DOWNLOAD_STATISTICS_DAILY_RETENTION,
+            help='The number of days of daily statistics to keep.',
+        )
+
+    def handle(self, *args, **options):
+        """Roll up the daily rows of every month older than the retention."""
+        before = (
+            localdate() - timedelta(days=options['days'])
+        ).replace(day=1)
+        for model in (
+            PackageReleaseDownloadStatistic,
+            PluginReleaseDownloadStatistic,
+            SubPluginReleaseDownloadStatistic,
+        ):
+            deleted = rollup_download_statistics(
+                model=model,
+                before=before,
+            )
+            self.stdout.write(
+                f'Rolled up {deleted} daily rows for '
+                f'{model._meta.verbose_name_plural}.'
+            )
@@ -0,0 +1,69 @@
+"""Command to process release jobs that are still pending."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.management.base import BaseCommand
+
+# App
+from project_manager.packages.api.serializers import (
+    PackageReleaseJobSerializer,
+)
+from project_manager.plugins.api.serializers import PluginReleaseJobSerializer
+from project_manager.release_jobs.constants import RELEASE_JOB_PENDING
+from project_manager.release_jobs.workers import (
+    requeue_stale_release_jobs,
+    run_release_job,
+)
+from project_manager.sub_plugins.api.serializers import (
+    SubPluginReleaseJobSerializer,
+)
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+class Command(BaseCommand):
+    """Process the pending release jobs, oldest first.
+
+    Jobs are normally run by the web process's worker pool, this picks up
+        any that were left behind, such as when the process was restarted.
+        Running jobs that have not been updated within the stale timeout
+        are requeued first.
+    """
+
+    def handle(self, *args, **options):
+        """Requeue the stale jobs and run every pending job."""
+        for serializer_class in (
+            PackageReleaseJobSerializer,
+            PluginReleaseJobSerializer,
+            SubPluginReleaseJobSerializer,
+        ):
+            model = serializer_class.Meta.model
+            requeued = requeue_stale_release_jobs(model=model)
+            if requeued:
+                self.stdout.write(
+                    f'Requeued {requeued} stale '
+                    f'{model._meta.verbose_name_plural}.'
+                )
+            job_ids = list(
+                model.objects.filter(
+                    status=RELEASE_JOB_PENDING,
+                ).order_by(
+                    'created',
+                ).values_list(
+                    'pk',
+                    flat=True,
+                )
+            )
+            for pk in job_ids:
+                run_release_job(
+                    model=model,
+                    pk=pk,
+                    serializer_class=serializer_class.release_serializer_class,
+                )
+            self.stdout.write(
+                f'Processed {len(job_ids)} pending '
+                f'{model._meta.verbose_name_plural}.'
+            )
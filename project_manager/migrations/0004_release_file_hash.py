@@ -0,0 +1,50 @@
+# Generated by Django 4.1.5 on 2026-10-17 19:01
+
+from hashlib import sha256
+
+from django.db import migrations, models
+
+
+def populate_file_hashes(apps, schema_editor):
+    for model_name in ('PackageRelease', 'PluginRelease', 'SubPluginRelease'):
+        model = apps.get_model('project_manager', model_name)
+        for release in model.objects.exclude(zip_file='').iterator():
+            file_hash = sha256()
+            try:
+                with release.zip_file.open('rb') as open_file:
+                    for chunk in open_file.chunks():
+                        file_hash.update(chunk)
+            except FileNotFoundError:
+                continue
+            model.objects.filter(pk=release.pk).update(
+                file_hash=file_hash.hexdigest(),
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0003_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='packagerelease',
+            name='file_hash',
+            field=models.CharField(blank=True, editable=False, help_text='The SHA-256 hash of the zip file.', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='pluginrelease',
+            name='file_hash',
+            field=models.CharField(blank=True, editable=False, help_text='The SHA-256 hash of the zip file.', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='subpluginrelease',
+            name='file_hash',
+            field=models.CharField(blank=True, editable=False, help_text='The SHA-256 hash of the zip file.', max_length=64),
+        ),
+        migrations.RunPython(
+            code=populate_file_hashes,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
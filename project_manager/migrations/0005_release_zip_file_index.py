@@ -0,0 +1,29 @@
+# Generated by Django 4.1.5 on 2026-10-17 19:13
+
+from django.db import migrations, models
+import project_manager.helpers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0004_release_file_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='packagerelease',
+            name='zip_file',
+            field=models.FileField(db_index=True, upload_to=project_manager.helpers.handle_release_zip_file_upload),
+        ),
+        migrations.AlterField(
+            model_name='pluginrelease',
+            name='zip_file',
+            field=models.FileField(db_index=True, upload_to=project_manager.helpers.handle_release_zip_file_upload),
+        ),
+        migrations.AlterField(
+            model_name='subpluginrelease',
+            name='zip_file',
+            field=models.FileField(db_index=True, upload_to=project_manager.helpers.handle_release_zip_file_upload),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.1.5 on 2026-10-17 19:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0005_release_zip_file_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubPluginReleaseDownloadStatistic',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', 'Day'), ('month', 'Month')], default='day', max_length=8)),
+                ('date', models.DateField(help_text='The first day of the period.')),
+                ('download_count', models.PositiveIntegerField(default=0)),
+                ('release', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='download_statistics', to='project_manager.subpluginrelease')),
+            ],
+            options={
+                'verbose_name': 'SubPlugin Release Download Statistic',
+                'verbose_name_plural': 'SubPlugin Release Download Statistics',
+                'unique_together': {('release', 'period', 'date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PluginReleaseDownloadStatistic',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', 'Day'), ('month', 'Month')], default='day', max_length=8)),
+                ('date', models.DateField(help_text='The first day of the period.')),
+                ('download_count', models.PositiveIntegerField(default=0)),
+                ('release', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='download_statistics', to='project_manager.pluginrelease')),
+            ],
+            options={
+                'verbose_name': 'Plugin Release Download Statistic',
+                'verbose_name_plural': 'Plugin Release Download Statistics',
+                'unique_together': {('release', 'period', 'date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PackageReleaseDownloadStatistic',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', 'Day'), ('month', 'Month')], default='day', max_length=8)),
+                ('date', models.DateField(help_text='The first day of the period.')),
+                ('download_count', models.PositiveIntegerField(default=0)),
+                ('release', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='download_statistics', to='project_manager.packagerelease')),
+            ],
+            options={
+                'verbose_name': 'Package Release Download Statistic',
+                'verbose_name_plural': 'Package Release Download Statistics',
+                'unique_together': {('release', 'period', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 4.1.5 on 2026-10-17 19:36
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import project_manager.helpers
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('project_manager', '0006_release_download_statistics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubPluginReleaseJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.CharField(help_text='The version for the release of the project.', max_length=8, validators=[django.core.validators.RegexValidator('^[0-9][0-9a-z.]*[0-9a-z]')])),
+                ('notes', models.TextField(blank=True, default='', help_text='The notes for the release of the project.', max_length=512)),
+                ('zip_file', models.FileField(blank=True, upload_to=project_manager.helpers.handle_release_job_upload)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('progress', models.PositiveSmallIntegerField(default=0, help_text='The percentage of the job that has been completed.')),
+                ('errors', models.JSONField(blank=True, default=dict, help_text='The validation errors for a failed job.')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('updated', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='updated')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sub_plugin_release_jobs', to='users.forumuser')),
+                ('release', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='job', to='project_manager.subpluginrelease')),
+                ('sub_plugin', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='release_jobs', to='project_manager.subplugin')),
+            ],
+            options={
+                'verbose_name': 'SubPlugin Release Job',
+                'verbose_name_plural': 'SubPlugin Release Jobs',
+            },
+        ),
+        migrations.CreateModel(
+            name='PluginReleaseJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.CharField(help_text='The version for the release of the project.', max_length=8, validators=[django.core.validators.RegexValidator('^[0-9][0-9a-z.]*[0-9a-z]')])),
+                ('notes', models.TextField(blank=True, default='', help_text='The notes for the release of the project.', max_length=512)),
+                ('zip_file', models.FileField(blank=True, upload_to=project_manager.helpers.handle_release_job_upload)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('progress', models.PositiveSmallIntegerField(default=0, help_text='The percentage of the job that has been completed.')),
+                ('errors', models.JSONField(blank=True, default=dict, help_text='The validation errors for a failed job.')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('updated', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='updated')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='plugin_release_jobs', to='users.forumuser')),
+                ('plugin', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='release_jobs', to='project_manager.plugin')),
+                ('release', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='job', to='project_manager.pluginrelease')),
+            ],
+            options={
+                'verbose_name': 'Plugin Release Job',
+                'verbose_name_plural': 'Plugin Release Jobs',
+            },
+        ),
+        migrations.CreateModel(
+            name='PackageReleaseJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.CharField(help_text='The version for the release of the project.', max_length=8, validators=[django.core.validators.RegexValidator('^[0-9][0-9a-z.]*[0-9a-z]')])),
+                ('notes', models.TextField(blank=True, default='', help_text='The notes for the release of the project.', max_length=512)),
+                ('zip_file', models.FileField(blank=True, upload_to=project_manager.helpers.handle_release_job_upload)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('progress', models.PositiveSmallIntegerField(default=0, help_text='The percentage of the job that has been completed.')),
+                ('errors', models.JSONField(blank=True, default=dict, help_text='The validation errors for a failed job.')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('updated', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='updated')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='package_release_jobs', to='users.forumuser')),
+                ('package', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='release_jobs', to='project_manager.package')),
+                ('release', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='job', to='project_manager.packagerelease')),
+            ],
+            options={
+                'verbose_name': 'Package Release Job',
+                'verbose_name_plural': 'Package Release Jobs',
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.1.5 on 2026-10-17 19:52
+
+from django.db import migrations, models
+import project_manager.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0007_release_jobs'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='packagereleasepackagerequirement',
+            name='version',
+            field=models.CharField(blank=True, help_text='The version, or version specifier, of the custom package for this release of the package.', max_length=64, null=True, validators=[project_manager.validators.specifier_validator]),
+        ),
+        migrations.AlterField(
+            model_name='pluginreleasepackagerequirement',
+            name='version',
+            field=models.CharField(blank=True, help_text='The version, or version specifier, of the custom package for this release of the plugin.', max_length=64, null=True, validators=[project_manager.validators.specifier_validator]),
+        ),
+        migrations.AlterField(
+            model_name='subpluginreleasepackagerequirement',
+            name='version',
+            field=models.CharField(blank=True, help_text='The version, or version specifier, of the custom package for this release of the sub_plugin.', max_length=64, null=True, validators=[project_manager.validators.specifier_validator]),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 4.1.5 on 2026-10-17 20:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def build_package_dependents(apps, schema_editor):
+    model = apps.get_model('project_manager', 'PackageDependent')
+    rows = []
+    for release_model_name, project_type, release_field, project_field in (
+        ('PluginRelease', 'plugin', 'plugin_release', 'plugin'),
+        ('SubPluginRelease', 'sub-plugin', 'sub_plugin_release', 'sub_plugin'),
+        ('PackageRelease', 'package', 'package_release', 'package'),
+    ):
+        requirement_model = apps.get_model(
+            'project_manager',
+            f'{release_model_name}PackageRequirement',
+        )
+        rows.extend(
+            model(
+                requirement_id=pk,
+                package_id=package_id,
+                project_type=project_type,
+                project_pk=project_pk,
+                version=version,
+                optional=optional,
+            ) for (
+                pk, package_id, project_pk, version, optional,
+            ) in requirement_model.objects.values_list(
+                'pk',
+                'package_requirement_id',
+                f'{release_field}__{project_field}_id',
+                'version',
+                'optional',
+            ).iterator()
+        )
+    model.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0008_package_requirement_specifiers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PackageDependent',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('requirement_id', models.UUIDField(editable=False, unique=True)),
+                ('project_type', models.CharField(choices=[('plugin', 'Plugin'), ('sub-plugin', 'SubPlugin'), ('package', 'Package')], max_length=16)),
+                ('project_pk', models.CharField(max_length=65)),
+                ('version', models.CharField(blank=True, max_length=64, null=True)),
+                ('optional', models.BooleanField(default=False)),
+                ('package', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dependents', to='project_manager.package')),
+            ],
+            options={
+                'verbose_name': 'Package Dependent',
+                'verbose_name_plural': 'Package Dependents',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='packagedependent',
+            index=models.Index(fields=['package', 'project_type', 'project_pk'], name='project_man_package_5858f0_idx'),
+        ),
+        migrations.RunPython(
+            code=build_package_dependents,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
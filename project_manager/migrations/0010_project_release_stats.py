@@ -0,0 +1,78 @@
+# Generated by Django 4.1.5 on 2026-10-17 20:08
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def store_project_release_stats(apps, schema_editor):
+    for project_name, project_field in (
+        ('Package', 'package'),
+        ('Plugin', 'plugin'),
+        ('SubPlugin', 'sub_plugin'),
+    ):
+        releases = apps.get_model(
+            'project_manager',
+            f'{project_name}Release',
+        ).objects.filter(
+            **{project_field: OuterRef('pk')},
+        ).order_by()
+        apps.get_model('project_manager', project_name).objects.update(
+            current_version=Subquery(
+                releases.order_by('-created').values('version')[:1],
+            ),
+            total_downloads=Coalesce(
+                Subquery(
+                    releases.values(
+                        project_field,
+                    ).annotate(
+                        total=Sum('download_count'),
+                    ).values('total'),
+                ),
+                0,
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0009_package_dependents'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='package',
+            name='current_version',
+            field=models.CharField(blank=True, editable=False, help_text='The version of the most recently created release.', max_length=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='package',
+            name='total_downloads',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, help_text='The sum of the download counts of all releases.'),
+        ),
+        migrations.AddField(
+            model_name='plugin',
+            name='current_version',
+            field=models.CharField(blank=True, editable=False, help_text='The version of the most recently created release.', max_length=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='plugin',
+            name='total_downloads',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, help_text='The sum of the download counts of all releases.'),
+        ),
+        migrations.AddField(
+            model_name='subplugin',
+            name='current_version',
+            field=models.CharField(blank=True, editable=False, help_text='The version of the most recently created release.', max_length=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='subplugin',
+            name='total_downloads',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, help_text='The sum of the download counts of all releases.'),
+        ),
+        migrations.RunPython(
+            code=store_project_release_stats,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
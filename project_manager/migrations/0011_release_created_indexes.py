@@ -0,0 +1,25 @@
+# Generated by Django 4.1.5 on 2026-10-17 20:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0010_project_release_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='packagerelease',
+            index=models.Index(fields=['package', '-created'], name='project_man_package_171027_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pluginrelease',
+            index=models.Index(fields=['plugin', '-created'], name='project_man_plugin__055507_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subpluginrelease',
+            index=models.Index(fields=['sub_plugin', '-created'], name='project_man_sub_plu_856c94_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.1.5 on 2026-10-17 20:27
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0011_release_created_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatisticsSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('package_count', models.PositiveIntegerField(default=0)),
+                ('plugin_count', models.PositiveIntegerField(default=0)),
+                ('sub_plugin_count', models.PositiveIntegerField(default=0)),
+                ('package_downloads', models.PositiveIntegerField(default=0)),
+                ('plugin_downloads', models.PositiveIntegerField(default=0)),
+                ('sub_plugin_downloads', models.PositiveIntegerField(default=0)),
+                ('users', models.PositiveIntegerField(default=0)),
+                ('recent_downloads', models.PositiveIntegerField(default=0)),
+                ('recent_date', models.DateField(help_text='The date the recent downloads were counted for.', null=True)),
+                ('updated', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='updated')),
+            ],
+            options={
+                'verbose_name': 'Statistics Snapshot',
+                'verbose_name_plural': 'Statistics Snapshots',
+            },
+        ),
+    ]
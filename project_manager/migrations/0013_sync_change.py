@@ -0,0 +1,92 @@
+# Generated by Django 4.1.5 on 2026-10-17 21:03
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+def record_existing_changes(apps, schema_editor):
+    project_types = {
+        'Package': 'package',
+        'Plugin': 'plugin',
+        'SubPlugin': 'sub-plugin',
+    }
+    changes = []
+    for model_name, project_type in project_types.items():
+        project_model = apps.get_model('project_manager', model_name)
+        updated = dict(project_model.objects.values_list('pk', 'updated'))
+        changes.extend(
+            (date, 'project', project_type, pk, '')
+            for pk, date in updated.items()
+        )
+        for suffix, object_type, key_field in (
+            ('Release', 'release', 'version'),
+            ('Tag', 'tag', 'tag_id'),
+            ('Game', 'game', 'game_id'),
+        ):
+            model = apps.get_model('project_manager', f'{model_name}{suffix}')
+            project_field = next(
+                field.attname for field in model._meta.concrete_fields
+                if field.is_relation and (
+                    field.related_model.__name__ in project_types
+                )
+            )
+            fields = [project_field, key_field]
+            if suffix == 'Release':
+                fields.append('created')
+            for row in model.objects.values(*fields):
+                project = row[project_field]
+                changes.append((
+                    row.get('created', updated[project]),
+                    object_type,
+                    project_type,
+                    project,
+                    row[key_field],
+                ))
+
+    change_model = apps.get_model('project_manager', 'SyncChange')
+    change_model.objects.bulk_create(
+        [
+            change_model(
+                created=date,
+                object_type=object_type,
+                project_type=project_type,
+                project=project,
+                key=key,
+            ) for date, object_type, project_type, project, key in sorted(
+                changes,
+                key=lambda change: change[0],
+            )
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_manager', '0012_statistics_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncChange',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(db_index=True, default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('object_type', models.CharField(choices=[('project', 'Project'), ('release', 'Release'), ('tag', 'Tag'), ('game', 'Game')], max_length=8)),
+                ('project_type', models.CharField(max_length=16)),
+                ('project', models.CharField(help_text="The project's primary key.", max_length=65)),
+                ('key', models.CharField(blank=True, help_text="The release's version, the tag's name, or the game's slug.", max_length=64)),
+                ('deleted', models.BooleanField(default=False)),
+            ],
+            options={
+                'verbose_name': 'Sync Change',
+                'verbose_name_plural': 'Sync Changes',
+            },
+        ),
+        migrations.RunPython(
+            code=record_existing_changes,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
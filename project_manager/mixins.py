@@ -5,10 +5,21 @@
 # =============================================================================
 # Django
 from django.conf import settings
-from django.db.models import F
 from django.http import Http404, HttpResponse
-from django.views.generic import View
+from django.utils.cache import get_conditional_response
 from django.utils.functional import cached_property
+from django.utils.http import http_date
+from django.views.generic import View
+
+# App
+from project_manager.downloads.backends import get_download_backend
+from project_manager.downloads.counters import download_counter
+from project_manager.downloads.helpers import (
+    get_cached_release,
+    if_range_matches,
+    is_new_download,
+    parse_range_header,
+)
 
 
 # =============================================================================
@@ -41,27 +52,23 @@ class DownloadMixin(View):
             '"base_url" attribute.'
         )
 
-    @property
-    def project_model(self):
-        """Return the project model."""
-        raise NotImplementedError(
-            f'Class "{self.__class__.__name__}" must implement a '
-            '"project_model" attribute.'
-        )
-
-    @property
-    def model_kwarg(self):
-        """Return the project's kwarg key."""
-        raise NotImplementedError(
-            f'Class "{self.__class__.__name__}" must implement a '
-            '"model_kwarg" attribute.'
-        )
-
     @cached_property
     def full_path(self):
         """Return the full path for the download."""
         return self.get_base_path() / self.kwargs['zip_file']
 
+    @cached_property
+    def relative_path(self):
+        """Return the download's path relative to the media root."""
+        return '/'.join(
+            self.full_path.relpath(settings.MEDIA_ROOT).splitall()[1:]
+        )
+
+    @cached_property
+    def download_backend(self):
+        """Return the backend used to send the file."""
+        return get_download_backend()
+
     def get_base_path(self):
         """Return the base path for the download."""
         return settings.MEDIA_ROOT / self.base_url / self.kwargs['slug']
@@ -72,35 +79,77 @@ class DownloadMixin(View):
             raise Http404
         return super().dispatch(request, *args, **kwargs)
 
+    @cached_property
+    def release(self):
+        """Return the release being downloaded."""
+        return get_cached_release(
+            model=self.model,
+            relative_path=self.relative_path,
+        )
+
     def get(self, request, **kwargs):
         """Handle the download and download counter."""
-        zip_file = kwargs['zip_file']
-        with self.full_path.open('rb') as open_file:
-            response = HttpResponse(
-                content=open_file.read(),
-                content_type='application/force-download',
-            )
-        response['Content-Disposition'] = f'attachment: filename={zip_file}'
-        self.update_download_count(
-            kwargs=kwargs,
-            zip_file=zip_file,
+        etag, last_modified = self.get_validators()
+        response = get_conditional_response(
+            request=request,
+            etag=etag,
+            last_modified=last_modified,
         )
+        if response is None:
+            response = self.get_download_response(
+                request=request,
+                etag=etag,
+                last_modified=last_modified,
+            )
+
+        if etag is not None:
+            response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
         return response
 
-    def get_instance(self, kwargs):
-        """Return the project's instance."""
-        return self.project_model.objects.get(slug=kwargs['slug'])
+    def get_validators(self):
+        """Return the ETag and last modified timestamp for the release."""
+        release = self.release
+        if release is None:
+            return None, None
 
-    def update_download_count(self, kwargs, zip_file):
-        """Increments the download count for the release."""
-        # TODO: update without having to use a query from get_instance
-        instance = self.get_instance(kwargs)
-        version = zip_file.split(
-            f'{instance.slug}-v', 1
-        )[1].rsplit('.', 1)[0]
-        self.model.objects.filter(**{
-            self.model_kwarg: instance,
-            'version': version,
-        }).update(
-            download_count=F('download_count') + 1
+        etag = f'"{release.file_hash}"' if release.file_hash else None
+        return etag, int(release.created.timestamp())
+
+    def get_download_response(self, request, etag, last_modified):
+        """Return the response for the file, or the requested byte ranges."""
+        ranges = None
+        if if_range_matches(
+            header=request.META.get('HTTP_IF_RANGE'),
+            etag=etag,
+            last_modified=last_modified,
+        ):
+            ranges = parse_range_header(
+                header=request.META.get('HTTP_RANGE'),
+                size=self.full_path.size,
+            )
+
+        if ranges == []:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{self.full_path.size}'
+            return response
+
+        response = self.download_backend.get_response(
+            full_path=self.full_path,
+            relative_path=self.relative_path,
+            file_name=self.kwargs['zip_file'],
+            ranges=ranges,
         )
+        if all([
+            request.method == 'GET',
+            self.release is not None,
+            is_new_download(ranges),
+        ]):
+            self.update_download_count(release=self.release)
+        return response
+
+    @staticmethod
+    def update_download_count(release):
+        """Increments the download count for the release."""
+        download_counter.increment(release=release)
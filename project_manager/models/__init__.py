@@ -1 +1,126 @@
 """Base models."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.db import models
+
+# Third Party Django
+from model_utils.fields import AutoCreatedField, AutoLastModifiedField
+
+# App
+from project_manager.constants import (
+    PROJECT_SLUG_MAX_LENGTH,
+    SYNC_OBJECT_TYPES,
+)
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'StatisticsSnapshot',
+    'SyncChange',
+)
+
+
+# =============================================================================
+# MODELS
+# =============================================================================
+class StatisticsSnapshot(models.Model):
+    """Materialized totals shown on the statistics page.
+
+    A single row is kept up to date as releases, projects, contributors,
+        and download counts are written, so that the page does not need to
+        aggregate the release tables.
+    """
+
+    package_count = models.PositiveIntegerField(
+        default=0,
+    )
+    plugin_count = models.PositiveIntegerField(
+        default=0,
+    )
+    sub_plugin_count = models.PositiveIntegerField(
+        default=0,
+    )
+    package_downloads = models.PositiveIntegerField(
+        default=0,
+    )
+    plugin_downloads = models.PositiveIntegerField(
+        default=0,
+    )
+    sub_plugin_downloads = models.PositiveIntegerField(
+        default=0,
+    )
+    users = models.PositiveIntegerField(
+        default=0,
+    )
+    recent_downloads = models.PositiveIntegerField(
+        default=0,
+    )
+    recent_date = models.DateField(
+        null=True,
+        help_text='The date the recent downloads were counted for.',
+    )
+    updated = AutoLastModifiedField(
+        verbose_name='updated',
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        verbose_name = 'Statistics Snapshot'
+        verbose_name_plural = 'Statistics Snapshots'
+
+    def __str__(self):
+        """Return the time the snapshot was last updated."""
+        return f'Statistics Snapshot: {self.updated}'
+
+
+class SyncChange(models.Model):
+    """A change to a project, release, tag, or game for the sync API.
+
+    Rows are only ever added, so their ids are the tokens that sync clients
+        use to ask for the changes after the last one they have seen. Rows
+        are only returned once they are older than SYNC_CHANGE_COMMIT_LAG,
+        so that a row committed after one with a higher id is not skipped.
+    """
+
+    created = AutoCreatedField(
+        verbose_name='created',
+        db_index=True,
+    )
+    object_type = models.CharField(
+        max_length=8,
+        choices=SYNC_OBJECT_TYPES,
+    )
+    project_type = models.CharField(
+        max_length=16,
+    )
+    project = models.CharField(
+        max_length=PROJECT_SLUG_MAX_LENGTH * 2 + 1,
+        help_text="The project's primary key.",
+    )
+    key = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="The release's version, the tag's name, or the game's slug.",
+    )
+    deleted = models.BooleanField(
+        default=False,
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        verbose_name = 'Sync Change'
+        verbose_name_plural = 'Sync Changes'
+
+    def __str__(self):
+        """Return the change's object."""
+        return (
+            f'{self.project_type} {self.project} {self.object_type} '
+            f'{self.key}'.rstrip()
+        )
@@ -4,7 +4,6 @@
 # IMPORTS
 # =============================================================================
 # Python
-from operator import attrgetter
 from uuid import uuid4
 
 # Django
@@ -15,7 +14,7 @@ from django.utils.text import slugify
 
 # Third Party Django
 from embed_video.fields import EmbedVideoField
-from model_utils.fields import AutoCreatedField
+from model_utils.fields import AutoCreatedField, AutoLastModifiedField
 from PIL import Image
 from precise_bbcode.fields import BBCodeTextField
 
@@ -31,10 +30,20 @@ from project_manager.constants import (
     RELEASE_NOTES_MAX_LENGTH,
     RELEASE_VERSION_MAX_LENGTH,
 )
+from project_manager.downloads.constants import (
+    DOWNLOAD_PERIOD_DAY,
+    DOWNLOAD_PERIODS,
+)
 from project_manager.helpers import (
+    get_file_hash,
     handle_project_logo_upload,
+    handle_release_job_upload,
     handle_release_zip_file_upload,
 )
+from project_manager.release_jobs.constants import (
+    RELEASE_JOB_PENDING,
+    RELEASE_JOB_STATUSES,
+)
 from project_manager.validators import version_validator
 
 
@@ -45,6 +54,8 @@ __all__ = (
     'AbstractUUIDPrimaryKeyModel',
     'Project',
     'ProjectRelease',
+    'ProjectReleaseDownloadStatistic',
+    'ProjectReleaseJob',
 )
 
 
@@ -125,6 +136,19 @@ class Project(models.Model):
     updated = models.DateTimeField(
         verbose_name='updated',
     )
+    current_version = models.CharField(
+        max_length=RELEASE_VERSION_MAX_LENGTH,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text='The version of the most recently created release.',
+    )
+    total_downloads = models.PositiveIntegerField(
+        default=0,
+        db_index=True,
+        editable=False,
+        help_text='The sum of the download counts of all releases.',
+    )
     basename = None
     logo_path = None
     slug = None
@@ -154,28 +178,6 @@ class Project(models.Model):
             '"releases" field via ForeignKey relationship.'
         )
 
-    @property
-    def current_version(self):
-        """Return the current release's version."""
-        # TODO: rework this query
-        return self.releases.values_list(
-            'version',
-            flat=True,
-        ).order_by(
-            '-created'
-        )[0]
-
-    @property
-    def total_downloads(self):
-        """Return the total number of downloads for the project."""
-        # TODO: rework this query
-        return sum(
-            map(
-                attrgetter('download_count'),
-                self.releases.all()
-            )
-        )
-
     def clean(self):
         """Clean all attributes and raise any errors that occur."""
         self.clean_logo()
@@ -242,10 +244,17 @@ class ProjectRelease(AbstractUUIDPrimaryKeyModel):
     )
     zip_file = models.FileField(
         upload_to=handle_release_zip_file_upload,
+        db_index=True,
     )
     download_count = models.PositiveIntegerField(
         default=0,
     )
+    file_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text='The SHA-256 hash of the zip file.',
+    )
     created = AutoCreatedField(
         verbose_name='created',
     )
@@ -304,6 +313,10 @@ class ProjectRelease(AbstractUUIDPrimaryKeyModel):
     def save(self, *args, **kwargs):
         """Update the Project's 'updated' value to the releases 'created'."""
         pk = self.pk
+        if self.zip_file and (
+            self._state.adding or self.field_tracker.has_changed('zip_file')
+        ):
+            self.file_hash = get_file_hash(self.zip_file)
         super().save(*args, **kwargs)
         if pk is None:
             self.project_class.objects.filter(
@@ -311,3 +324,87 @@ class ProjectRelease(AbstractUUIDPrimaryKeyModel):
             ).update(
                 updated=self.created,
             )
+
+
+class ProjectReleaseDownloadStatistic(models.Model):
+    """Base model for the number of downloads of a release in a period."""
+
+    period = models.CharField(
+        max_length=8,
+        choices=DOWNLOAD_PERIODS,
+        default=DOWNLOAD_PERIOD_DAY,
+    )
+    date = models.DateField(
+        help_text='The first day of the period.',
+    )
+    download_count = models.PositiveIntegerField(
+        default=0,
+    )
+
+    release = None
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        abstract = True
+
+    def __str__(self):
+        """Return the release, period, and date."""
+        return f'{self.release} - {self.period} - {self.date}'
+
+
+class ProjectReleaseJob(AbstractUUIDPrimaryKeyModel):
+    """Base model for releases that are validated and created in the background."""
+
+    version = models.CharField(
+        max_length=RELEASE_VERSION_MAX_LENGTH,
+        validators=[version_validator],
+        help_text='The version for the release of the project.',
+    )
+    notes = models.TextField(
+        max_length=RELEASE_NOTES_MAX_LENGTH,
+        blank=True,
+        default='',
+        help_text='The notes for the release of the project.',
+    )
+    zip_file = models.FileField(
+        upload_to=handle_release_job_upload,
+        blank=True,
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=RELEASE_JOB_STATUSES,
+        default=RELEASE_JOB_PENDING,
+    )
+    progress = models.PositiveSmallIntegerField(
+        default=0,
+        help_text='The percentage of the job that has been completed.',
+    )
+    errors = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='The validation errors for a failed job.',
+    )
+    created = AutoCreatedField(
+        verbose_name='created',
+    )
+    updated = AutoLastModifiedField(
+        verbose_name='updated',
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        abstract = True
+
+    @property
+    def project(self):
+        """Return the project's class."""
+        raise NotImplementedError(
+            f'Class "{self.__class__.__name__}" must implement a '
+            '"project" property.'
+        )
+
+    def __str__(self):
+        """Return the project name + job version."""
+        return f'{self.project} - {self.version} ({self.status})'
@@ -9,6 +9,7 @@ from project_manager.api.common.serializers import (
     ProjectCreateReleaseSerializer,
     ProjectGameSerializer,
     ProjectImageSerializer,
+    ProjectReleaseJobSerializer,
     ProjectReleaseSerializer,
     ProjectSerializer,
     ProjectTagSerializer,
@@ -22,6 +23,7 @@ from project_manager.packages.models import (
     PackageImage,
     PackageRelease,
     PackageReleaseDownloadRequirement,
+    PackageReleaseJob,
     PackageReleasePackageRequirement,
     PackageReleasePyPiRequirement,
     PackageReleaseVersionControlRequirement,
@@ -44,6 +46,7 @@ __all__ = (
     'PackageGameSerializer',
     'PackageImageSerializer',
     'PackageReleaseDownloadRequirementSerializer',
+    'PackageReleaseJobSerializer',
     'PackageReleasePackageRequirementSerializer',
     'PackageReleasePyPiRequirementSerializer',
     'PackageReleaseSerializer',
@@ -150,6 +153,17 @@ class PackageCreateReleaseSerializer(
         model = PackageRelease
 
 
+class PackageReleaseJobSerializer(ProjectReleaseJobSerializer):
+    """Serializer for queueing and retrieving Package release jobs."""
+
+    release_serializer_class = PackageReleaseSerializer
+
+    class Meta(ProjectReleaseJobSerializer.Meta):
+        """Define metaclass attributes."""
+
+        model = PackageReleaseJob
+
+
 class PackageSerializer(ProjectSerializer):
     """Serializer for updating and listing Packages."""
 
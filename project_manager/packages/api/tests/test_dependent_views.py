@@ -0,0 +1,201 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.cache import cache
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.common.views.mixins import ProjectRelatedInfoMixin
+from project_manager.packages.api.views import PackageDependentViewSet
+from project_manager.packages.models import Package, PackageDependent
+from test_utils.factories.packages import (
+    PackageFactory,
+    PackageReleaseFactory,
+    PackageReleasePackageRequirementFactory,
+)
+from test_utils.factories.plugins import (
+    PluginFactory,
+    PluginReleaseFactory,
+    PluginReleasePackageRequirementFactory,
+)
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PackageDependentViewSetTestCase(APITestCase):
+
+    package = package_dependent = plugin_1 = plugin_2 = None
+    list_path = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.package = PackageFactory(basename='test_package')
+        for version in ('1.0.0', '2.0.0'):
+            PackageReleaseFactory(package=cls.package, version=version)
+
+        cls.plugin_1 = PluginFactory(basename='plugin_1')
+        cls.plugin_2 = PluginFactory(basename='plugin_2')
+        cls.package_dependent = PackageFactory(basename='dependent')
+        for plugin, specifier in (
+            (cls.plugin_1, '<2'),
+            (cls.plugin_2, None),
+        ):
+            PluginReleasePackageRequirementFactory(
+                plugin_release=PluginReleaseFactory(plugin=plugin),
+                package_requirement=cls.package,
+                version=specifier,
+            )
+        PackageReleasePackageRequirementFactory(
+            package_release=PackageReleaseFactory(
+                package=cls.package_dependent,
+            ),
+            package_requirement=cls.package,
+            version='>=2.0.0',
+        )
+        cls.list_path = reverse(
+            viewname='api:packages:dependents-list',
+            kwargs={
+                'package_slug': cls.package.slug,
+            },
+        )
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(PackageDependentViewSet, ProjectRelatedInfoMixin),
+        )
+
+    def test_base_attributes(self):
+        self.assertTupleEqual(
+            tuple1=PackageDependentViewSet.http_method_names,
+            tuple2=('get', 'options'),
+        )
+        self.assertEqual(
+            first=PackageDependentViewSet.project_type,
+            second='package',
+        )
+        self.assertEqual(
+            first=PackageDependentViewSet.project_model,
+            second=Package,
+        )
+        self.assertIs(
+            expr1=PackageDependentViewSet.queryset.model,
+            expr2=PackageDependent,
+        )
+
+    def test_get_list(self):
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={
+                'count': 3,
+                'next': None,
+                'previous': None,
+                'results': [
+                    {
+                        'project_type': 'plugin',
+                        'name': self.plugin_1.name,
+                        'slug': self.plugin_1.slug,
+                    },
+                    {
+                        'project_type': 'plugin',
+                        'name': self.plugin_2.name,
+                        'slug': self.plugin_2.slug,
+                    },
+                    {
+                        'project_type': 'package',
+                        'name': self.package_dependent.name,
+                        'slug': self.package_dependent.slug,
+                    },
+                ],
+                'counts': {'plugin': 2, 'package': 1},
+                'versions': {'2.0.0': 2, '1.0.0': 2},
+            },
+        )
+
+        # Verify that the dependents are paginated
+        response = self.client.get(path=self.list_path, data={'page_size': 1})
+        content = response.json()
+        self.assertEqual(first=content['count'], second=3)
+        self.assertEqual(first=len(content['results']), second=1)
+        self.assertDictEqual(
+            d1=content['counts'],
+            d2={'plugin': 2, 'package': 1},
+        )
+
+    def test_get_list_failure(self):
+        response = self.client.get(
+            path=reverse(
+                viewname='api:packages:dependents-list',
+                kwargs={
+                    'package_slug': 'invalid',
+                },
+            ),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_404_NOT_FOUND,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'detail': 'Invalid package_slug.'},
+        )
+
+    def test_get_details(self):
+        response = self.client.get(
+            path=reverse(
+                viewname='api:packages:dependents-detail',
+                kwargs={
+                    'package_slug': self.package.slug,
+                    'version': '2.0.0',
+                },
+            ),
+        )
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        content = response.json()
+        self.assertEqual(first=content['version'], second='2.0.0')
+        self.assertEqual(first=content['count'], second=2)
+        self.assertListEqual(
+            list1=[result['slug'] for result in content['results']],
+            list2=[self.plugin_2.slug, self.package_dependent.slug],
+        )
+        self.assertDictEqual(
+            d1=content['counts'],
+            d2={'plugin': 1, 'package': 1},
+        )
+
+        response = self.client.get(
+            path=reverse(
+                viewname='api:packages:dependents-detail',
+                kwargs={
+                    'package_slug': self.package.slug,
+                    'version': '3.0.0',
+                },
+            ),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_404_NOT_FOUND,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'detail': 'Invalid version.'},
+        )
+
+    def test_options(self):
+        response = self.client.options(path=self.list_path)
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        self.assertEqual(
+            first=response.json()['name'],
+            second=f'{self.package} - Dependent',
+        )
@@ -0,0 +1,124 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from datetime import date
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.common.serializers import (
+    ProjectDownloadStatisticQuerySerializer,
+)
+from project_manager.api.common.views import ProjectDownloadStatisticViewSet
+from project_manager.packages.api.views import (
+    PackageDownloadStatisticViewSet,
+)
+from project_manager.packages.models import (
+    Package,
+    PackageReleaseDownloadStatistic,
+)
+from test_utils.factories.packages import (
+    PackageFactory,
+    PackageReleaseDownloadStatisticFactory,
+    PackageReleaseFactory,
+)
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PackageDownloadStatisticViewSetTestCase(APITestCase):
+
+    package = release = list_path = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.package = PackageFactory()
+        cls.release = PackageReleaseFactory(
+            package=cls.package,
+            version='1.0.0',
+        )
+        PackageReleaseDownloadStatisticFactory(
+            release=cls.release,
+            date=date(2023, 2, 1),
+            download_count=3,
+        )
+        PackageReleaseDownloadStatisticFactory(
+            date=date(2023, 2, 1),
+            download_count=100,
+        )
+        cls.list_path = reverse(
+            viewname='api:packages:downloads-list',
+            kwargs={
+                'package_slug': cls.package.slug,
+            },
+        )
+
+    def test_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(
+                PackageDownloadStatisticViewSet,
+                ProjectDownloadStatisticViewSet,
+            ),
+        )
+
+    def test_base_attributes(self):
+        self.assertEqual(
+            first=PackageDownloadStatisticViewSet.serializer_class,
+            second=ProjectDownloadStatisticQuerySerializer,
+        )
+        self.assertEqual(
+            first=PackageDownloadStatisticViewSet.project_type,
+            second='package',
+        )
+        self.assertEqual(
+            first=PackageDownloadStatisticViewSet.project_model,
+            second=Package,
+        )
+        self.assertIs(
+            expr1=PackageDownloadStatisticViewSet.queryset.model,
+            expr2=PackageReleaseDownloadStatistic,
+        )
+
+    def test_get_list(self):
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={
+                'period': 'day',
+                'downloads': [
+                    {'date': '2023-02-01', 'download_count': 3},
+                ],
+                'releases': {
+                    '1.0.0': [
+                        {'date': '2023-02-01', 'download_count': 3},
+                    ],
+                },
+            },
+        )
+
+    def test_get_list_failure(self):
+        response = self.client.get(
+            path=reverse(
+                viewname='api:packages:downloads-list',
+                kwargs={
+                    'package_slug': 'invalid',
+                },
+            ),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_404_NOT_FOUND,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'detail': 'Invalid package_slug.'},
+        )
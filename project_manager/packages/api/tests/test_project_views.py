@@ -9,6 +9,7 @@ from datetime import timedelta
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from django.db import connection
 from django.test import override_settings
@@ -216,6 +217,10 @@ class PackageViewSetTestCase(APITestCase):
         shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
         super().tearDownClass()
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_inheritance(self):
         self.assertTrue(expr=issubclass(PackageViewSet, ProjectViewSet))
 
@@ -239,11 +244,8 @@ class PackageViewSetTestCase(APITestCase):
         )
         self.assertEqual(first=len(prefetch_lookups), second=1)
         lookup = prefetch_lookups[0]
-        self.assertEqual(first=lookup.prefetch_to, second='releases')
-        self.assertEqual(
-            first=lookup.queryset.query.order_by,
-            second=('-created',),
-        )
+        self.assertEqual(first=lookup.prefetch_through, second='releases')
+        self.assertEqual(first=lookup.prefetch_to, second='current_releases')
 
         self.assertDictEqual(
             d1=PackageViewSet.queryset.query.select_related,
@@ -263,7 +265,16 @@ class PackageViewSetTestCase(APITestCase):
             obj.get_queryset(),
             '_prefetch_related_lookups'
         )
-        self.assertEqual(first=len(prefetch_lookups), second=1)
+        self.assertEqual(first=len(prefetch_lookups), second=5)
+        self.assertListEqual(
+            list1=[lookup.prefetch_to for lookup in prefetch_lookups[1:]],
+            list2=[
+                'current_releases__packagereleasepackagerequirement_set',
+                'current_releases__packagereleasedownloadrequirement_set',
+                'current_releases__packagereleasepypirequirement_set',
+                'current_releases__packagereleaseversioncontrolrequirement_set',
+            ],
+        )
 
         setattr(obj, 'action', 'list')
         prefetch_lookups = getattr(
@@ -330,10 +341,10 @@ class PackageViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that contributors can see results AND 'id'
+        # Verify that contributors can see results AND 'id', served from the cache
         self.client.force_login(self.contributor_1.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=6)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -349,10 +360,10 @@ class PackageViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that the owner can see results AND 'id'
+        # Verify that the owner can see results AND 'id', served from the cache
         self.client.force_login(self.owner.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=6)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -549,10 +560,10 @@ class PackageViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that contributors can see details
+            # Verify that contributors can see details, served from the cache
             self.client.force_login(self.contributor_1.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=8)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -562,10 +573,10 @@ class PackageViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that the owner can see details
+            # Verify that the owner can see details, served from the cache
             self.client.force_login(self.owner.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=8)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
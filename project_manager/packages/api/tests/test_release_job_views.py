@@ -0,0 +1,152 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import shutil
+import tempfile
+from unittest import mock
+
+# Django
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.test import override_settings
+
+# Third Party Python
+from path import Path
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.common.views import ProjectReleaseJobViewSet
+from project_manager.packages.api.serializers import (
+    PackageReleaseJobSerializer,
+    PackageReleaseSerializer,
+)
+from project_manager.packages.api.views import PackageReleaseJobViewSet
+from project_manager.packages.models import Package, PackageReleaseJob
+from project_manager.release_jobs.constants import RELEASE_JOB_SUCCEEDED
+from project_manager.release_jobs.workers import run_release_job
+from test_utils.factories.packages import PackageFactory
+from test_utils.factories.users import ForumUserFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PackageReleaseJobViewSetTestCase(APITestCase):
+
+    owner = package = regular_user = None
+    list_path = release_path = None
+    MEDIA_ROOT = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = ForumUserFactory()
+        cls.regular_user = ForumUserFactory()
+        cls.package = PackageFactory(
+            basename='test_package',
+            owner=cls.owner,
+        )
+        kwargs = {
+            'package_slug': cls.package.slug,
+        }
+        cls.list_path = reverse(
+            viewname='api:packages:release-jobs-list',
+            kwargs=kwargs,
+        )
+        cls.release_path = reverse(
+            viewname='api:packages:releases-list',
+            kwargs=kwargs,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def test_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(
+                PackageReleaseJobViewSet,
+                ProjectReleaseJobViewSet,
+            ),
+        )
+
+    def test_base_attributes(self):
+        self.assertEqual(
+            first=PackageReleaseJobViewSet.serializer_class,
+            second=PackageReleaseJobSerializer,
+        )
+        self.assertEqual(
+            first=PackageReleaseJobViewSet.project_type,
+            second='package',
+        )
+        self.assertEqual(
+            first=PackageReleaseJobViewSet.project_model,
+            second=Package,
+        )
+        self.assertIs(
+            expr1=PackageReleaseJobViewSet.queryset.model,
+            expr2=PackageReleaseJob,
+        )
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT, RELEASE_JOBS_ENABLED=True)
+    @mock.patch(target='project_manager.api.common.views.submit_release_job')
+    def test_post_release(self, mock_submit_release_job):
+        base_path = settings.BASE_DIR / 'fixtures' / 'releases' / 'packages'
+        file_path = base_path / 'test-package' / 'test-package-v1.0.0.zip'
+        self.client.force_login(self.owner.user)
+        with file_path.open('rb') as open_file:
+            response = self.client.post(
+                path=self.release_path,
+                data={
+                    'version': '1.0.0',
+                    'zip_file': UploadedFile(
+                        open_file,
+                        content_type='application/zip',
+                    ),
+                },
+            )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_202_ACCEPTED,
+        )
+        job = PackageReleaseJob.objects.get(pk=response.json()['id'])
+        mock_submit_release_job.assert_called_once_with(
+            job=job,
+            serializer_class=PackageReleaseSerializer,
+        )
+
+        run_release_job(
+            model=PackageReleaseJob,
+            pk=job.pk,
+            serializer_class=PackageReleaseSerializer,
+        )
+        job.refresh_from_db()
+        self.assertEqual(first=job.status, second=RELEASE_JOB_SUCCEEDED)
+        self.assertEqual(first=job.release.package, second=self.package)
+
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.json()['results'][0]['release'],
+            second='1.0.0',
+        )
+
+        # Verify that regular users cannot view the jobs
+        self.client.force_login(self.regular_user.user)
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_403_FORBIDDEN,
+        )
+
+    def test_options(self):
+        response = self.client.options(path=self.list_path)
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        self.assertEqual(
+            first=response.json()['name'],
+            second=f'{self.package} - Release Job',
+        )
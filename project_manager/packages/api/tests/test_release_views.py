@@ -9,6 +9,7 @@ from datetime import timedelta
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from django.db import connection
 from django.test import override_settings
@@ -274,6 +275,10 @@ class PackageReleaseViewSetTestCase(APITestCase):
         shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
         super().tearDownClass()
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_inheritance(self):
         self.assertTrue(
             expr=issubclass(PackageReleaseViewSet, ProjectReleaseViewSet),
@@ -431,10 +436,10 @@ class PackageReleaseViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that contributors can see results
+        # Verify that contributors can see results, served from the cache
         self.client.force_login(self.contributor.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=9)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -450,10 +455,10 @@ class PackageReleaseViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that the owner can see results
+        # Verify that the owner can see results, served from the cache
         self.client.force_login(self.owner.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=9)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -497,20 +502,20 @@ class PackageReleaseViewSetTestCase(APITestCase):
         )
         self.assertEqual(first=response.json()['count'], second=0)
 
-        # Verify that contributors can see results
+        # Verify that contributors can see results, served from the cache
         self.client.force_login(self.contributor.user)
         response = self.client.get(path=list_path)
-        self.assertEqual(first=len(connection.queries), second=4)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
         )
         self.assertEqual(first=response.json()['count'], second=0)
 
-        # Verify that the owner can see results
+        # Verify that the owner can see results, served from the cache
         self.client.force_login(self.owner.user)
         response = self.client.get(path=list_path)
-        self.assertEqual(first=len(connection.queries), second=4)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -584,10 +589,10 @@ class PackageReleaseViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that contributors can see details
+            # Verify that contributors can see details, served from the cache
             self.client.force_login(self.contributor.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=8)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -597,10 +602,10 @@ class PackageReleaseViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that the owner can see details
+            # Verify that the owner can see details, served from the cache
             self.client.force_login(self.owner.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=8)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -55,9 +55,11 @@ class PackageTagViewSetTestCase(APITestCase):
         )
         cls.package_tag_1 = PackageTagFactory(
             package=cls.package_1,
+            tag=TagFactory(name='first_tag'),
         )
         cls.package_tag_2 = PackageTagFactory(
             package=cls.package_1,
+            tag=TagFactory(name='second_tag'),
         )
         cls.regular_user = ForumUserFactory()
         cls.detail_api = 'api:packages:tags-detail'
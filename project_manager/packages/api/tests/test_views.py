@@ -55,9 +55,12 @@ class PackageAPIViewTestCase(APITestCase):
                     )
                 ) for key in (
                     'contributors',
+                    'dependents',
+                    'downloads',
                     'games',
                     'images',
                     'projects',
+                    'release-jobs',
                     'releases',
                     'tags',
                 )
@@ -13,8 +13,11 @@ from rest_framework import routers
 from project_manager.packages.api.views import (
     PackageAPIView,
     PackageContributorViewSet,
+    PackageDependentViewSet,
+    PackageDownloadStatisticViewSet,
     PackageGameViewSet,
     PackageImageViewSet,
+    PackageReleaseJobViewSet,
     PackageReleaseViewSet,
     PackageTagViewSet,
     PackageViewSet,
@@ -40,6 +43,11 @@ router.register(
     viewset=PackageReleaseViewSet,
     basename='releases',
 )
+router.register(
+    prefix='releases/(?P<package_slug>[^/.]+)/jobs',
+    viewset=PackageReleaseJobViewSet,
+    basename='release-jobs',
+)
 router.register(
     prefix='games/(?P<package_slug>[^/.]+)',
     viewset=PackageGameViewSet,
@@ -55,6 +63,16 @@ router.register(
     viewset=PackageContributorViewSet,
     basename='contributors',
 )
+router.register(
+    prefix='downloads/(?P<package_slug>[^/.]+)',
+    viewset=PackageDownloadStatisticViewSet,
+    basename='downloads',
+)
+router.register(
+    prefix='dependents/(?P<package_slug>[^/.]+)',
+    viewset=PackageDependentViewSet,
+    basename='dependents',
+)
 
 
 # =============================================================================
@@ -3,39 +3,51 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
-# Django
-from django.db.models import Prefetch
+# Third Party Django
+from rest_framework.exceptions import NotFound
 
 # App
 from project_manager.api.common.views import (
     ProjectAPIView,
     ProjectContributorViewSet,
+    ProjectDownloadStatisticViewSet,
     ProjectGameViewSet,
     ProjectImageViewSet,
+    ProjectReleaseJobViewSet,
     ProjectReleaseViewSet,
     ProjectTagViewSet,
     ProjectViewSet,
 )
+from project_manager.api.common.views.mixins import ProjectRelatedInfoMixin
+from project_manager.constants import RELEASE_VERSION_REGEX
+from project_manager.helpers import (
+    get_current_release_prefetch,
+    get_requirement_prefetches,
+)
 from project_manager.packages.api.filtersets import PackageFilterSet
 from project_manager.packages.api.serializers import (
     PackageContributorSerializer,
     PackageCreateSerializer,
     PackageGameSerializer,
     PackageImageSerializer,
+    PackageReleaseJobSerializer,
     PackageReleaseSerializer,
     PackageSerializer,
     PackageTagSerializer,
 )
+from project_manager.packages.dependents import (
+    get_dependent_details,
+    get_dependent_projects,
+)
 from project_manager.packages.models import (
     Package,
     PackageContributor,
+    PackageDependent,
     PackageGame,
     PackageImage,
     PackageRelease,
-    PackageReleaseDownloadRequirement,
-    PackageReleasePackageRequirement,
-    PackageReleasePyPiRequirement,
-    PackageReleaseVersionControlRequirement,
+    PackageReleaseDownloadStatistic,
+    PackageReleaseJob,
     PackageTag,
 )
 
@@ -46,8 +58,11 @@ from project_manager.packages.models import (
 __all__ = (
     'PackageAPIView',
     'PackageContributorViewSet',
+    'PackageDependentViewSet',
+    'PackageDownloadStatisticViewSet',
     'PackageGameViewSet',
     'PackageImageViewSet',
+    'PackageReleaseJobViewSet',
     'PackageReleaseViewSet',
     'PackageTagViewSet',
     'PackageViewSet',
@@ -61,6 +76,7 @@ class PackageAPIView(ProjectAPIView):
     """Package API routes."""
 
     project_type = 'package'
+    views = ProjectAPIView.views + ('dependents',)
 
 
 class PackageViewSet(ProjectViewSet):
@@ -71,12 +87,7 @@ class PackageViewSet(ProjectViewSet):
     queryset = Package.objects.select_related(
         'owner__user',
     ).prefetch_related(
-        Prefetch(
-            lookup='releases',
-            queryset=PackageRelease.objects.order_by(
-                '-created',
-            ),
-        ),
+        get_current_release_prefetch(release_model=PackageRelease),
     )
     serializer_class = PackageSerializer
 
@@ -104,40 +115,23 @@ class PackageReleaseViewSet(ProjectReleaseViewSet):
         'package',
         'created_by__user',
     ).prefetch_related(
-        Prefetch(
-            lookup='packagereleasepackagerequirement_set',
-            queryset=PackageReleasePackageRequirement.objects.order_by(
-                'package_requirement__name',
-            ).select_related(
-                'package_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='packagereleasedownloadrequirement_set',
-            queryset=PackageReleaseDownloadRequirement.objects.order_by(
-                'download_requirement__url',
-            ).select_related(
-                'download_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='packagereleasepypirequirement_set',
-            queryset=PackageReleasePyPiRequirement.objects.order_by(
-                'pypi_requirement__name',
-            ).select_related(
-                'pypi_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='packagereleaseversioncontrolrequirement_set',
-            queryset=PackageReleaseVersionControlRequirement.objects.order_by(
-                'vcs_requirement__url',
-            ).select_related(
-                'vcs_requirement',
-            )
-        ),
+        *get_requirement_prefetches(release_model=PackageRelease),
     )
     serializer_class = PackageReleaseSerializer
+    job_serializer_class = PackageReleaseJobSerializer
+
+    project_type = 'package'
+    project_model = Package
+
+
+class PackageReleaseJobViewSet(ProjectReleaseJobViewSet):
+    """ViewSet for retrieving release jobs for Packages."""
+
+    __doc__ += ProjectReleaseJobViewSet.doc_string
+    queryset = PackageReleaseJob.objects.select_related(
+        'release',
+    )
+    serializer_class = PackageReleaseJobSerializer
 
     project_type = 'package'
     project_model = Package
@@ -183,3 +177,82 @@ class PackageContributorViewSet(ProjectContributorViewSet):
 
     project_type = 'package'
     project_model = Package
+
+
+class PackageDownloadStatisticViewSet(ProjectDownloadStatisticViewSet):
+    """Download statistics for Packages."""
+
+    __doc__ += ProjectDownloadStatisticViewSet.doc_string
+    queryset = PackageReleaseDownloadStatistic.objects.all()
+
+    project_type = 'package'
+    project_model = Package
+
+
+class PackageDependentViewSet(ProjectRelatedInfoMixin):
+    """Projects that require the Package.
+
+    Lists the Plugins, SubPlugins, and Packages with a release that requires
+    the Package, along with the number of them for each project type and
+    for each of the Package's versions. Retrieve a version for only the
+    projects whose requirement allows that version.
+    """
+
+    filter_backends = ()
+    http_method_names = ('get', 'options')
+    lookup_value_regex = RELEASE_VERSION_REGEX
+    lookup_field = 'version'
+    queryset = PackageDependent.objects.all()
+
+    allow_retrieve_access = True
+    related_model_type = 'Dependent'
+    project_type = 'package'
+    project_model = Package
+
+    def list(self, request, *args, **kwargs):
+        """Return the Package's dependent projects, with their counts."""
+        projects = get_dependent_projects(package=self.project)
+        versions = {
+            version: 0
+            for version in self.project.releases.order_by(
+                '-created',
+            ).values_list(
+                'version',
+                flat=True,
+            )
+        }
+        for project_versions in projects.values():
+            for version in project_versions.intersection(versions):
+                versions[version] += 1
+
+        response = self._get_paginated_response(keys=list(projects))
+        response.data['versions'] = versions
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return the projects whose requirement allows the given version."""
+        version = self.kwargs['version']
+        if not self.project.releases.filter(version=version).exists():
+            raise NotFound(detail='Invalid version.')
+
+        projects = get_dependent_projects(package=self.project)
+        response = self._get_paginated_response(
+            keys=[
+                key for key, project_versions in projects.items()
+                if version in project_versions
+            ],
+        )
+        response.data['version'] = version
+        return response
+
+    def _get_paginated_response(self, keys):
+        """Return the page of dependents, with the counts for each type."""
+        counts = {}
+        for project_type, _ in keys:
+            counts[project_type] = counts.get(project_type, 0) + 1
+
+        response = self.get_paginated_response(
+            data=get_dependent_details(keys=self.paginate_queryset(keys)),
+        )
+        response.data['counts'] = counts
+        return response
@@ -18,10 +18,15 @@ from project_manager.constants import (
 # =============================================================================
 __all__ = (
     'PACKAGE_ALLOWED_FILE_TYPES',
+    'PACKAGE_DEPENDENT_RELEASE_MODELS',
+    'PACKAGE_DEPENDENT_TYPES',
     'PACKAGE_IMAGE_URL',
     'PACKAGE_LOGO_URL',
     'PACKAGE_PATH',
     'PACKAGE_RELEASE_URL',
+    'PACKAGE_VERSIONS_CACHE_KEY_PREFIX',
+    'RESOLUTION_CACHE_KEY_PREFIX',
+    'RESOLUTION_GENERATION_CACHE_KEY',
 )
 
 
@@ -48,3 +53,20 @@ PACKAGE_ALLOWED_FILE_TYPES.update({
 PACKAGE_IMAGE_URL = IMAGE_URL + 'packages/'
 PACKAGE_LOGO_URL = LOGO_URL + 'packages/'
 PACKAGE_RELEASE_URL = RELEASE_URL + 'packages/'
+
+PACKAGE_VERSIONS_CACHE_KEY_PREFIX = 'package-versions'
+RESOLUTION_CACHE_KEY_PREFIX = 'release-resolution'
+RESOLUTION_GENERATION_CACHE_KEY = 'release-resolution-generation'
+
+# The project type, requirement release field, and release project field of
+#   each release model whose Package requirements are indexed as dependents
+PACKAGE_DEPENDENT_RELEASE_MODELS = {
+    'PluginRelease': ('plugin', 'plugin_release', 'plugin'),
+    'SubPluginRelease': ('sub-plugin', 'sub_plugin_release', 'sub_plugin'),
+    'PackageRelease': ('package', 'package_release', 'package'),
+}
+PACKAGE_DEPENDENT_TYPES = (
+    ('plugin', 'Plugin'),
+    ('sub-plugin', 'SubPlugin'),
+    ('package', 'Package'),
+)
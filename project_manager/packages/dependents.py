@@ -0,0 +1,198 @@
+"""Denormalized reverse-dependency index for Packages."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from collections import defaultdict
+
+# Django
+from django.apps import apps
+from django.db import transaction
+
+# Third Party Python
+from packaging.specifiers import InvalidSpecifier
+
+# App
+from project_manager.packages.constants import (
+    PACKAGE_DEPENDENT_RELEASE_MODELS,
+    PACKAGE_DEPENDENT_TYPES,
+)
+from project_manager.packages.versions import (
+    get_package_version_indexes,
+    get_version_specifier,
+)
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'delete_package_dependent',
+    'get_dependent_details',
+    'get_dependent_projects',
+    'index_package_requirements',
+    'rebuild_package_dependents',
+    'update_package_dependent',
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def index_package_requirements(requirements):
+    """Add the index rows for Package requirement rows that were bulk created.
+
+    This is needed as bulk_create does not send the post_save signal.
+    """
+    model = _get_dependent_model()
+    model.objects.bulk_create([
+        model(
+            requirement_id=requirement.pk,
+            **_get_dependent_values(requirement),
+        ) for requirement in requirements
+    ])
+
+
+def update_package_dependent(instance, **kwargs):
+    """Add or update the index row when a Package requirement is saved."""
+    _get_dependent_model().objects.update_or_create(
+        requirement_id=instance.pk,
+        defaults=_get_dependent_values(instance),
+    )
+
+
+def delete_package_dependent(instance, **kwargs):
+    """Remove the index row when a Package requirement is deleted."""
+    _get_dependent_model().objects.filter(
+        requirement_id=instance.pk,
+    ).delete()
+
+
+def rebuild_package_dependents():
+    """Rebuild the whole index from the release requirement tables."""
+    model = _get_dependent_model()
+    rows = []
+    for release_model_name, (
+        project_type, release_field, project_field,
+    ) in PACKAGE_DEPENDENT_RELEASE_MODELS.items():
+        requirement_model = apps.get_model(
+            app_label='project_manager',
+            model_name=f'{release_model_name}PackageRequirement',
+        )
+        rows.extend(
+            model(
+                requirement_id=pk,
+                package_id=package_id,
+                project_type=project_type,
+                project_pk=project_pk,
+                version=version,
+                optional=optional,
+            ) for (
+                pk, package_id, project_pk, version, optional,
+            ) in requirement_model.objects.values_list(
+                'pk',
+                'package_requirement_id',
+                f'{release_field}__{project_field}_id',
+                'version',
+                'optional',
+            ).iterator()
+        )
+
+    with transaction.atomic():
+        model.objects.all().delete()
+        model.objects.bulk_create(rows, batch_size=500)
+    return len(rows)
+
+
+def get_dependent_projects(package):
+    """Return the Package versions usable by each of its dependent projects.
+
+    The projects are keyed by (project_type, project_pk). Each distinct
+        specifier is only matched against the Package's versions once.
+    """
+    index = get_package_version_indexes(package_ids=[package.pk])[package.pk]
+    matches = {}
+    projects = defaultdict(set)
+    for project_type, project_pk, version in package.dependents.values_list(
+        'project_type',
+        'project_pk',
+        'version',
+    ).distinct():
+        if version not in matches:
+            matches[version] = _get_matching_versions(
+                index=index,
+                version=version,
+            )
+        projects[(project_type, project_pk)].update(matches[version])
+
+    order = [project_type for project_type, _ in PACKAGE_DEPENDENT_TYPES]
+    return dict(
+        sorted(
+            projects.items(),
+            key=lambda item: (order.index(item[0][0]), item[0][1]),
+        )
+    )
+
+
+def get_dependent_details(keys):
+    """Return the name and slug of each of the given dependent projects.
+
+    The projects of each type are loaded together in a single query.
+    """
+    project_pks = defaultdict(list)
+    for project_type, project_pk in keys:
+        project_pks[project_type].append(project_pk)
+
+    projects = {}
+    for project_type, model_name in PACKAGE_DEPENDENT_TYPES:
+        if project_type not in project_pks:
+            continue
+        model = apps.get_model(
+            app_label='project_manager',
+            model_name=model_name,
+        )
+        for project in model.objects.filter(pk__in=project_pks[project_type]):
+            details = {
+                'project_type': project_type,
+                'name': project.name,
+                'slug': project.slug,
+            }
+            if project_type == 'sub-plugin':
+                details['plugin'] = project.plugin_id
+            projects[(project_type, project.pk)] = details
+
+    return [projects[key] for key in keys if key in projects]
+
+
+def _get_dependent_model():
+    return apps.get_model(
+        app_label='project_manager',
+        model_name='PackageDependent',
+    )
+
+
+def _get_dependent_values(requirement):
+    project_type, release_field, project_field = (
+        PACKAGE_DEPENDENT_RELEASE_MODELS[
+            requirement.__class__.__name__.removesuffix('PackageRequirement')
+        ]
+    )
+    release = getattr(requirement, release_field)
+    return {
+        'package_id': requirement.package_requirement_id,
+        'project_type': project_type,
+        'project_pk': getattr(release, f'{project_field}_id'),
+        'version': requirement.version,
+        'optional': requirement.optional,
+    }
+
+
+def _get_matching_versions(index, version):
+    if not version:
+        return set(index.names)
+    try:
+        specifier = get_version_specifier(version)
+    except InvalidSpecifier:
+        return set()
+    return set(index.find(specifier))
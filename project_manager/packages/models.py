@@ -17,17 +17,24 @@ from project_manager.constants import (
     PROJECT_BASENAME_MAX_LENGTH,
     PROJECT_SLUG_MAX_LENGTH,
     RELEASE_VERSION_MAX_LENGTH,
+    REQUIREMENT_SPECIFIER_MAX_LENGTH,
 )
 from project_manager.models.abstract import (
     AbstractUUIDPrimaryKeyModel,
     Project,
     ProjectRelease,
+    ProjectReleaseDownloadStatistic,
+    ProjectReleaseJob,
 )
 from project_manager.validators import (
     basename_validator,
+    specifier_validator,
     version_validator,
 )
-from project_manager.packages.constants import PACKAGE_LOGO_URL
+from project_manager.packages.constants import (
+    PACKAGE_DEPENDENT_TYPES,
+    PACKAGE_LOGO_URL,
+)
 from project_manager.packages.helpers import (
     handle_package_image_upload,
     handle_package_logo_upload,
@@ -41,10 +48,13 @@ from project_manager.packages.helpers import (
 __all__ = (
     'Package',
     'PackageContributor',
+    'PackageDependent',
     'PackageGame',
     'PackageImage',
     'PackageRelease',
     'PackageReleaseDownloadRequirement',
+    'PackageReleaseDownloadStatistic',
+    'PackageReleaseJob',
     'PackageReleasePackageRequirement',
     'PackageReleasePyPiRequirement',
     'PackageReleaseVersionControlRequirement',
@@ -152,12 +162,16 @@ class PackageRelease(ProjectRelease):
     field_tracker = FieldTracker(
         fields=[
             'version',
+            'zip_file',
         ]
     )
 
     class Meta(ProjectRelease.Meta):
         """Define metaclass attributes."""
 
+        indexes = [
+            models.Index(fields=('package', '-created')),
+        ]
         unique_together = ('package', 'version')
         verbose_name = 'Package Release'
         verbose_name_plural = 'Package Releases'
@@ -178,6 +192,57 @@ class PackageRelease(ProjectRelease):
         )
 
 
+class PackageReleaseDownloadStatistic(ProjectReleaseDownloadStatistic):
+    """Package release download statistics model."""
+
+    release = models.ForeignKey(
+        to='project_manager.PackageRelease',
+        related_name='download_statistics',
+        on_delete=models.CASCADE,
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        unique_together = ('release', 'period', 'date')
+        verbose_name = 'Package Release Download Statistic'
+        verbose_name_plural = 'Package Release Download Statistics'
+
+
+class PackageReleaseJob(ProjectReleaseJob):
+    """Package release job type model."""
+
+    package = models.ForeignKey(
+        to='project_manager.Package',
+        related_name='release_jobs',
+        on_delete=models.CASCADE,
+    )
+    created_by = models.ForeignKey(
+        to='users.ForumUser',
+        related_name='package_release_jobs',
+        on_delete=models.SET_NULL,
+        null=True,
+    )
+    release = models.OneToOneField(
+        to='project_manager.PackageRelease',
+        related_name='job',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        verbose_name = 'Package Release Job'
+        verbose_name_plural = 'Package Release Jobs'
+
+    @property
+    def project(self):
+        """Return the Package."""
+        return self.package
+
+
 class PackageImage(AbstractUUIDPrimaryKeyModel):
     """Package image type model."""
 
@@ -327,11 +392,11 @@ class PackageReleasePackageRequirement(AbstractUUIDPrimaryKeyModel):
         on_delete=models.CASCADE,
     )
     version = models.CharField(
-        max_length=RELEASE_VERSION_MAX_LENGTH,
-        validators=[version_validator],
+        max_length=REQUIREMENT_SPECIFIER_MAX_LENGTH,
+        validators=[specifier_validator],
         help_text=(
-            'The version of the custom package for this release '
-            'of the package.'
+            'The version, or version specifier, of the custom package for '
+            'this release of the package.'
         ),
         blank=True,
         null=True,
@@ -422,3 +487,52 @@ class PackageReleaseVersionControlRequirement(AbstractUUIDPrimaryKeyModel):
     def __str__(self):
         """Return the requirement's name and version."""
         return f'{self.vcs_requirement.url} - {self.version}'
+
+
+class PackageDependent(AbstractUUIDPrimaryKeyModel):
+    """Denormalized index of the project releases that require a Package.
+
+    Each row mirrors one Package requirement row of a Plugin, SubPlugin, or
+        Package release, so that a Package's dependents can be found from a
+        single table instead of joining all three requirement tables.
+    """
+
+    requirement_id = models.UUIDField(
+        unique=True,
+        editable=False,
+    )
+    package = models.ForeignKey(
+        to='project_manager.Package',
+        related_name='dependents',
+        on_delete=models.CASCADE,
+    )
+    project_type = models.CharField(
+        max_length=16,
+        choices=PACKAGE_DEPENDENT_TYPES,
+    )
+    project_pk = models.CharField(
+        max_length=PROJECT_SLUG_MAX_LENGTH * 2 + 1,
+    )
+    version = models.CharField(
+        max_length=REQUIREMENT_SPECIFIER_MAX_LENGTH,
+        blank=True,
+        null=True,
+    )
+    optional = models.BooleanField(
+        default=False,
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        indexes = [
+            models.Index(fields=('package', 'project_type', 'project_pk')),
+        ]
+        verbose_name = 'Package Dependent'
+        verbose_name_plural = 'Package Dependents'
+
+    def __str__(self):
+        """Return the dependent release and the Package it requires."""
+        return (
+            f'{self.package} Dependent: {self.project_type} {self.project_pk}'
+        )
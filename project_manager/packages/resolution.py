@@ -0,0 +1,379 @@
+"""Transitive requirement resolution for releases."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from time import time
+
+# Django
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Third Party Python
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+
+# App
+from project_manager.packages.constants import (
+    RESOLUTION_CACHE_KEY_PREFIX,
+    RESOLUTION_GENERATION_CACHE_KEY,
+)
+from project_manager.packages.versions import (
+    get_package_version_indexes,
+    get_version_specifier,
+)
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'ReleaseResolver',
+    'bump_resolution_generation',
+    'get_release_requirements',
+    'get_resolution_cache_key',
+    'get_resolved_requirements',
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+# The fields loaded for each requirement group's through model
+REQUIREMENT_GROUP_FIELDS = {
+    'custom': (
+        'PackageRequirement',
+        (
+            'package_requirement_id',
+            'package_requirement__name',
+            'package_requirement__basename',
+            'version',
+            'optional',
+        ),
+    ),
+    'pypi': (
+        'PyPiRequirement',
+        (
+            'pypi_requirement__name',
+            'pypi_requirement__slug',
+            'version',
+            'optional',
+        ),
+    ),
+    'vcs': (
+        'VersionControlRequirement',
+        (
+            'vcs_requirement__url',
+            'version',
+            'optional',
+        ),
+    ),
+    'download': (
+        'DownloadRequirement',
+        (
+            'download_requirement__url',
+            'optional',
+        ),
+    ),
+}
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+class ReleaseResolver:
+    """Resolve the full requirement tree of a release into an install plan.
+
+    The tree is walked a level at a time, so each level of custom packages
+        is resolved with a fixed number of queries. Each package is given
+        the newest version matching every specifier found for it so far. A
+        package found again at a deeper level keeps the version it was
+        given, and is reported as a conflict if that version does not match
+        the new specifier.
+    """
+
+    def __init__(self, release):
+        """Store the release and the empty install plan."""
+        self.release = release
+        self.packages = {}
+        self.pypi = {}
+        self.vcs = {}
+        self.download = {}
+        self.conflicts = {}
+
+        # A package release cannot require another version of its package
+        package_id = getattr(release, 'package_id', None)
+        if package_id is not None:
+            self.packages[package_id] = {
+                'version': release.version,
+                'optional': False,
+                'specifiers': [],
+                'root': True,
+            }
+
+    def resolve(self):
+        """Return the install plan for the release."""
+        release_model = self.release.__class__
+        release_ids = [self.release.pk]
+        depth = 0
+        while release_ids:
+            rows = get_release_requirements(
+                release_model=release_model,
+                release_ids=release_ids,
+            )
+            self._add_requirements(rows=rows)
+            release_ids = self._resolve_packages(
+                rows=rows['custom'],
+                depth=depth,
+            )
+            release_model = apps.get_model(
+                app_label='project_manager',
+                model_name='PackageRelease',
+            )
+            depth += 1
+
+        return self.get_plan()
+
+    def get_plan(self):
+        """Return the resolved requirements in installation order."""
+        packages = sorted(
+            (
+                entry for entry in self.packages.values()
+                if not entry.get('root') and entry['version'] is not None
+            ),
+            key=lambda entry: (-entry['depth'], entry['name']),
+        )
+        return {
+            'package_requirements': [
+                {
+                    'name': entry['name'],
+                    'slug': entry['slug'],
+                    'basename': entry['basename'],
+                    'version': entry['version'],
+                    'optional': entry['optional'],
+                } for entry in packages
+            ],
+            'pypi_requirements': [
+                {
+                    'name': entry['name'],
+                    'slug': entry['slug'],
+                    'version': ','.join(entry['versions']) or None,
+                    'optional': entry['optional'],
+                } for _, entry in sorted(self.pypi.items())
+            ],
+            'vcs_requirements': [
+                {
+                    'url': url,
+                    'version': ','.join(entry['versions']) or None,
+                    'optional': entry['optional'],
+                } for url, entry in sorted(self.vcs.items())
+            ],
+            'download_requirements': [
+                {
+                    'url': url,
+                    'optional': entry['optional'],
+                } for url, entry in sorted(self.download.items())
+            ],
+            'conflicts': [
+                {
+                    'slug': slug,
+                    'specifiers': specifiers,
+                } for slug, specifiers in sorted(self.conflicts.items())
+            ],
+        }
+
+    def _add_requirements(self, rows):
+        """Merge the level's PyPi, VCS, and download requirements."""
+        for row in rows['pypi']:
+            entry = self._get_flat_entry(
+                group=self.pypi,
+                key=row['pypi_requirement__name'],
+                row=row,
+            )
+            entry['slug'] = row['pypi_requirement__slug']
+            entry['name'] = row['pypi_requirement__name']
+
+        for row in rows['vcs']:
+            self._get_flat_entry(
+                group=self.vcs,
+                key=row['vcs_requirement__url'],
+                row=row,
+            )
+
+        for row in rows['download']:
+            self._get_flat_entry(
+                group=self.download,
+                key=row['download_requirement__url'],
+                row=row,
+            )
+
+    @staticmethod
+    def _get_flat_entry(group, key, row):
+        """Return the group's entry for the key, merging in the row."""
+        entry = group.setdefault(key, {'versions': [], 'optional': True})
+        entry['optional'] = entry['optional'] and row['optional']
+        version = row.get('version')
+        if version and version not in entry['versions']:
+            entry['versions'].append(version)
+        return entry
+
+    def _resolve_packages(self, rows, depth):
+        """Pick versions for the level's new packages.
+
+        The ids of the chosen PackageReleases are returned, so that their
+            requirements can be resolved as the next level.
+        """
+        new_packages = []
+        for row in rows:
+            package_id = row['package_requirement_id']
+            entry = self.packages.get(package_id)
+            if entry is None:
+                entry = self.packages[package_id] = {
+                    'name': row['package_requirement__name'],
+                    'slug': package_id,
+                    'basename': row['package_requirement__basename'],
+                    'version': None,
+                    'optional': True,
+                    'specifiers': [],
+                    'depth': depth,
+                }
+                new_packages.append(package_id)
+
+            entry['optional'] = entry['optional'] and row['optional']
+            version = row['version']
+            if not version or version in entry['specifiers']:
+                continue
+
+            entry['specifiers'].append(version)
+            if package_id not in new_packages:
+                self._check_resolved_package(
+                    package_id=package_id,
+                    specifier=version,
+                )
+
+        if not new_packages:
+            return []
+
+        indexes = get_package_version_indexes(package_ids=new_packages)
+        chosen = {}
+        for package_id in new_packages:
+            entry = self.packages[package_id]
+            specifier = self._get_specifier_set(entry['specifiers'])
+            version = None
+            if specifier is not None:
+                version = indexes[package_id].get_latest(specifier)
+            if version is None:
+                self.conflicts[package_id] = entry['specifiers']
+                continue
+
+            entry['version'] = chosen[package_id] = version
+
+        return [
+            pk for pk, package_id, version in apps.get_model(
+                app_label='project_manager',
+                model_name='PackageRelease',
+            ).objects.filter(
+                package_id__in=chosen,
+                version__in=set(chosen.values()),
+            ).values_list(
+                'pk',
+                'package_id',
+                'version',
+            ) if chosen[package_id] == version
+        ]
+
+    def _check_resolved_package(self, package_id, specifier):
+        """Store a conflict if the package's version fails the specifier."""
+        entry = self.packages[package_id]
+        if entry['version'] is None:
+            return
+
+        specifier_set = self._get_specifier_set([specifier])
+        if specifier_set is None or not specifier_set.contains(
+            entry['version'],
+            prereleases=True,
+        ):
+            self.conflicts[package_id] = entry['specifiers']
+
+    @staticmethod
+    def _get_specifier_set(specifiers):
+        """Return the combined SpecifierSet, or None if any are invalid."""
+        specifier_set = SpecifierSet()
+        try:
+            for specifier in specifiers:
+                specifier_set &= get_version_specifier(specifier)
+        except InvalidSpecifier:
+            return None
+        return specifier_set
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def get_release_requirements(release_model, release_ids):
+    """Return the requirement rows, by group, for the given releases."""
+    rows = {}
+    for group_type, (suffix, fields) in REQUIREMENT_GROUP_FIELDS.items():
+        model = apps.get_model(
+            app_label='project_manager',
+            model_name=f'{release_model.__name__}{suffix}',
+        )
+        release_field = next(
+            field.name for field in model._meta.fields
+            if field.related_model is release_model
+        )
+        rows[group_type] = list(
+            model.objects.filter(
+                **{f'{release_field}__in': release_ids}
+            ).values(*fields)
+        )
+    return rows
+
+
+def get_resolution_cache_key(release):
+    """Return the cache key for the release's current install plan."""
+    generation = cache.get(RESOLUTION_GENERATION_CACHE_KEY)
+    if generation is None:
+        generation = int(time() * 1000)
+        if not cache.add(RESOLUTION_GENERATION_CACHE_KEY, generation, None):
+            generation = cache.get(RESOLUTION_GENERATION_CACHE_KEY)
+    return (
+        f'{RESOLUTION_CACHE_KEY_PREFIX}:{release.__class__.__name__}:'
+        f'{release.pk}:{generation}'
+    )
+
+
+def get_resolved_requirements(release):
+    """Return the release's install plan, resolving it if not cached."""
+    cache_key = get_resolution_cache_key(release)
+    plan = cache.get(cache_key)
+    if plan is None:
+        plan = ReleaseResolver(release).resolve()
+        cache.set(
+            key=cache_key,
+            value=plan,
+            timeout=settings.RELEASE_RESOLUTION_CACHE_TIMEOUT,
+        )
+    return plan
+
+
+def bump_resolution_generation(**kwargs):
+    """Invalidate every cached install plan when a release changes.
+
+    Install plans depend on the releases of every package in the tree, so
+        they are all invalidated together by moving to a new generation.
+        Inside a transaction, the generation is moved again on commit, so
+        that a plan cached before the commit is not served afterwards.
+    """
+    _bump_generation()
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(_bump_generation)
+
+
+def _bump_generation():
+    try:
+        cache.incr(RESOLUTION_GENERATION_CACHE_KEY)
+    except ValueError:
+        cache.add(RESOLUTION_GENERATION_CACHE_KEY, int(time() * 1000), None)
@@ -0,0 +1,63 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.db import models
+from django.test import TestCase
+
+# App
+from project_manager.packages.models import Package, PackageDependent
+from test_utils.factories.plugins import PluginReleasePackageRequirementFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PackageDependentTestCase(TestCase):
+    def test_package_field(self):
+        field = PackageDependent._meta.get_field('package')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.ForeignKey,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=Package,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.CASCADE,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='dependents',
+        )
+
+    def test_requirement_id_field(self):
+        field = PackageDependent._meta.get_field('requirement_id')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.UUIDField,
+        )
+        self.assertTrue(expr=field.unique)
+
+    def test__str__(self):
+        requirement = PluginReleasePackageRequirementFactory()
+        obj = PackageDependent.objects.get(requirement_id=requirement.pk)
+        self.assertEqual(
+            first=str(obj),
+            second=(
+                f'{requirement.package_requirement} Dependent: plugin '
+                f'{requirement.plugin_release.plugin_id}'
+            ),
+        )
+
+    def test_meta_class(self):
+        self.assertEqual(
+            first=PackageDependent._meta.verbose_name,
+            second='Package Dependent',
+        )
+        self.assertEqual(
+            first=PackageDependent._meta.verbose_name_plural,
+            second='Package Dependents',
+        )
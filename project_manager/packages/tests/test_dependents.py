@@ -0,0 +1,188 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from importlib import import_module
+
+# Django
+from django.apps import apps
+from django.core.cache import cache
+from django.test import TestCase
+
+# App
+from project_manager.packages.dependents import (
+    get_dependent_details,
+    get_dependent_projects,
+    index_package_requirements,
+    rebuild_package_dependents,
+)
+from project_manager.packages.models import PackageDependent
+from project_manager.plugins.models import PluginReleasePackageRequirement
+from test_utils.factories.packages import (
+    PackageFactory,
+    PackageReleaseFactory,
+    PackageReleasePackageRequirementFactory,
+)
+from test_utils.factories.plugins import (
+    PluginFactory,
+    PluginReleaseFactory,
+    PluginReleasePackageRequirementFactory,
+)
+from test_utils.factories.sub_plugins import (
+    SubPluginFactory,
+    SubPluginReleaseFactory,
+    SubPluginReleasePackageRequirementFactory,
+)
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PackageDependentIndexTestCase(TestCase):
+
+    package = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.package = PackageFactory()
+        for version in ('1.0.0', '1.5.0', '2.0.0'):
+            PackageReleaseFactory(package=cls.package, version=version)
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    @staticmethod
+    def get_index_rows():
+        return sorted(
+            PackageDependent.objects.values_list(
+                'requirement_id',
+                'package_id',
+                'project_type',
+                'project_pk',
+                'version',
+                'optional',
+            )
+        )
+
+    def test_signals(self):
+        requirement = PluginReleasePackageRequirementFactory(
+            package_requirement=self.package,
+            version='<2',
+        )
+        dependent = self.package.dependents.get()
+        self.assertEqual(first=dependent.requirement_id, second=requirement.pk)
+        self.assertEqual(first=dependent.project_type, second='plugin')
+        self.assertEqual(
+            first=dependent.project_pk,
+            second=requirement.plugin_release.plugin_id,
+        )
+        self.assertEqual(first=dependent.version, second='<2')
+        self.assertFalse(expr=dependent.optional)
+
+        # Verify that updating the requirement updates the index row
+        requirement.version = '>=1.5'
+        requirement.optional = True
+        requirement.save()
+        dependent = self.package.dependents.get()
+        self.assertEqual(first=dependent.version, second='>=1.5')
+        self.assertTrue(expr=dependent.optional)
+
+        # Verify that deleting the release removes the index row
+        requirement.plugin_release.delete()
+        self.assertFalse(expr=self.package.dependents.exists())
+
+    def test_index_package_requirements(self):
+        plugin_release = PluginReleaseFactory()
+        requirements = PluginReleasePackageRequirement.objects.bulk_create([
+            PluginReleasePackageRequirement(
+                plugin_release=plugin_release,
+                package_requirement=self.package,
+                version='1.0.0',
+            ),
+        ])
+        self.assertFalse(expr=self.package.dependents.exists())
+        with self.assertNumQueries(1):
+            index_package_requirements(requirements=requirements)
+        self.assertEqual(
+            first=self.package.dependents.get().requirement_id,
+            second=requirements[0].pk,
+        )
+
+    def test_rebuild_package_dependents(self):
+        PluginReleasePackageRequirementFactory(package_requirement=self.package)
+        SubPluginReleasePackageRequirementFactory(
+            package_requirement=self.package,
+        )
+        PackageReleasePackageRequirementFactory(
+            package_requirement=self.package,
+        )
+        expected = self.get_index_rows()
+        PackageDependent.objects.all().delete()
+        self.assertEqual(first=rebuild_package_dependents(), second=3)
+        self.assertListEqual(list1=self.get_index_rows(), list2=expected)
+
+        # Verify that the migration builds the same index
+        PackageDependent.objects.all().delete()
+        import_module(
+            'project_manager.migrations.0009_package_dependents',
+        ).build_package_dependents(apps=apps, schema_editor=None)
+        self.assertListEqual(list1=self.get_index_rows(), list2=expected)
+
+    def test_get_dependent_projects(self):
+        plugin = PluginFactory(basename='test_plugin')
+        sub_plugin = SubPluginFactory(plugin=plugin)
+        package = PackageFactory()
+        for version, specifier in (('1.0.0', '<1.5'), ('1.1.0', '==2.0.0')):
+            PluginReleasePackageRequirementFactory(
+                plugin_release=PluginReleaseFactory(
+                    plugin=plugin,
+                    version=version,
+                ),
+                package_requirement=self.package,
+                version=specifier,
+            )
+        SubPluginReleasePackageRequirementFactory(
+            sub_plugin_release=SubPluginReleaseFactory(sub_plugin=sub_plugin),
+            package_requirement=self.package,
+        )
+        PackageReleasePackageRequirementFactory(
+            package_release=PackageReleaseFactory(package=package),
+            package_requirement=self.package,
+            version='>3',
+        )
+
+        with self.assertNumQueries(2):
+            projects = get_dependent_projects(package=self.package)
+        self.assertDictEqual(
+            d1=projects,
+            d2={
+                ('plugin', plugin.pk): {'1.0.0', '2.0.0'},
+                ('sub-plugin', sub_plugin.pk): {'1.0.0', '1.5.0', '2.0.0'},
+                ('package', package.pk): set(),
+            },
+        )
+
+        with self.assertNumQueries(3):
+            details = get_dependent_details(keys=list(projects))
+        self.assertListEqual(
+            list1=details,
+            list2=[
+                {
+                    'project_type': 'plugin',
+                    'name': plugin.name,
+                    'slug': plugin.slug,
+                },
+                {
+                    'project_type': 'sub-plugin',
+                    'name': sub_plugin.name,
+                    'slug': sub_plugin.slug,
+                    'plugin': plugin.slug,
+                },
+                {
+                    'project_type': 'package',
+                    'name': package.name,
+                    'slug': package.slug,
+                },
+            ],
+        )
@@ -7,6 +7,7 @@ from unittest import mock
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
@@ -43,6 +44,7 @@ class PackageZipFileTestCase(TestCase):
 
     def setUp(self) -> None:
         super().setUp()
+        cache.clear()
         self.mock_get_file_list = mock.patch(
             target='project_manager.helpers.ProjectZipFile.get_file_list',
         ).start()
@@ -3,10 +3,12 @@
 # =============================================================================
 # Python
 from datetime import timedelta
+from importlib import import_module
 from random import randint
 from unittest import mock
 
 # Django
+from django.apps import apps
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.test import TestCase
@@ -191,11 +193,17 @@ class PackageTestCase(TestCase):
                 version=version,
                 created=created + timedelta(minutes=offset),
             )
+            package.refresh_from_db()
             self.assertEqual(
                 first=package.current_version,
                 second=release.version,
             )
 
+        # Verify that deleting the current release restores the previous one
+        release.delete()
+        package.refresh_from_db()
+        self.assertEqual(first=package.current_version, second='1.1.0')
+
     def test_total_downloads(self):
         package = PackageFactory()
         total_downloads = 0
@@ -207,11 +215,29 @@ class PackageTestCase(TestCase):
                 download_count=download_count,
             )
 
+        package.refresh_from_db()
         self.assertEqual(
             first=package.total_downloads,
             second=total_downloads,
         )
 
+    def test_store_project_release_stats(self):
+        package = PackageFactory()
+        PackageReleaseFactory(package=package, version='1.0.0', download_count=3)
+        PackageReleaseFactory(package=package, version='1.1.0', download_count=4)
+        empty_package = PackageFactory()
+        Package.objects.update(current_version=None, total_downloads=10)
+
+        import_module(
+            'project_manager.migrations.0010_project_release_stats',
+        ).store_project_release_stats(apps=apps, schema_editor=None)
+        package.refresh_from_db()
+        self.assertEqual(first=package.current_version, second='1.1.0')
+        self.assertEqual(first=package.total_downloads, second=7)
+        empty_package.refresh_from_db()
+        self.assertIsNone(obj=empty_package.current_version)
+        self.assertEqual(first=empty_package.total_downloads, second=0)
+
     @mock.patch(
         target='project_manager.models.abstract.Image.open',
     )
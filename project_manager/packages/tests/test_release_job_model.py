@@ -0,0 +1,110 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.db import models
+from django.test import TestCase
+
+# App
+from project_manager.models.abstract import ProjectReleaseJob
+from project_manager.packages.models import (
+    Package,
+    PackageRelease,
+    PackageReleaseJob,
+)
+from test_utils.factories.packages import PackageReleaseJobFactory
+from users.models import ForumUser
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PackageReleaseJobTestCase(TestCase):
+    def test_model_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(PackageReleaseJob, ProjectReleaseJob),
+        )
+
+    def test_package_field(self):
+        field = PackageReleaseJob._meta.get_field('package')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.ForeignKey,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=Package,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.CASCADE,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='release_jobs',
+        )
+
+    def test_created_by_field(self):
+        field = PackageReleaseJob._meta.get_field('created_by')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.ForeignKey,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=ForumUser,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.SET_NULL,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='package_release_jobs',
+        )
+        self.assertTrue(expr=field.null)
+
+    def test_release_field(self):
+        field = PackageReleaseJob._meta.get_field('release')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.OneToOneField,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=PackageRelease,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.SET_NULL,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='job',
+        )
+        self.assertTrue(expr=field.blank)
+        self.assertTrue(expr=field.null)
+
+    def test_project_property(self):
+        obj = PackageReleaseJobFactory()
+        self.assertEqual(
+            first=obj.project,
+            second=obj.package,
+        )
+
+    def test__str__(self):
+        obj = PackageReleaseJobFactory()
+        self.assertEqual(
+            first=str(obj),
+            second=f'{obj.package} - {obj.version} (pending)',
+        )
+
+    def test_meta_class(self):
+        self.assertEqual(
+            first=PackageReleaseJob._meta.verbose_name,
+            second='Package Release Job',
+        )
+        self.assertEqual(
+            first=PackageReleaseJob._meta.verbose_name_plural,
+            second='Package Release Jobs',
+        )
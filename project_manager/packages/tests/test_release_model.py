@@ -172,7 +172,7 @@ class PackageReleaseTestCase(TestCase):
         )
         self.assertSetEqual(
             set1=PackageRelease.field_tracker.fields,
-            set2={'version'},
+            set2={'version', 'zip_file'},
         )
 
     def test_primary_attributes(self):
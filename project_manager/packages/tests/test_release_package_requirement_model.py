@@ -9,9 +9,9 @@ from django.db import models
 from django.test import TestCase
 
 # App
-from project_manager.constants import RELEASE_VERSION_MAX_LENGTH
+from project_manager.constants import REQUIREMENT_SPECIFIER_MAX_LENGTH
 from project_manager.models.abstract import AbstractUUIDPrimaryKeyModel
-from project_manager.validators import version_validator
+from project_manager.validators import specifier_validator
 from project_manager.packages.models import (
     Package,
     PackageRelease,
@@ -79,17 +79,17 @@ class PackageReleasePackageRequirementTestCase(TestCase):
         )
         self.assertEqual(
             first=field.max_length,
-            second=RELEASE_VERSION_MAX_LENGTH,
+            second=REQUIREMENT_SPECIFIER_MAX_LENGTH,
         )
         self.assertIn(
-            member=version_validator,
+            member=specifier_validator,
             container=field.validators,
         )
         self.assertEqual(
             first=field.help_text,
             second=(
-                'The version of the custom package for this release of the '
-                'package.'
+                'The version, or version specifier, of the custom package '
+                'for this release of the package.'
             )
         )
         self.assertTrue(expr=field.blank)
@@ -0,0 +1,217 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.cache import cache
+from django.test import TestCase
+
+# App
+from project_manager.packages.resolution import (
+    ReleaseResolver,
+    get_resolution_cache_key,
+    get_resolved_requirements,
+)
+from test_utils.factories.packages import (
+    PackageFactory,
+    PackageReleaseFactory,
+    PackageReleasePackageRequirementFactory,
+    PackageReleasePyPiRequirementFactory,
+)
+from test_utils.factories.plugins import (
+    PluginReleaseDownloadRequirementFactory,
+    PluginReleaseFactory,
+    PluginReleasePackageRequirementFactory,
+    PluginReleasePyPiRequirementFactory,
+)
+from test_utils.factories.requirements import (
+    DownloadRequirementFactory,
+    PyPiRequirementFactory,
+)
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class ReleaseResolverTestCase(TestCase):
+
+    package_a = package_b = package_c = package_d = None
+    plugin_release = package_a_release = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.package_a = PackageFactory(name='Package A', basename='package_a')
+        cls.package_b = PackageFactory(name='Package B', basename='package_b')
+        cls.package_c = PackageFactory(name='Package C', basename='package_c')
+        cls.package_d = PackageFactory(name='Package D', basename='package_d')
+        for package, versions in (
+            (cls.package_a, ('1.0.0', '1.1.0', '2.0.0')),
+            (cls.package_b, ('1.0.0',)),
+            (cls.package_c, ('1.0.0', '1.5.0', '2.0.0')),
+        ):
+            for version in versions:
+                PackageReleaseFactory(package=package, version=version)
+
+        pypi_requirement = PyPiRequirementFactory(name='requests')
+        cls.plugin_release = PluginReleaseFactory()
+        for package, version in (
+            (cls.package_a, '<2'),
+            (cls.package_b, None),
+        ):
+            PluginReleasePackageRequirementFactory(
+                plugin_release=cls.plugin_release,
+                package_requirement=package,
+                version=version,
+            )
+        PluginReleasePyPiRequirementFactory(
+            plugin_release=cls.plugin_release,
+            pypi_requirement=pypi_requirement,
+            version='>=2',
+            optional=True,
+        )
+        PluginReleaseDownloadRequirementFactory(
+            plugin_release=cls.plugin_release,
+            download_requirement=DownloadRequirementFactory(
+                url='https://example.com/download.zip',
+            ),
+        )
+
+        # Package A 1.1.0 requires Package C and requests
+        cls.package_a_release = cls.package_a.releases.get(version='1.1.0')
+        PackageReleasePackageRequirementFactory(
+            package_release=cls.package_a_release,
+            package_requirement=cls.package_c,
+            version='~=1.0',
+        )
+        PackageReleasePyPiRequirementFactory(
+            package_release=cls.package_a_release,
+            pypi_requirement=pypi_requirement,
+            version='<3',
+        )
+
+        # Package B requires an older Package A than was picked
+        PackageReleasePackageRequirementFactory(
+            package_release=cls.package_b.releases.get(),
+            package_requirement=cls.package_a,
+            version='<1.1',
+        )
+
+        # Package C requires Package A again, and a Package with no releases
+        package_c_release = cls.package_c.releases.get(version='1.5.0')
+        for package in (cls.package_a, cls.package_d):
+            PackageReleasePackageRequirementFactory(
+                package_release=package_c_release,
+                package_requirement=package,
+                optional=True,
+            )
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_resolve(self):
+        # Each level: 4 requirement queries, 1 version index query and
+        #   1 release query, the last level chooses no releases
+        with self.assertNumQueries(17):
+            plan = ReleaseResolver(self.plugin_release).resolve()
+
+        self.assertDictEqual(
+            d1=plan,
+            d2={
+                'package_requirements': [
+                    {
+                        'name': 'Package C',
+                        'slug': self.package_c.slug,
+                        'basename': 'package_c',
+                        'version': '1.5.0',
+                        'optional': False,
+                    },
+                    {
+                        'name': 'Package A',
+                        'slug': self.package_a.slug,
+                        'basename': 'package_a',
+                        'version': '1.1.0',
+                        'optional': False,
+                    },
+                    {
+                        'name': 'Package B',
+                        'slug': self.package_b.slug,
+                        'basename': 'package_b',
+                        'version': '1.0.0',
+                        'optional': False,
+                    },
+                ],
+                'pypi_requirements': [
+                    {
+                        'name': 'requests',
+                        'slug': 'requests',
+                        'version': '>=2,<3',
+                        'optional': False,
+                    },
+                ],
+                'vcs_requirements': [],
+                'download_requirements': [
+                    {
+                        'url': 'https://example.com/download.zip',
+                        'optional': False,
+                    },
+                ],
+                'conflicts': sorted(
+                    [
+                        {
+                            'slug': self.package_a.slug,
+                            'specifiers': ['<2', '<1.1'],
+                        },
+                        {
+                            'slug': self.package_d.slug,
+                            'specifiers': [],
+                        },
+                    ],
+                    key=lambda conflict: conflict['slug'],
+                ),
+            },
+        )
+
+    def test_resolve_package_release(self):
+        # Package C requires Package A, which requires Package C
+        plan = ReleaseResolver(self.package_a_release).resolve()
+        self.assertListEqual(
+            list1=[
+                (package['slug'], package['version'])
+                for package in plan['package_requirements']
+            ],
+            list2=[(self.package_c.slug, '1.5.0')],
+        )
+        self.assertListEqual(
+            list1=plan['conflicts'],
+            list2=[{'slug': self.package_d.slug, 'specifiers': []}],
+        )
+
+    def test_get_resolved_requirements(self):
+        plan = get_resolved_requirements(release=self.plugin_release)
+        with self.assertNumQueries(0):
+            self.assertDictEqual(
+                d1=get_resolved_requirements(release=self.plugin_release),
+                d2=plan,
+            )
+
+        # Verify that a new release invalidates the cached plans
+        cache_key = get_resolution_cache_key(release=self.plugin_release)
+        PackageReleaseFactory(package=self.package_c, version='1.6.0')
+        self.assertNotEqual(
+            first=get_resolution_cache_key(release=self.plugin_release),
+            second=cache_key,
+        )
+        plan = get_resolved_requirements(release=self.plugin_release)
+        self.assertEqual(
+            first=plan['package_requirements'][0]['version'],
+            second='1.6.0',
+        )
+
+        # Verify that a plan cached before the commit is invalidated on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            PackageReleaseFactory(package=self.package_c, version='1.7.0')
+            cache_key = get_resolution_cache_key(release=self.plugin_release)
+        self.assertNotEqual(
+            first=get_resolution_cache_key(release=self.plugin_release),
+            second=cache_key,
+        )
@@ -0,0 +1,170 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+# Third Party Python
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+
+# App
+from project_manager.packages.versions import (
+    VersionIndex,
+    get_package_version_indexes,
+    get_package_versions_cache_key,
+    get_version_specifier,
+)
+from project_manager.validators import specifier_validator
+from test_utils.factories.packages import PackageFactory, PackageReleaseFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class VersionIndexTestCase(TestCase):
+
+    index = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.index = VersionIndex([
+            '1.10.0', '1.2.0', '2.0.0b1', '1.0.0', '2.0.0', '1.2.1',
+            '1.0', 'invalid', '3.1', '1.0.x',
+        ])
+
+    def test_init(self):
+        self.assertListEqual(
+            list1=self.index.names,
+            list2=[
+                '1.0', '1.0.0', '1.2.0', '1.2.1', '1.10.0', '2.0.0b1',
+                '2.0.0', '3.1', '1.0.x', 'invalid',
+            ],
+        )
+        self.assertEqual(first=len(self.index), second=10)
+
+    def test_find(self):
+        for specifier, expected in (
+            ('==1.2.0', ['1.2.0']),
+            ('==1.0', ['1.0', '1.0.0']),
+            ('==1.3.0', []),
+            ('>=1.2.1', ['1.2.1', '1.10.0', '2.0.0', '3.1']),
+            ('>1.2.1,<3', ['1.10.0', '2.0.0']),
+            ('<=1.2.0', ['1.0', '1.0.0', '1.2.0']),
+            ('~=1.2', ['1.2.0', '1.2.1', '1.10.0']),
+            ('~=1.2.0', ['1.2.0', '1.2.1']),
+            ('!=1.2.0,<2', ['1.0', '1.0.0', '1.2.1', '1.10.0']),
+            ('==1.*', ['1.0', '1.0.0', '1.2.0', '1.2.1', '1.10.0']),
+            ('===3.1', ['3.1']),
+            ('===1.0.x', ['1.0.x']),
+            ('===1.0.x,>=1.0', []),
+            ('>=2.0.0b1,<=2.0.0', ['2.0.0b1', '2.0.0']),
+            ('>3,<2', []),
+            ('', [
+                '1.0', '1.0.0', '1.2.0', '1.2.1', '1.10.0', '2.0.0', '3.1',
+            ]),
+        ):
+            with self.subTest(specifier=specifier):
+                self.assertListEqual(
+                    list1=self.index.find(SpecifierSet(specifier)),
+                    list2=expected,
+                )
+
+    def test_get_latest(self):
+        self.assertEqual(
+            first=self.index.get_latest(SpecifierSet('<2')),
+            second='1.10.0',
+        )
+        self.assertIsNone(obj=self.index.get_latest(SpecifierSet('>4')))
+
+
+class VersionFunctionsTestCase(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_get_version_specifier(self):
+        self.assertEqual(
+            first=get_version_specifier(' 1.0.0 '),
+            second=SpecifierSet('==1.0.0'),
+        )
+        self.assertEqual(
+            first=get_version_specifier('>=1.0,<2'),
+            second=SpecifierSet('>=1.0,<2'),
+        )
+        self.assertEqual(
+            first=get_version_specifier('1.0.x'),
+            second=SpecifierSet('===1.0.x'),
+        )
+        for value in (
+            '>>1', 'latest', '', '>=1.0,<', 1, '>=1.0,' * 20, '1.0 x',
+            '==1.0.x',
+        ):
+            with self.subTest(value=value):
+                with self.assertRaises(InvalidSpecifier):
+                    get_version_specifier(value)
+
+    def test_specifier_validator(self):
+        specifier_validator('~=1.2')
+        with self.assertRaises(ValidationError) as context:
+            specifier_validator('latest')
+
+        self.assertListEqual(
+            list1=context.exception.messages,
+            list2=['"latest" is not a valid version specifier.'],
+        )
+
+    def test_get_package_version_indexes(self):
+        package_1 = PackageFactory()
+        package_2 = PackageFactory()
+        package_3 = PackageFactory()
+        for version in ('1.0.0', '2.0.0'):
+            PackageReleaseFactory(package=package_1, version=version)
+        PackageReleaseFactory(package=package_2, version='0.1.0')
+
+        package_ids = [package_1.pk, package_2.pk, package_3.pk]
+        with self.assertNumQueries(1):
+            indexes = get_package_version_indexes(package_ids=package_ids)
+
+        self.assertListEqual(
+            list1=indexes[package_1.pk].names,
+            list2=['1.0.0', '2.0.0'],
+        )
+        self.assertListEqual(
+            list1=indexes[package_2.pk].names,
+            list2=['0.1.0'],
+        )
+        self.assertEqual(first=len(indexes[package_3.pk]), second=0)
+
+        # Verify that the indexes are cached
+        with self.assertNumQueries(0):
+            indexes = get_package_version_indexes(package_ids=package_ids)
+        self.assertEqual(first=len(indexes), second=3)
+
+        # Verify that adding a release clears the package's index
+        PackageReleaseFactory(package=package_1, version='3.0.0')
+        self.assertIsNone(
+            obj=cache.get(get_package_versions_cache_key(package_1.pk)),
+        )
+        with self.assertNumQueries(1):
+            indexes = get_package_version_indexes(package_ids=package_ids)
+        self.assertListEqual(
+            list1=indexes[package_1.pk].names,
+            list2=['1.0.0', '2.0.0', '3.0.0'],
+        )
+
+        # Verify that an index cached before the commit is cleared on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            PackageReleaseFactory(package=package_1, version='4.0.0')
+            get_package_version_indexes(package_ids=[package_1.pk])
+        self.assertIsNone(
+            obj=cache.get(get_package_versions_cache_key(package_1.pk)),
+        )
+
+        # Verify that deleting a release clears the package's index
+        package_2.releases.get().delete()
+        indexes = get_package_version_indexes(package_ids=[package_2.pk])
+        self.assertEqual(first=len(indexes[package_2.pk]), second=0)
@@ -16,7 +16,7 @@ from rest_framework import status
 # App
 from project_manager.mixins import DownloadMixin
 from project_manager.packages.constants import PACKAGE_RELEASE_URL
-from project_manager.packages.models import Package, PackageRelease
+from project_manager.packages.models import PackageRelease
 from project_manager.packages.views import (
     PackageReleaseDownloadView,
     PackageCreateView,
@@ -28,7 +28,10 @@ from test_utils.factories.packages import PackageFactory, PackageReleaseFactory
 # =============================================================================
 # TEST CASES
 # =============================================================================
-@override_settings(MEDIA_ROOT=settings.BASE_DIR / 'fixtures')
+@override_settings(
+    MEDIA_ROOT=settings.BASE_DIR / 'fixtures',
+    DOWNLOAD_COUNT_FLUSH_THRESHOLD=1,
+)
 class PackageReleaseDownloadViewTestCase(TestCase):
 
     basename = package = zip_file = None
@@ -44,7 +47,7 @@ class PackageReleaseDownloadViewTestCase(TestCase):
         cls.release = PackageReleaseFactory(
             package=cls.package,
             version=version,
-            zip_file=cls.zip_file,
+            zip_file=f'{PACKAGE_RELEASE_URL}{cls.package.slug}/{cls.zip_file}',
         )
         cls.api_path = reverse(
             viewname='package-download',
@@ -73,14 +76,6 @@ class PackageReleaseDownloadViewTestCase(TestCase):
             first=PackageReleaseDownloadView.model,
             second=PackageRelease,
         )
-        self.assertEqual(
-            first=PackageReleaseDownloadView.project_model,
-            second=Package,
-        )
-        self.assertEqual(
-            first=PackageReleaseDownloadView.model_kwarg,
-            second='package',
-        )
         self.assertEqual(
             first=PackageReleaseDownloadView.base_url,
             second=PACKAGE_RELEASE_URL,
@@ -108,11 +103,24 @@ class PackageReleaseDownloadViewTestCase(TestCase):
             first=response.status_code,
             second=status.HTTP_200_OK,
         )
+        content = b''.join(response.streaming_content)
+        self.assertEqual(
+            first=response['Content-Type'],
+            second='application/zip',
+        )
+        self.assertEqual(
+            first=response['Content-Disposition'],
+            second=f'attachment; filename="{self.zip_file}"',
+        )
+        self.assertEqual(
+            first=int(response['Content-Length']),
+            second=len(content),
+        )
         self.assertIn(
             member=(
                 f'addons/source-python/packages/custom/{self.basename}/__init__.py'
             ),
-            container=str(response.content),
+            container=str(content),
         )
         self.assertEqual(
             first=PackageRelease.objects.get(pk=self.release.pk).download_count,
@@ -0,0 +1,214 @@
+"""Version specifier matching for Package requirements."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import re
+from bisect import bisect_left, bisect_right
+from functools import partial
+
+# Django
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Third Party Python
+from packaging.specifiers import InvalidSpecifier, Specifier, SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+# App
+from project_manager.constants import (
+    RELEASE_VERSION_REGEX,
+    REQUIREMENT_SPECIFIER_MAX_LENGTH,
+)
+from project_manager.packages.constants import PACKAGE_VERSIONS_CACHE_KEY_PREFIX
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'VersionIndex',
+    'clear_cached_package_versions',
+    'get_package_version_indexes',
+    'get_package_versions_cache_key',
+    'get_version_specifier',
+)
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+class VersionIndex:
+    """The sorted, parsed release versions of a Package.
+
+    Versions that are not PEP 440 compliant cannot be ordered, so they are
+        kept after the parsed versions and only matched exactly.
+    """
+
+    def __init__(self, versions):
+        """Parse and sort the given version strings."""
+        parsed = []
+        legacy = []
+        for version in versions:
+            try:
+                parsed.append((Version(version), version))
+            except InvalidVersion:
+                legacy.append(version)
+        parsed.sort()
+        self.versions = [version for version, _ in parsed]
+        self.names = [name for _, name in parsed] + sorted(legacy)
+
+    def __len__(self):
+        """Return the number of indexed versions."""
+        return len(self.names)
+
+    def find(self, specifier):
+        """Return the release versions matching the specifier, oldest first.
+
+        The specifier's bounds are located with a binary search, so only the
+            versions between them are tested against the specifier. Versions
+            that are not PEP 440 compliant only match an exact (===) clause.
+        """
+        if len(specifier) == 1:
+            (clause,) = specifier
+            legacy = self.names[len(self.versions):]
+            if clause.operator == '===' and clause.version in legacy:
+                return [clause.version]
+
+        start, end = 0, len(self.versions)
+        for clause in specifier:
+            clause_start, clause_end = self._get_bounds(clause)
+            start = max(start, clause_start)
+            end = min(end, clause_end)
+
+        if start >= end:
+            return []
+
+        matches = set(specifier.filter(self.versions[start:end]))
+        return [
+            name for version, name in zip(
+                self.versions[start:end],
+                self.names[start:end],
+            ) if version in matches
+        ]
+
+    def get_latest(self, specifier):
+        """Return the newest release version matching the specifier."""
+        matches = self.find(specifier)
+        return matches[-1] if matches else None
+
+    def _get_bounds(self, clause):
+        """Return the slice of versions the given clause can match."""
+        operator, version = clause.operator, clause.version
+        if operator in ('!=', '===') or version.endswith('.*'):
+            return 0, len(self.versions)
+
+        version = Version(version)
+        if operator == '==':
+            return (
+                bisect_left(self.versions, version),
+                bisect_right(self.versions, version),
+            )
+        if operator == '<':
+            return 0, bisect_left(self.versions, version)
+        if operator == '<=':
+            return 0, bisect_right(self.versions, version)
+
+        # >, >=, and ~= all only match versions from the given one upwards
+        return bisect_left(self.versions, version), len(self.versions)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def get_version_specifier(value):
+    """Return the SpecifierSet for the given requirement version.
+
+    A bare version, ie "1.0.0", is treated as an exact match. A bare
+        release version that is not PEP 440 compliant, ie "1.0.x", is
+        matched by its exact string.
+    """
+    if not isinstance(value, str):
+        raise InvalidSpecifier(f'Invalid specifier: {value!r}')
+
+    value = value.strip()
+    if len(value) > REQUIREMENT_SPECIFIER_MAX_LENGTH:
+        raise InvalidSpecifier(f'Specifier too long: {value!r}')
+
+    if value[:1].isdigit():
+        operator = '=='
+        try:
+            Version(value)
+        except InvalidVersion:
+            if re.fullmatch(RELEASE_VERSION_REGEX, value):
+                operator = '==='
+        value = f'{operator}{value}'
+
+    # Parse each clause so that legacy (non PEP 440) specifiers are rejected
+    return SpecifierSet(
+        ','.join(str(Specifier(clause)) for clause in value.split(','))
+    )
+
+
+def get_package_versions_cache_key(package_id):
+    """Return the cache key for the given Package's version index."""
+    return f'{PACKAGE_VERSIONS_CACHE_KEY_PREFIX}:{package_id}'
+
+
+def get_package_version_indexes(package_ids):
+    """Return the VersionIndex for each of the given Packages.
+
+    Indexes that are not cached are built together in a single query.
+    """
+    keys = {
+        get_package_versions_cache_key(package_id): package_id
+        for package_id in package_ids
+    }
+    indexes = {
+        keys[key]: index for key, index in cache.get_many(keys).items()
+    }
+    missing = set(keys.values()).difference(indexes)
+    if not missing:
+        return indexes
+
+    release_model = apps.get_model(
+        app_label='project_manager',
+        model_name='PackageRelease',
+    )
+    versions = {package_id: [] for package_id in missing}
+    for package_id, version in release_model.objects.filter(
+        package_id__in=missing,
+    ).values_list(
+        'package_id',
+        'version',
+    ):
+        versions[package_id].append(version)
+
+    built = {
+        package_id: VersionIndex(values)
+        for package_id, values in versions.items()
+    }
+    cache.set_many(
+        data={
+            get_package_versions_cache_key(package_id): index
+            for package_id, index in built.items()
+        },
+        timeout=settings.PACKAGE_VERSIONS_CACHE_TIMEOUT,
+    )
+    indexes.update(built)
+    return indexes
+
+
+def clear_cached_package_versions(instance, **kwargs):
+    """Remove the cached version index when a release is saved or deleted.
+
+    Inside a transaction, the index is removed again on commit, so that an
+        index cached before the commit is not used afterwards.
+    """
+    cache_key = get_package_versions_cache_key(instance.package_id)
+    cache.delete(cache_key)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(partial(cache.delete, cache_key))
@@ -29,8 +29,6 @@ class PackageReleaseDownloadView(DownloadMixin):
     """Package download view for releases."""
 
     model = PackageRelease
-    project_model = Package
-    model_kwarg = 'package'
     base_url = PACKAGE_RELEASE_URL
 
 
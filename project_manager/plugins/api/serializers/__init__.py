@@ -12,6 +12,7 @@ from project_manager.api.common.serializers import (
     ProjectCreateReleaseSerializer,
     ProjectGameSerializer,
     ProjectImageSerializer,
+    ProjectReleaseJobSerializer,
     ProjectReleaseSerializer,
     ProjectSerializer,
     ProjectTagSerializer,
@@ -26,6 +27,7 @@ from project_manager.plugins.models import (
     PluginImage,
     PluginRelease,
     PluginReleaseDownloadRequirement,
+    PluginReleaseJob,
     PluginReleasePackageRequirement,
     PluginReleasePyPiRequirement,
     PluginReleaseVersionControlRequirement,
@@ -49,6 +51,7 @@ __all__ = (
     'PluginGameSerializer',
     'PluginImageSerializer',
     'PluginReleaseDownloadRequirementSerializer',
+    'PluginReleaseJobSerializer',
     'PluginReleasePackageRequirementSerializer',
     'PluginReleasePyPiRequirementSerializer',
     'PluginReleaseSerializer',
@@ -154,6 +157,17 @@ class PluginCreateReleaseSerializer(
         model = PluginRelease
 
 
+class PluginReleaseJobSerializer(ProjectReleaseJobSerializer):
+    """Serializer for queueing and retrieving Plugin release jobs."""
+
+    release_serializer_class = PluginReleaseSerializer
+
+    class Meta(ProjectReleaseJobSerializer.Meta):
+        """Define metaclass attributes."""
+
+        model = PluginReleaseJob
+
+
 class PluginSerializer(ProjectSerializer):
     """Serializer for updating and listing Plugins."""
 
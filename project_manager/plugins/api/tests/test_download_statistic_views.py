@@ -0,0 +1,260 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from datetime import date
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.common.serializers import (
+    ProjectDownloadStatisticQuerySerializer,
+)
+from project_manager.api.common.views import ProjectDownloadStatisticViewSet
+from project_manager.downloads.constants import DOWNLOAD_PERIOD_MONTH
+from project_manager.plugins.api.views import PluginDownloadStatisticViewSet
+from project_manager.plugins.models import (
+    Plugin,
+    PluginReleaseDownloadStatistic,
+)
+from test_utils.factories.plugins import (
+    PluginFactory,
+    PluginReleaseDownloadStatisticFactory,
+    PluginReleaseFactory,
+)
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PluginDownloadStatisticViewSetTestCase(APITestCase):
+
+    plugin = release_1 = release_2 = list_path = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.plugin = PluginFactory()
+        cls.release_1 = PluginReleaseFactory(
+            plugin=cls.plugin,
+            version='1.0.0',
+        )
+        cls.release_2 = PluginReleaseFactory(
+            plugin=cls.plugin,
+            version='1.0.1',
+        )
+        for release, period, day, count in (
+            (cls.release_1, DOWNLOAD_PERIOD_MONTH, date(2023, 1, 1), 50),
+            (cls.release_1, 'day', date(2023, 2, 1), 3),
+            (cls.release_1, 'day', date(2023, 2, 2), 4),
+            (cls.release_2, 'day', date(2023, 2, 2), 5),
+        ):
+            PluginReleaseDownloadStatisticFactory(
+                release=release,
+                period=period,
+                date=day,
+                download_count=count,
+            )
+        PluginReleaseDownloadStatisticFactory(
+            release=PluginReleaseFactory(),
+            date=date(2023, 2, 2),
+            download_count=100,
+        )
+        cls.list_path = reverse(
+            viewname='api:plugins:downloads-list',
+            kwargs={
+                'plugin_slug': cls.plugin.slug,
+            },
+        )
+        cls.detail_path = reverse(
+            viewname='api:plugins:downloads-detail',
+            kwargs={
+                'plugin_slug': cls.plugin.slug,
+                'version': cls.release_1.version,
+            },
+        )
+
+    def test_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(
+                PluginDownloadStatisticViewSet,
+                ProjectDownloadStatisticViewSet,
+            ),
+        )
+
+    def test_base_attributes(self):
+        self.assertEqual(
+            first=PluginDownloadStatisticViewSet.serializer_class,
+            second=ProjectDownloadStatisticQuerySerializer,
+        )
+        self.assertEqual(
+            first=PluginDownloadStatisticViewSet.project_type,
+            second='plugin',
+        )
+        self.assertEqual(
+            first=PluginDownloadStatisticViewSet.project_model,
+            second=Plugin,
+        )
+        self.assertIs(
+            expr1=PluginDownloadStatisticViewSet.queryset.model,
+            expr2=PluginReleaseDownloadStatistic,
+        )
+
+    def test_http_method_names(self):
+        self.assertTupleEqual(
+            tuple1=PluginDownloadStatisticViewSet.http_method_names,
+            tuple2=('get', 'options'),
+        )
+
+    def test_get_list(self):
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={
+                'period': 'day',
+                'downloads': [
+                    {'date': '2023-02-01', 'download_count': 3},
+                    {'date': '2023-02-02', 'download_count': 9},
+                ],
+                'releases': {
+                    '1.0.0': [
+                        {'date': '2023-02-01', 'download_count': 3},
+                        {'date': '2023-02-02', 'download_count': 4},
+                    ],
+                    '1.0.1': [
+                        {'date': '2023-02-02', 'download_count': 5},
+                    ],
+                },
+            },
+        )
+
+    def test_get_list_month(self):
+        response = self.client.get(
+            path=self.list_path,
+            data={'period': 'month'},
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={
+                'period': 'month',
+                'downloads': [
+                    {'date': '2023-01-01', 'download_count': 50},
+                    {'date': '2023-02-01', 'download_count': 12},
+                ],
+                'releases': {
+                    '1.0.0': [
+                        {'date': '2023-01-01', 'download_count': 50},
+                        {'date': '2023-02-01', 'download_count': 7},
+                    ],
+                    '1.0.1': [
+                        {'date': '2023-02-01', 'download_count': 5},
+                    ],
+                },
+            },
+        )
+
+    def test_get_list_date_range(self):
+        response = self.client.get(
+            path=self.list_path,
+            data={'start': '2023-02-02', 'end': '2023-02-28'},
+        )
+        self.assertListEqual(
+            list1=response.json()['downloads'],
+            list2=[{'date': '2023-02-02', 'download_count': 9}],
+        )
+
+    def test_get_list_invalid_query(self):
+        response = self.client.get(
+            path=self.list_path,
+            data={'period': 'year', 'start': '2023-02-02', 'end': '2023-02-01'},
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertIn(member='period', container=response.json())
+
+        response = self.client.get(
+            path=self.list_path,
+            data={'start': '2023-02-02', 'end': '2023-02-01'},
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'end': ['End date must not be before the start date.']},
+        )
+
+    def test_get_list_failure(self):
+        response = self.client.get(
+            path=reverse(
+                viewname='api:plugins:downloads-list',
+                kwargs={
+                    'plugin_slug': 'invalid',
+                },
+            ),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_404_NOT_FOUND,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'detail': 'Invalid plugin_slug.'},
+        )
+
+    def test_get_details(self):
+        response = self.client.get(
+            path=self.detail_path,
+            data={'period': 'month'},
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={
+                'version': '1.0.0',
+                'period': 'month',
+                'downloads': [
+                    {'date': '2023-01-01', 'download_count': 50},
+                    {'date': '2023-02-01', 'download_count': 7},
+                ],
+            },
+        )
+
+    def test_get_details_failure(self):
+        response = self.client.get(
+            path=reverse(
+                viewname='api:plugins:downloads-detail',
+                kwargs={
+                    'plugin_slug': self.plugin.slug,
+                    'version': '9.9.9',
+                },
+            ),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_404_NOT_FOUND,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'detail': 'Invalid version.'},
+        )
+
+    def test_options(self):
+        response = self.client.options(path=self.list_path)
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        self.assertEqual(
+            first=response.json()['name'],
+            second=f'{self.plugin} - Download Statistic',
+        )
@@ -9,6 +9,7 @@ from datetime import timedelta
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from django.db import connection
 from django.test import override_settings
@@ -46,7 +47,11 @@ from test_utils.factories.plugins import (
     PluginContributorFactory,
     PluginFactory,
     PluginGameFactory,
+    PluginReleaseDownloadRequirementFactory,
     PluginReleaseFactory,
+    PluginReleasePackageRequirementFactory,
+    PluginReleasePyPiRequirementFactory,
+    PluginReleaseVersionControlRequirementFactory,
     PluginTagFactory,
 )
 from test_utils.factories.tags import TagFactory
@@ -217,6 +222,10 @@ class PluginViewSetTestCase(APITestCase):
         shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
         super().tearDownClass()
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_inheritance(self):
         self.assertTrue(expr=issubclass(PluginViewSet, ProjectViewSet))
 
@@ -240,11 +249,8 @@ class PluginViewSetTestCase(APITestCase):
         )
         self.assertEqual(first=len(prefetch_lookups), second=1)
         lookup = prefetch_lookups[0]
-        self.assertEqual(first=lookup.prefetch_to, second='releases')
-        self.assertEqual(
-            first=lookup.queryset.query.order_by,
-            second=('-created',),
-        )
+        self.assertEqual(first=lookup.prefetch_through, second='releases')
+        self.assertEqual(first=lookup.prefetch_to, second='current_releases')
 
         self.assertDictEqual(
             d1=PluginViewSet.queryset.query.select_related,
@@ -264,7 +270,16 @@ class PluginViewSetTestCase(APITestCase):
             obj.get_queryset(),
             '_prefetch_related_lookups'
         )
-        self.assertEqual(first=len(prefetch_lookups), second=1)
+        self.assertEqual(first=len(prefetch_lookups), second=5)
+        self.assertListEqual(
+            list1=[lookup.prefetch_to for lookup in prefetch_lookups[1:]],
+            list2=[
+                'current_releases__pluginreleasepackagerequirement_set',
+                'current_releases__pluginreleasedownloadrequirement_set',
+                'current_releases__pluginreleasepypirequirement_set',
+                'current_releases__pluginreleaseversioncontrolrequirement_set',
+            ],
+        )
 
         setattr(obj, 'action', 'list')
         prefetch_lookups = getattr(
@@ -332,10 +347,10 @@ class PluginViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that contributors can see results AND 'id'
+        # Verify that contributors can see results AND 'id', served from the cache
         self.client.force_login(self.contributor_1.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=6)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -351,10 +366,10 @@ class PluginViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that the owner can see results AND 'id'
+        # Verify that the owner can see results AND 'id', served from the cache
         self.client.force_login(self.owner.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=6)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -494,6 +509,36 @@ class PluginViewSetTestCase(APITestCase):
             second=2,
         )
 
+    def test_get_list_ordering_total_downloads(self):
+        PluginReleaseFactory(
+            plugin=self.plugin_1,
+            version='2.0.0',
+            zip_file='/media/release_v2.0.0.zip',
+            download_count=5,
+        )
+        for ordering, expected in (
+            (
+                '-total_downloads',
+                [(self.plugin_1.slug, 5), (self.plugin_2.slug, 0)],
+            ),
+            (
+                'total_downloads',
+                [(self.plugin_2.slug, 0), (self.plugin_1.slug, 5)],
+            ),
+        ):
+            response = self.client.get(
+                path=self.list_path,
+                data={'ordering': ordering},
+            )
+            results = response.json()['results']
+            self.assertListEqual(
+                list1=[
+                    (result['slug'], result['total_downloads'])
+                    for result in results
+                ],
+                list2=expected,
+            )
+
     @override_settings(DEBUG=True)
     def test_get_details(self):
         environ = getattr(self.client, '_base_environ')()
@@ -551,10 +596,10 @@ class PluginViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that contributors can see details
+            # Verify that contributors can see details, served from the cache
             self.client.force_login(self.contributor_1.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=8)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -564,10 +609,10 @@ class PluginViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that the owner can see details
+            # Verify that the owner can see details, served from the cache
             self.client.force_login(self.owner.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=8)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -577,6 +622,53 @@ class PluginViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
+    @override_settings(DEBUG=True)
+    def test_get_details_requirements(self):
+        for _ in range(3):
+            PluginReleasePackageRequirementFactory(
+                plugin_release=self.current_release_1,
+                version='>=1.0',
+            )
+            PluginReleasePyPiRequirementFactory(
+                plugin_release=self.current_release_1,
+                optional=True,
+            )
+            PluginReleaseVersionControlRequirementFactory(
+                plugin_release=self.current_release_1,
+            )
+            PluginReleaseDownloadRequirementFactory(
+                plugin_release=self.current_release_1,
+            )
+
+        # Verify that the query count does not grow with the requirements
+        response = self.client.get(path=self.detail_path)
+        self.assertEqual(first=len(connection.queries), second=6)
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        current_release = response.json()['current_release']
+
+        # Verify that the requirements match the release endpoint
+        response = self.client.get(
+            path=reverse(
+                viewname='api:plugins:releases-detail',
+                kwargs={
+                    'plugin_slug': self.plugin_1.slug,
+                    'version': self.current_release_1.version,
+                },
+            ),
+        )
+        release = response.json()
+        for key, release_key in (
+            ('download_requirements', 'download_requirements'),
+            ('package_requirements', 'package_requirements'),
+            ('pypi_requirements', 'pypi_requirements'),
+            ('version_control_requirements', 'vcs_requirements'),
+        ):
+            self.assertEqual(first=len(current_release[key]), second=3)
+            self.assertListEqual(
+                list1=current_release[key],
+                list2=release[release_key],
+            )
+
     @override_settings(MEDIA_ROOT=MEDIA_ROOT)
     def test_post(self):
         # Verify non-logged-in user cannot create a plugin
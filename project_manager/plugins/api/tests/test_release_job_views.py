@@ -0,0 +1,244 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import shutil
+import tempfile
+from unittest import mock
+
+# Django
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.test import override_settings
+
+# Third Party Python
+from path import Path
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.common.views import ProjectReleaseJobViewSet
+from project_manager.plugins.api.serializers import (
+    PluginReleaseJobSerializer,
+    PluginReleaseSerializer,
+)
+from project_manager.plugins.api.views import PluginReleaseJobViewSet
+from project_manager.plugins.models import Plugin, PluginReleaseJob
+from project_manager.release_jobs.constants import RELEASE_JOB_PENDING
+from test_utils.factories.plugins import (
+    PluginContributorFactory,
+    PluginFactory,
+    PluginReleaseFactory,
+    PluginReleaseJobFactory,
+)
+from test_utils.factories.users import ForumUserFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PluginReleaseJobViewSetTestCase(APITestCase):
+
+    contributor = job = owner = plugin = regular_user = None
+    detail_path = list_path = release_path = None
+    MEDIA_ROOT = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = ForumUserFactory()
+        cls.contributor = ForumUserFactory()
+        cls.regular_user = ForumUserFactory()
+        cls.plugin = PluginFactory(
+            basename='test_plugin',
+            owner=cls.owner,
+        )
+        PluginContributorFactory(
+            plugin=cls.plugin,
+            user=cls.contributor,
+        )
+        PluginReleaseFactory(
+            plugin=cls.plugin,
+            version='1.0.0',
+        )
+        cls.job = PluginReleaseJobFactory(
+            plugin=cls.plugin,
+            created_by=cls.owner,
+        )
+        PluginReleaseJobFactory()
+        cls.list_path = reverse(
+            viewname='api:plugins:release-jobs-list',
+            kwargs={
+                'plugin_slug': cls.plugin.slug,
+            },
+        )
+        cls.detail_path = reverse(
+            viewname='api:plugins:release-jobs-detail',
+            kwargs={
+                'plugin_slug': cls.plugin.slug,
+                'pk': cls.job.pk,
+            },
+        )
+        cls.release_path = reverse(
+            viewname='api:plugins:releases-list',
+            kwargs={
+                'plugin_slug': cls.plugin.slug,
+            },
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def test_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(PluginReleaseJobViewSet, ProjectReleaseJobViewSet),
+        )
+
+    def test_base_attributes(self):
+        self.assertEqual(
+            first=PluginReleaseJobViewSet.serializer_class,
+            second=PluginReleaseJobSerializer,
+        )
+        self.assertEqual(
+            first=PluginReleaseJobViewSet.project_type,
+            second='plugin',
+        )
+        self.assertEqual(
+            first=PluginReleaseJobViewSet.project_model,
+            second=Plugin,
+        )
+        self.assertIs(
+            expr1=PluginReleaseJobViewSet.queryset.model,
+            expr2=PluginReleaseJob,
+        )
+
+    def test_get_list(self):
+        # Verify that non-logged-in and regular users cannot view jobs
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_403_FORBIDDEN,
+        )
+        self.client.force_login(self.regular_user.user)
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_403_FORBIDDEN,
+        )
+
+        # Verify that contributors can view the project's jobs
+        self.client.force_login(self.contributor.user)
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        content = response.json()
+        self.assertEqual(first=content['count'], second=1)
+        result = content['results'][0]
+        self.assertEqual(first=result['id'], second=str(self.job.pk))
+        self.assertEqual(first=result['version'], second=self.job.version)
+        self.assertEqual(first=result['status'], second=RELEASE_JOB_PENDING)
+        self.assertIsNone(obj=result['release'])
+        self.assertNotIn(member='zip_file', container=result)
+
+    def test_get_details(self):
+        self.client.force_login(self.owner.user)
+        response = self.client.get(path=self.detail_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            first=response.json()['id'],
+            second=str(self.job.pk),
+        )
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT, RELEASE_JOBS_ENABLED=True)
+    @mock.patch(target='project_manager.api.common.views.submit_release_job')
+    def test_post_release(self, mock_submit_release_job):
+        base_path = settings.BASE_DIR / 'fixtures' / 'releases' / 'plugins'
+        file_path = base_path / 'test-plugin' / 'test-plugin-v1.0.0.zip'
+        self.client.force_login(self.contributor.user)
+
+        # Verify that an existing version is rejected before being queued
+        with file_path.open('rb') as open_file:
+            response = self.client.post(
+                path=self.release_path,
+                data={
+                    'version': '1.0.0',
+                    'zip_file': UploadedFile(
+                        open_file,
+                        content_type='application/zip',
+                    ),
+                },
+            )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'version': ['Given version matches existing version.']},
+        )
+        mock_submit_release_job.assert_not_called()
+
+        # Verify that the release is queued as a job
+        with file_path.open('rb') as open_file:
+            response = self.client.post(
+                path=self.release_path,
+                data={
+                    'version': '1.0.1',
+                    'notes': 'Some notes.',
+                    'zip_file': UploadedFile(
+                        open_file,
+                        content_type='application/zip',
+                    ),
+                },
+            )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_202_ACCEPTED,
+        )
+        content = response.json()
+        job = PluginReleaseJob.objects.get(pk=content['id'])
+        self.assertEqual(first=job.plugin, second=self.plugin)
+        self.assertEqual(first=job.created_by, second=self.contributor)
+        self.assertEqual(first=job.notes, second='Some notes.')
+        self.assertTrue(expr=job.zip_file)
+        self.assertEqual(first=content['status'], second=RELEASE_JOB_PENDING)
+        self.assertEqual(
+            first=response['Location'],
+            second='http://testserver' + reverse(
+                viewname='api:plugins:release-jobs-detail',
+                kwargs={
+                    'plugin_slug': self.plugin.slug,
+                    'pk': job.pk,
+                },
+            ),
+        )
+        mock_submit_release_job.assert_called_once_with(
+            job=job,
+            serializer_class=PluginReleaseSerializer,
+        )
+        self.assertFalse(expr=self.plugin.releases.filter(version='1.0.1'))
+
+    def test_post(self):
+        self.client.force_login(self.owner.user)
+        response = self.client.post(path=self.list_path, data={})
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_405_METHOD_NOT_ALLOWED,
+        )
+
+    def test_options(self):
+        response = self.client.options(path=self.list_path)
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        self.assertEqual(
+            first=response.json()['name'],
+            second=f'{self.plugin} - Release Job',
+        )
@@ -9,6 +9,7 @@ from datetime import timedelta
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from django.db import connection
 from django.test import override_settings
@@ -25,6 +26,7 @@ from rest_framework.test import APITestCase
 
 # App
 from project_manager.api.common.views import ProjectReleaseViewSet
+from project_manager.packages.resolution import get_resolved_requirements
 from project_manager.plugins.api.serializers import PluginReleaseSerializer
 from project_manager.plugins.api.views import PluginReleaseViewSet
 from project_manager.plugins.models import (
@@ -275,6 +277,10 @@ class PluginReleaseViewSetTestCase(APITestCase):
         shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
         super().tearDownClass()
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_inheritance(self):
         self.assertTrue(
             expr=issubclass(PluginReleaseViewSet, ProjectReleaseViewSet),
@@ -432,10 +438,10 @@ class PluginReleaseViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that contributors can see results
+        # Verify that contributors can see results, served from the cache
         self.client.force_login(self.contributor.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=9)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -451,10 +457,10 @@ class PluginReleaseViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that the owner can see results
+        # Verify that the owner can see results, served from the cache
         self.client.force_login(self.owner.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=9)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -498,20 +504,20 @@ class PluginReleaseViewSetTestCase(APITestCase):
         )
         self.assertEqual(first=response.json()['count'], second=0)
 
-        # Verify that contributors can see results
+        # Verify that contributors can see results, served from the cache
         self.client.force_login(self.contributor.user)
         response = self.client.get(path=list_path)
-        self.assertEqual(first=len(connection.queries), second=4)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
         )
         self.assertEqual(first=response.json()['count'], second=0)
 
-        # Verify that the owner can see results
+        # Verify that the owner can see results, served from the cache
         self.client.force_login(self.owner.user)
         response = self.client.get(path=list_path)
-        self.assertEqual(first=len(connection.queries), second=4)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -585,10 +591,10 @@ class PluginReleaseViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that contributors can see details
+            # Verify that contributors can see details, served from the cache
             self.client.force_login(self.contributor.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=8)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -598,10 +604,10 @@ class PluginReleaseViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that the owner can see details
+            # Verify that the owner can see details, served from the cache
             self.client.force_login(self.owner.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=8)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -633,6 +639,40 @@ class PluginReleaseViewSetTestCase(APITestCase):
             d2={'detail': 'Not found.'},
         )
 
+    def test_get_resolve(self):
+        cache.clear()
+        response = self.client.get(
+            path=reverse(
+                viewname='api:plugins:releases-resolve',
+                kwargs={
+                    'plugin_slug': self.plugin_1.slug,
+                    'version': self.plugin_release_2.version,
+                },
+            ),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2=get_resolved_requirements(release=self.plugin_release_2),
+        )
+
+        response = self.client.get(
+            path=reverse(
+                viewname='api:plugins:releases-resolve',
+                kwargs={
+                    'plugin_slug': self.plugin_1.slug,
+                    'version': '0.0.0',
+                },
+            ),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_404_NOT_FOUND,
+        )
+
     @override_settings(MEDIA_ROOT=MEDIA_ROOT)
     def test_post(self):
         base_path = settings.BASE_DIR / 'fixtures' / 'releases' / 'plugins'
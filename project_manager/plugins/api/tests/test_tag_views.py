@@ -55,9 +55,11 @@ class PluginTagViewSetTestCase(APITestCase):
         )
         cls.plugin_tag_1 = PluginTagFactory(
             plugin=cls.plugin_1,
+            tag=TagFactory(name='first_tag'),
         )
         cls.plugin_tag_2 = PluginTagFactory(
             plugin=cls.plugin_1,
+            tag=TagFactory(name='second_tag'),
         )
         cls.regular_user = ForumUserFactory()
         cls.detail_api = 'api:plugins:tags-detail'
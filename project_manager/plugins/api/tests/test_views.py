@@ -55,10 +55,12 @@ class PluginAPIViewTestCase(APITestCase):
                     )
                 ) for key in (
                     'contributors',
+                    'downloads',
                     'games',
                     'images',
                     'paths',
                     'projects',
+                    'release-jobs',
                     'releases',
                     'tags',
                 )
@@ -13,8 +13,10 @@ from rest_framework import routers
 from project_manager.plugins.api.views import (
     PluginAPIView,
     PluginContributorViewSet,
+    PluginDownloadStatisticViewSet,
     PluginGameViewSet,
     PluginImageViewSet,
+    PluginReleaseJobViewSet,
     PluginReleaseViewSet,
     PluginTagViewSet,
     PluginViewSet,
@@ -41,6 +43,11 @@ router.register(
     viewset=PluginReleaseViewSet,
     basename='releases',
 )
+router.register(
+    prefix='releases/(?P<plugin_slug>[^/.]+)/jobs',
+    viewset=PluginReleaseJobViewSet,
+    basename='release-jobs',
+)
 router.register(
     prefix='games/(?P<plugin_slug>[^/.]+)',
     viewset=PluginGameViewSet,
@@ -61,6 +68,11 @@ router.register(
     viewset=SubPluginPathViewSet,
     basename='paths',
 )
+router.register(
+    prefix='downloads/(?P<plugin_slug>[^/.]+)',
+    viewset=PluginDownloadStatisticViewSet,
+    basename='downloads',
+)
 
 
 # =============================================================================
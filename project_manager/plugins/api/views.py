@@ -3,26 +3,30 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
-# Django
-from django.db.models import Prefetch
-
 # App
 from project_manager.api.common.views import (
     ProjectAPIView,
     ProjectContributorViewSet,
+    ProjectDownloadStatisticViewSet,
     ProjectGameViewSet,
     ProjectImageViewSet,
+    ProjectReleaseJobViewSet,
     ProjectReleaseViewSet,
     ProjectTagViewSet,
     ProjectViewSet,
 )
 from project_manager.api.common.views.mixins import ProjectRelatedInfoMixin
+from project_manager.helpers import (
+    get_current_release_prefetch,
+    get_requirement_prefetches,
+)
 from project_manager.plugins.api.filtersets import PluginFilterSet
 from project_manager.plugins.api.serializers import (
     PluginContributorSerializer,
     PluginCreateSerializer,
     PluginGameSerializer,
     PluginImageSerializer,
+    PluginReleaseJobSerializer,
     PluginReleaseSerializer,
     PluginSerializer,
     PluginTagSerializer,
@@ -34,10 +38,8 @@ from project_manager.plugins.models import (
     PluginGame,
     PluginImage,
     PluginRelease,
-    PluginReleaseDownloadRequirement,
-    PluginReleasePackageRequirement,
-    PluginReleasePyPiRequirement,
-    PluginReleaseVersionControlRequirement,
+    PluginReleaseDownloadStatistic,
+    PluginReleaseJob,
     PluginTag,
     SubPluginPath,
 )
@@ -49,8 +51,10 @@ from project_manager.plugins.models import (
 __all__ = (
     'PluginAPIView',
     'PluginContributorViewSet',
+    'PluginDownloadStatisticViewSet',
     'PluginGameViewSet',
     'PluginImageViewSet',
+    'PluginReleaseJobViewSet',
     'PluginReleaseViewSet',
     'PluginTagViewSet',
     'PluginViewSet',
@@ -76,12 +80,7 @@ class PluginViewSet(ProjectViewSet):
     queryset = Plugin.objects.select_related(
         'owner__user',
     ).prefetch_related(
-        Prefetch(
-            lookup='releases',
-            queryset=PluginRelease.objects.order_by(
-                '-created',
-            ),
-        ),
+        get_current_release_prefetch(release_model=PluginRelease),
     )
     serializer_class = PluginSerializer
 
@@ -109,40 +108,23 @@ class PluginReleaseViewSet(ProjectReleaseViewSet):
         'plugin',
         'created_by__user',
     ).prefetch_related(
-        Prefetch(
-            lookup='pluginreleasepackagerequirement_set',
-            queryset=PluginReleasePackageRequirement.objects.order_by(
-                'package_requirement__name',
-            ).select_related(
-                'package_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='pluginreleasedownloadrequirement_set',
-            queryset=PluginReleaseDownloadRequirement.objects.order_by(
-                'download_requirement__url',
-            ).select_related(
-                'download_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='pluginreleasepypirequirement_set',
-            queryset=PluginReleasePyPiRequirement.objects.order_by(
-                'pypi_requirement__name',
-            ).select_related(
-                'pypi_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='pluginreleaseversioncontrolrequirement_set',
-            queryset=PluginReleaseVersionControlRequirement.objects.order_by(
-                'vcs_requirement__url',
-            ).select_related(
-                'vcs_requirement',
-            )
-        ),
+        *get_requirement_prefetches(release_model=PluginRelease),
     )
     serializer_class = PluginReleaseSerializer
+    job_serializer_class = PluginReleaseJobSerializer
+
+    project_type = 'plugin'
+    project_model = Plugin
+
+
+class PluginReleaseJobViewSet(ProjectReleaseJobViewSet):
+    """ViewSet for retrieving release jobs for Plugins."""
+
+    __doc__ += ProjectReleaseJobViewSet.doc_string
+    queryset = PluginReleaseJob.objects.select_related(
+        'release',
+    )
+    serializer_class = PluginReleaseJobSerializer
 
     project_type = 'plugin'
     project_model = Plugin
@@ -190,6 +172,16 @@ class PluginContributorViewSet(ProjectContributorViewSet):
     project_model = Plugin
 
 
+class PluginDownloadStatisticViewSet(ProjectDownloadStatisticViewSet):
+    """Download statistics for Plugins."""
+
+    __doc__ += ProjectDownloadStatisticViewSet.doc_string
+    queryset = PluginReleaseDownloadStatistic.objects.all()
+
+    project_type = 'plugin'
+    project_model = Plugin
+
+
 class SubPluginPathViewSet(ProjectRelatedInfoMixin):
     """Sub-Plugin Paths listing.
 
@@ -17,14 +17,18 @@ from project_manager.constants import (
     PROJECT_BASENAME_MAX_LENGTH,
     PROJECT_SLUG_MAX_LENGTH,
     RELEASE_VERSION_MAX_LENGTH,
+    REQUIREMENT_SPECIFIER_MAX_LENGTH,
 )
 from project_manager.models.abstract import (
     AbstractUUIDPrimaryKeyModel,
     Project,
     ProjectRelease,
+    ProjectReleaseDownloadStatistic,
+    ProjectReleaseJob,
 )
 from project_manager.validators import (
     basename_validator,
+    specifier_validator,
     version_validator,
 )
 from project_manager.plugins.constants import PLUGIN_LOGO_URL, PATH_MAX_LENGTH
@@ -46,6 +50,8 @@ __all__ = (
     'PluginImage',
     'PluginRelease',
     'PluginReleaseDownloadRequirement',
+    'PluginReleaseDownloadStatistic',
+    'PluginReleaseJob',
     'PluginReleasePackageRequirement',
     'PluginReleasePyPiRequirement',
     'PluginReleaseVersionControlRequirement',
@@ -154,12 +160,16 @@ class PluginRelease(ProjectRelease):
     field_tracker = FieldTracker(
         fields=[
             'version',
+            'zip_file',
         ]
     )
 
     class Meta(ProjectRelease.Meta):
         """Define metaclass attributes."""
 
+        indexes = [
+            models.Index(fields=('plugin', '-created')),
+        ]
         unique_together = ('plugin', 'version')
         verbose_name = 'Plugin Release'
         verbose_name_plural = 'Plugin Releases'
@@ -180,6 +190,57 @@ class PluginRelease(ProjectRelease):
         )
 
 
+class PluginReleaseDownloadStatistic(ProjectReleaseDownloadStatistic):
+    """Plugin release download statistics model."""
+
+    release = models.ForeignKey(
+        to='project_manager.PluginRelease',
+        related_name='download_statistics',
+        on_delete=models.CASCADE,
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        unique_together = ('release', 'period', 'date')
+        verbose_name = 'Plugin Release Download Statistic'
+        verbose_name_plural = 'Plugin Release Download Statistics'
+
+
+class PluginReleaseJob(ProjectReleaseJob):
+    """Plugin release job type model."""
+
+    plugin = models.ForeignKey(
+        to='project_manager.Plugin',
+        related_name='release_jobs',
+        on_delete=models.CASCADE,
+    )
+    created_by = models.ForeignKey(
+        to='users.ForumUser',
+        related_name='plugin_release_jobs',
+        on_delete=models.SET_NULL,
+        null=True,
+    )
+    release = models.OneToOneField(
+        to='project_manager.PluginRelease',
+        related_name='job',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        verbose_name = 'Plugin Release Job'
+        verbose_name_plural = 'Plugin Release Jobs'
+
+    @property
+    def project(self):
+        """Return the Plugin."""
+        return self.plugin
+
+
 class PluginImage(AbstractUUIDPrimaryKeyModel):
     """Plugin image type model."""
 
@@ -395,11 +456,11 @@ class PluginReleasePackageRequirement(AbstractUUIDPrimaryKeyModel):
         on_delete=models.CASCADE,
     )
     version = models.CharField(
-        max_length=RELEASE_VERSION_MAX_LENGTH,
-        validators=[version_validator],
+        max_length=REQUIREMENT_SPECIFIER_MAX_LENGTH,
+        validators=[specifier_validator],
         help_text=(
-            'The version of the custom package for this release '
-            'of the plugin.'
+            'The version, or version specifier, of the custom package for '
+            'this release of the plugin.'
         ),
         blank=True,
         null=True,
@@ -7,6 +7,7 @@ from unittest import mock
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
@@ -25,6 +26,7 @@ from project_manager.plugins.helpers import (
     handle_plugin_logo_upload,
     handle_plugin_zip_upload,
 )
+from requirements.models import DownloadRequirement, PyPiRequirement
 from test_utils.factories.packages import PackageFactory, PackageReleaseFactory
 from test_utils.factories.plugins import (
     PluginFactory,
@@ -45,6 +47,7 @@ class PluginZipFileTestCase(TestCase):
 
     def setUp(self) -> None:
         super().setUp()
+        cache.clear()
         self.mock_get_file_list = mock.patch(
             target='project_manager.helpers.ProjectZipFile.get_file_list',
         ).start()
@@ -486,6 +489,197 @@ class PluginZipFileTestCase(TestCase):
         )
 
 
+    @mock.patch(
+        target='project_manager.helpers.json.loads',
+    )
+    def test_validate_requirements_bulk_resolution(self, mock_json_loads):
+        pypi_requirement = PyPiRequirementFactory(name='existing-package')
+        mock_json_loads.return_value = {
+            'download': [
+                {'url': 'https://example.com/download-2.zip'},
+                {'url': 'https://example.com/download-1.zip'},
+            ],
+            'pypi': [
+                {'name': 'existing-package', 'version': '1.0'},
+                {'name': 'New_Package', 'optional': True},
+            ],
+        }
+        obj = PluginZipFile('')
+        with self.assertNumQueries(6):
+            obj.validate_requirements()
+
+        new_pypi_requirement = PyPiRequirement.objects.get(name='New_Package')
+        self.assertEqual(
+            first=new_pypi_requirement.slug,
+            second='new_package',
+        )
+        self.assertEqual(
+            first=DownloadRequirement.objects.count(),
+            second=2,
+        )
+        self.assertDictEqual(
+            d1=obj.requirements,
+            d2={
+                'download': [
+                    {
+                        'download_requirement': DownloadRequirement.objects.get(
+                            url='https://example.com/download-2.zip',
+                        ),
+                        'optional': False,
+                    },
+                    {
+                        'download_requirement': DownloadRequirement.objects.get(
+                            url='https://example.com/download-1.zip',
+                        ),
+                        'optional': False,
+                    },
+                ],
+                'pypi': [
+                    {
+                        'pypi_requirement': pypi_requirement,
+                        'version': '1.0',
+                        'optional': False,
+                    },
+                    {
+                        'pypi_requirement': new_pypi_requirement,
+                        'version': None,
+                        'optional': True,
+                    },
+                ],
+            },
+        )
+
+        # Verify that nothing is created when the file has errors
+        mock_json_loads.return_value = {
+            'pypi': [
+                {'name': 'another-package'},
+                {'version': '1.0'},
+            ],
+        }
+        obj = PluginZipFile('')
+        with self.assertRaises(ValidationError):
+            obj.validate_requirements()
+
+        self.assertFalse(
+            expr=PyPiRequirement.objects.filter(
+                name='another-package',
+            ).exists(),
+        )
+
+
+    @mock.patch(
+        target='project_manager.helpers.json.loads',
+    )
+    def test_validate_requirements_conflict(self, mock_json_loads):
+        mock_json_loads.return_value = {
+            'pypi': [{'name': 'New_Package'}],
+        }
+        get_instances = ProjectZipFile._get_requirement_instances
+        created = []
+
+        def create_between(**kwargs):
+            instances = get_instances(**kwargs)
+            if not created:
+                created.append(PyPiRequirementFactory(name='New_Package'))
+            return instances
+
+        # Verify that a requirement created by another upload is used
+        obj = PluginZipFile('')
+        with mock.patch.object(
+            target=ProjectZipFile,
+            attribute='_get_requirement_instances',
+            side_effect=create_between,
+        ):
+            obj.validate_requirements()
+
+        self.assertEqual(
+            first=obj.requirements['pypi'][0]['pypi_requirement'],
+            second=created[0],
+        )
+        self.assertEqual(
+            first=PyPiRequirement.objects.filter(name='New_Package').count(),
+            second=1,
+        )
+
+    @mock.patch(
+        target='project_manager.helpers.json.loads',
+    )
+    def test_validate_requirements_custom_query_count(self, mock_json_loads):
+        packages = [
+            PackageFactory(basename=f'custom_package_{number}')
+            for number in range(5)
+        ]
+        for package in packages:
+            PackageReleaseFactory(package=package, version='1.0.0')
+
+        mock_json_loads.return_value = {
+            'custom': [
+                {'basename': package.basename, 'version': '1.0.0'}
+                for package in packages
+            ] + [
+                {'basename': packages[0].basename},
+                {'basename': packages[1].basename, 'version': '>=1.0,<2'},
+            ],
+        }
+        obj = PluginZipFile('')
+        with self.assertNumQueries(2):
+            obj.validate_requirements()
+
+        self.assertListEqual(
+            list1=[
+                requirement['package_requirement']
+                for requirement in obj.requirements['custom']
+            ],
+            list2=packages + packages[:2],
+        )
+        self.assertEqual(
+            first=obj.requirements['custom'][-1]['version'],
+            second='>=1.0,<2',
+        )
+
+        # Verify that the version indexes are cached
+        obj = PluginZipFile('')
+        with self.assertNumQueries(1):
+            obj.validate_requirements()
+
+        mock_json_loads.return_value = {
+            'custom': [
+                {'basename': 'invalid'},
+                'invalid',
+                {'basename': packages[1].basename, 'version': '2.0.0'},
+                {'version': '1.0.0'},
+                {'basename': packages[3].basename, 'version': '>=2'},
+                {'basename': packages[4].basename, 'version': 'latest'},
+                {'basename': packages[2].basename, 'version': '1.0.0'},
+            ],
+        }
+        obj = PluginZipFile('')
+        with self.assertNumQueries(1):
+            with self.assertRaises(ValidationError) as context:
+                obj.validate_requirements()
+
+        self.assertDictEqual(
+            d1=context.exception.message_dict,
+            d2={
+                'zip_file': [
+                    'Invalid object found in "custom" listing in '
+                    'requirements json file.',
+                    'No basename found for object in "custom" listing in '
+                    'requirements json file.',
+                    'Custom Package "invalid" from requirements json file '
+                    'not found.',
+                    f'Custom Package "{packages[1].basename}" version '
+                    f'"2.0.0", from requirements json file, not found.',
+                    f'Custom Package "{packages[3].basename}" version '
+                    f'">=2", from requirements json file, not found.',
+                    f'Custom Package "{packages[4].basename}" version '
+                    f'"latest", from requirements json file, is not a valid '
+                    f'version specifier.',
+                ],
+            },
+        )
+
+
 class HelperFunctionsTestCase(TestCase):
     def test_handle_plugin_zip_upload(self):
         obj = PluginReleaseFactory()
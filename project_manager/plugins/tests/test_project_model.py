@@ -191,11 +191,17 @@ class PluginTestCase(TestCase):
                 version=version,
                 created=created + timedelta(minutes=offset),
             )
+            plugin.refresh_from_db()
             self.assertEqual(
                 first=plugin.current_version,
                 second=release.version,
             )
 
+        # Verify that deleting the current release restores the previous one
+        release.delete()
+        plugin.refresh_from_db()
+        self.assertEqual(first=plugin.current_version, second='1.1.0')
+
     def test_total_downloads(self):
         plugin = PluginFactory()
         total_downloads = 0
@@ -207,6 +213,7 @@ class PluginTestCase(TestCase):
                 download_count=download_count,
             )
 
+        plugin.refresh_from_db()
         self.assertEqual(
             first=plugin.total_downloads,
             second=total_downloads,
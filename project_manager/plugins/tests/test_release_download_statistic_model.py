@@ -0,0 +1,69 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.db import models
+from django.test import TestCase
+
+# App
+from project_manager.models.abstract import ProjectReleaseDownloadStatistic
+from project_manager.plugins.models import (
+    PluginRelease,
+    PluginReleaseDownloadStatistic,
+)
+from test_utils.factories.plugins import PluginReleaseDownloadStatisticFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PluginReleaseDownloadStatisticTestCase(TestCase):
+    def test_model_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(
+                PluginReleaseDownloadStatistic,
+                ProjectReleaseDownloadStatistic,
+            )
+        )
+
+    def test_release_field(self):
+        field = PluginReleaseDownloadStatistic._meta.get_field('release')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.ForeignKey,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=PluginRelease,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.CASCADE,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='download_statistics',
+        )
+        self.assertFalse(expr=field.blank)
+        self.assertFalse(expr=field.null)
+
+    def test__str__(self):
+        obj = PluginReleaseDownloadStatisticFactory()
+        self.assertEqual(
+            first=str(obj),
+            second=f'{obj.release} - day - {obj.date}',
+        )
+
+    def test_meta_class(self):
+        self.assertTupleEqual(
+            tuple1=PluginReleaseDownloadStatistic._meta.unique_together,
+            tuple2=(('release', 'period', 'date'),),
+        )
+        self.assertEqual(
+            first=PluginReleaseDownloadStatistic._meta.verbose_name,
+            second='Plugin Release Download Statistic',
+        )
+        self.assertEqual(
+            first=PluginReleaseDownloadStatistic._meta.verbose_name_plural,
+            second='Plugin Release Download Statistics',
+        )
@@ -0,0 +1,110 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.db import models
+from django.test import TestCase
+
+# App
+from project_manager.models.abstract import ProjectReleaseJob
+from project_manager.plugins.models import (
+    Plugin,
+    PluginRelease,
+    PluginReleaseJob,
+)
+from test_utils.factories.plugins import PluginReleaseJobFactory
+from users.models import ForumUser
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class PluginReleaseJobTestCase(TestCase):
+    def test_model_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(PluginReleaseJob, ProjectReleaseJob),
+        )
+
+    def test_plugin_field(self):
+        field = PluginReleaseJob._meta.get_field('plugin')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.ForeignKey,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=Plugin,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.CASCADE,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='release_jobs',
+        )
+
+    def test_created_by_field(self):
+        field = PluginReleaseJob._meta.get_field('created_by')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.ForeignKey,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=ForumUser,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.SET_NULL,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='plugin_release_jobs',
+        )
+        self.assertTrue(expr=field.null)
+
+    def test_release_field(self):
+        field = PluginReleaseJob._meta.get_field('release')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.OneToOneField,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=PluginRelease,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.SET_NULL,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='job',
+        )
+        self.assertTrue(expr=field.blank)
+        self.assertTrue(expr=field.null)
+
+    def test_project_property(self):
+        obj = PluginReleaseJobFactory()
+        self.assertEqual(
+            first=obj.project,
+            second=obj.plugin,
+        )
+
+    def test__str__(self):
+        obj = PluginReleaseJobFactory()
+        self.assertEqual(
+            first=str(obj),
+            second=f'{obj.plugin} - {obj.version} (pending)',
+        )
+
+    def test_meta_class(self):
+        self.assertEqual(
+            first=PluginReleaseJob._meta.verbose_name,
+            second='Plugin Release Job',
+        )
+        self.assertEqual(
+            first=PluginReleaseJob._meta.verbose_name_plural,
+            second='Plugin Release Jobs',
+        )
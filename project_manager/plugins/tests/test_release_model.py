@@ -173,7 +173,7 @@ class PluginReleaseTestCase(TestCase):
         )
         self.assertSetEqual(
             set1=PluginRelease.field_tracker.fields,
-            set2={'version'},
+            set2={'version', 'zip_file'},
         )
 
     def test_primary_attributes(self):
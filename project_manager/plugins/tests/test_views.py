@@ -8,15 +8,17 @@ from unittest import mock
 from django.conf import settings
 from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils.http import http_date
 from django.views.generic import TemplateView
 
 # Third Party Django
 from rest_framework import status
 
 # App
+from project_manager.downloads.counters import download_counter
 from project_manager.mixins import DownloadMixin
 from project_manager.plugins.constants import PLUGIN_RELEASE_URL
-from project_manager.plugins.models import Plugin, PluginRelease
+from project_manager.plugins.models import PluginRelease
 from project_manager.plugins.views import (
     PluginReleaseDownloadView,
     PluginCreateView,
@@ -28,7 +30,10 @@ from test_utils.factories.plugins import PluginFactory, PluginReleaseFactory
 # =============================================================================
 # TEST CASES
 # =============================================================================
-@override_settings(MEDIA_ROOT=settings.BASE_DIR / 'fixtures')
+@override_settings(
+    MEDIA_ROOT=settings.BASE_DIR / 'fixtures',
+    DOWNLOAD_COUNT_FLUSH_THRESHOLD=1,
+)
 class PluginReleaseDownloadViewTestCase(TestCase):
 
     basename = plugin = zip_file = None
@@ -44,7 +49,7 @@ class PluginReleaseDownloadViewTestCase(TestCase):
         cls.release = PluginReleaseFactory(
             plugin=cls.plugin,
             version=version,
-            zip_file=cls.zip_file,
+            zip_file=f'{PLUGIN_RELEASE_URL}{cls.plugin.slug}/{cls.zip_file}',
         )
         cls.api_path = reverse(
             viewname='plugin-download',
@@ -73,14 +78,6 @@ class PluginReleaseDownloadViewTestCase(TestCase):
             first=PluginReleaseDownloadView.model,
             second=PluginRelease,
         )
-        self.assertEqual(
-            first=PluginReleaseDownloadView.project_model,
-            second=Plugin,
-        )
-        self.assertEqual(
-            first=PluginReleaseDownloadView.model_kwarg,
-            second='plugin',
-        )
         self.assertEqual(
             first=PluginReleaseDownloadView.base_url,
             second=PLUGIN_RELEASE_URL,
@@ -108,17 +105,247 @@ class PluginReleaseDownloadViewTestCase(TestCase):
             first=response.status_code,
             second=status.HTTP_200_OK,
         )
+        content = b''.join(response.streaming_content)
+        self.assertEqual(
+            first=response['Content-Type'],
+            second='application/zip',
+        )
+        self.assertEqual(
+            first=response['Content-Disposition'],
+            second=f'attachment; filename="{self.zip_file}"',
+        )
+        self.assertEqual(
+            first=int(response['Content-Length']),
+            second=len(content),
+        )
         self.assertIn(
             member=(
                 f'addons/source-python/plugins/{self.basename}/{self.basename}.py'
             ),
-            container=str(response.content),
+            container=str(content),
         )
         self.assertIn(
             member=(
                 f'addons/source-python/plugins/{self.basename}/__init__.py'
             ),
-            container=str(response.content),
+            container=str(content),
+        )
+        self.assertEqual(
+            first=PluginRelease.objects.get(pk=self.release.pk).download_count,
+            second=1,
+        )
+
+    def _get_download_count(self):
+        return PluginRelease.objects.get(pk=self.release.pk).download_count
+
+    @override_settings(DOWNLOAD_COUNT_FLUSH_THRESHOLD=100)
+    def test_get_cached_release(self):
+        self.client.get(path=self.api_path)
+        with self.assertNumQueries(0):
+            response = self.client.get(path=self.api_path)
+        self.assertEqual(
+            first=response['ETag'],
+            second=f'"{self.release.file_hash}"',
+        )
+        download_counter.flush()
+
+    @override_settings(DOWNLOAD_COUNT_FLUSH_THRESHOLD=2)
+    def test_get_buffered_count(self):
+        self.client.get(path=self.api_path)
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=0,
+        )
+        self.client.get(path=self.api_path)
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=2,
+        )
+
+    def test_get_validators(self):
+        response = self.client.get(path=self.api_path)
+        release = PluginRelease.objects.get(pk=self.release.pk)
+        self.assertEqual(
+            first=len(release.file_hash),
+            second=64,
+        )
+        self.assertEqual(
+            first=response['ETag'],
+            second=f'"{release.file_hash}"',
+        )
+        self.assertEqual(
+            first=response['Last-Modified'],
+            second=http_date(release.created.timestamp()),
+        )
+        self.assertEqual(
+            first=response['Accept-Ranges'],
+            second='bytes',
+        )
+
+    def test_get_if_none_match(self):
+        release = PluginRelease.objects.get(pk=self.release.pk)
+        response = self.client.get(
+            path=self.api_path,
+            HTTP_IF_NONE_MATCH=f'"{release.file_hash}"',
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_304_NOT_MODIFIED,
+        )
+        self.assertEqual(
+            first=response['ETag'],
+            second=f'"{release.file_hash}"',
+        )
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=0,
+        )
+
+    def test_get_if_modified_since(self):
+        release = PluginRelease.objects.get(pk=self.release.pk)
+        response = self.client.get(
+            path=self.api_path,
+            HTTP_IF_MODIFIED_SINCE=http_date(release.created.timestamp()),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_304_NOT_MODIFIED,
+        )
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=0,
+        )
+
+    def test_get_range(self):
+        with (settings.BASE_DIR / 'fixtures' / self.release.zip_file.name).open(
+            'rb'
+        ) as open_file:
+            contents = open_file.read()
+
+        response = self.client.get(
+            path=self.api_path,
+            HTTP_RANGE='bytes=0-9',
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_206_PARTIAL_CONTENT,
+        )
+        self.assertEqual(
+            first=response['Content-Range'],
+            second=f'bytes 0-9/{len(contents)}',
+        )
+        self.assertEqual(
+            first=b''.join(response.streaming_content),
+            second=contents[:10],
+        )
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=1,
+        )
+
+        # Resuming the download should not count again
+        response = self.client.get(
+            path=self.api_path,
+            HTTP_RANGE='bytes=10-',
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_206_PARTIAL_CONTENT,
+        )
+        self.assertEqual(
+            first=b''.join(response.streaming_content),
+            second=contents[10:],
+        )
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=1,
+        )
+
+    def test_get_multiple_ranges(self):
+        response = self.client.get(
+            path=self.api_path,
+            HTTP_RANGE='bytes=0-4,-5',
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_206_PARTIAL_CONTENT,
+        )
+        self.assertTrue(
+            expr=response['Content-Type'].startswith(
+                'multipart/byteranges; boundary='
+            ),
+        )
+        self.assertEqual(
+            first=int(response['Content-Length']),
+            second=len(b''.join(response.streaming_content)),
+        )
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=1,
+        )
+
+    def test_get_range_not_satisfiable(self):
+        response = self.client.get(
+            path=self.api_path,
+            HTTP_RANGE='bytes=100000000-',
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+        )
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=0,
+        )
+
+    def test_get_if_range_mismatch(self):
+        response = self.client.get(
+            path=self.api_path,
+            HTTP_RANGE='bytes=10-',
+            HTTP_IF_RANGE='"outdated"',
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=1,
+        )
+
+    def test_head(self):
+        response = self.client.head(path=self.api_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            first=self._get_download_count(),
+            second=0,
+        )
+
+    @override_settings(
+        DOWNLOAD_BACKEND=(
+            'project_manager.downloads.backends.XAccelRedirectDownloadBackend'
+        ),
+        DOWNLOAD_OFFLOAD_PREFIX='/internal/',
+    )
+    def test_get_offloaded(self):
+        response = self.client.get(path=self.api_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            first=response.content,
+            second=b'',
+        )
+        self.assertEqual(
+            first=response['X-Accel-Redirect'],
+            second=(
+                f'/internal/{PLUGIN_RELEASE_URL}{self.plugin.slug}/'
+                f'{self.zip_file}'
+            ),
         )
         self.assertEqual(
             first=PluginRelease.objects.get(pk=self.release.pk).download_count,
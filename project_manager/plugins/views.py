@@ -29,8 +29,6 @@ class PluginReleaseDownloadView(DownloadMixin):
     """Plugin download view for releases."""
 
     model = PluginRelease
-    project_model = Plugin
-    model_kwarg = 'plugin'
     base_url = PLUGIN_RELEASE_URL
 
 
@@ -0,0 +1 @@
+"""Asynchronous release creation app."""
@@ -0,0 +1,39 @@
+"""Constants for use with release jobs."""
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'RELEASE_JOB_FAILED',
+    'RELEASE_JOB_PENDING',
+    'RELEASE_JOB_PROGRESS_COMPLETE',
+    'RELEASE_JOB_PROGRESS_STARTED',
+    'RELEASE_JOB_PROGRESS_VALIDATED',
+    'RELEASE_JOB_RUNNING',
+    'RELEASE_JOB_STATUSES',
+    'RELEASE_JOB_SUCCEEDED',
+    'RELEASE_JOB_URL',
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+RELEASE_JOB_PENDING = 'pending'
+RELEASE_JOB_RUNNING = 'running'
+RELEASE_JOB_SUCCEEDED = 'succeeded'
+RELEASE_JOB_FAILED = 'failed'
+RELEASE_JOB_STATUSES = (
+    (RELEASE_JOB_PENDING, 'Pending'),
+    (RELEASE_JOB_RUNNING, 'Running'),
+    (RELEASE_JOB_SUCCEEDED, 'Succeeded'),
+    (RELEASE_JOB_FAILED, 'Failed'),
+)
+
+# Percentage of the job completed after each step
+RELEASE_JOB_PROGRESS_STARTED = 10
+RELEASE_JOB_PROGRESS_VALIDATED = 60
+RELEASE_JOB_PROGRESS_COMPLETE = 100
+
+# Uploads waiting to be validated are stored here, outside of the releases
+RELEASE_JOB_URL = 'release-jobs/'
@@ -0,0 +1,190 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import mock
+
+# Django
+from django.conf import settings
+from django.core.files import File
+from django.test import TestCase, override_settings
+from django.utils.timezone import now
+
+# Third Party Python
+from path import Path
+
+# App
+from project_manager.plugins.api.serializers import PluginReleaseSerializer
+from project_manager.plugins.models import PluginReleaseJob
+from project_manager.release_jobs import workers
+from project_manager.release_jobs.constants import (
+    RELEASE_JOB_FAILED,
+    RELEASE_JOB_PENDING,
+    RELEASE_JOB_RUNNING,
+    RELEASE_JOB_SUCCEEDED,
+)
+from project_manager.release_jobs.workers import (
+    get_executor,
+    requeue_stale_release_jobs,
+    run_release_job,
+    submit_release_job,
+)
+from test_utils.factories.plugins import PluginFactory, PluginReleaseJobFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class ReleaseJobWorkersTestCase(TestCase):
+
+    MEDIA_ROOT = Path(tempfile.mkdtemp())
+    plugin = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.plugin = PluginFactory(basename='test_plugin')
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def _create_job(self, file_name, **kwargs):
+        base_path = settings.BASE_DIR / 'fixtures' / 'releases' / 'plugins'
+        job = PluginReleaseJobFactory(plugin=self.plugin, **kwargs)
+        with (base_path / 'test-plugin' / file_name).open('rb') as open_file:
+            job.zip_file.save(name=file_name, content=File(open_file))
+        return job
+
+    def _run(self, job):
+        run_release_job(
+            model=PluginReleaseJob,
+            pk=job.pk,
+            serializer_class=PluginReleaseSerializer,
+        )
+        job.refresh_from_db()
+
+    def test_get_executor(self):
+        executor = get_executor()
+        self.assertIsInstance(obj=executor, cls=ThreadPoolExecutor)
+        self.assertIs(expr1=get_executor(), expr2=executor)
+
+    @mock.patch(target='project_manager.release_jobs.workers.get_executor')
+    def test_submit_release_job(self, mock_get_executor):
+        job = PluginReleaseJobFactory()
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            submit_release_job(
+                job=job,
+                serializer_class=PluginReleaseSerializer,
+            )
+
+        mock_get_executor.assert_not_called()
+        self.assertEqual(first=len(callbacks), second=1)
+        callbacks[0]()
+        mock_get_executor.return_value.submit.assert_called_once_with(
+            workers._run_release_job_in_worker,  # pylint: disable=protected-access
+            PluginReleaseJob,
+            job.pk,
+            PluginReleaseSerializer,
+        )
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT)
+    def test_run_release_job(self):
+        job = self._create_job(file_name='test-plugin-v1.0.0.zip')
+        zip_path = Path(job.zip_file.path)
+        self._run(job=job)
+        self.assertEqual(first=job.status, second=RELEASE_JOB_SUCCEEDED)
+        self.assertEqual(first=job.progress, second=100)
+        self.assertDictEqual(d1=job.errors, d2={})
+        self.assertFalse(expr=job.zip_file)
+        self.assertFalse(expr=zip_path.isfile())
+        self.assertEqual(first=job.release.version, second=job.version)
+        self.assertEqual(first=job.release.plugin, second=self.plugin)
+        self.assertEqual(first=job.release.created_by, second=job.created_by)
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT)
+    def test_run_release_job_invalid(self):
+        job = self._create_job(file_name='test-plugin-invalid-v1.0.0.zip')
+        self._run(job=job)
+        self.assertEqual(first=job.status, second=RELEASE_JOB_FAILED)
+        self.assertIn(member='zip_file', container=job.errors)
+        self.assertIsNone(obj=job.release)
+        self.assertFalse(expr=job.zip_file)
+        self.assertFalse(expr=self.plugin.releases.exists())
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT)
+    @mock.patch(
+        target='project_manager.plugins.api.serializers.PluginReleaseSerializer.save',
+        side_effect=OSError,
+    )
+    def test_run_release_job_exception(self, _):
+        job = self._create_job(file_name='test-plugin-v1.0.0.zip')
+        with self.assertLogs(logger=workers.logger, level='ERROR'):
+            self._run(job=job)
+
+        self.assertEqual(first=job.status, second=RELEASE_JOB_FAILED)
+        self.assertDictEqual(
+            d1=job.errors,
+            d2={'detail': ['Unable to process the release.']},
+        )
+        self.assertFalse(expr=job.zip_file)
+
+    def test_run_release_job_already_claimed(self):
+        job = PluginReleaseJobFactory(status=RELEASE_JOB_RUNNING)
+        with mock.patch(
+            target='project_manager.release_jobs.workers._create_release',
+        ) as mock_create_release:
+            self._run(job=job)
+
+        mock_create_release.assert_not_called()
+        self.assertEqual(first=job.status, second=RELEASE_JOB_RUNNING)
+
+    @override_settings(RELEASE_JOB_STALE_TIMEOUT=60)
+    def test_run_release_job_claim_updated(self):
+        job = PluginReleaseJobFactory()
+        PluginReleaseJob.objects.filter(pk=job.pk).update(
+            updated=now() - timedelta(minutes=5),
+        )
+
+        # Verify that a job queued longer than the timeout is not requeued
+        #   while it runs
+        requeued = []
+        with mock.patch(
+            target='project_manager.release_jobs.workers._create_release',
+            side_effect=lambda **kwargs: requeued.append(
+                requeue_stale_release_jobs(model=PluginReleaseJob),
+            ),
+        ):
+            self._run(job=job)
+
+        self.assertListEqual(list1=requeued, list2=[0])
+        self.assertEqual(first=job.status, second=RELEASE_JOB_RUNNING)
+
+    @override_settings(RELEASE_JOB_STALE_TIMEOUT=60)
+    def test_requeue_stale_release_jobs(self):
+        stale_job = PluginReleaseJobFactory(
+            status=RELEASE_JOB_RUNNING,
+            progress=60,
+        )
+        running_job = PluginReleaseJobFactory(status=RELEASE_JOB_RUNNING)
+        failed_job = PluginReleaseJobFactory(status=RELEASE_JOB_FAILED)
+        PluginReleaseJob.objects.filter(
+            pk__in=[stale_job.pk, failed_job.pk],
+        ).update(updated=now() - timedelta(minutes=5))
+
+        self.assertEqual(
+            first=requeue_stale_release_jobs(model=PluginReleaseJob),
+            second=1,
+        )
+        for job, status in (
+            (stale_job, RELEASE_JOB_PENDING),
+            (running_job, RELEASE_JOB_RUNNING),
+            (failed_job, RELEASE_JOB_FAILED),
+        ):
+            job.refresh_from_db()
+            self.assertEqual(first=job.status, second=status)
+        self.assertEqual(first=stale_job.progress, second=0)
@@ -0,0 +1,187 @@
+"""Background processing of release jobs."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Lock
+
+# Django
+from django.conf import settings
+from django.core.files import File
+from django.db import connection, transaction
+from django.utils.timezone import now
+
+# App
+from project_manager.release_jobs.constants import (
+    RELEASE_JOB_FAILED,
+    RELEASE_JOB_PENDING,
+    RELEASE_JOB_PROGRESS_COMPLETE,
+    RELEASE_JOB_PROGRESS_STARTED,
+    RELEASE_JOB_PROGRESS_VALIDATED,
+    RELEASE_JOB_RUNNING,
+    RELEASE_JOB_SUCCEEDED,
+)
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'get_executor',
+    'requeue_stale_release_jobs',
+    'run_release_job',
+    'submit_release_job',
+)
+
+
+# =============================================================================
+# GLOBAL VARIABLES
+# =============================================================================
+logger = logging.getLogger(__name__)
+_executor = None
+_executor_lock = Lock()
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def get_executor():
+    """Return the process's worker pool, creating it on first use."""
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.RELEASE_JOB_WORKERS,
+                thread_name_prefix='release-job',
+            )
+        return _executor
+
+
+def submit_release_job(job, serializer_class):
+    """Queue the job to run once the current transaction is committed."""
+    transaction.on_commit(
+        lambda: get_executor().submit(
+            _run_release_job_in_worker,
+            job.__class__,
+            job.pk,
+            serializer_class,
+        )
+    )
+
+
+def requeue_stale_release_jobs(model):
+    """Move the running jobs that are no longer being updated to pending.
+
+    A job is left running when its process stops while running it, so the
+        jobs not updated within RELEASE_JOB_STALE_TIMEOUT are requeued. The
+        requeue is conditional on the job's status, so a job that finishes
+        meanwhile is left alone.
+    """
+    cutoff = now() - timedelta(seconds=settings.RELEASE_JOB_STALE_TIMEOUT)
+    return model.objects.filter(
+        status=RELEASE_JOB_RUNNING,
+        updated__lt=cutoff,
+    ).update(
+        status=RELEASE_JOB_PENDING,
+        progress=0,
+        updated=now(),
+    )
+
+
+def _run_release_job_in_worker(model, pk, serializer_class):
+    """Run the job and close the worker thread's database connection."""
+    try:
+        run_release_job(
+            model=model,
+            pk=pk,
+            serializer_class=serializer_class,
+        )
+    finally:
+        connection.close()
+
+
+def run_release_job(model, pk, serializer_class):
+    """Validate the job's upload and create its release.
+
+    The job is claimed by moving it out of pending, so a job is only ever
+        run once even when the management command runs alongside the pool.
+        The claim also sets updated, so a job that waited in pending longer
+        than the stale timeout is not requeued as soon as it is claimed.
+    """
+    claimed = model.objects.filter(
+        pk=pk,
+        status=RELEASE_JOB_PENDING,
+    ).update(
+        status=RELEASE_JOB_RUNNING,
+        progress=RELEASE_JOB_PROGRESS_STARTED,
+        updated=now(),
+    )
+    if not claimed:
+        return
+
+    job = model.objects.select_related('created_by').get(pk=pk)
+    try:
+        release = _create_release(
+            job=job,
+            serializer_class=serializer_class,
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.exception('Release job "%s" failed.', pk)
+        _finish_release_job(
+            job=job,
+            status=RELEASE_JOB_FAILED,
+            errors={'detail': ['Unable to process the release.']},
+        )
+        return
+
+    if release is None:
+        return
+
+    _finish_release_job(
+        job=job,
+        status=RELEASE_JOB_SUCCEEDED,
+        release=release,
+        progress=RELEASE_JOB_PROGRESS_COMPLETE,
+    )
+
+
+def _create_release(job, serializer_class):
+    """Return the release created from the job, or None if it is invalid."""
+    with job.zip_file.open('rb') as zip_file:
+        serializer = serializer_class(
+            data={
+                'notes': job.notes,
+                'version': job.version,
+                'zip_file': File(
+                    file=zip_file,
+                    name=job.zip_file.name.rsplit('/', 1)[-1],
+                ),
+            },
+            context={'job': job},
+        )
+        if not serializer.is_valid():
+            _finish_release_job(
+                job=job,
+                status=RELEASE_JOB_FAILED,
+                errors=serializer.errors,
+            )
+            return None
+
+        job.progress = RELEASE_JOB_PROGRESS_VALIDATED
+        job.save(update_fields=['progress', 'updated'])
+        return serializer.save()
+
+
+def _finish_release_job(job, status, **fields):
+    """Store the job's outcome and remove its uploaded zip file."""
+    job.zip_file.delete(save=False)
+    job.status = status
+    for name, value in fields.items():
+        setattr(job, name, value)
+    job.save(
+        update_fields=['zip_file', 'status', 'updated', *fields],
+    )
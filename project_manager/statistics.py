@@ -0,0 +1,266 @@
+"""Materialized platform statistics for the statistics page."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from datetime import timedelta
+
+# Django
+from django.apps import apps
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    PositiveIntegerField,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
+from django.utils.timezone import localdate, now
+
+# App
+from project_manager.constants import (
+    STATISTICS_PROJECT_TYPES,
+    STATISTICS_SNAPSHOT_PK,
+)
+from project_manager.downloads.constants import (
+    DOWNLOAD_PERIOD_DAY,
+    RECENT_DOWNLOAD_DAYS,
+)
+from project_manager.downloads.statistics import get_statistic_model
+from project_manager.helpers import get_release_project_field
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'add_release_statistics',
+    'add_statistics_downloads',
+    'get_active_user_count',
+    'get_recent_downloads',
+    'get_statistics_snapshot',
+    'recompute_statistics',
+    'remove_release_statistics',
+    'update_statistics_users',
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def get_statistics_snapshot():
+    """Return the statistics snapshot, building it if it does not exist.
+
+    The recent downloads are recounted once a day, as their window moves
+        with the date.
+    """
+    snapshot = _get_snapshot_model().objects.filter(
+        pk=STATISTICS_SNAPSHOT_PK,
+    ).first()
+    if snapshot is None:
+        return recompute_statistics()
+
+    today = localdate()
+    if snapshot.recent_date != today:
+        snapshot.recent_downloads = get_recent_downloads(today=today)
+        snapshot.recent_date = today
+        snapshot.save(
+            update_fields=['recent_downloads', 'recent_date', 'updated'],
+        )
+    return snapshot
+
+
+def recompute_statistics():
+    """Rebuild the statistics snapshot from the release and project tables."""
+    values = {}
+    for model_name, prefix in STATISTICS_PROJECT_TYPES:
+        release_model = _get_release_model(model_name)
+        info = release_model.objects.aggregate(
+            download_count=Coalesce(Sum('download_count'), 0),
+            project_count=Count(
+                get_release_project_field(release_model),
+                distinct=True,
+            ),
+        )
+        values[f'{prefix}_count'] = info['project_count']
+        values[f'{prefix}_downloads'] = info['download_count']
+
+    today = localdate()
+    values.update(
+        users=get_active_user_count(),
+        recent_downloads=get_recent_downloads(today=today),
+        recent_date=today,
+    )
+    snapshot, _ = _get_snapshot_model().objects.update_or_create(
+        pk=STATISTICS_SNAPSHOT_PK,
+        defaults=values,
+    )
+    return snapshot
+
+
+def get_active_user_count():
+    """Return the number of users that own or contribute to a project."""
+    querysets = []
+    for model_name, _ in STATISTICS_PROJECT_TYPES:
+        querysets.extend([
+            apps.get_model(
+                app_label='project_manager',
+                model_name=model_name,
+            ).objects.filter(
+                owner__isnull=False,
+            ).order_by().values_list('owner_id'),
+            apps.get_model(
+                app_label='project_manager',
+                model_name=f'{model_name}Contributor',
+            ).objects.order_by().values_list('user_id'),
+        ])
+    return querysets[0].union(*querysets[1:]).count()
+
+
+def get_recent_downloads(today=None):
+    """Return the number of downloads in the recent days."""
+    start = (today or localdate()) - timedelta(days=RECENT_DOWNLOAD_DAYS - 1)
+    return sum(
+        get_statistic_model(_get_release_model(model_name)).objects.filter(
+            period=DOWNLOAD_PERIOD_DAY,
+            date__gte=start,
+        ).aggregate(
+            download_count=Coalesce(Sum('download_count'), 0),
+        )['download_count']
+        for model_name, _ in STATISTICS_PROJECT_TYPES
+    )
+
+
+def add_release_statistics(instance, created, **kwargs):
+    """Add a newly created release to the snapshot.
+
+    Its project is counted when this is the project's first release.
+    """
+    if not created:
+        return
+
+    prefix, is_only_release = _get_release_info(instance)
+    values = {
+        f'{prefix}_downloads': (
+            F(f'{prefix}_downloads') + instance.download_count
+        ),
+    }
+    if is_only_release:
+        values[f'{prefix}_count'] = F(f'{prefix}_count') + 1
+    _update_snapshot(**values)
+
+
+def remove_release_statistics(instance, **kwargs):
+    """Remove a deleted release from the snapshot.
+
+    The projects with releases are recounted, as post_delete is only sent
+        once every release in a deletion is gone, so each release of a
+        deleted project would otherwise find no releases left.
+    """
+    release_model = instance.__class__
+    prefix = dict(STATISTICS_PROJECT_TYPES)[
+        release_model.project_class.__name__
+    ]
+    _update_snapshot(**{
+        f'{prefix}_downloads': _get_decrement(
+            field_name=f'{prefix}_downloads',
+            amount=instance.download_count,
+        ),
+        f'{prefix}_count': release_model.objects.values(
+            get_release_project_field(release_model),
+        ).distinct().count(),
+    })
+
+
+def add_statistics_downloads(counts):
+    """Add flushed download counts to the snapshot in a single UPDATE.
+
+    The counts are keyed by release model, then by (release_id, date).
+        Recent downloads are only added to a snapshot counted for today,
+        others are recounted when next read.
+    """
+    today = localdate()
+    start = today - timedelta(days=RECENT_DOWNLOAD_DAYS - 1)
+    prefixes = dict(STATISTICS_PROJECT_TYPES)
+    values = {}
+    recent_downloads = 0
+    for release_model, release_counts in counts.items():
+        field_name = (
+            f'{prefixes[release_model.project_class.__name__]}_downloads'
+        )
+        values[field_name] = F(field_name) + sum(release_counts.values())
+        recent_downloads += sum(
+            count for (_, day), count in release_counts.items()
+            if start <= day <= today
+        )
+    if not values:
+        return
+
+    values['recent_downloads'] = Case(
+        When(
+            recent_date=today,
+            then=F('recent_downloads') + recent_downloads,
+        ),
+        default=F('recent_downloads'),
+        output_field=PositiveIntegerField(),
+    )
+    _update_snapshot(**values)
+
+
+def update_statistics_users(**kwargs):
+    """Recount the snapshot's active users.
+
+    This is connected to the signals of the projects, their contributors,
+        and the forum users, as any of them can change who is active.
+    """
+    _update_snapshot(users=get_active_user_count())
+
+
+def _get_snapshot_model():
+    return apps.get_model(
+        app_label='project_manager',
+        model_name='StatisticsSnapshot',
+    )
+
+
+def _get_release_model(model_name):
+    return apps.get_model(
+        app_label='project_manager',
+        model_name=f'{model_name}Release',
+    )
+
+
+def _get_release_info(instance):
+    """Return the release's field prefix and whether it is its project's only."""
+    release_model = instance.__class__
+    project_field = get_release_project_field(release_model)
+    prefix = dict(STATISTICS_PROJECT_TYPES)[
+        release_model.project_class.__name__
+    ]
+    return prefix, not release_model.objects.filter(
+        **{project_field: getattr(instance, f'{project_field}_id')},
+    ).exclude(
+        pk=instance.pk,
+    ).exists()
+
+
+def _get_decrement(field_name, amount):
+    """Return the field less the amount, without going below zero."""
+    return Greatest(
+        F(field_name) - amount,
+        Value(0),
+        output_field=PositiveIntegerField(),
+    )
+
+
+def _update_snapshot(**values):
+    """Update the snapshot row, if it has been built."""
+    _get_snapshot_model().objects.filter(
+        pk=STATISTICS_SNAPSHOT_PK,
+    ).update(
+        updated=now(),
+        **values,
+    )
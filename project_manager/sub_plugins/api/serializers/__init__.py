@@ -15,6 +15,7 @@ from project_manager.api.common.serializers import (
     ProjectCreateReleaseSerializer,
     ProjectGameSerializer,
     ProjectImageSerializer,
+    ProjectReleaseJobSerializer,
     ProjectReleaseSerializer,
     ProjectSerializer,
     ProjectTagSerializer,
@@ -29,6 +30,7 @@ from project_manager.sub_plugins.models import (
     SubPluginImage,
     SubPluginRelease,
     SubPluginReleaseDownloadRequirement,
+    SubPluginReleaseJob,
     SubPluginReleasePackageRequirement,
     SubPluginReleasePyPiRequirement,
     SubPluginReleaseVersionControlRequirement,
@@ -52,6 +54,7 @@ __all__ = (
     'SubPluginImageSerializer',
     'SubPluginReleaseSerializer',
     'SubPluginReleaseDownloadRequirementSerializer',
+    'SubPluginReleaseJobSerializer',
     'SubPluginReleasePackageRequirementSerializer',
     'SubPluginReleasePyPiRequirementSerializer',
     'SubPluginSerializer',
@@ -167,6 +170,17 @@ class SubPluginCreateReleaseSerializer(
         return [zip_file, self.parent_project]
 
 
+class SubPluginReleaseJobSerializer(ProjectReleaseJobSerializer):
+    """Serializer for queueing and retrieving SubPlugin release jobs."""
+
+    release_serializer_class = SubPluginReleaseSerializer
+
+    class Meta(ProjectReleaseJobSerializer.Meta):
+        """Define metaclass attributes."""
+
+        model = SubPluginReleaseJob
+
+
 class SubPluginSerializer(ProjectSerializer):
     """Serializer for updating and listing SubPlugins."""
 
@@ -35,7 +35,10 @@ class SubPluginReleaseBase:
     @cached_property
     def parent_project(self):
         """Return the parent plugin."""
-        kwargs = getattr(self, 'context')['view'].kwargs
+        context = getattr(self, 'context')
+        if 'job' in context:
+            return context['job'].sub_plugin.plugin
+        kwargs = context['view'].kwargs
         plugin_slug = kwargs.get('plugin_slug')
         try:
             plugin = Plugin.objects.get(slug=plugin_slug)
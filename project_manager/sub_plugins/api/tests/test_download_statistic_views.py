@@ -0,0 +1,126 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from datetime import date
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.common.serializers import (
+    ProjectDownloadStatisticQuerySerializer,
+)
+from project_manager.api.common.views import ProjectDownloadStatisticViewSet
+from project_manager.sub_plugins.api.views import (
+    SubPluginDownloadStatisticViewSet,
+)
+from project_manager.sub_plugins.models import (
+    SubPlugin,
+    SubPluginReleaseDownloadStatistic,
+)
+from test_utils.factories.sub_plugins import (
+    SubPluginFactory,
+    SubPluginReleaseDownloadStatisticFactory,
+    SubPluginReleaseFactory,
+)
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class SubPluginDownloadStatisticViewSetTestCase(APITestCase):
+
+    sub_plugin = release = list_path = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sub_plugin = SubPluginFactory()
+        cls.release = SubPluginReleaseFactory(
+            sub_plugin=cls.sub_plugin,
+            version='1.0.0',
+        )
+        SubPluginReleaseDownloadStatisticFactory(
+            release=cls.release,
+            date=date(2023, 2, 1),
+            download_count=3,
+        )
+        SubPluginReleaseDownloadStatisticFactory(
+            date=date(2023, 2, 1),
+            download_count=100,
+        )
+        cls.list_path = reverse(
+            viewname='api:sub-plugins:downloads-list',
+            kwargs={
+                'plugin_slug': cls.sub_plugin.plugin.slug,
+                'sub_plugin_slug': cls.sub_plugin.slug,
+            },
+        )
+
+    def test_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(
+                SubPluginDownloadStatisticViewSet,
+                ProjectDownloadStatisticViewSet,
+            ),
+        )
+
+    def test_base_attributes(self):
+        self.assertEqual(
+            first=SubPluginDownloadStatisticViewSet.serializer_class,
+            second=ProjectDownloadStatisticQuerySerializer,
+        )
+        self.assertEqual(
+            first=SubPluginDownloadStatisticViewSet.project_type,
+            second='sub-plugin',
+        )
+        self.assertEqual(
+            first=SubPluginDownloadStatisticViewSet.project_model,
+            second=SubPlugin,
+        )
+        self.assertIs(
+            expr1=SubPluginDownloadStatisticViewSet.queryset.model,
+            expr2=SubPluginReleaseDownloadStatistic,
+        )
+
+    def test_get_list(self):
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_200_OK,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={
+                'period': 'day',
+                'downloads': [
+                    {'date': '2023-02-01', 'download_count': 3},
+                ],
+                'releases': {
+                    '1.0.0': [
+                        {'date': '2023-02-01', 'download_count': 3},
+                    ],
+                },
+            },
+        )
+
+    def test_get_list_failure(self):
+        response = self.client.get(
+            path=reverse(
+                viewname='api:sub-plugins:downloads-list',
+                kwargs={
+                    'plugin_slug': self.sub_plugin.plugin.slug,
+                    'sub_plugin_slug': 'invalid',
+                },
+            ),
+        )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_404_NOT_FOUND,
+        )
+        self.assertDictEqual(
+            d1=response.json(),
+            d2={'detail': 'Invalid sub_plugin_slug.'},
+        )
@@ -9,6 +9,7 @@ from datetime import timedelta
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from django.db import connection
 from django.test import override_settings
@@ -226,6 +227,10 @@ class SubPluginViewSetTestCase(APITestCase):
         shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
         super().tearDownClass()
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_inheritance(self):
         self.assertTrue(expr=issubclass(SubPluginViewSet, ProjectViewSet))
 
@@ -249,11 +254,8 @@ class SubPluginViewSetTestCase(APITestCase):
         )
         self.assertEqual(first=len(prefetch_lookups), second=1)
         lookup = prefetch_lookups[0]
-        self.assertEqual(first=lookup.prefetch_to, second='releases')
-        self.assertEqual(
-            first=lookup.queryset.query.order_by,
-            second=('-created',),
-        )
+        self.assertEqual(first=lookup.prefetch_through, second='releases')
+        self.assertEqual(first=lookup.prefetch_to, second='current_releases')
 
         self.assertDictEqual(
             d1=SubPluginViewSet.queryset.query.select_related,
@@ -308,7 +310,16 @@ class SubPluginViewSetTestCase(APITestCase):
             obj.get_queryset(),
             '_prefetch_related_lookups'
         )
-        self.assertEqual(first=len(prefetch_lookups), second=1)
+        self.assertEqual(first=len(prefetch_lookups), second=5)
+        self.assertListEqual(
+            list1=[lookup.prefetch_to for lookup in prefetch_lookups[1:]],
+            list2=[
+                'current_releases__subpluginreleasepackagerequirement_set',
+                'current_releases__subpluginreleasedownloadrequirement_set',
+                'current_releases__subpluginreleasepypirequirement_set',
+                'current_releases__subpluginreleaseversioncontrolrequirement_set',
+            ],
+        )
 
         setattr(obj, 'action', 'list')
         prefetch_lookups = getattr(
@@ -381,10 +392,10 @@ class SubPluginViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that contributors can see results AND 'id'
+        # Verify that contributors can see results AND 'id', served from the cache
         self.client.force_login(self.contributor_1.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=7)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -400,10 +411,10 @@ class SubPluginViewSetTestCase(APITestCase):
             d2=payload_1,
         )
 
-        # Verify that the owner can see results AND 'id'
+        # Verify that the owner can see results AND 'id', served from the cache
         self.client.force_login(self.owner.user)
         response = self.client.get(path=self.list_path)
-        self.assertEqual(first=len(connection.queries), second=7)
+        self.assertEqual(first=len(connection.queries), second=2)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -601,10 +612,10 @@ class SubPluginViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that contributors can see details
+            # Verify that contributors can see details, served from the cache
             self.client.force_login(self.contributor_1.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=9)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -614,10 +625,10 @@ class SubPluginViewSetTestCase(APITestCase):
                 d2=payload,
             )
 
-            # Verify that the owner can see details
+            # Verify that the owner can see details, served from the cache
             self.client.force_login(self.owner.user)
             response = self.client.get(path=path)
-            self.assertEqual(first=len(connection.queries), second=9)
+            self.assertEqual(first=len(connection.queries), second=2)
             self.assertEqual(
                 first=response.status_code,
                 second=status.HTTP_200_OK,
@@ -0,0 +1,167 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import shutil
+import tempfile
+from unittest import mock
+
+# Django
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.test import override_settings
+
+# Third Party Python
+from path import Path
+
+# Third Party Django
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+# App
+from project_manager.api.common.views import ProjectReleaseJobViewSet
+from project_manager.release_jobs.constants import RELEASE_JOB_SUCCEEDED
+from project_manager.release_jobs.workers import run_release_job
+from project_manager.sub_plugins.api.serializers import (
+    SubPluginReleaseJobSerializer,
+    SubPluginReleaseSerializer,
+)
+from project_manager.sub_plugins.api.views import SubPluginReleaseJobViewSet
+from project_manager.sub_plugins.models import SubPlugin, SubPluginReleaseJob
+from test_utils.factories.plugins import PluginFactory, SubPluginPathFactory
+from test_utils.factories.sub_plugins import SubPluginFactory
+from test_utils.factories.users import ForumUserFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class SubPluginReleaseJobViewSetTestCase(APITestCase):
+
+    owner = plugin = regular_user = sub_plugin = None
+    list_path = release_path = None
+    MEDIA_ROOT = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = ForumUserFactory()
+        cls.regular_user = ForumUserFactory()
+        cls.plugin = PluginFactory(
+            basename='test_plugin',
+        )
+        SubPluginPathFactory(
+            plugin=cls.plugin,
+            path='sub_plugins',
+            allow_package_using_basename=True,
+        )
+        cls.sub_plugin = SubPluginFactory(
+            basename='test_sub_plugin',
+            owner=cls.owner,
+            plugin=cls.plugin,
+        )
+        kwargs = {
+            'plugin_slug': cls.plugin.slug,
+            'sub_plugin_slug': cls.sub_plugin.slug,
+        }
+        cls.list_path = reverse(
+            viewname='api:sub-plugins:release-jobs-list',
+            kwargs=kwargs,
+        )
+        cls.release_path = reverse(
+            viewname='api:sub-plugins:releases-list',
+            kwargs=kwargs,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def test_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(
+                SubPluginReleaseJobViewSet,
+                ProjectReleaseJobViewSet,
+            ),
+        )
+
+    def test_base_attributes(self):
+        self.assertEqual(
+            first=SubPluginReleaseJobViewSet.serializer_class,
+            second=SubPluginReleaseJobSerializer,
+        )
+        self.assertEqual(
+            first=SubPluginReleaseJobViewSet.project_type,
+            second='sub-plugin',
+        )
+        self.assertEqual(
+            first=SubPluginReleaseJobViewSet.project_model,
+            second=SubPlugin,
+        )
+        self.assertIs(
+            expr1=SubPluginReleaseJobViewSet.queryset.model,
+            expr2=SubPluginReleaseJob,
+        )
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT, RELEASE_JOBS_ENABLED=True)
+    @mock.patch(target='project_manager.api.common.views.submit_release_job')
+    def test_post_release(self, mock_submit_release_job):
+        base_path = settings.BASE_DIR / 'fixtures' / 'releases' / 'sub-plugins'
+        file_path = (
+            base_path / 'test-plugin' / 'test-sub-plugin' /
+            'test-sub-plugin-v1.0.0.zip'
+        )
+        self.client.force_login(self.owner.user)
+        with file_path.open('rb') as open_file:
+            response = self.client.post(
+                path=self.release_path,
+                data={
+                    'version': '1.0.0',
+                    'zip_file': UploadedFile(
+                        open_file,
+                        content_type='application/zip',
+                    ),
+                },
+            )
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_202_ACCEPTED,
+        )
+        job = SubPluginReleaseJob.objects.get(pk=response.json()['id'])
+        mock_submit_release_job.assert_called_once_with(
+            job=job,
+            serializer_class=SubPluginReleaseSerializer,
+        )
+
+        # Verify that the job validates against the parent plugin
+        run_release_job(
+            model=SubPluginReleaseJob,
+            pk=job.pk,
+            serializer_class=SubPluginReleaseSerializer,
+        )
+        job.refresh_from_db()
+        self.assertEqual(first=job.status, second=RELEASE_JOB_SUCCEEDED)
+        self.assertEqual(first=job.release.sub_plugin, second=self.sub_plugin)
+
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.json()['results'][0]['release'],
+            second='1.0.0',
+        )
+
+        # Verify that regular users cannot view the jobs
+        self.client.force_login(self.regular_user.user)
+        response = self.client.get(path=self.list_path)
+        self.assertEqual(
+            first=response.status_code,
+            second=status.HTTP_403_FORBIDDEN,
+        )
+
+    def test_options(self):
+        response = self.client.options(path=self.list_path)
+        self.assertEqual(first=response.status_code, second=status.HTTP_200_OK)
+        self.assertEqual(
+            first=response.json()['name'],
+            second=f'{self.sub_plugin} - Release Job',
+        )
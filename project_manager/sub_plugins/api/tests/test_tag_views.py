@@ -58,9 +58,11 @@ class SubPluginTagViewSetTestCase(APITestCase):
         )
         cls.sub_plugin_tag_1 = SubPluginTagFactory(
             sub_plugin=cls.sub_plugin_1,
+            tag=TagFactory(name='first_tag'),
         )
         cls.sub_plugin_tag_2 = SubPluginTagFactory(
             sub_plugin=cls.sub_plugin_1,
+            tag=TagFactory(name='second_tag'),
         )
         cls.regular_user = ForumUserFactory()
         cls.detail_api = 'api:sub-plugins:tags-detail'
@@ -59,9 +59,11 @@ class SubPluginAPIViewTestCase(APITestCase):
                     )
                 ) for key in (
                     'contributors',
+                    'downloads',
                     'games',
                     'images',
                     'projects',
+                    'release-jobs',
                     'releases',
                     'tags',
                 )
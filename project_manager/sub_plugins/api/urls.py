@@ -13,8 +13,10 @@ from rest_framework import routers
 from project_manager.sub_plugins.api.views import (
     SubPluginAPIView,
     SubPluginContributorViewSet,
+    SubPluginDownloadStatisticViewSet,
     SubPluginGameViewSet,
     SubPluginImageViewSet,
+    SubPluginReleaseJobViewSet,
     SubPluginReleaseViewSet,
     SubPluginTagViewSet,
     SubPluginViewSet,
@@ -40,6 +42,11 @@ router.register(
     viewset=SubPluginReleaseViewSet,
     basename='releases',
 )
+router.register(
+    prefix='releases/(?P<plugin_slug>[^/.]+)/(?P<sub_plugin_slug>[^/.]+)/jobs',
+    viewset=SubPluginReleaseJobViewSet,
+    basename='release-jobs',
+)
 router.register(
     prefix='games/(?P<plugin_slug>[^/.]+)/(?P<sub_plugin_slug>[^/.]+)',
     viewset=SubPluginGameViewSet,
@@ -57,6 +64,11 @@ router.register(
     viewset=SubPluginContributorViewSet,
     basename='contributors',
 )
+router.register(
+    prefix='downloads/(?P<plugin_slug>[^/.]+)/(?P<sub_plugin_slug>[^/.]+)',
+    viewset=SubPluginDownloadStatisticViewSet,
+    basename='downloads',
+)
 
 
 # =============================================================================
@@ -3,9 +3,6 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
-# Django
-from django.db.models import Prefetch
-
 # Third Party Django
 from rest_framework.parsers import ParseError
 
@@ -13,12 +10,18 @@ from rest_framework.parsers import ParseError
 from project_manager.api.common.views import (
     ProjectAPIView,
     ProjectContributorViewSet,
+    ProjectDownloadStatisticViewSet,
     ProjectGameViewSet,
     ProjectImageViewSet,
+    ProjectReleaseJobViewSet,
     ProjectReleaseViewSet,
     ProjectTagViewSet,
     ProjectViewSet,
 )
+from project_manager.helpers import (
+    get_current_release_prefetch,
+    get_requirement_prefetches,
+)
 from project_manager.plugins.models import Plugin
 from project_manager.sub_plugins.api.filtersets import SubPluginFilterSet
 from project_manager.sub_plugins.api.serializers import (
@@ -26,6 +29,7 @@ from project_manager.sub_plugins.api.serializers import (
     SubPluginCreateSerializer,
     SubPluginGameSerializer,
     SubPluginImageSerializer,
+    SubPluginReleaseJobSerializer,
     SubPluginReleaseSerializer,
     SubPluginSerializer,
     SubPluginTagSerializer,
@@ -36,10 +40,8 @@ from project_manager.sub_plugins.models import (
     SubPluginGame,
     SubPluginImage,
     SubPluginRelease,
-    SubPluginReleaseDownloadRequirement,
-    SubPluginReleasePackageRequirement,
-    SubPluginReleasePyPiRequirement,
-    SubPluginReleaseVersionControlRequirement,
+    SubPluginReleaseDownloadStatistic,
+    SubPluginReleaseJob,
     SubPluginTag,
 )
 
@@ -50,8 +52,10 @@ from project_manager.sub_plugins.models import (
 __all__ = (
     'SubPluginAPIView',
     'SubPluginContributorViewSet',
+    'SubPluginDownloadStatisticViewSet',
     'SubPluginGameViewSet',
     'SubPluginImageViewSet',
+    'SubPluginReleaseJobViewSet',
     'SubPluginReleaseViewSet',
     'SubPluginTagViewSet',
     'SubPluginViewSet',
@@ -79,12 +83,7 @@ class SubPluginViewSet(ProjectViewSet):
         'owner__user',
         'plugin',
     ).prefetch_related(
-        Prefetch(
-            lookup='releases',
-            queryset=SubPluginRelease.objects.order_by(
-                '-created',
-            ),
-        ),
+        get_current_release_prefetch(release_model=SubPluginRelease),
     )
     serializer_class = SubPluginSerializer
     lookup_field = 'slug'
@@ -104,6 +103,10 @@ class SubPluginViewSet(ProjectViewSet):
         except Plugin.DoesNotExist as exception:
             raise ParseError('Invalid plugin_slug.') from exception
 
+    def get_project_pk(self):
+        """Return the SubPlugin's id, which includes its Plugin's slug."""
+        return f'{self.kwargs.get("plugin_slug")}.{super().get_project_pk()}'
+
 
 class SubPluginImageViewSet(ProjectImageViewSet):
     """ViewSet for adding, removing, and listing images for SubPlugins."""
@@ -126,42 +129,27 @@ class SubPluginReleaseViewSet(ProjectReleaseViewSet):
         'sub_plugin',
         'created_by__user',
     ).prefetch_related(
-        Prefetch(
-            lookup='subpluginreleasepackagerequirement_set',
-            queryset=SubPluginReleasePackageRequirement.objects.order_by(
-                'package_requirement__name',
-            ).select_related(
-                'package_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='subpluginreleasedownloadrequirement_set',
-            queryset=SubPluginReleaseDownloadRequirement.objects.order_by(
-                'download_requirement__url',
-            ).select_related(
-                'download_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='subpluginreleasepypirequirement_set',
-            queryset=SubPluginReleasePyPiRequirement.objects.order_by(
-                'pypi_requirement__name',
-            ).select_related(
-                'pypi_requirement',
-            )
-        ),
-        Prefetch(
-            lookup='subpluginreleaseversioncontrolrequirement_set',
-            queryset=(
-                SubPluginReleaseVersionControlRequirement.objects.order_by(
-                    'vcs_requirement__url',
-                ).select_related(
-                    'vcs_requirement',
-                )
-            )
-        ),
+        *get_requirement_prefetches(release_model=SubPluginRelease),
     )
     serializer_class = SubPluginReleaseSerializer
+    job_serializer_class = SubPluginReleaseJobSerializer
+
+    project_type = 'sub-plugin'
+    project_model = SubPlugin
+
+    def get_project_pk(self):
+        """Return the SubPlugin's id, which includes its Plugin's slug."""
+        return f'{self.kwargs.get("plugin_slug")}.{super().get_project_pk()}'
+
+
+class SubPluginReleaseJobViewSet(ProjectReleaseJobViewSet):
+    """ViewSet for retrieving release jobs for SubPlugins."""
+
+    __doc__ += ProjectReleaseJobViewSet.doc_string
+    queryset = SubPluginReleaseJob.objects.select_related(
+        'release',
+    )
+    serializer_class = SubPluginReleaseJobSerializer
 
     project_type = 'sub-plugin'
     project_model = SubPlugin
@@ -207,3 +195,13 @@ class SubPluginContributorViewSet(ProjectContributorViewSet):
 
     project_type = 'sub-plugin'
     project_model = SubPlugin
+
+
+class SubPluginDownloadStatisticViewSet(ProjectDownloadStatisticViewSet):
+    """Download statistics for SubPlugins."""
+
+    __doc__ += ProjectDownloadStatisticViewSet.doc_string
+    queryset = SubPluginReleaseDownloadStatistic.objects.all()
+
+    project_type = 'sub-plugin'
+    project_model = SubPlugin
@@ -3,11 +3,10 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
-# Django
-import json
+# Python
 import logging
-from zipfile import ZipFile
 
+# Django
 from django.core.exceptions import ValidationError
 
 # App
@@ -60,32 +59,19 @@ class SubPluginZipFile(ProjectZipFile):
         )
         super().__init__(zip_file)
 
-    def _validate_path(self, path):
-        """Validate the given path is ok for the extension."""
-        if path.endswith('/'):
-            return True
-
-        try:
-            extension = path.rsplit('/', 1)[1].rsplit('.', 1)[1]
-        except IndexError:
-            return True
-
-        for base_path, allowed_extensions in self.file_types.items():
-            for sub_plugin_path in self.sub_plugin_paths:
-                if not path.startswith(
-                    base_path.format(
-                        self=self,
-                        sub_plugin_path=sub_plugin_path,
-                    )
-                ):
-                    continue
-
-                if extension in allowed_extensions:
-                    return True
-
-                return False
-
-        return False
+    def get_allowed_paths(self):
+        """Return the formatted base paths and their allowed extensions."""
+        return [
+            (
+                base_path.format(
+                    self=self,
+                    sub_plugin_path=sub_plugin_path,
+                ),
+                allowed_extensions,
+            )
+            for base_path, allowed_extensions in self.file_types.items()
+            for sub_plugin_path in self.sub_plugin_paths
+        ]
 
     def find_base_info(self):
         """Store all base information for the zip file."""
@@ -158,15 +144,15 @@ class SubPluginZipFile(ProjectZipFile):
         module_found = package_found = False
         if path_values['allow_module']:
             check_path = f'{sub_path}{self.basename}.py'
-            self.is_module = module_found = check_path in self.file_list
+            self.is_module = module_found = check_path in self.file_paths
 
         if path_values['allow_package_using_basename']:
             check_path = f'{sub_path}{self.basename}/{self.basename}.py'
-            package_found = check_path in self.file_list
+            package_found = check_path in self.file_paths
 
         if path_values['allow_package_using_init']:
             check_path = f'{sub_path}{self.basename}/__init__.py'
-            package_found = check_path in self.file_list or package_found
+            package_found = check_path in self.file_paths or package_found
 
         if package_found and module_found:
             raise ValidationError(
@@ -190,24 +176,12 @@ class SubPluginZipFile(ProjectZipFile):
 
     def get_requirements_file_contents(self):
         """Return the contents of the requirements.json file."""
-        requirement_paths = self.get_requirement_paths()
-        for requirement_path in requirement_paths:
-            try:
-                with ZipFile(self.zip_file).open(requirement_path) as requirement_file:
-                    contents = json.load(requirement_file)
-            except KeyError:
-                continue
-            except json.decoder.JSONDecodeError as exception:
-                raise ValidationError({
-                    'zip_file': 'Requirements json file cannot be decoded.'
-                }) from exception
-
-            if not isinstance(contents, dict):
-                raise ValidationError({
-                    'zip_file': 'Invalid requirements json file.'
-                })
-
-            return contents
+        for requirement_path in self.get_requirement_paths():
+            contents = self.read_requirements_file(
+                requirement_path=requirement_path,
+            )
+            if contents is not None:
+                return contents
 
         logger.debug('No requirement file found.')
         return None
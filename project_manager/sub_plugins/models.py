@@ -17,14 +17,18 @@ from project_manager.constants import (
     PROJECT_BASENAME_MAX_LENGTH,
     PROJECT_SLUG_MAX_LENGTH,
     RELEASE_VERSION_MAX_LENGTH,
+    REQUIREMENT_SPECIFIER_MAX_LENGTH,
 )
 from project_manager.models.abstract import (
     AbstractUUIDPrimaryKeyModel,
     Project,
     ProjectRelease,
+    ProjectReleaseDownloadStatistic,
+    ProjectReleaseJob,
 )
 from project_manager.validators import (
     basename_validator,
+    specifier_validator,
     version_validator,
 )
 from project_manager.sub_plugins.constants import SUB_PLUGIN_LOGO_URL
@@ -45,6 +49,8 @@ __all__ = (
     'SubPluginImage',
     'SubPluginRelease',
     'SubPluginReleaseDownloadRequirement',
+    'SubPluginReleaseDownloadStatistic',
+    'SubPluginReleaseJob',
     'SubPluginReleasePackageRequirement',
     'SubPluginReleasePyPiRequirement',
     'SubPluginReleaseVersionControlRequirement',
@@ -174,12 +180,16 @@ class SubPluginRelease(ProjectRelease):
     field_tracker = FieldTracker(
         fields=[
             'version',
+            'zip_file',
         ]
     )
 
     class Meta(ProjectRelease.Meta):
         """Define metaclass attributes."""
 
+        indexes = [
+            models.Index(fields=('sub_plugin', '-created')),
+        ]
         unique_together = ('sub_plugin', 'version')
         verbose_name = 'SubPlugin Release'
         verbose_name_plural = 'SubPlugin Releases'
@@ -201,6 +211,57 @@ class SubPluginRelease(ProjectRelease):
         )
 
 
+class SubPluginReleaseDownloadStatistic(ProjectReleaseDownloadStatistic):
+    """SubPlugin release download statistics model."""
+
+    release = models.ForeignKey(
+        to='project_manager.SubPluginRelease',
+        related_name='download_statistics',
+        on_delete=models.CASCADE,
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        unique_together = ('release', 'period', 'date')
+        verbose_name = 'SubPlugin Release Download Statistic'
+        verbose_name_plural = 'SubPlugin Release Download Statistics'
+
+
+class SubPluginReleaseJob(ProjectReleaseJob):
+    """SubPlugin release job type model."""
+
+    sub_plugin = models.ForeignKey(
+        to='project_manager.SubPlugin',
+        related_name='release_jobs',
+        on_delete=models.CASCADE,
+    )
+    created_by = models.ForeignKey(
+        to='users.ForumUser',
+        related_name='sub_plugin_release_jobs',
+        on_delete=models.SET_NULL,
+        null=True,
+    )
+    release = models.OneToOneField(
+        to='project_manager.SubPluginRelease',
+        related_name='job',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        verbose_name = 'SubPlugin Release Job'
+        verbose_name_plural = 'SubPlugin Release Jobs'
+
+    @property
+    def project(self):
+        """Return the SubPlugin."""
+        return self.sub_plugin
+
+
 class SubPluginImage(AbstractUUIDPrimaryKeyModel):
     """SubPlugin image type model."""
 
@@ -349,11 +410,11 @@ class SubPluginReleasePackageRequirement(AbstractUUIDPrimaryKeyModel):
         on_delete=models.CASCADE,
     )
     version = models.CharField(
-        max_length=RELEASE_VERSION_MAX_LENGTH,
-        validators=[version_validator],
+        max_length=REQUIREMENT_SPECIFIER_MAX_LENGTH,
+        validators=[specifier_validator],
         help_text=(
-            'The version of the custom package for this release '
-            'of the sub_plugin.'
+            'The version, or version specifier, of the custom package for '
+            'this release of the sub_plugin.'
         ),
         blank=True,
         null=True,
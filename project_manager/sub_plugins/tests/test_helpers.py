@@ -7,6 +7,7 @@ from unittest import mock
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
@@ -62,12 +63,14 @@ class SubPluginZipFileTestCase(TestCase):
 
     def setUp(self) -> None:
         super().setUp()
+        cache.clear()
         self.mock_get_file_list = mock.patch(
             target='project_manager.helpers.ProjectZipFile.get_file_list',
         ).start()
-        mock.patch(
+        self.mock_zipfile = mock.patch(
             target='project_manager.helpers.ZipFile',
-        ).start()
+        )
+        self.mock_zipfile.start()
 
     def tearDown(self) -> None:
         super().tearDown()
@@ -310,6 +313,7 @@ class SubPluginZipFileTestCase(TestCase):
         target='project_manager.sub_plugins.helpers.logger',
     )
     def test_validate_requirements_file_failures(self, mock_logger):
+        self.mock_zipfile.stop()
         base_path = settings.BASE_DIR / 'fixtures' / 'releases' / 'sub-plugins' / 'test-plugin'
         file_path = base_path / 'test-sub-plugin' / 'test-sub-plugin-v1.0.0.zip'
         self.mock_get_file_list.return_value = []
@@ -383,9 +387,6 @@ class SubPluginZipFileTestCase(TestCase):
             path='sub_plugins',
         )
         obj.paths = {sub_plugin_path}
-        mock.patch(
-            target='project_manager.sub_plugins.helpers.ZipFile',
-        ).start()
         with self.assertRaises(ValidationError) as context:
             obj.validate_requirements()
 
@@ -211,11 +211,17 @@ class SubPluginTestCase(TestCase):
                 version=version,
                 created=created + timedelta(minutes=offset),
             )
+            sub_plugin.refresh_from_db()
             self.assertEqual(
                 first=sub_plugin.current_version,
                 second=release.version,
             )
 
+        # Verify that deleting the current release restores the previous one
+        release.delete()
+        sub_plugin.refresh_from_db()
+        self.assertEqual(first=sub_plugin.current_version, second='1.1.0')
+
     def test_total_downloads(self):
         sub_plugin = SubPluginFactory()
         total_downloads = 0
@@ -227,6 +233,7 @@ class SubPluginTestCase(TestCase):
                 download_count=download_count,
             )
 
+        sub_plugin.refresh_from_db()
         self.assertEqual(
             first=sub_plugin.total_downloads,
             second=total_downloads,
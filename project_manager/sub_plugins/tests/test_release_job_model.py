@@ -0,0 +1,110 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.db import models
+from django.test import TestCase
+
+# App
+from project_manager.models.abstract import ProjectReleaseJob
+from project_manager.sub_plugins.models import (
+    SubPlugin,
+    SubPluginRelease,
+    SubPluginReleaseJob,
+)
+from test_utils.factories.sub_plugins import SubPluginReleaseJobFactory
+from users.models import ForumUser
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class SubPluginReleaseJobTestCase(TestCase):
+    def test_model_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(SubPluginReleaseJob, ProjectReleaseJob),
+        )
+
+    def test_sub_plugin_field(self):
+        field = SubPluginReleaseJob._meta.get_field('sub_plugin')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.ForeignKey,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=SubPlugin,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.CASCADE,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='release_jobs',
+        )
+
+    def test_created_by_field(self):
+        field = SubPluginReleaseJob._meta.get_field('created_by')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.ForeignKey,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=ForumUser,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.SET_NULL,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='sub_plugin_release_jobs',
+        )
+        self.assertTrue(expr=field.null)
+
+    def test_release_field(self):
+        field = SubPluginReleaseJob._meta.get_field('release')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.OneToOneField,
+        )
+        self.assertEqual(
+            first=field.remote_field.model,
+            second=SubPluginRelease,
+        )
+        self.assertEqual(
+            first=field.remote_field.on_delete,
+            second=models.SET_NULL,
+        )
+        self.assertEqual(
+            first=field.remote_field.related_name,
+            second='job',
+        )
+        self.assertTrue(expr=field.blank)
+        self.assertTrue(expr=field.null)
+
+    def test_project_property(self):
+        obj = SubPluginReleaseJobFactory()
+        self.assertEqual(
+            first=obj.project,
+            second=obj.sub_plugin,
+        )
+
+    def test__str__(self):
+        obj = SubPluginReleaseJobFactory()
+        self.assertEqual(
+            first=str(obj),
+            second=f'{obj.sub_plugin} - {obj.version} (pending)',
+        )
+
+    def test_meta_class(self):
+        self.assertEqual(
+            first=SubPluginReleaseJob._meta.verbose_name,
+            second='SubPlugin Release Job',
+        )
+        self.assertEqual(
+            first=SubPluginReleaseJob._meta.verbose_name_plural,
+            second='SubPlugin Release Jobs',
+        )
@@ -173,7 +173,7 @@ class SubPluginReleaseTestCase(TestCase):
         )
         self.assertSetEqual(
             set1=SubPluginRelease.field_tracker.fields,
-            set2={'version'},
+            set2={'version', 'zip_file'},
         )
 
     def test_primary_attributes(self):
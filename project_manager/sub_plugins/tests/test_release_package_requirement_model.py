@@ -9,9 +9,9 @@ from django.db import models
 from django.test import TestCase
 
 # App
-from project_manager.constants import RELEASE_VERSION_MAX_LENGTH
+from project_manager.constants import REQUIREMENT_SPECIFIER_MAX_LENGTH
 from project_manager.models.abstract import AbstractUUIDPrimaryKeyModel
-from project_manager.validators import version_validator
+from project_manager.validators import specifier_validator
 from project_manager.packages.models import Package
 from project_manager.sub_plugins.models import (
     SubPluginRelease,
@@ -77,17 +77,17 @@ class SubPluginReleasePackageRequirementTestCase(TestCase):
         )
         self.assertEqual(
             first=field.max_length,
-            second=RELEASE_VERSION_MAX_LENGTH,
+            second=REQUIREMENT_SPECIFIER_MAX_LENGTH,
         )
         self.assertIn(
-            member=version_validator,
+            member=specifier_validator,
             container=field.validators,
         )
         self.assertEqual(
             first=field.help_text,
             second=(
-                'The version of the custom package for this release of the '
-                'sub_plugin.'
+                'The version, or version specifier, of the custom package '
+                'for this release of the sub_plugin.'
             )
         )
         self.assertTrue(expr=field.blank)
@@ -15,7 +15,6 @@ from rest_framework import status
 
 # App
 from project_manager.mixins import DownloadMixin
-from project_manager.plugins.models import Plugin
 from project_manager.sub_plugins.constants import SUB_PLUGIN_RELEASE_URL
 from project_manager.sub_plugins.models import SubPluginRelease
 from project_manager.sub_plugins.views import (
@@ -33,7 +32,10 @@ from test_utils.factories.sub_plugins import (
 # =============================================================================
 # TEST CASES
 # =============================================================================
-@override_settings(MEDIA_ROOT=settings.BASE_DIR / 'fixtures')
+@override_settings(
+    MEDIA_ROOT=settings.BASE_DIR / 'fixtures',
+    DOWNLOAD_COUNT_FLUSH_THRESHOLD=1,
+)
 class SubPluginReleaseDownloadViewTestCase(TestCase):
 
     basename = plugin_basename = sub_plugin = zip_file = None
@@ -54,7 +56,10 @@ class SubPluginReleaseDownloadViewTestCase(TestCase):
         cls.release = SubPluginReleaseFactory(
             sub_plugin=cls.sub_plugin,
             version=version,
-            zip_file=cls.zip_file,
+            zip_file=(
+                f'{SUB_PLUGIN_RELEASE_URL}{plugin.slug}/{cls.sub_plugin.slug}/'
+                f'{cls.zip_file}'
+            ),
         )
         cls.api_path = reverse(
             viewname='sub-plugin-download',
@@ -84,14 +89,6 @@ class SubPluginReleaseDownloadViewTestCase(TestCase):
             first=SubPluginReleaseDownloadView.model,
             second=SubPluginRelease,
         )
-        self.assertEqual(
-            first=SubPluginReleaseDownloadView.project_model,
-            second=Plugin,
-        )
-        self.assertEqual(
-            first=SubPluginReleaseDownloadView.model_kwarg,
-            second='sub_plugin',
-        )
         self.assertEqual(
             first=SubPluginReleaseDownloadView.base_url,
             second=SUB_PLUGIN_RELEASE_URL,
@@ -119,19 +116,32 @@ class SubPluginReleaseDownloadViewTestCase(TestCase):
             first=response.status_code,
             second=status.HTTP_200_OK,
         )
+        content = b''.join(response.streaming_content)
+        self.assertEqual(
+            first=response['Content-Type'],
+            second='application/zip',
+        )
+        self.assertEqual(
+            first=response['Content-Disposition'],
+            second=f'attachment; filename="{self.zip_file}"',
+        )
+        self.assertEqual(
+            first=int(response['Content-Length']),
+            second=len(content),
+        )
         self.assertIn(
             member=(
                 f'addons/source-python/plugins/{self.plugin_basename}/sub_plugins/'
                 f'{self.basename}/__init__.py'
             ),
-            container=str(response.content),
+            container=str(content),
         )
         self.assertIn(
             member=(
                 f'addons/source-python/plugins/{self.plugin_basename}/sub_plugins/'
                 f'{self.basename}/{self.basename}.py'
             ),
-            container=str(response.content),
+            container=str(content),
         )
         self.assertEqual(
             first=SubPluginRelease.objects.get(pk=self.release.pk).download_count,
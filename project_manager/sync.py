@@ -0,0 +1,279 @@
+"""Change log of projects, releases, tags, and games for the sync API."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from collections import defaultdict
+from datetime import timedelta
+
+# Django
+from django.apps import apps
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import is_naive, make_aware, now
+
+# App
+from project_manager.constants import (
+    SYNC_CHANGE_LIMIT,
+    SYNC_PROJECT_TYPES,
+    SYNC_RELATED_OBJECTS,
+)
+
+
+# =============================================================================
+# ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'get_sync_changes',
+    'get_sync_start',
+    'record_sync_change',
+    'record_sync_deletion',
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def record_sync_change(instance, **kwargs):
+    """Record that the instance was created or updated."""
+    _get_change_model().objects.create(**_get_change_values(instance))
+
+
+def record_sync_deletion(instance, **kwargs):
+    """Record a tombstone for the deleted instance."""
+    _get_change_model().objects.create(
+        deleted=True,
+        **_get_change_values(instance),
+    )
+
+
+def get_sync_start(since):
+    """Return the id of the last change before the given token or timestamp.
+
+    Tokens are the ids returned by previous syncs. None is returned when
+        the value is neither a token nor a timestamp. Timestamps within the
+        commit lag start from the last settled change.
+    """
+    if since.isdigit():
+        return int(since)
+
+    try:
+        timestamp = parse_datetime(since)
+    except ValueError:
+        return None
+    if timestamp is None:
+        return None
+    if is_naive(timestamp):
+        timestamp = make_aware(timestamp)
+    change = _get_change_model().objects.filter(
+        created__lte=min(timestamp, _get_settled_time()),
+    ).order_by('-pk').values_list('pk', flat=True).first()
+    return change or 0
+
+
+def get_sync_changes(start, limit=SYNC_CHANGE_LIMIT):
+    """Return the current state of everything changed after the given id.
+
+    Only the latest change of each object is used. Projects are included
+        when their releases change, as that updates their current version,
+        and the deletions of a deleted project's releases, tags, and games
+        are left out, as the project's own tombstone covers them.
+
+    Ids are assigned when the changes are inserted, but transactions can
+        commit out of order, so a token past a change that is not committed
+        yet would skip it. Changes newer than SYNC_CHANGE_COMMIT_LAG, and
+        every change after them, are left for a later sync.
+    """
+    rows = _get_settled_changes(start=start, limit=limit + 1)
+    more = len(rows) > limit
+    rows = rows[:limit]
+
+    latest = {}
+    for _, object_type, project_type, project, key, deleted, _ in rows:
+        latest[(object_type, project_type, project, key)] = deleted
+        if object_type == 'release' and not deleted:
+            latest.setdefault(('project', project_type, project, ''), False)
+
+    deleted_projects = {
+        (project_type, project)
+        for (object_type, project_type, project, _), deleted in latest.items()
+        if object_type == 'project' and deleted
+    }
+    changed = defaultdict(lambda: defaultdict(set))
+    deletions = []
+    for (object_type, project_type, project, key), deleted in latest.items():
+        if not deleted:
+            changed[object_type][project_type].add((project, key))
+        elif object_type == 'project' or (
+            (project_type, project) not in deleted_projects
+        ):
+            deletions.append({
+                'object_type': object_type,
+                'project_type': project_type,
+                'project': project,
+                'key': key,
+            })
+
+    return {
+        'token': str(rows[-1][0] if rows else start),
+        'more': more,
+        'projects': _get_projects(changed['project']),
+        'releases': _get_releases(changed['release']),
+        'tags': _get_related(changed['tag'], suffix='Tag'),
+        'games': _get_related(changed['game'], suffix='Game'),
+        'deleted': deletions,
+    }
+
+
+def _get_change_model():
+    return apps.get_model(
+        app_label='project_manager',
+        model_name='SyncChange',
+    )
+
+
+def _get_settled_changes(start, limit):
+    """Return the changes after the given id, up to the first unsettled one."""
+    rows = list(
+        _get_change_model().objects.filter(
+            pk__gt=start,
+        ).order_by('pk').values_list(
+            'pk',
+            'object_type',
+            'project_type',
+            'project',
+            'key',
+            'deleted',
+            'created',
+        )[:limit]
+    )
+    settled = _get_settled_time()
+    for index, row in enumerate(rows):
+        if row[-1] > settled:
+            return rows[:index]
+    return rows
+
+
+def _get_settled_time():
+    """Return the time before which every change is assumed committed."""
+    return now() - timedelta(seconds=settings.SYNC_CHANGE_COMMIT_LAG)
+
+
+def _get_project_model(project_type, suffix=''):
+    model_name = next(
+        name for name, value in SYNC_PROJECT_TYPES.items()
+        if value == project_type
+    )
+    return apps.get_model(
+        app_label='project_manager',
+        model_name=f'{model_name}{suffix}',
+    )
+
+
+def _get_project_field(model):
+    """Return the model's ForeignKey to its project."""
+    return next(
+        field for field in model._meta.concrete_fields
+        if field.is_relation and (
+            field.related_model.__name__ in SYNC_PROJECT_TYPES
+        )
+    )
+
+
+def _get_change_values(instance):
+    """Return the SyncChange values that identify the instance."""
+    model_name = instance.__class__.__name__
+    if model_name in SYNC_PROJECT_TYPES:
+        return {
+            'object_type': 'project',
+            'project_type': SYNC_PROJECT_TYPES[model_name],
+            'project': instance.pk,
+        }
+
+    project_field = _get_project_field(instance.__class__)
+    object_type, key_field = next(
+        values for suffix, values in SYNC_RELATED_OBJECTS.items()
+        if model_name.endswith(suffix)
+    )
+    return {
+        'object_type': object_type,
+        'project_type': SYNC_PROJECT_TYPES[
+            project_field.related_model.__name__
+        ],
+        'project': getattr(instance, project_field.attname),
+        'key': getattr(instance, key_field),
+    }
+
+
+def _get_projects(changed):
+    """Return the current values of the changed projects that still exist."""
+    projects = []
+    for project_type, keys in sorted(changed.items()):
+        model = _get_project_model(project_type)
+        projects.extend(
+            {
+                'project_type': project_type,
+                'project': row.pop('pk'),
+                **row,
+            } for row in model.objects.filter(
+                pk__in=[project for project, _ in keys],
+            ).order_by('pk').values(
+                'pk',
+                'name',
+                'basename',
+                'current_version',
+                'updated',
+            )
+        )
+    return projects
+
+
+def _get_releases(changed):
+    """Return the current values of the changed releases that still exist."""
+    releases = []
+    for project_type, keys in sorted(changed.items()):
+        model = _get_project_model(project_type, suffix='Release')
+        field = _get_project_field(model)
+        project_field = field.attname
+        releases.extend(
+            {
+                'project_type': project_type,
+                'project': getattr(release, project_field),
+                'version': release.version,
+                'created': release.created,
+                'file_hash': release.file_hash,
+                'url': release.get_absolute_url(),
+            } for release in model.objects.filter(
+                **{f'{project_field}__in': {project for project, _ in keys}},
+                version__in={version for _, version in keys},
+            ).select_related(
+                field.name,
+            ).order_by(project_field, 'created')
+            if (getattr(release, project_field), release.version) in keys
+        )
+    return releases
+
+
+def _get_related(changed, suffix):
+    """Return the changed tags or games that are still linked."""
+    related = []
+    for project_type, keys in sorted(changed.items()):
+        model = _get_project_model(project_type, suffix=suffix)
+        project_field = _get_project_field(model).attname
+        key_field = SYNC_RELATED_OBJECTS[suffix][1]
+        related.extend(
+            {
+                'project_type': project_type,
+                'project': project,
+                SYNC_RELATED_OBJECTS[suffix][0]: key,
+            } for project, key in model.objects.filter(
+                **{f'{project_field}__in': {project for project, _ in keys}},
+                **{f'{key_field}__in': {key for _, key in keys}},
+            ).order_by(project_field, key_field).values_list(
+                project_field,
+                key_field,
+            )
+            if (project, key) in keys
+        )
+    return related
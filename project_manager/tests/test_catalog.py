@@ -0,0 +1,211 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import gzip
+import json
+import shutil
+import tempfile
+from threading import Thread
+from unittest import mock
+
+# Django
+from django.test import TestCase, override_settings
+
+# Third Party Python
+from path import Path
+
+# App
+from project_manager.catalog import (
+    build_catalog,
+    get_catalog_file,
+    update_catalog_projects,
+    write_catalog,
+)
+from project_manager.helpers import lock_file
+from test_utils.factories.packages import PackageFactory
+from test_utils.factories.plugins import (
+    PluginFactory,
+    PluginReleaseFactory,
+    PluginReleasePackageRequirementFactory,
+    PluginReleasePyPiRequirementFactory,
+)
+from test_utils.factories.sub_plugins import (
+    SubPluginFactory,
+    SubPluginReleaseFactory,
+)
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class CatalogTestCase(TestCase):
+
+    MEDIA_ROOT = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(cls.MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        super().setUp()
+        shutil.rmtree(self.MEDIA_ROOT / 'catalog', ignore_errors=True)
+
+    def read_catalog(self):
+        with get_catalog_file().open() as open_file:
+            return json.load(open_file)
+
+    def test_build_catalog(self):
+        plugin = PluginFactory(basename='test_plugin')
+        PluginReleaseFactory(
+            plugin=plugin,
+            version='1.0.0',
+            zip_file='/media/test-plugin-v1.0.0.zip',
+        )
+        release = PluginReleaseFactory(
+            plugin=plugin,
+            version='1.0.1',
+            zip_file='/media/test-plugin-v1.0.1.zip',
+        )
+        package = PackageFactory(basename='test_package')
+        PluginReleasePackageRequirementFactory(
+            plugin_release=release,
+            package_requirement=package,
+            version='>=1.0',
+        )
+        pypi_requirement = PluginReleasePyPiRequirementFactory(
+            plugin_release=release,
+            optional=True,
+        )
+        sub_plugin = SubPluginFactory(plugin=plugin, basename='test_sub')
+        sub_plugin_release = SubPluginReleaseFactory(
+            sub_plugin=sub_plugin,
+            version='2.0.0',
+            zip_file='/media/test-sub-v2.0.0.zip',
+        )
+
+        catalog = build_catalog()
+        self.assertDictEqual(d1=catalog['packages'], d2={})
+        self.assertDictEqual(
+            d1=catalog['plugins'],
+            d2={
+                plugin.pk: {
+                    'name': plugin.name,
+                    'basename': 'test_plugin',
+                    'version': '1.0.1',
+                    'created': release.created,
+                    'url': release.get_absolute_url(),
+                    'file_hash': release.file_hash,
+                    'requirements': {
+                        'packages': [{
+                            'slug': package.pk,
+                            'version': '>=1.0',
+                            'optional': False,
+                        }],
+                        'pypi': [{
+                            'name': pypi_requirement.pypi_requirement.name,
+                            'version': None,
+                            'optional': True,
+                        }],
+                    },
+                },
+            },
+        )
+        self.assertListEqual(
+            list1=list(catalog['sub-plugins']),
+            list2=[sub_plugin.pk],
+        )
+        self.assertEqual(
+            first=catalog['sub-plugins'][sub_plugin.pk]['url'],
+            second=sub_plugin_release.get_absolute_url(),
+        )
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT)
+    def test_write_catalog(self):
+        plugin = PluginFactory(basename='test_plugin')
+        PluginReleaseFactory(
+            plugin=plugin,
+            version='1.0.0',
+            zip_file='/media/test-plugin-v1.0.0.zip',
+        )
+        write_catalog(catalog=build_catalog())
+
+        catalog_file = get_catalog_file()
+        content = catalog_file.read_bytes()
+        self.assertEqual(
+            first=gzip.decompress(
+                (catalog_file.parent / 'index.json.gz').read_bytes(),
+            ),
+            second=content,
+        )
+        self.assertNotIn(member=b'": ', container=content)
+        self.assertListEqual(
+            list1=sorted(path.name for path in catalog_file.parent.files()),
+            list2=['index.json', 'index.json.gz', 'index.json.lock'],
+        )
+        self.assertEqual(
+            first=json.loads(content)['plugins'][plugin.pk]['version'],
+            second='1.0.0',
+        )
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT)
+    def test_write_catalog_lock(self):
+        catalog_file = get_catalog_file()
+
+        # Verify that the catalog is not written while another process
+        #   holds its lock
+        with lock_file(catalog_file.parent / 'index.json.lock'):
+            thread = Thread(
+                target=write_catalog,
+                kwargs={'catalog': {'plugins': {}}},
+            )
+            thread.start()
+            thread.join(timeout=0.5)
+            self.assertTrue(expr=thread.is_alive())
+            self.assertFalse(expr=catalog_file.isfile())
+
+        thread.join()
+        self.assertTrue(expr=catalog_file.isfile())
+
+    @override_settings(MEDIA_ROOT=MEDIA_ROOT)
+    def test_update_catalog(self):
+        plugin = PluginFactory(basename='test_plugin')
+
+        # Verify that nothing is written before the catalog is built
+        with self.captureOnCommitCallbacks(execute=True):
+            PluginReleaseFactory(
+                plugin=plugin,
+                version='1.0.0',
+                zip_file='/media/test-plugin-v1.0.0.zip',
+            )
+        self.assertFalse(expr=get_catalog_file().isfile())
+
+        write_catalog(catalog=build_catalog())
+
+        # Verify that the catalog is rewritten once per transaction
+        with mock.patch(
+            target='project_manager.catalog.update_catalog_projects',
+            wraps=update_catalog_projects,
+        ) as mock_update:
+            with self.captureOnCommitCallbacks(execute=True):
+                release = PluginReleaseFactory(
+                    plugin=plugin,
+                    version='1.0.1',
+                    zip_file='/media/test-plugin-v1.0.1.zip',
+                )
+                PluginReleasePyPiRequirementFactory(plugin_release=release)
+                PluginReleasePyPiRequirementFactory(plugin_release=release)
+        mock_update.assert_called_once_with(projects={('Plugin', plugin.pk)})
+        entry = self.read_catalog()['plugins'][plugin.pk]
+        self.assertEqual(first=entry['version'], second='1.0.1')
+        self.assertEqual(first=len(entry['requirements']['pypi']), second=2)
+
+        # Verify that deleted projects are removed
+        plugin_pk = plugin.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            plugin.delete()
+        self.assertDictEqual(d1=self.read_catalog()['plugins'], d2={})
+
+        update_catalog_projects(projects=[('Plugin', plugin_pk)])
+        self.assertDictEqual(d1=self.read_catalog()['plugins'], d2={})
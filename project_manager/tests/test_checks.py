@@ -0,0 +1,43 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Django
+from django.test import SimpleTestCase, override_settings
+
+# App
+from project_manager.checks import check_shared_cache
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class ChecksTestCase(SimpleTestCase):
+
+    @override_settings(DEBUG=False)
+    def test_check_shared_cache(self):
+        errors = check_shared_cache()
+        self.assertListEqual(
+            list1=[error.id for error in errors],
+            list2=['project_manager.E001'],
+        )
+
+        with override_settings(DEBUG=True):
+            self.assertListEqual(
+                list1=check_shared_cache(),
+                list2=[],
+            )
+
+        with override_settings(
+            CACHES={
+                'default': {
+                    'BACKEND': (
+                        'django.core.cache.backends.filebased.FileBasedCache'
+                    ),
+                    'LOCATION': '/tmp/sppm-test-cache',
+                },
+            },
+        ):
+            self.assertListEqual(
+                list1=check_shared_cache(),
+                list2=[],
+            )
@@ -2,15 +2,34 @@
 # IMPORTS
 # =============================================================================
 # Python
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
 from unittest import mock
 
 # Django
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.test import TestCase
+from django.utils.timezone import now
+
+# Third Party Python
+from path import Path
 
 # App
 from project_manager.management.commands.create_secret_key_file import ALLOWED_CHARS
+from project_manager.packages.models import PackageReleaseDownloadStatistic
+from project_manager.plugins.api.serializers import PluginReleaseSerializer
+from project_manager.plugins.models import (
+    PluginReleaseDownloadStatistic,
+    PluginReleaseJob,
+)
+from project_manager.release_jobs.constants import (
+    RELEASE_JOB_RUNNING,
+    RELEASE_JOB_SUCCEEDED,
+)
+from project_manager.sub_plugins.models import SubPluginReleaseDownloadStatistic
+from test_utils.factories.plugins import PluginReleaseJobFactory
 
 
 # =============================================================================
@@ -18,6 +37,28 @@ from project_manager.management.commands.create_secret_key_file import ALLOWED_C
 # =============================================================================
 class CommandsTestCase(TestCase):
 
+    @mock.patch(
+        target='project_manager.management.commands.build_catalog.write_catalog',
+    )
+    @mock.patch(
+        target='project_manager.management.commands.build_catalog.build_catalog',
+        return_value={
+            'generated': None,
+            'packages': {'test-package': {}},
+            'plugins': {'test-plugin': {}, 'other-plugin': {}},
+            'sub-plugins': {},
+        },
+    )
+    def test_build_catalog(self, mock_build, mock_write):
+        stdout = StringIO()
+        call_command('build_catalog', stdout=stdout)
+        mock_build.assert_called_once_with()
+        mock_write.assert_called_once_with(catalog=mock_build.return_value)
+        self.assertEqual(
+            first=stdout.getvalue(),
+            second='Wrote the catalog index of 3 projects.\n',
+        )
+
     @mock.patch(
         target='project_manager.management.commands.create_secret_key_file.SECRET_FILE'
     )
@@ -49,3 +90,164 @@ class CommandsTestCase(TestCase):
             first=str(context.exception),
             second='Secret key file already exists.'
         )
+
+    @mock.patch(
+        target='project_manager.management.commands.export_projects.iter_export_lines',
+        return_value=iter(['{"slug":"first"}\n', '{"slug":"second"}\n']),
+    )
+    def test_export_projects(self, mock_iter):
+        stdout = StringIO()
+        call_command('export_projects', '--chunk-size', '10', stdout=stdout)
+        mock_iter.assert_called_once_with(chunk_size=10)
+        self.assertEqual(
+            first=stdout.getvalue(),
+            second='{"slug":"first"}\n{"slug":"second"}\n',
+        )
+
+    @mock.patch(
+        target='project_manager.management.commands.export_projects.iter_export_lines',
+        return_value=iter(['{"slug":"first"}\n', '{"slug":"second"}\n']),
+    )
+    def test_export_projects_output(self, mock_iter):
+        stdout = StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / 'projects.ndjson'
+            call_command('export_projects', '--output', output, stdout=stdout)
+            mock_iter.assert_called_once_with(chunk_size=None)
+            self.assertEqual(
+                first=output.read_text(),
+                second='{"slug":"first"}\n{"slug":"second"}\n',
+            )
+        self.assertEqual(
+            first=stdout.getvalue(),
+            second=f'Exported 2 projects to "{output}".\n',
+        )
+
+    @mock.patch(
+        target='project_manager.management.commands.flush_download_counts.download_counter'
+    )
+    def test_flush_download_counts(self, mock_download_counter):
+        mock_download_counter.flush.return_value = 5
+        mock_download_counter.pending = 0
+        stdout = StringIO()
+        call_command('flush_download_counts', stdout=stdout)
+        mock_download_counter.flush.assert_called_once_with()
+        mock_download_counter.spool.assert_not_called()
+        self.assertEqual(
+            first=stdout.getvalue(),
+            second='Wrote 5 download counts.\n',
+        )
+
+    @mock.patch(
+        target='project_manager.management.commands.flush_download_counts.download_counter'
+    )
+    def test_flush_download_counts_failure(self, mock_download_counter):
+        mock_download_counter.flush.return_value = 0
+        mock_download_counter.pending = 2
+        with self.assertRaises(CommandError) as context:
+            call_command('flush_download_counts')
+
+        mock_download_counter.spool.assert_called_once_with()
+        self.assertEqual(
+            first=str(context.exception),
+            second='Unable to write download counts, they have been spooled.'
+        )
+
+    @mock.patch(
+        target='project_manager.management.commands.rollup_download_statistics.localdate',
+        return_value=date(2023, 5, 15),
+    )
+    @mock.patch(
+        target='project_manager.management.commands.rollup_download_statistics.rollup_download_statistics',
+        return_value=2,
+    )
+    def test_rollup_download_statistics(self, mock_rollup, _):
+        stdout = StringIO()
+        call_command('rollup_download_statistics', '--days', '30', stdout=stdout)
+        self.assertListEqual(
+            list1=mock_rollup.call_args_list,
+            list2=[
+                mock.call(model=model, before=date(2023, 4, 1))
+                for model in (
+                    PackageReleaseDownloadStatistic,
+                    PluginReleaseDownloadStatistic,
+                    SubPluginReleaseDownloadStatistic,
+                )
+            ],
+        )
+        self.assertEqual(
+            first=stdout.getvalue(),
+            second=(
+                'Rolled up 2 daily rows for '
+                'Package Release Download Statistics.\n'
+                'Rolled up 2 daily rows for '
+                'Plugin Release Download Statistics.\n'
+                'Rolled up 2 daily rows for '
+                'SubPlugin Release Download Statistics.\n'
+            ),
+        )
+
+    @mock.patch(
+        target='project_manager.management.commands.run_release_jobs.run_release_job',
+    )
+    def test_run_release_jobs(self, mock_run_release_job):
+        job_1 = PluginReleaseJobFactory()
+        job_2 = PluginReleaseJobFactory(status=RELEASE_JOB_RUNNING)
+        PluginReleaseJob.objects.filter(pk=job_2.pk).update(
+            updated=now() - timedelta(days=1),
+        )
+        PluginReleaseJobFactory(status=RELEASE_JOB_RUNNING)
+        PluginReleaseJobFactory(status=RELEASE_JOB_SUCCEEDED)
+        stdout = StringIO()
+        call_command('run_release_jobs', stdout=stdout)
+        self.assertListEqual(
+            list1=mock_run_release_job.call_args_list,
+            list2=[
+                mock.call(
+                    model=PluginReleaseJob,
+                    pk=job.pk,
+                    serializer_class=PluginReleaseSerializer,
+                )
+                for job in (job_1, job_2)
+            ],
+        )
+        self.assertEqual(
+            first=stdout.getvalue(),
+            second=(
+                'Processed 0 pending Package Release Jobs.\n'
+                'Requeued 1 stale Plugin Release Jobs.\n'
+                'Processed 2 pending Plugin Release Jobs.\n'
+                'Processed 0 pending SubPlugin Release Jobs.\n'
+            ),
+        )
+
+    @mock.patch(
+        target='project_manager.management.commands.rebuild_package_dependents.rebuild_package_dependents',
+        return_value=3,
+    )
+    def test_rebuild_package_dependents(self, mock_rebuild):
+        stdout = StringIO()
+        call_command('rebuild_package_dependents', stdout=stdout)
+        mock_rebuild.assert_called_once_with()
+        self.assertEqual(
+            first=stdout.getvalue(),
+            second='Indexed 3 Package dependents.\n',
+        )
+
+    @mock.patch(
+        target='project_manager.management.commands.recompute_statistics.recompute_statistics',
+        return_value=mock.Mock(
+            users=4,
+            package_count=1,
+            plugin_count=2,
+            sub_plugin_count=3,
+        ),
+    )
+    def test_recompute_statistics(self, mock_recompute):
+        stdout = StringIO()
+        call_command('recompute_statistics', stdout=stdout)
+        mock_recompute.assert_called_once_with()
+        self.assertEqual(
+            first=stdout.getvalue(),
+            second='Recomputed statistics for 4 users and 6 projects.\n',
+        )
@@ -0,0 +1,164 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+import json
+
+# Django
+from django.test import TestCase
+
+# App
+from project_manager.export import iter_export_lines
+from test_utils.factories.games import GameFactory
+from test_utils.factories.packages import (
+    PackageFactory,
+    PackageReleaseFactory,
+)
+from test_utils.factories.plugins import (
+    PluginContributorFactory,
+    PluginFactory,
+    PluginGameFactory,
+    PluginReleaseFactory,
+    PluginReleasePackageRequirementFactory,
+    PluginTagFactory,
+)
+from test_utils.factories.sub_plugins import (
+    SubPluginFactory,
+    SubPluginReleaseFactory,
+)
+from test_utils.factories.tags import TagFactory
+from test_utils.factories.users import ForumUserFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class ExportTestCase(TestCase):
+
+    def get_records(self, **kwargs):
+        return [json.loads(line) for line in iter_export_lines(**kwargs)]
+
+    def test_iter_export_lines(self):
+        package = PackageFactory(basename='test_package')
+        PackageReleaseFactory(
+            package=package,
+            version='1.0.0',
+            zip_file='releases/packages/test-package/test-package-v1.0.0.zip',
+        )
+        plugin = PluginFactory(basename='test_plugin', synopsis='[b]Bold[/b]')
+        old_release = PluginReleaseFactory(
+            plugin=plugin,
+            version='1.0.0',
+            zip_file='releases/plugins/test-plugin/test-plugin-v1.0.0.zip',
+        )
+        release = PluginReleaseFactory(
+            plugin=plugin,
+            version='1.0.1',
+            notes='New release',
+            zip_file='releases/plugins/test-plugin/test-plugin-v1.0.1.zip',
+        )
+        PluginReleasePackageRequirementFactory(
+            plugin_release=release,
+            package_requirement=package,
+            version='>=1.0',
+        )
+        contributor = ForumUserFactory()
+        PluginContributorFactory(plugin=plugin, user=contributor)
+        PluginTagFactory(plugin=plugin, tag=TagFactory(name='test_tag'))
+        game = GameFactory()
+        PluginGameFactory(plugin=plugin, game=game)
+        sub_plugin = SubPluginFactory(plugin=plugin, basename='test_sub')
+        plugin.refresh_from_db()
+
+        records = self.get_records()
+        self.assertListEqual(
+            list1=[
+                (record['project_type'], record['slug'])
+                for record in records
+            ],
+            list2=[
+                ('package', package.slug),
+                ('plugin', plugin.slug),
+                ('sub-plugin', sub_plugin.slug),
+            ],
+        )
+        record = records[1]
+        self.assertEqual(first=record['synopsis'], second='[b]Bold[/b]')
+        self.assertEqual(first=record['current_version'], second='1.0.1')
+        self.assertEqual(
+            first=record['created'],
+            second=plugin.created.isoformat()[:23] + 'Z',
+        )
+        self.assertDictEqual(
+            d1=record['owner'],
+            d2={
+                'forum_id': plugin.owner.forum_id,
+                'username': plugin.owner.user.username,
+            },
+        )
+        self.assertListEqual(
+            list1=record['contributors'],
+            list2=[{
+                'forum_id': contributor.forum_id,
+                'username': contributor.user.username,
+            }],
+        )
+        self.assertListEqual(list1=record['tags'], list2=['test_tag'])
+        self.assertListEqual(list1=record['games'], list2=[game.pk])
+        self.assertListEqual(
+            list1=[item['version'] for item in record['releases']],
+            list2=['1.0.1', '1.0.0'],
+        )
+        self.assertEqual(
+            first=record['releases'][0]['zip_file'],
+            second=release.get_absolute_url(),
+        )
+        self.assertEqual(
+            first=record['releases'][1]['zip_file'],
+            second=old_release.get_absolute_url(),
+        )
+        self.assertEqual(
+            first=record['releases'][0]['notes'],
+            second='New release',
+        )
+        self.assertListEqual(
+            list1=record['releases'][0]['package_requirements'],
+            list2=[{
+                'name': package.name,
+                'slug': package.slug,
+                'version': '>=1.0',
+                'optional': False,
+            }],
+        )
+        self.assertListEqual(
+            list1=record['releases'][1]['package_requirements'],
+            list2=[],
+        )
+        self.assertEqual(first=records[2]['plugin'], second=plugin.pk)
+        self.assertListEqual(list1=records[2]['releases'], list2=[])
+
+    def test_iter_export_lines_queries(self):
+        for index in range(4):
+            plugin = PluginFactory(basename=f'test_plugin_{index}')
+            PluginReleaseFactory(
+                plugin=plugin,
+                version='1.0.0',
+                zip_file=f'releases/plugins/{plugin.slug}/release.zip',
+            )
+            PluginContributorFactory(plugin=plugin)
+            sub_plugin = SubPluginFactory(plugin=plugin)
+            SubPluginReleaseFactory(
+                sub_plugin=sub_plugin,
+                version='1.0.0',
+                zip_file=f'releases/sub-plugins/{sub_plugin.pk}/release.zip',
+            )
+
+        # Verify that the queries do not grow with the projects in a chunk
+        with self.assertNumQueries(19):
+            records = self.get_records(chunk_size=10)
+        self.assertEqual(first=len(records), second=8)
+
+        # Verify that each chunk prefetches its own related objects
+        with self.assertNumQueries(35):
+            records = self.get_records(chunk_size=2)
+        self.assertEqual(first=len(records), second=8)
@@ -2,13 +2,16 @@
 # IMPORTS
 # =============================================================================
 # Python
+from datetime import timedelta
+from hashlib import sha256
 from random import sample
 from unittest import mock
 from zipfile import BadZipFile
 
 # Django
-from django.core.exceptions import ValidationError
+from django.core.exceptions import SuspiciousFileOperation, ValidationError
 from django.test import TestCase
+from django.utils.timezone import now
 
 # App
 from project_manager.constants import (
@@ -16,16 +19,59 @@ from project_manager.constants import (
     CANNOT_START_WITH,
 )
 from project_manager.helpers import (
+    AllowedPathTrie,
     ProjectZipFile,
     find_image_number,
+    get_current_release_prefetch,
+    get_file_hash,
+    get_relation_count_subquery,
+    get_release_project_field,
+    get_requirement_prefetches,
     handle_project_logo_upload,
+    handle_release_job_upload,
     handle_release_zip_file_upload,
 )
+from project_manager.packages.models import PackageRelease
+from project_manager.plugins.models import Plugin, PluginRelease
+from project_manager.sub_plugins.models import SubPluginRelease
+from test_utils.factories.plugins import (
+    PluginContributorFactory,
+    PluginFactory,
+    PluginReleaseFactory,
+    PluginReleasePackageRequirementFactory,
+)
+from test_utils.factories.users import ForumUserFactory
+from users.models import ForumUser
 
 
 # =============================================================================
 # TEST CASES
 # =============================================================================
+class AllowedPathTrieTestCase(TestCase):
+    def test_get_allowed_extensions(self):
+        obj = AllowedPathTrie([
+            ('addons/source-python/packages/custom/', ['py', 'json']),
+            ('addons/source-python/packages/custom/test/', ['txt']),
+            ('addons/source-python/data/custom/', ['ini']),
+            ('sound/source-python/', ['mp3']),
+            ('sound/', ['wav']),
+        ])
+        for path, expected in (
+            ('addons/source-python/packages/custom/test.py', {'py', 'json'}),
+            ('addons/source-python/packages/custom/test/a.py', {'py', 'json'}),
+            ('addons/source-python/data/custom/test/a.ini', {'ini'}),
+            ('sound/source-python/test/a.mp3', {'mp3'}),
+            ('sound/other/a.wav', {'wav'}),
+            ('addons/source-python/packages/test.py', None),
+            ('addons/source-python/packages/customized/a.py', None),
+            ('test.py', None),
+        ):
+            self.assertEqual(
+                first=obj.get_allowed_extensions(path),
+                second=expected,
+            )
+
+
 class ProjectZipFileTestCase(TestCase):
 
     def setUp(self) -> None:
@@ -39,7 +85,7 @@ class ProjectZipFileTestCase(TestCase):
         mock.patch.stopall()
 
     def test_get_file_list(self):
-        zip_obj = self.mock_zip_file.return_value.__enter__.return_value
+        zip_obj = self.mock_zip_file.return_value
         name_list = zip_obj.namelist.return_value = (
             'addons/',
             'addons/source-python/',
@@ -81,6 +127,66 @@ class ProjectZipFileTestCase(TestCase):
             second='Given file is not a valid zip file.',
         )
 
+    def test_open_zip_file(self):
+        zip_file = 'test.zip'
+        obj = ProjectZipFile(zip_file)
+        self.mock_zip_file.assert_called_once_with(zip_file)
+        self.assertEqual(
+            first=obj.zip_obj,
+            second=self.mock_zip_file.return_value,
+        )
+
+        self.mock_zip_file.side_effect = BadZipFile()
+        with self.assertRaises(ValidationError) as context:
+            ProjectZipFile(zip_file)
+
+        self.assertDictEqual(
+            d1=context.exception.message_dict,
+            d2={'zip_file': ['Given file is not a valid zip file.']},
+        )
+
+    def test_close(self):
+        with ProjectZipFile('test.zip') as obj:
+            self.mock_zip_file.return_value.close.assert_not_called()
+
+        self.assertIsInstance(obj=obj, cls=ProjectZipFile)
+        self.mock_zip_file.return_value.close.assert_called_once_with()
+
+    def test_get_allowed_paths(self):
+        class TestProjectZipFile(ProjectZipFile):
+            file_types = {
+                'addons/{self.basename}/': ['py'],
+                'resource/': ['txt'],
+            }
+
+        obj = TestProjectZipFile('')
+        obj.basename = 'test'
+        self.assertListEqual(
+            list1=obj.get_allowed_paths(),
+            list2=[
+                ('addons/test/', ['py']),
+                ('resource/', ['txt']),
+            ],
+        )
+
+    def test_read_requirements_file(self):
+        zip_obj = self.mock_zip_file.return_value
+        zip_obj.open.return_value.__enter__.return_value.read.return_value = (
+            '{"pypi": []}'
+        )
+        obj = ProjectZipFile('')
+        self.assertDictEqual(
+            d1=obj.read_requirements_file(requirement_path='requirements.json'),
+            d2={'pypi': []},
+        )
+        zip_obj.open.assert_called_once_with('requirements.json')
+
+        zip_obj.open.side_effect = KeyError()
+        self.assertIsNone(
+            obj=obj.read_requirements_file(requirement_path='missing.json'),
+        )
+        self.mock_zip_file.assert_called_once_with('')
+
     def test_project_type_required(self):
         obj = ProjectZipFile('')
         with self.assertRaises(NotImplementedError) as context:
@@ -230,6 +336,146 @@ class CommonHelperFunctionsTestCase(TestCase):
             second=f'{max_value + 1:04}',
         )
 
+    def test_get_current_release_prefetch(self):
+        created = now()
+        current_releases = {}
+        for plugin in (PluginFactory(), PluginFactory()):
+            for offset in range(3):
+                current_releases[plugin.pk] = PluginReleaseFactory(
+                    plugin=plugin,
+                    created=created + timedelta(minutes=offset),
+                )
+        PluginFactory()
+
+        with self.assertNumQueries(2):
+            plugins = list(
+                Plugin.objects.prefetch_related(
+                    get_current_release_prefetch(release_model=PluginRelease),
+                )
+            )
+        for plugin in plugins:
+            self.assertListEqual(
+                list1=plugin.current_releases,
+                list2=(
+                    [current_releases[plugin.pk]]
+                    if plugin.pk in current_releases else []
+                ),
+            )
+
+    def test_get_file_hash(self):
+        field_file = mock.Mock(_committed=True)
+        field_file.chunks.return_value = [b'test', b'data']
+        self.assertEqual(
+            first=get_file_hash(field_file),
+            second=sha256(b'testdata').hexdigest(),
+        )
+        field_file.close.assert_called_once_with()
+
+    def test_get_file_hash_uncommitted(self):
+        field_file = mock.Mock(_committed=False)
+        field_file.chunks.return_value = [b'test']
+        self.assertEqual(
+            first=get_file_hash(field_file),
+            second=sha256(b'test').hexdigest(),
+        )
+        field_file.close.assert_not_called()
+
+    def test_get_file_hash_missing_file(self):
+        field_file = mock.Mock(_committed=True)
+        field_file.chunks.side_effect = FileNotFoundError
+        self.assertEqual(
+            first=get_file_hash(field_file),
+            second='',
+        )
+
+    def test_get_file_hash_outside_storage(self):
+        field_file = mock.Mock(_committed=True)
+        field_file.chunks.side_effect = SuspiciousFileOperation
+        self.assertEqual(
+            first=get_file_hash(field_file),
+            second='',
+        )
+
+    def test_get_relation_count_subquery(self):
+        owner = ForumUserFactory()
+        plugin = PluginFactory(owner=owner)
+        PluginFactory(owner=owner)
+        PluginContributorFactory(plugin=plugin, user=owner)
+        PluginContributorFactory(plugin=plugin)
+        users = ForumUser.objects.annotate(
+            plugin_count=get_relation_count_subquery(
+                model=ForumUser,
+                relation_name='plugins',
+            ),
+            plugin_contribution_count=get_relation_count_subquery(
+                model=ForumUser,
+                relation_name='plugin_contributions',
+            ),
+        )
+        self.assertNotIn(member='JOIN', container=str(users.query))
+        self.assertDictEqual(
+            d1={
+                user.pk: (user.plugin_count, user.plugin_contribution_count)
+                for user in users
+            },
+            d2={
+                user.pk: (
+                    user.plugins.count(),
+                    user.plugin_contributions.count(),
+                ) for user in ForumUser.objects.all()
+            },
+        )
+        self.assertEqual(
+            first=users.get(pk=owner.pk).plugin_count,
+            second=2,
+        )
+
+    def test_get_release_project_field(self):
+        for release_model, field_name in (
+            (PackageRelease, 'package'),
+            (PluginRelease, 'plugin'),
+            (SubPluginRelease, 'sub_plugin'),
+        ):
+            with self.subTest(release_model=release_model):
+                self.assertEqual(
+                    first=get_release_project_field(release_model),
+                    second=field_name,
+                )
+
+    def test_get_requirement_prefetches(self):
+        prefetches = get_requirement_prefetches(
+            release_model=SubPluginRelease,
+            prefix='current_releases__',
+        )
+        self.assertListEqual(
+            list1=[prefetch.prefetch_to for prefetch in prefetches],
+            list2=[
+                'current_releases__subpluginreleasepackagerequirement_set',
+                'current_releases__subpluginreleasedownloadrequirement_set',
+                'current_releases__subpluginreleasepypirequirement_set',
+                'current_releases__'
+                'subpluginreleaseversioncontrolrequirement_set',
+            ],
+        )
+        self.assertEqual(
+            first=prefetches[0].queryset.query.select_related,
+            second={'package_requirement': {}},
+        )
+
+        release = PluginReleaseFactory()
+        for _ in range(3):
+            PluginReleasePackageRequirementFactory(plugin_release=release)
+        with self.assertNumQueries(5):
+            release = PluginRelease.objects.prefetch_related(
+                *get_requirement_prefetches(release_model=PluginRelease),
+            ).get(pk=release.pk)
+        with self.assertNumQueries(0):
+            names = [
+                requirement.package_requirement.name for requirement in
+                release.pluginreleasepackagerequirement_set.all()
+            ]
+        self.assertListEqual(list1=names, list2=sorted(names))
+
     @staticmethod
     def test_handle_project_logo_upload():
         obj = mock.Mock()
@@ -240,6 +486,16 @@ class CommonHelperFunctionsTestCase(TestCase):
         )
         obj.handle_logo_upload.assert_called_once_with(filename)
 
+    def test_handle_release_job_upload(self):
+        obj = mock.Mock(pk='abc')
+        self.assertEqual(
+            first=handle_release_job_upload(
+                instance=obj,
+                filename='test.zip',
+            ),
+            second='release-jobs/abc.zip',
+        )
+
     @staticmethod
     def test_handle_release_zip_file_upload():
         obj = mock.Mock()
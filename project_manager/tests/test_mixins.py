@@ -43,29 +43,3 @@ class DownloadMixinTestCase(TestCase):
                 f'"base_url" attribute.'
             ),
         )
-
-    def test_project_model_required(self):
-        obj = DownloadMixin()
-        with self.assertRaises(NotImplementedError) as context:
-            _ = obj.project_model
-
-        self.assertEqual(
-            first=str(context.exception),
-            second=(
-                f'Class "{obj.__class__.__name__}" must implement a '
-                f'"project_model" attribute.'
-            ),
-        )
-
-    def test_model_kwarg_required(self):
-        obj = DownloadMixin()
-        with self.assertRaises(NotImplementedError) as context:
-            _ = obj.model_kwarg
-
-        self.assertEqual(
-            first=str(context.exception),
-            second=(
-                f'Class "{obj.__class__.__name__}" must implement a '
-                f'"model_kwarg" attribute.'
-            ),
-        )
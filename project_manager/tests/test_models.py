@@ -10,10 +10,14 @@ from django.test import TestCase
 
 # Third Party Django
 from embed_video.fields import EmbedVideoField
-from model_utils.fields import AutoCreatedField
+from model_utils.fields import AutoCreatedField, AutoLastModifiedField
 from precise_bbcode.fields import BBCodeTextField
 
 # App
+from project_manager.downloads.constants import (
+    DOWNLOAD_PERIOD_DAY,
+    DOWNLOAD_PERIODS,
+)
 from project_manager.constants import (
     PROJECT_CONFIGURATION_MAX_LENGTH,
     PROJECT_DESCRIPTION_MAX_LENGTH,
@@ -24,12 +28,19 @@ from project_manager.constants import (
 )
 from project_manager.helpers import (
     handle_project_logo_upload,
+    handle_release_job_upload,
     handle_release_zip_file_upload,
 )
 from project_manager.models.abstract import (
     AbstractUUIDPrimaryKeyModel,
     Project,
     ProjectRelease,
+    ProjectReleaseDownloadStatistic,
+    ProjectReleaseJob,
+)
+from project_manager.release_jobs.constants import (
+    RELEASE_JOB_PENDING,
+    RELEASE_JOB_STATUSES,
 )
 from project_manager.validators import version_validator
 
@@ -307,6 +318,7 @@ class ProjectReleaseTestCase(TestCase):
         )
         self.assertFalse(expr=field.blank)
         self.assertFalse(expr=field.null)
+        self.assertTrue(expr=field.db_index)
 
     def test_download_count_field(self):
         field = ProjectRelease._meta.get_field('download_count')
@@ -321,6 +333,19 @@ class ProjectReleaseTestCase(TestCase):
         self.assertFalse(expr=field.blank)
         self.assertFalse(expr=field.null)
 
+    def test_file_hash_field(self):
+        field = ProjectRelease._meta.get_field('file_hash')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.CharField,
+        )
+        self.assertEqual(
+            first=field.max_length,
+            second=64,
+        )
+        self.assertTrue(expr=field.blank)
+        self.assertFalse(expr=field.editable)
+
     def test_created_field(self):
         field = ProjectRelease._meta.get_field('created')
         self.assertIsInstance(
@@ -375,3 +400,180 @@ class ProjectReleaseTestCase(TestCase):
         self.assertTrue(
             expr=ProjectRelease._meta.abstract
         )
+
+
+class ProjectReleaseDownloadStatisticTestCase(TestCase):
+    def test_model_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(ProjectReleaseDownloadStatistic, models.Model),
+        )
+
+    def test_period_field(self):
+        field = ProjectReleaseDownloadStatistic._meta.get_field('period')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.CharField,
+        )
+        self.assertEqual(
+            first=field.max_length,
+            second=8,
+        )
+        self.assertTupleEqual(
+            tuple1=tuple(field.choices),
+            tuple2=DOWNLOAD_PERIODS,
+        )
+        self.assertEqual(
+            first=field.default,
+            second=DOWNLOAD_PERIOD_DAY,
+        )
+
+    def test_date_field(self):
+        field = ProjectReleaseDownloadStatistic._meta.get_field('date')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.DateField,
+        )
+        self.assertEqual(
+            first=field.help_text,
+            second='The first day of the period.',
+        )
+        self.assertFalse(expr=field.blank)
+        self.assertFalse(expr=field.null)
+
+    def test_download_count_field(self):
+        field = ProjectReleaseDownloadStatistic._meta.get_field(
+            'download_count'
+        )
+        self.assertIsInstance(
+            obj=field,
+            cls=models.PositiveIntegerField,
+        )
+        self.assertEqual(
+            first=field.default,
+            second=0,
+        )
+
+    def test_meta_class(self):
+        self.assertTrue(
+            expr=ProjectReleaseDownloadStatistic._meta.abstract
+        )
+
+
+class ProjectReleaseJobTestCase(TestCase):
+    def test_model_inheritance(self):
+        self.assertTrue(
+            expr=issubclass(ProjectReleaseJob, AbstractUUIDPrimaryKeyModel),
+        )
+
+    def test_version_field(self):
+        field = ProjectReleaseJob._meta.get_field('version')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.CharField,
+        )
+        self.assertEqual(
+            first=field.max_length,
+            second=RELEASE_VERSION_MAX_LENGTH,
+        )
+        self.assertIn(
+            member=version_validator,
+            container=field.validators,
+        )
+
+    def test_notes_field(self):
+        field = ProjectReleaseJob._meta.get_field('notes')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.TextField,
+        )
+        self.assertEqual(
+            first=field.max_length,
+            second=RELEASE_NOTES_MAX_LENGTH,
+        )
+        self.assertTrue(expr=field.blank)
+        self.assertEqual(
+            first=field.default,
+            second='',
+        )
+
+    def test_zip_file_field(self):
+        field = ProjectReleaseJob._meta.get_field('zip_file')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.FileField,
+        )
+        self.assertEqual(
+            first=field.upload_to,
+            second=handle_release_job_upload,
+        )
+        self.assertTrue(expr=field.blank)
+
+    def test_status_field(self):
+        field = ProjectReleaseJob._meta.get_field('status')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.CharField,
+        )
+        self.assertTupleEqual(
+            tuple1=tuple(field.choices),
+            tuple2=RELEASE_JOB_STATUSES,
+        )
+        self.assertEqual(
+            first=field.default,
+            second=RELEASE_JOB_PENDING,
+        )
+
+    def test_progress_field(self):
+        field = ProjectReleaseJob._meta.get_field('progress')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.PositiveSmallIntegerField,
+        )
+        self.assertEqual(
+            first=field.default,
+            second=0,
+        )
+
+    def test_errors_field(self):
+        field = ProjectReleaseJob._meta.get_field('errors')
+        self.assertIsInstance(
+            obj=field,
+            cls=models.JSONField,
+        )
+        self.assertEqual(
+            first=field.default,
+            second=dict,
+        )
+        self.assertTrue(expr=field.blank)
+
+    def test_created_field(self):
+        field = ProjectReleaseJob._meta.get_field('created')
+        self.assertIsInstance(
+            obj=field,
+            cls=AutoCreatedField,
+        )
+
+    def test_updated_field(self):
+        field = ProjectReleaseJob._meta.get_field('updated')
+        self.assertIsInstance(
+            obj=field,
+            cls=AutoLastModifiedField,
+        )
+
+    def test_project_required(self):
+        obj = ''
+        with self.assertRaises(NotImplementedError) as context:
+            ProjectReleaseJob.project.fget(obj)
+
+        self.assertEqual(
+            first=str(context.exception),
+            second=(
+                f'Class "{obj.__class__.__name__}" must implement a "project"'
+                f' property.'
+            ),
+        )
+
+    def test_meta_class(self):
+        self.assertTrue(
+            expr=ProjectReleaseJob._meta.abstract
+        )
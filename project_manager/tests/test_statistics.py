@@ -0,0 +1,196 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from datetime import timedelta
+
+# Django
+from django.test import TestCase
+from django.utils.timezone import localdate
+
+# App
+from project_manager.downloads.constants import (
+    DOWNLOAD_PERIOD_MONTH,
+    RECENT_DOWNLOAD_DAYS,
+)
+from project_manager.downloads.counters import DownloadCounter
+from project_manager.models import StatisticsSnapshot
+from project_manager.statistics import (
+    get_active_user_count,
+    get_recent_downloads,
+    get_statistics_snapshot,
+    recompute_statistics,
+)
+from test_utils.factories.packages import (
+    PackageReleaseDownloadStatisticFactory,
+    PackageReleaseFactory,
+)
+from test_utils.factories.plugins import (
+    PluginContributorFactory,
+    PluginFactory,
+    PluginReleaseDownloadStatisticFactory,
+    PluginReleaseFactory,
+)
+from test_utils.factories.sub_plugins import (
+    SubPluginFactory,
+    SubPluginReleaseDownloadStatisticFactory,
+    SubPluginReleaseFactory,
+)
+from test_utils.factories.users import ForumUserFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+class StatisticsSnapshotTestCase(TestCase):
+
+    def assert_snapshot_matches(self):
+        snapshot = get_statistics_snapshot()
+        fields = [
+            field.name for field in StatisticsSnapshot._meta.fields
+            if field.name not in ('id', 'updated')
+        ]
+        expected = recompute_statistics()
+        self.assertDictEqual(
+            d1={field: getattr(snapshot, field) for field in fields},
+            d2={field: getattr(expected, field) for field in fields},
+        )
+        return snapshot
+
+    def test_get_statistics_snapshot(self):
+        self.assertFalse(expr=StatisticsSnapshot.objects.exists())
+        PluginReleaseFactory(download_count=5)
+        snapshot = get_statistics_snapshot()
+        self.assertEqual(first=snapshot.pk, second=1)
+        self.assertEqual(first=snapshot.plugin_count, second=1)
+        self.assertEqual(first=snapshot.plugin_downloads, second=5)
+        self.assertEqual(first=snapshot.recent_date, second=localdate())
+
+        with self.assertNumQueries(1):
+            get_statistics_snapshot()
+
+        # Verify that recent downloads counted on another day are recounted
+        StatisticsSnapshot.objects.update(
+            recent_date=localdate() - timedelta(days=1),
+            recent_downloads=10,
+        )
+        PluginReleaseDownloadStatisticFactory(download_count=3)
+        snapshot = get_statistics_snapshot()
+        self.assertEqual(first=snapshot.recent_downloads, second=3)
+        self.assertEqual(first=snapshot.recent_date, second=localdate())
+
+    def test_release_signals(self):
+        get_statistics_snapshot()
+        plugin = PluginFactory()
+        release_1 = PluginReleaseFactory(plugin=plugin, download_count=2)
+        release_2 = PluginReleaseFactory(plugin=plugin, download_count=3)
+        PackageReleaseFactory(download_count=7)
+        snapshot = self.assert_snapshot_matches()
+        self.assertEqual(first=snapshot.plugin_count, second=1)
+        self.assertEqual(first=snapshot.plugin_downloads, second=5)
+        self.assertEqual(first=snapshot.package_count, second=1)
+
+        # Verify that the project is counted until its last release is gone
+        release_1.delete()
+        snapshot = self.assert_snapshot_matches()
+        self.assertEqual(first=snapshot.plugin_count, second=1)
+        self.assertEqual(first=snapshot.plugin_downloads, second=3)
+        release_2.delete()
+        snapshot = self.assert_snapshot_matches()
+        self.assertEqual(first=snapshot.plugin_count, second=0)
+
+        # Verify that deleting a project removes its releases' totals
+        sub_plugin = SubPluginFactory()
+        SubPluginReleaseFactory(sub_plugin=sub_plugin, download_count=4)
+        self.assertEqual(
+            first=self.assert_snapshot_matches().sub_plugin_downloads,
+            second=4,
+        )
+        sub_plugin.plugin.delete()
+        snapshot = self.assert_snapshot_matches()
+        self.assertEqual(first=snapshot.sub_plugin_count, second=0)
+        self.assertEqual(first=snapshot.sub_plugin_downloads, second=0)
+
+    def test_release_signals_batch_delete(self):
+        get_statistics_snapshot()
+        plugin = PluginFactory()
+        for download_count in (1, 2, 3):
+            PluginReleaseFactory(plugin=plugin, download_count=download_count)
+        other_plugin = PluginFactory()
+        PluginReleaseFactory(plugin=other_plugin, download_count=4)
+        PluginReleaseFactory(plugin=other_plugin, download_count=5)
+        self.assertEqual(
+            first=self.assert_snapshot_matches().plugin_count,
+            second=2,
+        )
+
+        # Verify that a project's releases deleted together count it once
+        plugin.delete()
+        snapshot = get_statistics_snapshot()
+        self.assertEqual(first=snapshot.plugin_count, second=1)
+        self.assertEqual(first=snapshot.plugin_downloads, second=9)
+        self.assert_snapshot_matches()
+
+        other_plugin.releases.all().delete()
+        snapshot = get_statistics_snapshot()
+        self.assertEqual(first=snapshot.plugin_count, second=0)
+        self.assertEqual(first=snapshot.plugin_downloads, second=0)
+
+    def test_user_signals(self):
+        get_statistics_snapshot()
+        owner = ForumUserFactory()
+        contributor = ForumUserFactory()
+        ForumUserFactory()
+        plugin = PluginFactory(owner=owner)
+        PluginContributorFactory(plugin=plugin, user=contributor)
+        self.assertEqual(first=self.assert_snapshot_matches().users, second=2)
+
+        owner.delete()
+        self.assertEqual(first=self.assert_snapshot_matches().users, second=1)
+
+    def test_download_counter(self):
+        release = PluginReleaseFactory()
+        sub_plugin_release = SubPluginReleaseFactory()
+        get_statistics_snapshot()
+        counter = DownloadCounter()
+        for _ in range(3):
+            counter.increment(release=release)
+        counter.increment(release=sub_plugin_release)
+        counter.flush()
+        snapshot = self.assert_snapshot_matches()
+        self.assertEqual(first=snapshot.plugin_downloads, second=3)
+        self.assertEqual(first=snapshot.sub_plugin_downloads, second=1)
+        self.assertEqual(first=snapshot.recent_downloads, second=4)
+
+    def test_get_active_user_count(self):
+        user = ForumUserFactory()
+        PluginFactory(owner=user)
+        SubPluginFactory(owner=user)
+        PluginContributorFactory(user=user)
+        PluginFactory(owner=None)
+        self.assertEqual(first=get_active_user_count(), second=3)
+
+    def test_get_recent_downloads(self):
+        today = localdate()
+        PackageReleaseDownloadStatisticFactory(
+            date=today,
+            download_count=3,
+        )
+        PluginReleaseDownloadStatisticFactory(
+            date=today - timedelta(days=RECENT_DOWNLOAD_DAYS - 1),
+            download_count=5,
+        )
+        SubPluginReleaseDownloadStatisticFactory(
+            date=today,
+            download_count=7,
+        )
+        PluginReleaseDownloadStatisticFactory(
+            date=today - timedelta(days=RECENT_DOWNLOAD_DAYS),
+            download_count=11,
+        )
+        PluginReleaseDownloadStatisticFactory(
+            period=DOWNLOAD_PERIOD_MONTH,
+            date=today.replace(day=1),
+            download_count=13,
+        )
+        self.assertEqual(first=get_recent_downloads(), second=15)
@@ -0,0 +1,307 @@
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Python
+from datetime import timedelta
+from importlib import import_module
+
+# Django
+from django.apps import apps
+from django.test import TestCase, override_settings
+from django.utils.timezone import now
+
+# App
+from project_manager.models import SyncChange
+from project_manager.sync import (
+    get_sync_changes,
+    get_sync_start,
+)
+from test_utils.factories.games import GameFactory
+from test_utils.factories.plugins import (
+    PluginFactory,
+    PluginGameFactory,
+    PluginReleaseFactory,
+    PluginTagFactory,
+)
+from test_utils.factories.sub_plugins import (
+    SubPluginFactory,
+    SubPluginReleaseFactory,
+)
+from test_utils.factories.tags import TagFactory
+
+
+# =============================================================================
+# TEST CASES
+# =============================================================================
+@override_settings(SYNC_CHANGE_COMMIT_LAG=0)
+class SyncChangesTestCase(TestCase):
+
+    def get_latest_token(self):
+        return SyncChange.objects.order_by('-pk').values_list(
+            'pk',
+            flat=True,
+        ).first() or 0
+
+    def test_record_changes(self):
+        plugin = PluginFactory(basename='test_plugin')
+        PluginReleaseFactory(plugin=plugin, version='1.0.0')
+        PluginTagFactory(plugin=plugin, tag=TagFactory(name='test_tag'))
+        PluginGameFactory(plugin=plugin, game=GameFactory(basename='csgo'))
+        sub_plugin = SubPluginFactory(plugin=plugin, basename='test_sub')
+        self.assertListEqual(
+            list1=list(
+                SyncChange.objects.order_by('pk').values_list(
+                    'object_type',
+                    'project_type',
+                    'project',
+                    'key',
+                    'deleted',
+                )
+            ),
+            list2=[
+                ('project', 'plugin', plugin.pk, '', False),
+                ('release', 'plugin', plugin.pk, '1.0.0', False),
+                ('tag', 'plugin', plugin.pk, 'test_tag', False),
+                ('game', 'plugin', plugin.pk, 'csgo', False),
+                ('project', 'sub-plugin', sub_plugin.pk, '', False),
+            ],
+        )
+
+        token = self.get_latest_token()
+        plugin_pk = plugin.pk
+        plugin.delete()
+        self.assertTrue(
+            expr=SyncChange.objects.filter(
+                pk__gt=token,
+                object_type='project',
+                project=plugin_pk,
+                deleted=True,
+            ).exists(),
+        )
+
+    def test_get_sync_changes(self):
+        plugin = PluginFactory(basename='test_plugin')
+        release = PluginReleaseFactory(
+            plugin=plugin,
+            version='1.0.0',
+            zip_file='/media/test-plugin-v1.0.0.zip',
+        )
+        token = self.get_latest_token()
+        changes = get_sync_changes(start=token)
+        self.assertDictEqual(
+            d1=changes,
+            d2={
+                'token': str(token),
+                'more': False,
+                'projects': [],
+                'releases': [],
+                'tags': [],
+                'games': [],
+                'deleted': [],
+            },
+        )
+
+        # Verify that only the latest state of each object is returned
+        tag = PluginTagFactory(plugin=plugin, tag=TagFactory(name='test_tag'))
+        PluginGameFactory(plugin=plugin, game=GameFactory(basename='csgo'))
+        new_release = PluginReleaseFactory(
+            plugin=plugin,
+            version='1.0.1',
+            zip_file='/media/test-plugin-v1.0.1.zip',
+        )
+        new_release.notes = 'Updated notes'
+        new_release.save()
+        release.delete()
+        tag.delete()
+        plugin.refresh_from_db()
+
+        changes = get_sync_changes(start=token)
+        self.assertEqual(
+            first=changes['token'],
+            second=str(self.get_latest_token()),
+        )
+        self.assertListEqual(
+            list1=changes['projects'],
+            list2=[{
+                'project_type': 'plugin',
+                'project': plugin.pk,
+                'name': plugin.name,
+                'basename': plugin.basename,
+                'current_version': '1.0.1',
+                'updated': plugin.updated,
+            }],
+        )
+        self.assertListEqual(
+            list1=changes['releases'],
+            list2=[{
+                'project_type': 'plugin',
+                'project': plugin.pk,
+                'version': '1.0.1',
+                'created': new_release.created,
+                'file_hash': new_release.file_hash,
+                'url': new_release.get_absolute_url(),
+            }],
+        )
+        self.assertListEqual(list1=changes['tags'], list2=[])
+        self.assertListEqual(
+            list1=changes['games'],
+            list2=[{
+                'project_type': 'plugin',
+                'project': plugin.pk,
+                'game': 'csgo',
+            }],
+        )
+        self.assertListEqual(
+            list1=changes['deleted'],
+            list2=[
+                {
+                    'object_type': 'tag',
+                    'project_type': 'plugin',
+                    'project': plugin.pk,
+                    'key': 'test_tag',
+                },
+                {
+                    'object_type': 'release',
+                    'project_type': 'plugin',
+                    'project': plugin.pk,
+                    'key': '1.0.0',
+                },
+            ],
+        )
+
+    def test_get_sync_changes_deleted_project(self):
+        plugin = PluginFactory(basename='test_plugin')
+        sub_plugin = SubPluginFactory(plugin=plugin, basename='test_sub')
+        SubPluginReleaseFactory(sub_plugin=sub_plugin, version='1.0.0')
+        plugin_pk, sub_plugin_pk = plugin.pk, sub_plugin.pk
+        token = self.get_latest_token()
+
+        # Verify that the project's tombstone covers its related objects
+        plugin.delete()
+        changes = get_sync_changes(start=token)
+        self.assertListEqual(
+            list1=changes['deleted'],
+            list2=[
+                {
+                    'object_type': 'project',
+                    'project_type': 'sub-plugin',
+                    'project': sub_plugin_pk,
+                    'key': '',
+                },
+                {
+                    'object_type': 'project',
+                    'project_type': 'plugin',
+                    'project': plugin_pk,
+                    'key': '',
+                },
+            ],
+        )
+        self.assertListEqual(list1=changes['projects'], list2=[])
+        self.assertListEqual(list1=changes['releases'], list2=[])
+
+    def test_get_sync_changes_queries(self):
+        plugin = PluginFactory(basename='test_plugin')
+        for index in range(3):
+            sub_plugin = SubPluginFactory(
+                plugin=plugin,
+                basename=f'test_sub_{index}',
+            )
+            SubPluginReleaseFactory(
+                sub_plugin=sub_plugin,
+                version='1.0.0',
+                zip_file=f'/media/{sub_plugin.slug}-v1.0.0.zip',
+            )
+
+        # Verify that the queries do not grow with the releases
+        with self.assertNumQueries(4):
+            changes = get_sync_changes(start=0)
+        self.assertEqual(first=len(changes['releases']), second=3)
+
+    def test_get_sync_changes_limit(self):
+        plugins = [
+            PluginFactory(basename=f'test_plugin_{index}')
+            for index in range(3)
+        ]
+        changes = get_sync_changes(start=0, limit=2)
+        self.assertTrue(expr=changes['more'])
+        self.assertListEqual(
+            list1=[project['project'] for project in changes['projects']],
+            list2=sorted(plugin.pk for plugin in plugins[:2]),
+        )
+
+        changes = get_sync_changes(start=int(changes['token']), limit=2)
+        self.assertFalse(expr=changes['more'])
+        self.assertListEqual(
+            list1=[project['project'] for project in changes['projects']],
+            list2=[plugins[2].pk],
+        )
+
+    @override_settings(SYNC_CHANGE_COMMIT_LAG=60)
+    def test_get_sync_changes_commit_lag(self):
+        plugin_1 = PluginFactory(basename='test_plugin_1')
+        SyncChange.objects.update(created=now() - timedelta(minutes=5))
+        settled_token = self.get_latest_token()
+        PluginFactory(basename='test_plugin_2')
+
+        # Verify that changes are not returned until they are settled
+        changes = get_sync_changes(start=0)
+        self.assertEqual(first=changes['token'], second=str(settled_token))
+        self.assertFalse(expr=changes['more'])
+        self.assertListEqual(
+            list1=[project['project'] for project in changes['projects']],
+            list2=[plugin_1.pk],
+        )
+        self.assertEqual(
+            first=get_sync_start(now().isoformat()),
+            second=settled_token,
+        )
+
+        # Verify that older changes after an unsettled one are not returned
+        SyncChange.objects.filter(pk=settled_token).update(created=now())
+        changes = get_sync_changes(start=0)
+        self.assertLess(a=int(changes['token']), b=settled_token)
+
+    def test_get_sync_start(self):
+        PluginFactory(basename='test_plugin')
+        token = self.get_latest_token()
+        self.assertEqual(first=get_sync_start(str(token)), second=token)
+        self.assertEqual(
+            first=get_sync_start((now() + timedelta(minutes=1)).isoformat()),
+            second=token,
+        )
+        self.assertEqual(
+            first=get_sync_start(
+                (now() - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%S'),
+            ),
+            second=0,
+        )
+        for value in ('invalid', '2023-13-45T00:00:00', '-1'):
+            self.assertIsNone(obj=get_sync_start(value))
+
+    def test_record_existing_changes(self):
+        plugin = PluginFactory(
+            basename='test_plugin',
+            updated=now() - timedelta(days=2),
+        )
+        release = PluginReleaseFactory(plugin=plugin, version='1.0.0')
+        PluginTagFactory(plugin=plugin, tag=TagFactory(name='test_tag'))
+        plugin.refresh_from_db()
+        SyncChange.objects.all().delete()
+
+        import_module(
+            'project_manager.migrations.0013_sync_change',
+        ).record_existing_changes(apps=apps, schema_editor=None)
+        self.assertListEqual(
+            list1=list(
+                SyncChange.objects.order_by('pk').values_list(
+                    'created',
+                    'object_type',
+                    'key',
+                )
+            ),
+            list2=[
+                (plugin.updated, 'project', ''),
+                (plugin.updated, 'tag', 'test_tag'),
+                (release.created, 'release', '1.0.0'),
+            ],
+        )
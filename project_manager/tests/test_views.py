@@ -13,6 +13,7 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 
 # App
+from project_manager.statistics import get_statistics_snapshot
 from project_manager.views import StatisticsView
 from test_utils.factories.packages import (
     PackageContributorFactory,
@@ -59,6 +60,8 @@ class StatisticsViewTestCase(TestCase):
         )
 
     def test_get(self):
+        # Build the snapshot first so the data below is added incrementally
+        get_statistics_snapshot()
         contributing_users = set()
         total_users = randint(20, 30)
         user_list = [ForumUserFactory() for _ in range(total_users)]
@@ -140,7 +143,8 @@ class StatisticsViewTestCase(TestCase):
                             download_count=download_count,
                         )
 
-        response = self.client.get(path=self.api_path)
+        with self.assertNumQueries(1):
+            response = self.client.get(path=self.api_path)
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -166,7 +170,8 @@ class StatisticsViewTestCase(TestCase):
                     package_download_count,
                     plugin_download_count,
                     sub_plugin_download_count,
-                ])
+                ]),
+                'recent_downloads': 0,
             }
         )
 
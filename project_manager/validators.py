@@ -4,10 +4,15 @@
 # IMPORTS
 # =============================================================================
 # Django
+from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 
+# Third Party Python
+from packaging.specifiers import InvalidSpecifier
+
 # App
 from project_manager.constants import RELEASE_VERSION_REGEX
+from project_manager.packages.versions import get_version_specifier
 
 
 # =============================================================================
@@ -15,6 +20,7 @@ from project_manager.constants import RELEASE_VERSION_REGEX
 # =============================================================================
 __all__ = (
     'basename_validator',
+    'specifier_validator',
     'version_validator',
 )
 
@@ -33,3 +39,17 @@ basename_validator = RegexValidator(r'^[a-z][0-9a-z_]*[0-9a-z]')
 #   Contain only numbers, lower-case characters, and decimals.
 #   End in a number or lower-case character.
 version_validator = RegexValidator(r'^' + RELEASE_VERSION_REGEX)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+def specifier_validator(value):
+    """Validate that the value is a version or version specifier."""
+    try:
+        get_version_specifier(value)
+    except InvalidSpecifier as exception:
+        raise ValidationError(
+            message=f'"{value}" is not a valid version specifier.',
+            code='invalid',
+        ) from exception
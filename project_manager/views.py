@@ -4,15 +4,11 @@
 # IMPORTS
 # =============================================================================
 # Django
-from django.db.models import Count, Q, Sum
-from django.db.models.functions import Coalesce
 from django.views.generic import TemplateView
 
 # App
-from project_manager.packages.models import PackageRelease
-from project_manager.plugins.models import PluginRelease
-from project_manager.sub_plugins.models import SubPluginRelease
-from users.models import ForumUser
+from project_manager.constants import STATISTICS_PROJECT_TYPES
+from project_manager.statistics import get_statistics_snapshot
 
 
 # =============================================================================
@@ -33,45 +29,29 @@ class StatisticsView(TemplateView):
     http_method_names = ('get', 'options')
 
     def get_context_data(self, **kwargs):
-        """Return all statistical context data."""
+        """Return all statistical context data.
+
+        The totals are read from the statistics snapshot, which is kept up
+            to date as releases, projects, and download counts are written.
+        """
         context = super().get_context_data(**kwargs)
-        package_info = PackageRelease.objects.aggregate(
-            download_count=Coalesce(Sum('download_count'), 0),
-            project_count=Count('package', distinct=True),
-        )
-        plugin_info = PluginRelease.objects.aggregate(
-            download_count=Coalesce(Sum('download_count'), 0),
-            project_count=Count('plugin', distinct=True),
-        )
-        sub_plugin_info = SubPluginRelease.objects.aggregate(
-            download_count=Coalesce(Sum('download_count'), 0),
-            project_count=Count('sub_plugin', distinct=True),
-        )
-        users = ForumUser.objects.filter(
-            Q(plugins__isnull=False) |
-            Q(plugin_contributions__isnull=False) |
-            Q(sub_plugins__isnull=False) |
-            Q(sub_plugin_contributions__isnull=False) |
-            Q(packages__isnull=False) |
-            Q(package_contributions__isnull=False)
-        ).distinct().count()
+        snapshot = get_statistics_snapshot()
+        context['users'] = snapshot.users
+        for _, prefix in STATISTICS_PROJECT_TYPES:
+            context[f'{prefix}_count'] = getattr(snapshot, f'{prefix}_count')
+            context[f'{prefix}_downloads'] = getattr(
+                snapshot,
+                f'{prefix}_downloads',
+            )
         context.update({
-            'users': users,
-            'package_count': package_info['project_count'],
-            'plugin_count': plugin_info['project_count'],
-            'sub_plugin_count': sub_plugin_info['project_count'],
-            'total_projects': sum([
-                package_info['project_count'],
-                plugin_info['project_count'],
-                sub_plugin_info['project_count'],
-            ]),
-            'package_downloads': package_info['download_count'],
-            'plugin_downloads': plugin_info['download_count'],
-            'sub_plugin_downloads': sub_plugin_info['download_count'],
-            'total_downloads': sum([
-                package_info['download_count'],
-                plugin_info['download_count'],
-                sub_plugin_info['download_count'],
-            ])
+            'total_projects': sum(
+                context[f'{prefix}_count']
+                for _, prefix in STATISTICS_PROJECT_TYPES
+            ),
+            'total_downloads': sum(
+                context[f'{prefix}_downloads']
+                for _, prefix in STATISTICS_PROJECT_TYPES
+            ),
+            'recent_downloads': snapshot.recent_downloads,
         })
         return context
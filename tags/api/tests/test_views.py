@@ -4,6 +4,7 @@
 # Django
 from django.db import connection
 from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import Coalesce
 from django.test import override_settings
 
 # Third Party Django
@@ -155,20 +156,18 @@ class TagViewSetTestCase(APITestCase):
             tuple1=getattr(queryset, '_prefetch_related_lookups'),
             tuple2=(),
         )
+        # Verify that each count is an independent subquery, not a join
+        self.assertNotIn(member='JOIN', container=str(queryset.query))
         annotations = queryset.query.annotations
         self.assertIn(
             member='package_count',
             container=annotations,
         )
         package_count = annotations['package_count']
-        self.assertTrue(expr=package_count.distinct)
-        self.assertEqual(
-            first=len(package_count.source_expressions),
-            second=1,
-        )
+        self.assertIsInstance(obj=package_count, cls=Coalesce)
         self.assertIs(
-            expr1=package_count.source_expressions[0].target,
-            expr2=getattr(PackageTag.package, 'field'),
+            expr1=package_count.source_expressions[0].query.model,
+            expr2=PackageTag,
         )
 
         self.assertIn(
@@ -176,14 +175,10 @@ class TagViewSetTestCase(APITestCase):
             container=annotations,
         )
         plugin_count = annotations['plugin_count']
-        self.assertTrue(expr=plugin_count.distinct)
-        self.assertEqual(
-            first=len(plugin_count.source_expressions),
-            second=1,
-        )
+        self.assertIsInstance(obj=plugin_count, cls=Coalesce)
         self.assertIs(
-            expr1=plugin_count.source_expressions[0].target,
-            expr2=getattr(PluginTag.plugin, 'field'),
+            expr1=plugin_count.source_expressions[0].query.model,
+            expr2=PluginTag,
         )
 
         self.assertIn(
@@ -191,14 +186,10 @@ class TagViewSetTestCase(APITestCase):
             container=annotations,
         )
         sub_plugin_count = annotations['sub_plugin_count']
-        self.assertTrue(expr=sub_plugin_count.distinct)
-        self.assertEqual(
-            first=len(sub_plugin_count.source_expressions),
-            second=1,
-        )
+        self.assertIsInstance(obj=sub_plugin_count, cls=Coalesce)
         self.assertIs(
-            expr1=sub_plugin_count.source_expressions[0].target,
-            expr2=getattr(SubPluginTag.sub_plugin, 'field'),
+            expr1=sub_plugin_count.source_expressions[0].query.model,
+            expr2=SubPluginTag,
         )
 
         self.assertIn(
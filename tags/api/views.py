@@ -4,7 +4,7 @@
 # IMPORTS
 # =============================================================================
 # Django
-from django.db.models import Count, F, Prefetch
+from django.db.models import F, Prefetch
 
 # Third Party Django
 from django_filters.rest_framework import DjangoFilterBackend
@@ -13,6 +13,8 @@ from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.viewsets import GenericViewSet
 
 # App
+from project_manager.api.common.views.mixins import CachedResponseMixin
+from project_manager.helpers import get_relation_count_subquery
 from project_manager.sub_plugins.models import SubPlugin
 from tags.api.serializers import TagListSerializer, TagRetrieveSerializer
 from tags.models import Tag
@@ -29,7 +31,12 @@ __all__ = (
 # =============================================================================
 # VIEWS
 # =============================================================================
-class TagViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
+class TagViewSet(
+    CachedResponseMixin,
+    ListModelMixin,
+    RetrieveModelMixin,
+    GenericViewSet,
+):
     """ViewSet for listing Supported Games.
 
     ###Available Ordering:
@@ -83,8 +90,17 @@ class TagViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
             )
 
         return queryset.annotate(
-            package_count=Count('packages', distinct=True),
-            plugin_count=Count('plugins', distinct=True),
-            sub_plugin_count=Count('sub_plugins', distinct=True),
+            package_count=get_relation_count_subquery(
+                model=Tag,
+                relation_name='packages',
+            ),
+            plugin_count=get_relation_count_subquery(
+                model=Tag,
+                relation_name='plugins',
+            ),
+            sub_plugin_count=get_relation_count_subquery(
+                model=Tag,
+                relation_name='sub_plugins',
+            ),
             project_count=F('package_count') + F('plugin_count') + F('sub_plugin_count'),
         )
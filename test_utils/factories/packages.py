@@ -4,7 +4,7 @@
 # IMPORTS
 # =============================================================================
 # Django
-from django.utils.timezone import get_current_timezone
+from django.utils.timezone import get_current_timezone, localdate
 
 # Third Party Django
 import factory
@@ -17,6 +17,8 @@ from project_manager.packages.models import (
     PackageImage,
     PackageRelease,
     PackageReleaseDownloadRequirement,
+    PackageReleaseDownloadStatistic,
+    PackageReleaseJob,
     PackageReleasePackageRequirement,
     PackageReleasePyPiRequirement,
     PackageReleaseVersionControlRequirement,
@@ -34,6 +36,8 @@ __all__ = (
     'PackageImageFactory',
     'PackageReleaseFactory',
     'PackageReleaseDownloadRequirementFactory',
+    'PackageReleaseDownloadStatisticFactory',
+    'PackageReleaseJobFactory',
     'PackageReleasePackageRequirementFactory',
     'PackageReleasePyPiRequirementFactory',
     'PackageReleaseVersionControlRequirementFactory',
@@ -158,6 +162,39 @@ class PackageReleaseDownloadRequirementFactory(
         model = PackageReleaseDownloadRequirement
 
 
+class PackageReleaseDownloadStatisticFactory(
+    factory.django.DjangoModelFactory
+):
+    """Model factory to use when testing with PackageReleaseDownloadStatistic objects."""
+
+    release = factory.SubFactory(
+        factory='test_utils.factories.packages.PackageReleaseFactory',
+    )
+    date = factory.LazyFunction(function=localdate)
+
+    class Meta:
+        """Define the metaclass attributes."""
+
+        model = PackageReleaseDownloadStatistic
+
+
+class PackageReleaseJobFactory(factory.django.DjangoModelFactory):
+    """Model factory to use when testing with PackageReleaseJob objects."""
+
+    package = factory.SubFactory(
+        factory='test_utils.factories.packages.PackageFactory',
+    )
+    version = factory.Sequence(function=lambda n: f'2.0.{n}')
+    created_by = factory.SubFactory(
+        factory='test_utils.factories.users.ForumUserFactory',
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        model = PackageReleaseJob
+
+
 class PackageReleasePackageRequirementFactory(
     factory.django.DjangoModelFactory
 ):
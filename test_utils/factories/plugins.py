@@ -4,7 +4,7 @@
 # IMPORTS
 # =============================================================================
 # Django
-from django.utils.timezone import get_current_timezone
+from django.utils.timezone import get_current_timezone, localdate
 
 # Third Party Django
 import factory
@@ -17,6 +17,8 @@ from project_manager.plugins.models import (
     PluginImage,
     PluginRelease,
     PluginReleaseDownloadRequirement,
+    PluginReleaseDownloadStatistic,
+    PluginReleaseJob,
     PluginReleasePackageRequirement,
     PluginReleasePyPiRequirement,
     PluginReleaseVersionControlRequirement,
@@ -35,6 +37,8 @@ __all__ = (
     'PluginImageFactory',
     'PluginReleaseFactory',
     'PluginReleaseDownloadRequirementFactory',
+    'PluginReleaseDownloadStatisticFactory',
+    'PluginReleaseJobFactory',
     'PluginReleasePackageRequirementFactory',
     'PluginReleasePyPiRequirementFactory',
     'PluginReleaseVersionControlRequirementFactory',
@@ -160,6 +164,39 @@ class PluginReleaseDownloadRequirementFactory(
         model = PluginReleaseDownloadRequirement
 
 
+class PluginReleaseDownloadStatisticFactory(
+    factory.django.DjangoModelFactory
+):
+    """Model factory to use when testing with PluginReleaseDownloadStatistic objects."""
+
+    release = factory.SubFactory(
+        factory='test_utils.factories.plugins.PluginReleaseFactory',
+    )
+    date = factory.LazyFunction(function=localdate)
+
+    class Meta:
+        """Define the metaclass attributes."""
+
+        model = PluginReleaseDownloadStatistic
+
+
+class PluginReleaseJobFactory(factory.django.DjangoModelFactory):
+    """Model factory to use when testing with PluginReleaseJob objects."""
+
+    plugin = factory.SubFactory(
+        factory='test_utils.factories.plugins.PluginFactory',
+    )
+    version = factory.Sequence(function=lambda n: f'2.0.{n}')
+    created_by = factory.SubFactory(
+        factory='test_utils.factories.users.ForumUserFactory',
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        model = PluginReleaseJob
+
+
 class PluginReleasePackageRequirementFactory(
     factory.django.DjangoModelFactory
 ):
@@ -4,7 +4,7 @@
 # IMPORTS
 # =============================================================================
 # Django
-from django.utils.timezone import get_current_timezone
+from django.utils.timezone import get_current_timezone, localdate
 
 # Third Party Django
 import factory
@@ -17,6 +17,8 @@ from project_manager.sub_plugins.models import (
     SubPluginImage,
     SubPluginRelease,
     SubPluginReleaseDownloadRequirement,
+    SubPluginReleaseDownloadStatistic,
+    SubPluginReleaseJob,
     SubPluginReleasePackageRequirement,
     SubPluginReleasePyPiRequirement,
     SubPluginReleaseVersionControlRequirement,
@@ -34,6 +36,8 @@ __all__ = (
     'SubPluginImageFactory',
     'SubPluginReleaseFactory',
     'SubPluginReleaseDownloadRequirementFactory',
+    'SubPluginReleaseDownloadStatisticFactory',
+    'SubPluginReleaseJobFactory',
     'SubPluginReleasePackageRequirementFactory',
     'SubPluginReleasePyPiRequirementFactory',
     'SubPluginReleaseVersionControlRequirementFactory',
@@ -161,6 +165,39 @@ class SubPluginReleaseDownloadRequirementFactory(
         model = SubPluginReleaseDownloadRequirement
 
 
+class SubPluginReleaseDownloadStatisticFactory(
+    factory.django.DjangoModelFactory
+):
+    """Model factory to use when testing with SubPluginReleaseDownloadStatistic objects."""
+
+    release = factory.SubFactory(
+        factory='test_utils.factories.sub_plugins.SubPluginReleaseFactory',
+    )
+    date = factory.LazyFunction(function=localdate)
+
+    class Meta:
+        """Define the metaclass attributes."""
+
+        model = SubPluginReleaseDownloadStatistic
+
+
+class SubPluginReleaseJobFactory(factory.django.DjangoModelFactory):
+    """Model factory to use when testing with SubPluginReleaseJob objects."""
+
+    sub_plugin = factory.SubFactory(
+        factory='test_utils.factories.sub_plugins.SubPluginFactory',
+    )
+    version = factory.Sequence(function=lambda n: f'2.0.{n}')
+    created_by = factory.SubFactory(
+        factory='test_utils.factories.users.ForumUserFactory',
+    )
+
+    class Meta:
+        """Define metaclass attributes."""
+
+        model = SubPluginReleaseJob
+
+
 class SubPluginReleasePackageRequirementFactory(
     factory.django.DjangoModelFactory
 ):
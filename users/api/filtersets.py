@@ -51,4 +51,4 @@ class ForumUserFilterSet(FilterSet):
             Q(package_contribution_count__gt=0) |
             Q(sub_plugin_count__gt=0) |
             Q(sub_plugin_contribution_count__gt=0)
-        ).distinct()
+        )
@@ -377,6 +377,10 @@ class ForumUserViewSetTestCase(APITestCase):
             data={'has_contributions': True},
         )
         self.assertEqual(first=len(connection.queries), second=2)
+        self.assertNotIn(
+            member='DISTINCT',
+            container=connection.queries[-1]['sql'],
+        )
         self.assertEqual(
             first=response.status_code,
             second=status.HTTP_200_OK,
@@ -4,13 +4,14 @@
 # IMPORTS
 # =============================================================================
 #  Django
-from django.db.models import Count, F, Prefetch
+from django.db.models import F, Prefetch
 
 # Third Party Django
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.viewsets import ModelViewSet
 
 # App
+from project_manager.helpers import get_relation_count_subquery
 from project_manager.sub_plugins.models import SubPlugin
 from users.api.filtersets import ForumUserFilterSet
 from users.api.ordering import ForumUserOrderingFilter
@@ -82,12 +83,30 @@ class ForumUserViewSet(ModelViewSet):
             )
 
         return queryset.annotate(
-            package_count=Count('packages', distinct=True),
-            package_contribution_count=Count('package_contributions', distinct=True),
-            plugin_count=Count('plugins', distinct=True),
-            plugin_contribution_count=Count('plugin_contributions', distinct=True),
-            sub_plugin_count=Count('sub_plugins', distinct=True),
-            sub_plugin_contribution_count=Count('sub_plugin_contributions', distinct=True),
+            package_count=get_relation_count_subquery(
+                model=ForumUser,
+                relation_name='packages',
+            ),
+            package_contribution_count=get_relation_count_subquery(
+                model=ForumUser,
+                relation_name='package_contributions',
+            ),
+            plugin_count=get_relation_count_subquery(
+                model=ForumUser,
+                relation_name='plugins',
+            ),
+            plugin_contribution_count=get_relation_count_subquery(
+                model=ForumUser,
+                relation_name='plugin_contributions',
+            ),
+            sub_plugin_count=get_relation_count_subquery(
+                model=ForumUser,
+                relation_name='sub_plugins',
+            ),
+            sub_plugin_contribution_count=get_relation_count_subquery(
+                model=ForumUser,
+                relation_name='sub_plugin_contributions',
+            ),
             project_count=F('package_count') + F('plugin_count') + F('sub_plugin_count'),
             project_contribution_count=(
                 F('package_contribution_count') +